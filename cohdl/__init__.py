@@ -57,3 +57,4 @@ from ._compiler.frontend import use_pretty_traceback
 
 from . import std
 from . import utility
+from . import sim
@@ -0,0 +1 @@
+from ._python_codegen import PythonCodegen
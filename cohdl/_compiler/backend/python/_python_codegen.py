@@ -0,0 +1,656 @@
+from __future__ import annotations
+
+from cohdl._core._ir import repr as ir
+from cohdl._core._type_qualifier import TypeQualifier, Generic, Temporary
+
+from cohdl.sim import _packed as packed
+from cohdl.sim._packed import PackedType, Kind
+from cohdl._core._intrinsic_operations import (
+    UnaryOperator,
+    BinaryOperator,
+    ComparisonOperator,
+)
+
+
+def _set(value: list, index: int, elem):
+    # arrays are never modified in place, because
+    # the previous value may still be referenced
+    value = list(value)
+    value[index] = elem
+    return value
+
+
+_arithmetic = {
+    BinaryOperator.ADD: "({} + {})",
+    BinaryOperator.SUB: "({} - {})",
+    BinaryOperator.MUL: "({} * {})",
+    BinaryOperator.DIV: "truncdiv({}, {})",
+    BinaryOperator.TRUNC_DIV: "truncdiv({}, {})",
+    BinaryOperator.MOD: "mod({}, {})",
+    BinaryOperator.REM: "rem({}, {})",
+}
+
+_bitwise = {
+    BinaryOperator.BIT_AND: "({} & {})",
+    BinaryOperator.BIT_OR: "({} | {})",
+    BinaryOperator.BIT_XOR: "({} ^ {})",
+}
+
+_comparison = {
+    ComparisonOperator.EQ: "==",
+    ComparisonOperator.NE: "!=",
+    ComparisonOperator.GT: ">",
+    ComparisonOperator.LT: "<",
+    ComparisonOperator.GE: ">=",
+    ComparisonOperator.LE: "<=",
+}
+
+
+def _to_int(ptype: PackedType, text: str):
+    if ptype.kind is Kind.SIGNED:
+        sign = 1 << (ptype.width - 1)
+        return f"(({text} ^ {sign}) - {sign})"
+    return text
+
+
+def _wrap(ptype: PackedType, text: str):
+    if ptype.kind is Kind.INTEGER:
+        return text
+    return f"({text} & {ptype.mask})"
+
+
+class PythonCodegen:
+    """
+    translates the statements of a process into the source code
+    of a Python function, that is compiled using `compile()`
+
+    The generated code operates directly on the packed values
+    of the simulator. Signals are read from the value list and written
+    to the pending dict, temporaries become local variables.
+    """
+
+    def __init__(self, instance):
+        self._instance = instance
+        self._namespace = {
+            "values": instance._sim._values,
+            "pending": instance._sim._pending,
+            "last": instance._sim._last,
+            "truncdiv": packed.truncdiv,
+            "rem": packed.rem,
+            "mod": packed.mod,
+            "_set": _set,
+        }
+        self._constants: dict = {}
+        self._lines: list[str] = []
+        self._indent = 1
+        self._local_cnt = 0
+
+        # temporaries assigned on all paths to the current statement,
+        # temporaries that might be read before the first assignment
+        # and temporaries stored in the value list
+        self._defined: set[int] = set()
+        self._maybe_unassigned: set[int] = set()
+        self._persistent: set[int] = set()
+
+    def process(self, code: ir.CodeBlock, reads: set):
+        """
+        returns a function, that executes code once,
+        all signals read by code are added to reads
+        """
+
+        # temporaries are variables of the process, that keep
+        # their value between activations, only those assigned before
+        # their first use can be replaced with local variables
+        self._block(code, reads)
+        self._persistent = self._maybe_unassigned
+        self._lines = []
+        self._defined = set()
+        self._maybe_unassigned = set()
+        self._block(code, reads)
+
+        params = ", ".join(self._namespace)
+        source = "\n".join(
+            [f"def _make({params}):", "    def run():"]
+            + (self._lines if len(self._lines) != 0 else ["        pass"])
+            + ["    return run"]
+        )
+
+        scope = {}
+        exec(compile(source, "<cohdl process>", "exec"), scope)
+        run = scope["_make"](**self._namespace)
+        run.source = source
+        return run
+
+    #
+    # code emission
+    #
+
+    def _line(self, text: str):
+        self._lines.append("    " * (self._indent + 1) + text)
+
+    def _local(self, prefix: str):
+        self._local_cnt += 1
+        return f"_{prefix}{self._local_cnt}"
+
+    def _constant(self, value):
+        if isinstance(value, int):
+            return repr(value)
+
+        # lists are compared by value, all other constants by identity
+        key = repr(value) if isinstance(value, list) else id(value)
+
+        if key not in self._constants:
+            name = f"k{len(self._constants)}"
+            self._constants[key] = name
+            self._namespace[name] = value
+
+        return self._constants[key]
+
+    #
+    # locations
+    #
+
+    def _is_local(self, slot):
+        return isinstance(slot.root, Temporary) and slot.nr not in self._persistent
+
+    def _storage(self, slot, reads: set | None, read: bool):
+        if self._is_local(slot):
+            if read and slot.nr not in self._defined:
+                self._maybe_unassigned.add(slot.nr)
+            return f"t{slot.nr}"
+
+        if read and reads is not None and slot.is_signal:
+            reads.add(slot.nr)
+
+        return f"values[{slot.nr}]"
+
+    def _index(self, index):
+        if isinstance(index, int):
+            return index
+
+        parts = [] if index.const == 0 else [str(index.const)]
+
+        for location, ptype in index.parts:
+            text = self._convert(
+                ptype, location.ptype, self._extract(location, None, None)
+            )
+            parts.append(_to_int(ptype, text))
+
+        name = self._local("i")
+        self._line(f"{name} = {' + '.join(parts)}")
+        return name
+
+    def _indices(self, location):
+        # evaluates all runtime indices once, before the location is used
+        return [self._index(step.index) for step in location.steps]
+
+    def _extract(self, location, base: str | None, indices: list | None):
+        if base is None:
+            base = self._storage(location.slot, None, True)
+        if indices is None:
+            indices = self._indices(location)
+
+        ptype = location.slot.ptype
+
+        for step, index in zip(location.steps, indices):
+            if ptype.kind is Kind.ARRAY:
+                base = f"{base}[{index}]"
+            else:
+                mask = 1 if step.width is None else (1 << step.width) - 1
+
+                if index == 0:
+                    base = f"({base} & {mask})"
+                else:
+                    base = f"(({base} >> {index}) & {mask})"
+
+            ptype = step.ptype
+
+        return base
+
+    def _insert(self, ptype: PackedType, steps, indices, base: str, value: str):
+        if len(steps) == 0:
+            return value
+
+        step, index = steps[0], indices[0]
+
+        if ptype.kind is Kind.ARRAY:
+            inner = self._insert(
+                step.ptype, steps[1:], indices[1:], f"{base}[{index}]", value
+            )
+            return f"_set({base}, {index}, {inner})"
+
+        mask = 1 if step.width is None else (1 << step.width) - 1
+
+        if isinstance(index, int):
+            extract = f"(({base} >> {index}) & {mask})"
+            inner = self._insert(step.ptype, steps[1:], indices[1:], extract, value)
+            return f"(({base} & {~(mask << index)}) | ({inner} << {index}))"
+
+        extract = f"(({base} >> {index}) & {mask})"
+        inner = self._insert(step.ptype, steps[1:], indices[1:], extract, value)
+        return f"(({base} & ~({mask} << {index})) | ({inner} << {index}))"
+
+    #
+    # value access
+    #
+
+    def _convert(self, target: PackedType, source: PackedType | None, text: str):
+        # raises an error for invalid conversions
+        fn = packed.convert(target, source)
+
+        if fn is packed._identity:
+            return text
+
+        tk = target.kind
+        sk = source.kind
+
+        if tk in (Kind.VECTOR, Kind.UNSIGNED, Kind.SIGNED):
+            if sk in (Kind.VECTOR, Kind.UNSIGNED, Kind.SIGNED):
+                if sk is Kind.SIGNED and source.width < target.width:
+                    return f"({_to_int(source, text)} & {target.mask})"
+                if source.width <= target.width:
+                    return text
+                return f"({text} & {target.mask})"
+            if sk in (Kind.BIT, Kind.BOOL):
+                return text
+            return f"({text} & {target.mask})"
+
+        if tk in (Kind.BIT, Kind.BOOL) and sk is Kind.INTEGER:
+            return f"(1 if {text} else 0)"
+
+        if tk is Kind.INTEGER and sk is Kind.SIGNED:
+            return _to_int(source, text)
+
+        return f"{self._constant(fn)}({text})"
+
+    def _reader(self, obj: TypeQualifier, reads: set | None):
+        ptype = packed.packed_type(obj.type)
+        location = self._instance.location(obj, reads)
+        storage = self._storage(location.slot, reads, True)
+        text = self._extract(location, storage, None)
+        return self._convert(ptype, location.ptype, text), ptype
+
+    def _operand(self, value, hint: PackedType | None, reads: set):
+        """
+        returns the source code, that evaluates value and the packed type of the result
+        """
+
+        if isinstance(value, TypeQualifier):
+            return self._reader(value, reads)
+
+        ptype = packed.constant_type(value)
+
+        if ptype is None:
+            assert hint is not None, f"cannot determine type of constant '{value}'"
+            ptype = hint
+
+        return self._constant(packed.constant(ptype, value)), ptype
+
+    def _operands(self, lhs, rhs, reads):
+        # constants without a type of their own (Null/Full)
+        # use the type of the other operand
+        if isinstance(lhs, TypeQualifier) or not isinstance(rhs, TypeQualifier):
+            lhs_text, lhs_type = self._operand(lhs, None, reads)
+            rhs_text, rhs_type = self._operand(rhs, lhs_type, reads)
+        else:
+            rhs_text, rhs_type = self._operand(rhs, None, reads)
+            lhs_text, lhs_type = self._operand(lhs, rhs_type, reads)
+
+        return lhs_text, lhs_type, rhs_text, rhs_type
+
+    def _writer(self, obj: TypeQualifier, reads: set):
+        """
+        returns a function, that emits an assignment of
+        a packed value of type obj.type to obj
+        """
+
+        ptype = packed.packed_type(obj.type)
+        location = self._instance.location(obj, reads)
+        slot = location.slot
+        nr = slot.nr
+
+        assert not isinstance(
+            slot.root, Generic
+        ), f"writing to generic '{slot.name()}' not allowed"
+
+        indices = self._indices(location)
+
+        def write(text: str):
+            text = self._convert(location.ptype, ptype, text)
+
+            if len(location.steps) == 0:
+                if slot.is_signal:
+                    self._line(f"pending[{nr}] = {text}")
+                elif self._is_local(slot):
+                    self._line(f"t{nr} = {text}")
+                    self._defined.add(nr)
+                else:
+                    self._line(f"values[{nr}] = {text}")
+                return
+
+            if slot.is_signal:
+                base = self._local("b")
+                self._line(
+                    f"{base} = pending[{nr}] if {nr} in pending else values[{nr}]"
+                )
+                target = f"pending[{nr}]"
+            else:
+                base = self._storage(slot, reads, True)
+                target = base
+
+            insert = self._insert(slot.ptype, location.steps, indices, base, text)
+            self._line(f"{target} = {insert}")
+
+        return write, ptype
+
+    def _assignment(self, target, source, reads):
+        write, ptype = self._writer(target, reads)
+
+        if isinstance(source, (tuple, list)):
+            assert ptype.kind is Kind.ARRAY, "list assigned to non array object"
+            elems = []
+
+            for elem in source:
+                text, elem_type = self._operand(elem, ptype.elem, reads)
+                elems.append(self._convert(ptype.elem, elem_type, text))
+
+            zero = self._constant(packed.zero(ptype.elem))
+            elems += [zero] * (ptype.count - len(elems))
+            write(f"[{', '.join(elems)}]")
+            return
+
+        text, source_type = self._operand(source, ptype, reads)
+        write(self._convert(ptype, source_type, text))
+
+    #
+    # statements
+    #
+
+    def _event(self, event, reads):
+        if isinstance(event, ir.EventGroup):
+            events = [self._event(sub, reads) for sub in event.events]
+            op = " and " if event.operation is ir.EventGroup.Operation.AND else " or "
+            return f"({op.join(events)})"
+
+        location = self._instance.location(event.sig, reads)
+        nr = location.slot.nr
+        indices = self._indices(location)
+        current = self._extract(
+            location, self._storage(location.slot, reads, True), indices
+        )
+        previous = self._extract(location, f"last[{nr}]", indices)
+        Type = ir.Event.Type
+        event_type = event.event_type
+
+        if event_type is Type.HIGH:
+            return f"({current} == 1)"
+        if event_type is Type.LOW:
+            return f"({current} == 0)"
+        if event_type is Type.RISING:
+            return f"({current} == 1 and {nr} in last and {previous} != 1)"
+        if event_type is Type.FALLING:
+            return f"({current} == 0 and {nr} in last and {previous} != 0)"
+        if event_type is Type.BOTH_EDGES:
+            return f"({nr} in last and {previous} != {current})"
+
+        raise AssertionError(f"invalid event type {event_type}")
+
+    def _block(self, block: ir.CodeBlock, reads):
+        for stmt in block.content():
+            self._stmt(stmt, reads)
+
+    def _branch(self, block: ir.CodeBlock, reads, defined: set):
+        # generates a branch of a conditional statement
+        # and returns the temporaries assigned in it
+        self._defined = set(defined)
+        self._indent += 1
+        start = len(self._lines)
+        self._block(block, reads)
+
+        if len(self._lines) == start:
+            self._line("pass")
+
+        self._indent -= 1
+        return self._defined
+
+    def _test(self, stmt: ir.If, reads):
+        if isinstance(stmt._test, (ir.Event, ir.EventGroup)):
+            return self._event(stmt._test, reads)
+
+        text, ptype = self._operand(stmt._test, None, reads)
+        packed.truth(ptype)
+        return text
+
+    def _if(self, stmt: ir.If, reads):
+        defined = self._defined
+        self._line(f"if {self._test(stmt, reads)}:")
+        body_defined = self._branch(stmt._body, reads, defined)
+        self._defined = body_defined & self._orelse(stmt._orelse, reads, defined)
+
+    def _orelse(self, block: ir.CodeBlock, reads, defined: set):
+        # generates the else branch of an if statement
+        # and returns the temporaries assigned in it
+        content = block.content()
+
+        if len(content) == 0:
+            return set(defined)
+
+        # chains of if/else if are generated as elif branches
+        # when the nested test requires no preparation
+        # (deeply nested blocks exceed the limits of the Python parser)
+        if len(content) == 1 and isinstance(content[0], ir.If):
+            nested = content[0]
+            start = len(self._lines)
+            self._defined = defined
+            test = self._test(nested, reads)
+
+            if len(self._lines) == start:
+                self._line(f"elif {test}:")
+                body_defined = self._branch(nested._body, reads, defined)
+                return body_defined & self._orelse(nested._orelse, reads, defined)
+
+            del self._lines[start:]
+
+        self._line("else:")
+        return self._branch(block, reads, defined)
+
+    def _stmt(self, stmt: ir.Statement, reads):
+        if isinstance(stmt, ir.CodeBlock):
+            self._block(stmt, reads)
+            return
+
+        if isinstance(stmt, (ir.Nop, ir.Comment)):
+            return
+
+        if isinstance(
+            stmt, (ir.SignalAssignment, ir.SignalPush, ir.VariableAssignment)
+        ):
+            self._assignment(stmt._target, stmt._source, reads)
+            return
+
+        if isinstance(stmt, ir.If):
+            self._if(stmt, reads)
+            return
+
+        if isinstance(stmt, ir.CaseWhen):
+            text, ptype = self._operand(stmt._value, None, reads)
+            value = self._local("k")
+            self._line(f"{value} = {text}")
+
+            op = "is" if ptype.kind is Kind.ENUM else "=="
+            defined = self._defined
+            result = None
+            keyword = "if"
+
+            for branch in stmt._branches:
+                key = self._constant(packed.constant(ptype, branch.cond))
+                self._line(f"{keyword} {value} {op} {key}:")
+                branch_defined = self._branch(branch.code, reads, defined)
+                result = branch_defined if result is None else result & branch_defined
+                keyword = "elif"
+
+            if stmt._default is not None:
+                if result is None:
+                    self._block(stmt._default, reads)
+                    return
+
+                self._line("else:")
+                result = result & self._branch(stmt._default, reads, defined)
+            else:
+                result = defined
+
+            self._defined = defined if result is None else result
+            return
+
+        if isinstance(stmt, ir.Assert):
+            text, ptype = self._operand(stmt._cond, None, reads)
+            packed.truth(ptype)
+            msg = self._constant(f"simulation assertion failed: {stmt._msg}")
+            self._line(f"if not {text}:")
+            self._indent += 1
+            self._line(f"raise AssertionError({msg})")
+            self._indent -= 1
+            return
+
+        if isinstance(stmt, ir.Expression):
+            self._expression(stmt, reads)
+            return
+
+        if isinstance(stmt, ir.InlineCode):
+            raise AssertionError("inline code cannot be simulated")
+
+        raise AssertionError(f"statement {type(stmt)} cannot be simulated")
+
+    def _expression(self, stmt: ir.Expression, reads):
+        if isinstance(stmt, ir.SelectWith):
+            self._select_with(stmt, reads)
+            return
+
+        write, result = self._writer(stmt.result(), reads)
+
+        if isinstance(stmt, ir.BinOp):
+            lhs, lhs_type, rhs, rhs_type = self._operands(stmt._lhs, stmt._rhs, reads)
+            write(self._binary_op(stmt._op, lhs, lhs_type, rhs, rhs_type, result))
+        elif isinstance(stmt, ir.UnaryOp):
+            arg, arg_type = self._operand(stmt._arg, result, reads)
+            write(self._unary_op(stmt._op, arg, arg_type, result))
+        elif isinstance(stmt, ir.Compare):
+            lhs, lhs_type, rhs, rhs_type = self._operands(stmt._lhs, stmt._rhs, reads)
+            write(self._compare_op(stmt._op, lhs, lhs_type, rhs, rhs_type))
+        elif isinstance(stmt, ir.Boolean):
+            arg, arg_type = self._operand(stmt._arg, None, reads)
+            packed.truth(arg_type)
+            write(f"(1 if {arg} else 0)")
+        elif isinstance(stmt, (ir.All, ir.Any)):
+            args = [self._operand(arg, None, reads)[0] for arg in stmt._args]
+            op = " and " if isinstance(stmt, ir.All) else " or "
+            write(f"(1 if ({op.join(args)}) else 0)")
+        else:
+            raise AssertionError(f"expression {type(stmt)} cannot be simulated")
+
+    def _select_with(self, stmt: ir.SelectWith, reads):
+        write, result = self._writer(stmt.result(), reads)
+        text, ptype = self._operand(stmt._arg, None, reads)
+        value = self._local("k")
+        self._line(f"{value} = {text}")
+
+        op = "is" if ptype.kind is Kind.ENUM else "=="
+        keys = set()
+        keyword = "if"
+
+        for cond, branch_value in stmt._branches:
+            key = self._constant(packed.constant(ptype, cond))
+
+            if key in keys:
+                continue
+
+            keys.add(key)
+            self._line(f"{keyword} {value} {op} {key}:")
+            self._indent += 1
+            branch_text, branch_type = self._operand(branch_value, result, reads)
+            write(self._convert(result, branch_type, branch_text))
+            self._indent -= 1
+            keyword = "elif"
+
+        if keyword == "elif":
+            self._line("else:")
+            self._indent += 1
+
+        if stmt._default is None:
+            write(self._constant(packed.zero(result)))
+        else:
+            default_text, default_type = self._operand(stmt._default, result, reads)
+            write(self._convert(result, default_type, default_text))
+
+        if keyword == "elif":
+            self._indent -= 1
+
+    #
+    # operations
+    #
+
+    def _unary_op(self, op, arg: str, arg_type: PackedType, result: PackedType):
+        if op is UnaryOperator.BOOL:
+            return f"(1 if {arg} else 0)"
+        if op is UnaryOperator.NOT:
+            return f"(0 if {arg} else 1)"
+        if op is UnaryOperator.INV:
+            return self._convert(result, arg_type, f"({arg} ^ {arg_type.mask})")
+        if op is UnaryOperator.NEG:
+            return _wrap(result, f"(-{_to_int(arg_type, arg)})")
+        if op is UnaryOperator.POS:
+            return _wrap(result, _to_int(arg_type, arg))
+        if op is UnaryOperator.ABS:
+            return _wrap(result, f"abs({_to_int(arg_type, arg)})")
+
+        raise AssertionError(f"unary operator {op} not supported")
+
+    def _binary_op(self, op, lhs, lhs_type, rhs, rhs_type, result):
+        if op is BinaryOperator.AND:
+            return f"(1 if ({lhs} and {rhs}) else 0)"
+        if op is BinaryOperator.OR:
+            return f"(1 if ({lhs} or {rhs}) else 0)"
+
+        if op in _bitwise:
+            return _bitwise[op].format(
+                self._convert(result, lhs_type, lhs),
+                self._convert(result, rhs_type, rhs),
+            )
+
+        if op in _arithmetic:
+            fmt = _arithmetic[op]
+
+            if lhs_type.kind is Kind.SIGNED or rhs_type.kind is Kind.SIGNED:
+                return _wrap(
+                    result,
+                    fmt.format(_to_int(lhs_type, lhs), _to_int(rhs_type, rhs)),
+                )
+
+            return _wrap(result, fmt.format(lhs, rhs))
+
+        if op is BinaryOperator.CONCAT:
+            return f"(({lhs} << {rhs_type.width}) | {rhs})"
+
+        if op is BinaryOperator.LSHIFT:
+            return _wrap(result, f"({lhs} << {_to_int(rhs_type, rhs)})")
+
+        if op is BinaryOperator.RSHIFT:
+            if lhs_type.kind is Kind.SIGNED:
+                return _wrap(
+                    result, f"({_to_int(lhs_type, lhs)} >> {_to_int(rhs_type, rhs)})"
+                )
+            return f"({lhs} >> {_to_int(rhs_type, rhs)})"
+
+        raise AssertionError(f"binary operator {op} not supported")
+
+    def _compare_op(self, op, lhs, lhs_type, rhs, rhs_type):
+        if lhs_type.kind is Kind.SIGNED or rhs_type.kind is Kind.SIGNED:
+            lhs = _to_int(lhs_type, lhs)
+            rhs = _to_int(rhs_type, rhs)
+        elif lhs_type.kind is Kind.ENUM:
+            if op is ComparisonOperator.EQ:
+                return f"(1 if {lhs} is {rhs} else 0)"
+            if op is ComparisonOperator.NE:
+                return f"(0 if {lhs} is {rhs} else 1)"
+
+        return f"(1 if {lhs} {_comparison[op]} {rhs} else 0)"
@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+from cohdl._core._ir import repr as ir
+from cohdl._core._type_qualifier import (
+    TypeQualifier,
+    Signal,
+    Port,
+    Variable,
+    Temporary,
+    Generic,
+    Offset,
+)
+from cohdl._core._intrinsic import _SensitivityList
+from cohdl.utility import IdMap
+
+
+class StructuralHash:
+    """
+    assigns the same id to all entity templates with
+    identical ports, generics and architectures
+    (the names of internal signals and processes are ignored)
+    """
+
+    def __init__(self):
+        self._ids: dict[tuple, int] = {}
+        self._template_ids: IdMap[ir.EntityTemplate, int] = IdMap()
+
+    def template_id(self, template: ir.EntityTemplate) -> int:
+        if template in self._template_ids:
+            return self._template_ids[template]
+
+        if template.extern():
+            # extern entities are referenced by name, never merge them
+            key = ("extern", id(template))
+        else:
+            key = _TemplateKey(self, template).key()
+
+        result = self._ids.setdefault(key, len(self._ids))
+        self._template_ids[template] = result
+        return result
+
+
+def _value_key(value):
+    if isinstance(value, (tuple, list)):
+        return (type(value), tuple(_value_key(elem) for elem in value))
+
+    if isinstance(value, dict):
+        return (
+            dict,
+            tuple(sorted((repr(k), _value_key(v)) for k, v in value.items())),
+        )
+
+    text = repr(value)
+
+    if " at 0x" in text:
+        # no structural representation available,
+        # only identical objects compare equal
+        return (type(value), id(value))
+
+    return (type(value), text)
+
+
+def _qualifier_key(obj: TypeQualifier):
+    if isinstance(obj, Port):
+        return (Port, obj.direction())
+
+    for qualifier in (Signal, Variable, Temporary, Generic):
+        if isinstance(obj, qualifier):
+            return qualifier
+
+    return type(obj)
+
+
+class _TemplateKey:
+    """
+    builds a hashable representation of an entity template
+    """
+
+    def __init__(self, structural_hash: StructuralHash, template: ir.EntityTemplate):
+        self._structural_hash = structural_hash
+        self._template = template
+
+        # ports and generics are identified by name,
+        # all other objects by the order of their first use
+        self._names: IdMap[TypeQualifier, str] = IdMap()
+        self._roots: IdMap[TypeQualifier, int] = IdMap()
+        self._declarations: list[tuple] = []
+
+        for name, port in template.port_declarations().items():
+            self._names[port] = name
+
+        for name, generic in template.generic_declarations().items():
+            self._names[generic] = name
+
+    def key(self) -> tuple:
+        template = self._template
+        info = template.info()
+
+        ports = tuple(
+            (name, port.direction(), port.type)
+            for name, port in template.port_declarations().items()
+        )
+
+        generics = tuple(
+            (name, generic.type, _value_key(generic._default))
+            for name, generic in template.generic_declarations().items()
+        )
+
+        architecture = self._block(template)
+
+        return (
+            ports,
+            generics,
+            _value_key(info.attributes),
+            architecture,
+            tuple(self._declarations),
+        )
+
+    def _root(self, root: TypeQualifier):
+        if root in self._names:
+            return self._names[root]
+
+        if root not in self._roots:
+            self._roots[root] = len(self._roots)
+            self._declarations.append(
+                (
+                    _qualifier_key(root),
+                    root.type,
+                    _value_key(root.default()) if root.has_default() else None,
+                    root._noreset,
+                    root._maybe_uninitialized,
+                    _value_key(root._attributes),
+                )
+            )
+
+        return self._roots[root]
+
+    def _value(self, value):
+        if not isinstance(value, TypeQualifier):
+            if isinstance(value, (tuple, list)):
+                return tuple(self._value(elem) for elem in value)
+            return _value_key(value)
+
+        ref_spec = []
+
+        for ref in value._ref_spec:
+            if isinstance(ref, Offset):
+                ref_spec.append(("offset", self._value(ref.offset)))
+            else:
+                ref_spec.append(
+                    ("slice", self._value(ref.start), self._value(ref.stop))
+                )
+
+            ref_spec.append(tuple(self._value(elem) for elem in ref.base_offset))
+
+        return (
+            _qualifier_key(value),
+            value.type,
+            self._root(value._root),
+            tuple(ref_spec),
+        )
+
+    def _event(self, event):
+        if isinstance(event, ir.Event):
+            return ("event", event.event_type, self._value(event.sig))
+
+        return (
+            "event_group",
+            event.operation,
+            tuple(self._event(sub) for sub in event.events),
+        )
+
+    def _stmt(self, stmt: ir.Statement):
+        if isinstance(stmt, ir.CodeBlock):
+            return ("code", tuple(self._stmt(sub) for sub in stmt.content()))
+
+        if isinstance(stmt, ir.If):
+            if isinstance(stmt._test, (ir.Event, ir.EventGroup)):
+                test = self._event(stmt._test)
+            else:
+                test = self._value(stmt._test)
+
+            return ("if", test, self._stmt(stmt._body), self._stmt(stmt._orelse))
+
+        if isinstance(stmt, ir.CaseWhen):
+            return (
+                "case",
+                self._value(stmt._value),
+                tuple(
+                    (self._value(branch.cond), self._stmt(branch.code))
+                    for branch in stmt._branches
+                ),
+                None if stmt._default is None else self._stmt(stmt._default),
+            )
+
+        if isinstance(stmt, ir.Comment):
+            return ("comment", tuple(stmt.lines))
+
+        if isinstance(stmt, _leaf_statements):
+            objects = []
+
+            def collect(obj, access):
+                objects.append((access, self._value(obj)))
+                return obj
+
+            stmt.visit_objects(collect)
+
+            if isinstance(stmt, ir.SelectWith):
+                details = (len(stmt._branches), stmt._default is None)
+            else:
+                details = (getattr(stmt, "_op", None), getattr(stmt, "_msg", None))
+
+            return (type(stmt), details, tuple(objects))
+
+        # unknown statements are only equal to themselves
+        return ("unique", id(stmt))
+
+    def _context(self, ctx: ir.Context):
+        if isinstance(ctx, ir.Sequential):
+            if isinstance(ctx._sensitivity, _SensitivityList):
+                sensitivity = tuple(
+                    self._value(sig) for sig in ctx._sensitivity.signals
+                )
+            else:
+                sensitivity = None
+
+            return (
+                "sequential",
+                _value_key(ctx.attributes),
+                sensitivity,
+                (
+                    None
+                    if ctx._always_expr is None
+                    else self._stmt(ctx._always_expr.code())
+                ),
+                self._stmt(ctx.code()),
+            )
+
+        return ("concurrent", _value_key(ctx.attributes), self._stmt(ctx.code()))
+
+    def _block(self, block: ir.Block):
+        if isinstance(block, ir.Entity):
+            return (
+                "entity",
+                self._structural_hash.template_id(block.get_template()),
+                tuple(
+                    (name, self._value(port))
+                    for name, port in block.get_ports().items()
+                ),
+                tuple(
+                    (name, self._value(generic))
+                    for name, generic in block.get_generics().items()
+                ),
+            )
+
+        return (
+            "block",
+            _value_key(block._attributes),
+            tuple(self._block(sub) for sub in block.subblocks()),
+            tuple(self._context(ctx) for ctx in block.contexts()),
+        )
+
+
+_leaf_statements = (
+    ir.Nop,
+    ir.SignalAssignment,
+    ir.SignalPush,
+    ir.VariableAssignment,
+    ir.ResetInstance,
+    ir.BinOp,
+    ir.UnaryOp,
+    ir.Compare,
+    ir.Boolean,
+    ir.All,
+    ir.Any,
+    ir.SelectWith,
+    ir.Assert,
+)
@@ -5,10 +5,14 @@ import enum
 from cohdl._core._ir import repr as ir
 from cohdl._core._type_qualifier import (
     Signal,
+    Variable,
     Temporary,
     Port,
     TypeQualifier,
+    Offset,
+    Generic,
 )
+from cohdl._core._array import Array
 from cohdl.utility import IdMap
 from cohdl.utility.id_map import IdSet
 
@@ -16,6 +20,7 @@ from cohdl._core._inline import InlineRaw, InlineVhdl
 from cohdl._core._intrinsic import _SensitivityAll, _SensitivityList
 
 from . import _vhdl_repr as vhdl
+from ._structural_hash import StructuralHash
 
 
 def assign_temporary(target, source: vhdl.Expression, kwargs):
@@ -40,6 +45,16 @@ class _StmtAssembler:
     #
 
     def apply(self, inp, *args, **kwargs):
+        inlined: IdMap[ir.Statement, Temporary] | None = kwargs.get("inlined")
+
+        if inlined is not None and inp in inlined:
+            # compact mode, the temporary defined by this statement
+            # is formatted in place of its only read
+            kwargs["scope"].inline_temporary(
+                self.apply(inp, **{**kwargs, "inlined": None})
+            )
+            return vhdl.Nop()
+
         if isinstance(
             inp, (ir.SignalAssignment | ir.SignalPush | ir.VariableAssignment)
         ):
@@ -227,6 +242,302 @@ class _StmtAssembler:
         raise AssertionError(f"cannot convert {inp}")
 
 
+#
+#
+#
+# compact mode analysis
+#
+#
+#
+
+# statements, that can read inlined temporaries
+# as part of a larger expression
+_inline_readers = (
+    ir.SignalAssignment,
+    ir.SignalPush,
+    ir.VariableAssignment,
+    ir.BinOp,
+    ir.UnaryOp,
+    ir.Compare,
+    ir.Boolean,
+    ir.All,
+    ir.Any,
+    ir.SelectWith,
+    ir.Assert,
+)
+
+# limits the nesting of inlined expressions
+_max_inline_depth = 8
+
+
+def _with_referenced(operation):
+    # also pass objects used as offsets or slice bounds to operation
+    def visit(obj, access: ir.AccessFlags):
+        if isinstance(obj, TypeQualifier):
+            for ref in obj._ref_spec:
+                if isinstance(ref, Offset):
+                    bounds = [ref.offset]
+                else:
+                    bounds = [ref.start, ref.stop]
+
+                for bound in bounds:
+                    if isinstance(bound, TypeQualifier):
+                        operation(bound, ir.AccessFlags.READ)
+
+        return operation(obj, access)
+
+    return visit
+
+
+def _defined_temporary(stmt: ir.Statement):
+    """
+    returns the temporary defined by stmt, if stmt
+    can be formatted as an expression in place of that temporary
+    """
+
+    if isinstance(stmt, (ir.SignalAssignment, ir.VariableAssignment)):
+        if isinstance(stmt._source, (list, tuple)):
+            return None
+        target = stmt._target
+    elif isinstance(stmt, ir.BinOp):
+        # concatenations have no fixed vhdl type
+        # and cannot be used as operands of conversions
+        if stmt._op is ir.BinOp.Operator.CONCAT:
+            return None
+        target = stmt.result()
+    elif isinstance(stmt, (ir.UnaryOp, ir.Compare, ir.Boolean, ir.All, ir.Any)):
+        target = stmt.result()
+    else:
+        return None
+
+    if (
+        not isinstance(target, Temporary)
+        or target._root is not target
+        or target._maybe_uninitialized
+        or issubclass(target.type, Array)
+    ):
+        return None
+
+    return target
+
+
+def _read_ports(template: ir.EntityTemplate) -> IdSet[Port]:
+    """
+    returns all ports of template, that are read
+    inside its architecture
+    """
+
+    result = IdSet()
+
+    def collect(obj, access: ir.AccessFlags):
+        if isinstance(obj, Port) and access.is_read():
+            result.add(obj._root)
+        return obj
+
+    for ctx in template.all_contexts():
+        ctx.visit_referenced_objects(collect)
+
+    for block in template.all_blocks():
+        if isinstance(block, ir.Entity):
+            declarations = block.get_template().port_declarations()
+
+            for name, port in block.get_ports().items():
+                if not declarations[name].is_output():
+                    _with_referenced(collect)(port, ir.AccessFlags.READ)
+
+    return result
+
+
+def _inlined_roots(kwargs) -> IdSet[Temporary]:
+    inlined = kwargs.get("inlined")
+
+    if inlined is None:
+        return IdSet()
+
+    result = IdSet()
+    result.update(inlined.values())
+    return result
+
+
+class _InlineAnalysis:
+    """
+    searches temporaries that are written once and read once
+    in the same context so the defining expression
+    can be formatted in place of the read
+    """
+
+    class _Access:
+        def __init__(self, ctx, path: tuple, pos: int):
+            self.ctx = ctx
+            self.path = path
+            self.pos = pos
+
+    def __init__(self, template: ir.EntityTemplate):
+        self._writes: IdMap[Temporary, int] = IdMap()
+        self._reads: IdMap[Temporary, int] = IdMap()
+        self._blocked: IdSet[Temporary] = IdSet()
+        self._definitions: list[tuple[Temporary, ir.Statement]] = []
+        self._defined: IdSet[Temporary] = IdSet()
+        self._def_access: IdMap[Temporary, _InlineAnalysis._Access] = IdMap()
+        self._use_access: IdMap[Temporary, _InlineAnalysis._Access] = IdMap()
+        self._operands: IdMap[Temporary, list[TypeQualifier]] = IdMap()
+        self._pos = 0
+
+        for block in template.all_blocks():
+            if isinstance(block, ir.Entity):
+                for port in block.get_ports().values():
+                    self._block(port)
+
+        for ctx in template.all_contexts():
+            if isinstance(ctx, ir.Sequential) and ctx._always_expr is not None:
+                self._walk(ctx._always_expr.code(), ctx._always_expr, (), False)
+
+            self._walk(ctx.code(), ctx, (), True)
+
+    @staticmethod
+    def _count(counter: IdMap, obj) -> int:
+        return counter[obj] if obj in counter else 0
+
+    def _record(self, ctx, path, readable: bool, operands: list | None):
+        def record(obj, access: ir.AccessFlags):
+            if operands is not None and access.is_read():
+                operands.append(obj)
+
+            if not isinstance(obj, Temporary):
+                return obj
+
+            root = obj._root
+
+            if access.is_read():
+                self._reads[root] = self._count(self._reads, root) + 1
+                self._use_access[root] = _InlineAnalysis._Access(ctx, path, self._pos)
+
+                if not readable or len(obj._ref_spec) != 0:
+                    self._blocked.add(root)
+
+            if access.is_written() or access.is_pushed():
+                self._writes[root] = self._count(self._writes, root) + 1
+
+            return obj
+
+        return _with_referenced(record)
+
+    def _block(self, obj):
+        # objects referenced outside of expressions are never inlined
+        def block(obj, access):
+            if isinstance(obj, TypeQualifier):
+                self._blocked.add(obj._root)
+            return obj
+
+        _with_referenced(block)(obj, ir.AccessFlags.READ)
+
+    def _walk(self, stmt, ctx, path: tuple, inline: bool):
+        self._pos += 1
+
+        if isinstance(stmt, ir.CodeBlock):
+            path = (*path, id(stmt))
+
+            for sub in stmt.content():
+                self._walk(sub, ctx, path, inline)
+        elif isinstance(stmt, ir.If):
+            record = self._record(ctx, path, inline, None)
+
+            if isinstance(stmt._test, (ir.Event, ir.EventGroup)):
+                stmt._test.visit_objects(self._record(ctx, path, False, None))
+            else:
+                record(stmt._test, ir.AccessFlags.READ)
+
+            self._walk(stmt._body, ctx, path, inline)
+            self._walk(stmt._orelse, ctx, path, inline)
+        elif isinstance(stmt, ir.CaseWhen):
+            # case expressions must have a locally static subtype
+            self._record(ctx, path, False, None)(stmt._value, ir.AccessFlags.READ)
+
+            for branch in stmt._branches:
+                self._walk(branch.code, ctx, path, inline)
+
+            if stmt._default is not None:
+                self._walk(stmt._default, ctx, path, inline)
+        else:
+            readable = inline and isinstance(stmt, _inline_readers)
+
+            if isinstance(stmt, ir.SelectWith):
+                self._block(stmt._arg)
+
+            defined = _defined_temporary(stmt) if inline else None
+            operands = [] if defined is not None else None
+
+            stmt.visit_objects(self._record(ctx, path, readable, operands))
+
+            if defined is not None:
+                self._definitions.append((defined, stmt))
+                self._defined.add(defined)
+                self._def_access[defined] = _InlineAnalysis._Access(
+                    ctx, path, self._pos
+                )
+                self._operands[defined] = [
+                    op for op in operands if isinstance(op, TypeQualifier)
+                ]
+
+    def inlined_definitions(self) -> IdMap[ir.Statement, Temporary]:
+        result = IdMap()
+        depth: IdMap[Temporary, int] = IdMap()
+
+        for temp, stmt in self._definitions:
+            if (
+                temp in self._blocked
+                or self._count(self._writes, temp) != 1
+                or self._count(self._reads, temp) != 1
+            ):
+                continue
+
+            definition = self._def_access[temp]
+            use = self._use_access[temp]
+
+            if definition.ctx is not use.ctx:
+                continue
+
+            sequential = isinstance(definition.ctx, ir.Sequential)
+
+            if sequential:
+                # the definition must be executed before
+                # the use, whenever the use is executed
+                if (
+                    definition.pos >= use.pos
+                    or use.path[: len(definition.path)] != definition.path
+                ):
+                    continue
+
+            temp_depth = 1
+
+            for op in self._operands[temp]:
+                root = op._root
+
+                if sequential:
+                    # variables could change their value between
+                    # the definition and the use of the temporary
+                    if isinstance(root, Variable):
+                        break
+                    if (
+                        isinstance(root, Temporary)
+                        and self._count(self._writes, root) != 1
+                    ):
+                        break
+
+                if root in depth:
+                    temp_depth = max(temp_depth, depth[root] + 1)
+                elif root in self._defined:
+                    # definition follows the use, don't inline it
+                    # so the nesting depth remains bounded
+                    self._blocked.add(root)
+            else:
+                if temp_depth <= _max_inline_depth:
+                    depth[temp] = temp_depth
+                    result[stmt] = temp
+
+        return result
+
+
 #
 #
 #
@@ -242,10 +553,35 @@ class Context(enum.Enum):
 
 
 class VhdlAssembler:
-    def __init__(self, additional_reserved_names: set[str] = None):
+    def __init__(
+        self,
+        additional_reserved_names: set[str] = None,
+        process_all: bool = False,
+        compact: bool = False,
+        deduplicate: bool = False,
+    ):
         self._known_templates: IdMap[ir.EntityTemplate, vhdl.Entity] = IdMap()
         self._stmt_assembler = _StmtAssembler()
 
+        # when set, processes without explicit sensitivity are
+        # emitted as VHDL-2008 'process(all)' instead of listing
+        # all read signals
+        self._process_all = process_all
+
+        # when set, single use temporaries are inlined,
+        # unread output ports are not buffered and
+        # redundant conversions are omitted
+        self._compact = compact
+
+        # when set, structurally identical entity templates
+        # are merged into a single vhdl entity
+        if deduplicate:
+            self._structural_hash = StructuralHash()
+        else:
+            self._structural_hash = None
+
+        self._merged_templates: dict[int, vhdl.Entity] = {}
+
         if additional_reserved_names is None:
             self._additional_reserved_names = None
         else:
@@ -283,8 +619,17 @@ class VhdlAssembler:
             if inp in self._get_known_templates():
                 return self._get_known_templates()[inp]
 
+            if self._structural_hash is not None:
+                template_id = self._structural_hash.template_id(inp)
+
+                if template_id in self._merged_templates:
+                    ret = self._merged_templates[template_id]
+                    self._add_template(inp, ret)
+                    return ret
+
             module_scope = vhdl.ModuleScope(
-                additional_reserved_names=self._additional_reserved_names
+                additional_reserved_names=self._additional_reserved_names,
+                compact=self._compact,
             )
             entity_scope = vhdl.EntityScope(module_scope)
             arch_scope = vhdl.ArchScope(entity_scope)
@@ -309,7 +654,21 @@ class VhdlAssembler:
             blocks = []
 
             # search buffer ports
-            buffer_ports = output_ports
+            if self._compact:
+                # ports without default values are only buffered,
+                # when they are read inside the architecture
+                read_ports = _read_ports(inp)
+                buffer_ports = [
+                    port
+                    for port in output_ports
+                    if port.has_default() or port in read_ports
+                ]
+                kwargs = {
+                    **kwargs,
+                    "inlined": _InlineAnalysis(inp).inlined_definitions(),
+                }
+            else:
+                buffer_ports = output_ports
             # create buffer signals
             buffer_assignments = []
 
@@ -344,9 +703,12 @@ class VhdlAssembler:
             # assign buffer to port
             # use buffer instead of port
 
-            blocks.append(
-                vhdl.Concurrent(arch_scope, buffer_assignments, "buffer assignment", {})
-            )
+            if len(buffer_assignments) != 0 or not self._compact:
+                blocks.append(
+                    vhdl.Concurrent(
+                        arch_scope, buffer_assignments, "buffer assignment", {}
+                    )
+                )
 
             # convert subblocks
             for block in inp.subblocks():
@@ -367,6 +729,9 @@ class VhdlAssembler:
 
             self._add_template(inp, ret)
 
+            if self._structural_hash is not None:
+                self._merged_templates[template_id] = ret
+
             module_scope.complete_setup()
 
             return ret
@@ -382,9 +747,10 @@ class VhdlAssembler:
 
         if isinstance(inp, ir.Concurrent):
             parent_scope: vhdl.VhdlScope = kwargs["parent_scope"]
+            inlined_roots = _inlined_roots(kwargs)
 
             def collect_objects(obj, access):
-                if isinstance(obj, TypeQualifier):
+                if isinstance(obj, TypeQualifier) and obj._root not in inlined_roots:
                     parent_scope.declare(obj._root)
                 return obj
 
@@ -394,7 +760,12 @@ class VhdlAssembler:
                 parent_scope,
                 [
                     _StmtAssembler.convert_statement(
-                        stmt, **{**kwargs, "context": Context.CONCURRENT}
+                        stmt,
+                        **{
+                            **kwargs,
+                            "context": Context.CONCURRENT,
+                            "scope": parent_scope,
+                        },
                     )
                     for stmt in inp.code().content()
                 ],
@@ -406,9 +777,28 @@ class VhdlAssembler:
             parent_scope: vhdl.VhdlScope = kwargs["parent_scope"]
             scope = vhdl.ProcessScope(parent_scope)
 
+            # since process(all) is not supported prior to VHDL-2008
+            # search for all signals, that are read in the process
+            # and specify them explicitly in the sensitivity list
+            # (done in the same traversal that declares all objects,
+            # the list is ordered by the first read of each signal)
+            collect_sensitivity = (
+                isinstance(inp._sensitivity, _SensitivityAll) and not self._process_all
+            )
+            read_roots = IdSet()
+            inlined_roots = _inlined_roots(kwargs)
+
             def collect_objects(obj, access):
-                if isinstance(obj, TypeQualifier):
+                if isinstance(obj, TypeQualifier) and obj._root not in inlined_roots:
                     scope.declare(obj._root)
+
+                    if (
+                        collect_sensitivity
+                        and access is ir.AccessFlags.READ
+                        and isinstance(obj, Signal)
+                        and not isinstance(obj._root, Generic)
+                    ):
+                        read_roots.add(obj._root)
                 return obj
 
             inp.visit_referenced_objects(collect_objects)
@@ -416,7 +806,14 @@ class VhdlAssembler:
             kwargs = {**kwargs, "context": Context.SEQUENTIAL}
 
             code = vhdl.CodeBlock(
-                [self.convert_stmt(inp._code, context=Context.SEQUENTIAL)]
+                [
+                    self.convert_stmt(
+                        inp._code,
+                        context=Context.SEQUENTIAL,
+                        scope=scope,
+                        inlined=kwargs.get("inlined"),
+                    )
+                ]
             )
 
             #
@@ -428,19 +825,7 @@ class VhdlAssembler:
             if proc_name is None:
                 proc_name = "process"
 
-            # since process(all) is not supported prior to VHDL-2008
-            # instead search for all signals, that are read in the process
-            # and specify them explicitly in the sensitivity list
-            if isinstance(inp._sensitivity, _SensitivityAll):
-                read_roots = IdSet()
-
-                def find_read_roots(obj, access: ir.AccessFlags):
-                    if access is ir.AccessFlags.READ and isinstance(obj, Signal):
-                        read_roots.add(obj._root)
-                    return obj
-
-                inp.visit_referenced_objects(find_read_roots)
-
+            if collect_sensitivity:
                 sensitivity = _SensitivityList(read_roots)
             else:
                 sensitivity = inp._sensitivity
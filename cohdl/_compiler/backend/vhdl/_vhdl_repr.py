@@ -10,7 +10,6 @@ from cohdl._core._primitive_type import _PrimitiveType
 from cohdl._core._type_qualifier import (
     Port,
     TypeQualifier,
-    Generic,
     RefSpec,
     Offset,
     Slice,
@@ -292,7 +291,9 @@ class BinOp(Expression):
                 self._rhs.result = self._rhs.result.bitvector
 
         op = BinOp.operator_string[self._op]
-        return f"({self._lhs.write(scope)}) {op} ({self._rhs.write(scope)})"
+        lhs = scope.format_operand(self._lhs.write(scope))
+        rhs = scope.format_operand(self._rhs.write(scope))
+        return f"{lhs} {op} {rhs}"
 
 
 class UnaryOp(Expression):
@@ -325,23 +326,31 @@ class UnaryOp(Expression):
             return f"{op}({self._arg.write(scope)})"
 
 
+def _write_assigned_source(scope: VhdlScope, target: Target, source: Expression):
+    decayed_target = TypeQualifier.decay(target.result)
+
+    if isinstance(decayed_target, Array):
+        return source.write(scope, decayed_target)
+
+    result = scope.format_cast(target.result, source.result, source.write(scope))
+
+    if scope._compact:
+        while _is_enclosed(result):
+            result = result[1:-1]
+
+    return result
+
+
 class SignalAssignment(Statement):
     def __init__(self, target: Target, source: Expression):
         self._target = target
         self._source = source
 
     def write(self, scope: VhdlScope) -> str:
-        decayed_target = TypeQualifier.decay(self._target.result)
-        is_array = isinstance(decayed_target, Array)
-
         target = self._target.write(scope)
-
-        if is_array:
-            source = self._source.write(scope, decayed_target)
-            return f"{target} <= {source};"
-        else:
-            source = self._source.write(scope)
-            return f"{target} <= {scope.format_cast(self._target.result, self._source.result, source)};"
+        return (
+            f"{target} <= {_write_assigned_source(scope, self._target, self._source)};"
+        )
 
 
 class VariableAssignment(Statement):
@@ -354,17 +363,10 @@ class VariableAssignment(Statement):
         self._source = source
 
     def write(self, scope: VhdlScope) -> str:
-        decayed_target = TypeQualifier.decay(self._target.result)
-        is_array = isinstance(decayed_target, Array)
-
         target = self._target.write(scope)
-
-        if is_array:
-            source = self._source.write(scope, decayed_target)
-            return f"{target} := {source};"
-        else:
-            source = self._source.write(scope)
-            return f"{target} := {scope.format_cast(self._target.result, self._source.result, source)};"
+        return (
+            f"{target} := {_write_assigned_source(scope, self._target, self._source)};"
+        )
 
 
 class If(Statement):
@@ -565,6 +567,185 @@ class InlineCode(Expression):
 #
 
 
+_vector_conversions = ("std_logic_vector", "unsigned", "signed")
+
+
+def _closing_paren(text: str, start: int) -> int:
+    # returns the position of the parenthesis closing text[start]
+    depth = 0
+
+    for pos in range(start, len(text)):
+        if text[pos] == "(":
+            depth += 1
+        elif text[pos] == ")":
+            depth -= 1
+
+            if depth == 0:
+                return pos
+
+    return -1
+
+
+def _is_enclosed(text: str) -> bool:
+    """
+    check if text is enclosed in a single pair of parentheses
+    """
+
+    return text.startswith("(") and _closing_paren(text, 0) == len(text) - 1
+
+
+def _is_primary(text: str) -> bool:
+    """
+    check if text can be used as an operand of
+    another expression without enclosing parentheses
+    """
+
+    if text.startswith("-"):
+        return False
+
+    depth = 0
+
+    for char in text:
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == " " and depth == 0:
+            return False
+
+    return True
+
+
+def _split_call(text: str) -> Tuple[str, str] | None:
+    """
+    split text of the form 'name(arg)' into name and arg,
+    returns None if text is not a single function call
+    """
+
+    name, sep, _ = text.partition("(")
+
+    if not sep or not name.isidentifier():
+        return None
+
+    if _closing_paren(text, len(name)) != len(text) - 1:
+        return None
+
+    return name, text[len(name) + 1 : -1]
+
+
+def _simplify_call(text: str) -> str:
+    """
+    Conversions between std_logic_vector, unsigned and signed
+    do not change the converted bits, replace nested
+    conversions like 'unsigned(std_logic_vector(x))' with 'unsigned(x)'.
+    Also removes redundant parentheses around the argument.
+    """
+
+    call = _split_call(text)
+
+    if call is None:
+        return text
+
+    name, arg = call
+
+    if name in _vector_conversions:
+        inner = _split_call(arg)
+
+        while inner is not None and inner[0] in _vector_conversions:
+            arg = inner[1]
+            inner = _split_call(arg)
+
+    while _is_enclosed(arg):
+        arg = arg[1:-1]
+
+    return f"{name}({arg})"
+
+
+class FormatCache:
+    """
+    memo tables for strings produced by the format methods of VhdlScope
+
+    Formatting is only valid after the setup of a scope is complete,
+    at that point all names are fixed and the same object
+    always produces the same string.
+    """
+
+    tables = ("type", "literal", "ref")
+
+    class Stats:
+        """
+        number of cache hits and misses per table,
+        shared by all scopes of one entity
+        """
+
+        def __init__(self):
+            self.hits = {table: 0 for table in FormatCache.tables}
+            self.misses = {table: 0 for table in FormatCache.tables}
+
+        def __add__(self, other: FormatCache.Stats) -> FormatCache.Stats:
+            result = FormatCache.Stats()
+
+            for table in FormatCache.tables:
+                result.hits[table] = self.hits[table] + other.hits[table]
+                result.misses[table] = self.misses[table] + other.misses[table]
+
+            return result
+
+        def hit_rate(self, table: str | None = None) -> float:
+            if table is None:
+                hits = sum(self.hits.values())
+                total = hits + sum(self.misses.values())
+            else:
+                hits = self.hits[table]
+                total = hits + self.misses[table]
+
+            return 0.0 if total == 0 else hits / total
+
+        def __str__(self):
+            return "\n".join(
+                f"{table}: hits={self.hits[table]}, misses={self.misses[table]}"
+                for table in FormatCache.tables
+            )
+
+    def __init__(self, stats: FormatCache.Stats):
+        self.stats = stats
+        self._content = {table: {} for table in FormatCache.tables}
+
+    def lookup(self, table: str, key, fn, *args) -> str:
+        """
+        return the cached result for key or
+        store and return the result of fn(*args)
+        """
+
+        content = self._content[table]
+
+        if key in content:
+            self.stats.hits[table] += 1
+            return content[key]
+
+        self.stats.misses[table] += 1
+        result = content[key] = fn(*args)
+        return result
+
+    def lookup_obj(self, table: str, obj, extra, fn, *args) -> str:
+        """
+        like lookup but keyed by the identity of obj and an additional hashable value,
+        obj is kept alive by the cache so its id cannot be reused
+        """
+
+        content = self._content[table]
+        key = (id(obj), extra)
+
+        if key in content:
+            self.stats.hits[table] += 1
+            return content[key][1]
+
+        self.stats.misses[table] += 1
+        result = fn(*args)
+        content[key] = (obj, result)
+        return result
+
+
 class VhdlScope:
     class _VectorSliceHint:
         """
@@ -596,7 +777,16 @@ class VhdlScope:
         self._declarations: IdMap[typing.Any, VhdlScope.Declaration] = IdMap()
         self._used_names: set[str] = set()
 
-        if parent is not None:
+        if parent is None:
+            self._format_cache = FormatCache(FormatCache.Stats())
+            self._compact = False
+            self._inlined: IdMap[Temporary, SignalAssignment | VariableAssignment] = (
+                IdMap()
+            )
+        else:
+            self._format_cache = FormatCache(parent._format_cache.stats)
+            self._compact = parent._compact
+            self._inlined = parent._inlined
             parent._subscopes.append(self)
 
     def reserve_name(self, name):
@@ -784,6 +974,28 @@ class VhdlScope:
     # the following functions are valid after setup is complete
     #
 
+    def inline_temporary(self, assignment: SignalAssignment | VariableAssignment):
+        """
+        format the source of the given assignment in place of
+        its target, instead of declaring the target
+        (only used in compact mode)
+        """
+        self._inlined[assignment._target.result] = assignment
+
+    def format_operand(self, value_str: str) -> str:
+        # enclose operands of binary operators in parentheses
+        if self._compact and _is_enclosed(value_str):
+            return value_str
+        return f"({value_str})"
+
+    def _format_inlined(self, root: Temporary) -> str:
+        assignment = self._inlined[root]
+        result = _write_assigned_source(self, assignment._target, assignment._source)
+
+        if _is_primary(result) or _is_enclosed(result):
+            return result
+        return f"({result})"
+
     def declarations(self) -> dict:
         return {decl.name: decl.obj for decl in self._declarations.values()}
 
@@ -796,6 +1008,10 @@ class VhdlScope:
 
         raise AssertionError(f"object {obj} not declared in scope")
 
+    def format_cache_stats(self) -> FormatCache.Stats:
+        # statistics are shared by all scopes with a common root
+        return self._format_cache.stats
+
     def dump(self) -> TextBlock:
         local_decl = []
 
@@ -856,12 +1072,22 @@ class VhdlScope:
             obj_type = obj.type
 
             if constrain:
+                # case and select expressions require a locally static subtype,
+                # a plain slice is rejected by VHDL-93 even in compact mode
                 if issubclass(obj_type, Unsigned):
                     return f"unsigned'({slice_result})", Unsigned[width]
                 if issubclass(obj_type, Signed):
                     return f"signed'({slice_result})", Signed[width]
                 return f"std_logic_vector'({slice_result})", BitVector[width]
 
+            if self._compact and obj._root is obj:
+                # the slice already has the vhdl type of the sliced root
+                if issubclass(obj_type, Unsigned):
+                    return slice_result, Unsigned[width]
+                if issubclass(obj_type, Signed):
+                    return slice_result, Signed[width]
+                return slice_result, BitVector[width]
+
             if issubclass(obj_type, Unsigned):
                 return f"unsigned({slice_result})", Unsigned[width]
             if issubclass(obj_type, Signed):
@@ -871,6 +1097,16 @@ class VhdlScope:
         raise AssertionError("error, cannot format input")
 
     def format_literal(self, obj) -> str:
+        if isinstance(obj, (BitVector, Array)):
+            # vector and array literals are expensive to format and
+            # the same objects (for example default values) are used repeatedly
+            return self._format_cache.lookup_obj(
+                "literal", obj, None, self._format_literal, obj
+            )
+
+        return self._format_literal(obj)
+
+    def _format_literal(self, obj) -> str:
         if isinstance(obj, (cohdl_enum.Enum, cohdl_enum.DynamicEnum)):
             return obj.name
 
@@ -887,9 +1123,9 @@ class VhdlScope:
             return f"'{obj}'"
         if isinstance(obj, BitVector):
             if isinstance(obj, Unsigned):
-                return f"unsigned'({self.format_literal(obj.bitvector)})"
+                return f"unsigned'({self._format_literal(obj.bitvector)})"
             if isinstance(obj, Signed):
-                return f"signed'({self.format_literal(obj.bitvector)})"
+                return f"signed'({self._format_literal(obj.bitvector)})"
             return f'"{obj}"'
         if isinstance(obj, Integer):
             return f"{obj}"
@@ -901,29 +1137,22 @@ class VhdlScope:
         if obj is Full:
             return ">>FULL_LITERAL>>"
 
-        if not isinstance(obj, Array):
-            assert isinstance(obj, Generic)
-
-            obj = obj._wrapped
-
-            if isinstance(obj, (int, float)):
-                return str(obj)
-            elif isinstance(obj, str):
-                return f'"{obj}"'
-        else:
+        if isinstance(obj, Array):
             val = obj._value
             assert val is not None, "array has no default value"
             elemtype = obj._elemtype_
 
             # use ( 0 => ELEM0, 1 => ELEM1 ) notation because
             # ( ELEM0, ELEM1 ) form is not allowed for arrays with only a single element
+            # elements are only converted when their type does not
+            # match the element type, copying them is expensive for large arrays
             elemstr = [
-                f"{nr} => {self.format_literal(elemtype(elem))}"
+                f"{nr} => {self._format_literal(elem if type(elem) is elemtype else elemtype(elem))}"
                 for nr, elem in enumerate(val)
             ]
 
             if len(val) < obj._count_:
-                elemstr.append(f"others => {self.format_literal(elemtype())}")
+                elemstr.append(f"others => {self._format_literal(elemtype())}")
 
             return f'( {", ".join(elemstr)} )'
 
@@ -1009,6 +1238,15 @@ class VhdlScope:
         if isinstance(obj, TypeQualifier):
             obj = obj.get()
 
+        if isinstance(obj, Integer):
+            assert obj.get_value() is not None
+
+        # the formatted type only depends on the type of obj
+        # (parameterized types like BitVector[8] are unique classes)
+        key = obj if isinstance(obj, type) else type(obj)
+        return self._format_cache.lookup("type", key, self._format_type, obj)
+
+    def _format_type(self, obj) -> str:
         if isinstance(obj, (_boolean._Boolean)) or obj is bool:
             return "boolean"
         if isinstance(obj, Bit):
@@ -1075,30 +1313,45 @@ class VhdlScope:
             return f"( {components} )"
         else:
             assert isinstance(obj, TypeQualifier)
-            root_name = self.lookup_name(obj._root)
-
-            if len(obj._ref_spec) == 0:
-                result = self.format_vhdl_cast(obj, root_name)
-            else:
-                result = root_name
-                parent = obj._root
-
-                for ref in obj._ref_spec:
-                    result, result_type = self._format_ref(
-                        parent, result, ref, False, constrain
-                    )
-                    parent = ref.obj
-
-                result = self.format_cast(obj.copy(), Signal[result_type](), result)
+            result = self._format_cache.lookup_obj(
+                "ref", obj, constrain, self._format_qualifier, obj, constrain
+            )
 
         if target_hint is None:
             return result
 
         return self.format_cast(target_hint, obj, result)
 
+    def _format_qualifier(self, obj: TypeQualifier, constrain: bool) -> str:
+        if self._compact and obj._root in self._inlined:
+            root_name = self._format_inlined(obj._root)
+        else:
+            root_name = self.lookup_name(obj._root)
+
+        if len(obj._ref_spec) == 0:
+            return self.format_vhdl_cast(obj, root_name)
+
+        result = root_name
+        parent = obj._root
+
+        for ref in obj._ref_spec:
+            result, result_type = self._format_ref(
+                parent, result, ref, False, constrain
+            )
+            parent = ref.obj
+
+        return self.format_cast(obj.copy(), Signal[result_type](), result)
+
     def format_target(self, obj):
         assert isinstance(obj, (Signal, Variable, Temporary))
 
+        # use a separate key from format_value since
+        # targets are formatted without casts
+        return self._format_cache.lookup_obj(
+            "ref", obj, "target", self._format_target, obj
+        )
+
+    def _format_target(self, obj) -> str:
         root = obj._root
         result = self.lookup_name(root)
         parent = root
@@ -1157,12 +1410,33 @@ class VhdlScope:
 
         raise AssertionError(f"assignment not supported {vhdl_type} -> {value.type}")
 
+    def _format_constant_as(self, target_type, value) -> str:
+        """
+        format a constant value (Null, Full or a BitVector)
+        as a literal of target_type
+        """
+
+        def convert():
+            return self._format_literal(target_type(value))
+
+        if isinstance(value, _NullFullType):
+            return self._format_cache.lookup("literal", (target_type, value), convert)
+
+        return self._format_cache.lookup_obj("literal", value, target_type, convert)
+
     def format_cast(self, target, value, value_str):
         """
         wrap value_str that corresponds to value in a cast function
         to make it assignable to target
         """
 
+        result = self._format_cast(target, value, value_str)
+
+        if self._compact:
+            return _simplify_call(result)
+        return result
+
+    def _format_cast(self, target, value, value_str):
         target_type = type(TypeQualifier.decay(target))
         value_type = type(TypeQualifier.decay(value))
 
@@ -1193,7 +1467,7 @@ class VhdlScope:
             if issubclass(value_type, _Boolean):
                 return f"cohdl_bool_to_std_logic({value_str})"
             if issubclass(value_type, _NullFullType):
-                return self.format_literal(target_type(value))
+                return self._format_constant_as(target_type, value)
 
         elif issubclass(target_type, (_Boolean, bool)):
             if issubclass(value_type, (_Boolean, bool)):
@@ -1210,7 +1484,7 @@ class VhdlScope:
 
         elif issubclass(target_type, BitVector):
             if issubclass(value_type, _NullFullType) or isinstance(value, BitVector):
-                return self.format_literal(vhdl_target_type(value))
+                return self._format_constant_as(vhdl_target_type, value)
 
             if issubclass(value_type, Integer):
                 if issubclass(target_type, Unsigned):
@@ -1453,8 +1727,11 @@ class ModuleScope(VhdlScope):
         "resize",
     }
 
-    def __init__(self, *, additional_reserved_names: set[str] = None):
+    def __init__(
+        self, *, additional_reserved_names: set[str] = None, compact: bool = False
+    ):
         super().__init__()
+        self._compact = compact
 
         if additional_reserved_names is None:
             additional_reserved_names = set()
@@ -1478,6 +1755,14 @@ class AliasScope:
 
         self.__dict__ = baseObject.__dict__
         self.__class__._alias_map_ = IdMap()  # type: ignore
+        self.__class__._alias_format_cache_ = FormatCache(baseObject._format_cache.stats)  # type: ignore
+
+    @property
+    def _format_cache(self) -> FormatCache:
+        # The alias scope shares __dict__ with the aliased scope
+        # but resolves names differently. Use a separate cache
+        # so cached names of aliased objects don't leak between them.
+        return self.__class__._alias_format_cache_  # type: ignore
 
     def set_alias(self, obj, replacement):
         self.__class__._alias_map_[obj] = replacement  # type: ignore
@@ -1564,9 +1849,21 @@ class Entity(Instance):
         self._blocks.append(block)
 
     def _generic_declarations(self) -> list[str]:
-        raise AssertionError(
-            "not implemented, generics can only be used when instantiating external entities"
-        )
+        ret = []
+
+        for name, generic in self._generics.items():
+            decl = f"{name} : {self._scope.format_type(generic)}"
+
+            if generic.has_default():
+                decl += f" := {self._scope.format_literal(generic.default())}"
+
+            ret.append(decl + ";")
+
+        if len(ret) != 0:
+            # remove terminating semicolon
+            ret[-1] = ret[-1][:-1]
+
+        return ret
 
     def _port_declarations(self) -> list[str]:
         ret = []
@@ -1620,9 +1917,15 @@ class Entity(Instance):
         )
 
     def _entity_declaration(self) -> TextBlock:
+        if len(self._generics) == 0:
+            generics = []
+        else:
+            generics = [IndentBlock(self._generic_map())]
+
         return TextBlock(
             [
                 f"entity {self._name} is",
+                *generics,
                 IndentBlock(self._port_map()),
                 f"end {self._name};",
             ]
@@ -1845,6 +2148,10 @@ class EntityInst(Instance):
         generic_map: list[Tuple[str, str]] = []
 
         for generic_name in entity._generics:
+            if generic_name not in self._generics:
+                # use default value of generic
+                continue
+
             generic_map.append(
                 (
                     generic_name,
@@ -1854,6 +2161,9 @@ class EntityInst(Instance):
                 )
             )
 
+        if len(generic_map) == 0:
+            return []
+
         line_end = [","] * (len(generic_map) - 1) + [""]
 
         return [
@@ -1862,7 +2172,7 @@ class EntityInst(Instance):
                 f"{port_name} => {local}{sep}"
                 for (port_name, local), sep in zip(generic_map, line_end)
             ],
-            ");",
+            ")",
         ]
 
     def _port_map(self) -> list[str]:
@@ -1909,6 +2219,24 @@ class EntityInst(Instance):
 
 
 import os
+import multiprocessing
+import concurrent.futures
+
+# library written by a worker process of Library._write_entities,
+# only set in the worker processes by the pool initializer
+_worker_library: Library | None = None
+
+
+def _init_worker(library: Library):
+    global _worker_library
+    _worker_library = library
+
+
+def _write_entity_worker(index: int) -> tuple[str, FormatCache.Stats]:
+    # the statistics are returned with the result,
+    # because the caches of the worker are discarded when it exits
+    entity = _worker_library._entities[index]
+    return entity.write(), entity.scope().format_cache_stats()
 
 
 class Library(Instance):
@@ -1942,17 +2270,70 @@ class Library(Instance):
     def top_entity(self):
         return self._top_entity
 
-    def write(self):
-        return TextBlock([entity.write() for entity in self._entities]).dump()
+    def format_cache_stats(self) -> FormatCache.Stats:
+        """
+        combined statistics of the format caches of all entities in the library
+        """
 
-    def write_dir(self, path):
-        file_list = []
+        result = FormatCache.Stats()
 
         for entity in self._entities:
+            result = result + entity.scope().format_cache_stats()
+
+        return result
+
+    def _write_entities(self, jobs: int | None = None) -> list[str]:
+        """
+        write all entities of the library and return the resulting
+        strings in the same order as self._entities
+
+        When jobs is larger than one, the entities are written concurrently
+        by forked worker processes. Entities are independent after scope setup
+        is complete so each worker only reads the scope tables inherited
+        from the parent process. The format cache statistics
+        of the workers are copied back to the entities in this process.
+        On platforms without fork the entities are written sequentially,
+        because the formatting is pure Python code and would not benefit
+        from threads (and the format caches are not synchronized).
+        """
+
+        if jobs is None or jobs <= 1 or len(self._entities) <= 1:
+            return [entity.write() for entity in self._entities]
+
+        if "fork" not in multiprocessing.get_all_start_methods():
+            return [entity.write() for entity in self._entities]
+
+        jobs = min(jobs, len(self._entities))
+
+        with concurrent.futures.ProcessPoolExecutor(
+            jobs,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_init_worker,
+            initargs=(self,),
+        ) as executor:
+            results = list(
+                executor.map(_write_entity_worker, range(len(self._entities)))
+            )
+
+        for entity, (_, worker_stats) in zip(self._entities, results):
+            # the worker started with a copy of the statistics of this process
+            stats = entity.scope().format_cache_stats()
+            stats.hits.update(worker_stats.hits)
+            stats.misses.update(worker_stats.misses)
+
+        return [content for content, _ in results]
+
+    def write(self, jobs: int | None = None):
+        return TextBlock(self._write_entities(jobs)).dump()
+
+    def write_dir(self, path, jobs: int | None = None):
+        file_list = []
+
+        for entity, content in zip(self._entities, self._write_entities(jobs)):
             file_path = os.path.join(path, f"{entity.name()}.vhd")
             file_list.append(file_path)
 
             with open(file_path, "w") as file:
-                print(entity.write(), file=file)
+                print(content, file=file)
 
         return file_list
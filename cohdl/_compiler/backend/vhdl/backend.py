@@ -1,8 +1,18 @@
 from cohdl._compiler.backend.vhdl._vhdl_assembler import VhdlAssembler, VhdlMakeLibrary
 
 
-def generate_vhdl(input, *, additional_reserved_names: set[str] = None):
-    vhdl = VhdlAssembler(additional_reserved_names=additional_reserved_names).apply(
-        input
-    )
+def generate_vhdl(
+    input,
+    *,
+    additional_reserved_names: set[str] = None,
+    process_all: bool = False,
+    compact: bool = False,
+    deduplicate: bool = False,
+):
+    vhdl = VhdlAssembler(
+        additional_reserved_names=additional_reserved_names,
+        process_all=process_all,
+        compact=compact,
+        deduplicate=deduplicate,
+    ).apply(input)
     return VhdlMakeLibrary().apply(vhdl)
@@ -397,6 +397,8 @@ class IrGenerator:
                         # contained await expressions to overwrite them
                         block.addfront(ir._Transition(new_state))
 
+                new_state._origin = ir.Statement._current_frame
+
                 result_list = self.apply(
                     inp.bound_statements(), open_blocks=[new_state.code()]
                 )
@@ -460,6 +462,8 @@ class IrGenerator:
 
                 ctx.add_state(new_state)
 
+            new_state._origin = ir.Statement._current_frame
+
             # evaluate bound statements before continuing with
             # actual code of while loop
             open_blocks = self._convert_bound(inp, [new_state._open_block])
@@ -555,6 +559,7 @@ class IrGenerator:
             parent_block = open_blocks[0]
 
             ctx = ir.StatemachineContext.enter(inp._name)
+            ctx.first_state()._origin = inp._location
 
             statemachine_end = self.apply(inp._body, open_blocks=[ctx.first_block()])
 
@@ -3,6 +3,8 @@ from __future__ import annotations
 import ast
 import inspect
 import builtins
+import collections
+import types
 
 import typing
 from typing import Iterable, Any, cast
@@ -47,7 +49,7 @@ from cohdl._core._context import Context, ContextType
 from cohdl._core._context import _block_stack
 from cohdl.utility.virtual_traceback import VirtualFrame
 
-from ._value_branch import _MergedBranch, _ValueBranch, ObjTraits
+from ._value_branch import _MergedBranch, ObjTraits
 from . import _prepare_ast_out as out
 from cohdl._core._boolean import _Boolean, _BooleanLiteral
 from cohdl._core._boolean import true as cohdl_true
@@ -89,6 +91,44 @@ def _make_static_comparable(lhs, rhs):
     return lhs, type(lhs_val)(rhs)
 
 
+# converted branches of read only select tables (for example the
+# memoized lookup tables of std), keyed by table identity and selector type
+_select_branch_cache: collections.OrderedDict = collections.OrderedDict()
+_SELECT_BRANCH_CACHE_SIZE = 256
+
+
+def _select_branches(arg, branches) -> list | tuple:
+    def convert():
+        return [
+            (
+                # convert cond from str literal to compatible primitive
+                # according to argument
+                _make_static_comparable(arg, cond)[1],
+                expr,
+            )
+            for cond, expr in branches.items()
+        ]
+
+    if not isinstance(branches, types.MappingProxyType):
+        return convert()
+
+    key = (id(branches), type(_type_qualifier.TypeQualifier.decay(arg)))
+    cached = _select_branch_cache.get(key)
+
+    # the table is stored in the cache entry, so its id cannot be reused
+    if cached is not None and cached[0] is branches:
+        _select_branch_cache.move_to_end(key)
+        return cached[1]
+
+    result = tuple(convert())
+    _select_branch_cache[key] = (branches, result)
+
+    if len(_select_branch_cache) > _SELECT_BRANCH_CACHE_SIZE:
+        _select_branch_cache.popitem(last=False)
+
+    return result
+
+
 #
 #
 #
@@ -292,7 +332,7 @@ class PrepareAst:
             # RuntimeWarning: coroutine was never awaited
             result.coro.close()
 
-            return out.Statemachine(sub._code, result.coro.__name__)
+            return out.Statemachine(sub._code, result.coro.__name__, fn_def.location())
 
         if isinstance(result, _ResetContext):
             return out.ResetContext()
@@ -301,16 +341,7 @@ class PrepareAst:
             return out.ResetPushed()
 
         if isinstance(result, _SelectWith):
-            branches = [
-                (
-                    # convert cond from str literal to compatible primitive
-                    # according to argument
-                    _make_static_comparable(result.arg, cond)[1],
-                    expr,
-                )
-                for cond, expr in result.branches.items()
-            ]
-
+            branches = _select_branches(result.arg, result.branches)
             return out.SelectWith(result.arg, branches, result.default)
 
         if isinstance(result, _Any):
@@ -661,39 +692,36 @@ class PrepareAst:
             return PrepareAst(fn, self._context, self, noreturn=noreturn).convert_call()
 
         if isinstance(fn, _MergedBranch):
-            first, *rest = fn.branches
+            # branches can contain merged branches of nested conditional
+            # expressions, all of them must resolve to the same function
+            first, *rest = fn._leaves()
 
-            is_builtin_method = type(first.obj) is type("".__eq__)
+            is_builtin_method = type(first) is type("".__eq__)
 
-            if is_builtin_method or inspect.ismethod(first.obj):
+            if is_builtin_method or inspect.ismethod(first):
                 if is_builtin_method:
-                    func = getattr(type(first.obj.__self__), first.obj.__name__)
+                    func = getattr(type(first.__self__), first.__name__)
 
                     for r in rest:
                         assert func is getattr(
-                            type(r.obj.__self__), r.obj.__name__
+                            type(r.__self__), r.__name__
                         ), "methods in merged branch differ"
                 else:
-                    func = first.obj.__func__
+                    func = first.__func__
 
                     for r in rest:
-                        assert func is r.obj.__func__, "methods in merged branch differ"
+                        assert func is r.__func__, "methods in merged branch differ"
 
-                merged_self = _MergedBranch(
-                    [
-                        _ValueBranch(branch.hook, branch.obj.__self__)
-                        for branch in fn.branches
-                    ]
-                )
+                merged_self = fn._map(lambda method: method.__self__)
 
                 args.insert(0, merged_self)
                 fn = func
 
             else:
-                fn = first.obj
+                fn = first
 
                 for r in rest:
-                    assert fn is r.obj, "functions in merged branch differ"
+                    assert fn is r, "functions in merged branch differ"
 
         is_builtin_method = type(fn) is type("".__eq__)
         original_fn = fn
@@ -691,10 +691,12 @@ class CondSelect(Statement):
 
 
 class Statemachine(Statement):
-    def __init__(self, body: CodeBlock, name: str):
+    def __init__(self, body: CodeBlock, name: str, location=None):
         super().__init__()
         self._body = body
         self._name = name
+        # source location of the coroutine function
+        self._location = location
 
     def dump(self) -> IndentBlock:
         return IndentBlock(title="Statemachine", content=self._body.dump())
@@ -263,6 +263,30 @@ class _MergedBranch:
 
         return all(a.obj is b.obj for a, b in zip(self.branches, other.branches))
 
+    def _leaves(self):
+        # all possible objects, including those of nested merged branches
+        for branch in self.branches:
+            if isinstance(branch.obj, _MergedBranch):
+                yield from branch.obj._leaves()
+            else:
+                yield branch.obj
+
+    def _map(self, fn):
+        # applies fn to all possible objects, keeps the branch structure
+        return _MergedBranch(
+            [
+                _ValueBranch(
+                    branch.hook,
+                    (
+                        branch.obj._map(fn)
+                        if isinstance(branch.obj, _MergedBranch)
+                        else fn(branch.obj)
+                    ),
+                )
+                for branch in self.branches
+            ]
+        )
+
     def _getitem(self, *args):
         return _MergedBranch([branch.__getitem__(*args) for branch in self.branches])
 
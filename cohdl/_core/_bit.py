@@ -3,7 +3,8 @@ from __future__ import annotations
 import enum
 
 from ._primitive_type import _PrimitiveType
-from ._boolean import Null, _NullFullType, _Boolean
+from ._boolean import Null, _NullFullType, _Boolean, true, false
+from ._integer import Integer
 from ._intrinsic import _intrinsic
 
 
@@ -79,9 +80,6 @@ class BitState(enum.Enum):
     def construct(
         arg: BitState | Bit | str | int | bool | _NullFullType | None,
     ) -> BitState:
-        from ._integer import Integer
-        from ._boolean import true, false
-
         if arg is None:
             return BitState.UNINITIALZED
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Callable
 
-from ._type_qualifier import Port, Generic
+from ._type_qualifier import TypeQualifier, Port, Generic
 from ._collect_ast_and_scope import FunctionDefinition, InstantiatedFunction
 from cohdl.utility.source_location import SourceLocation
 from ._intrinsic import _intrinsic, _intrinsic_replacement, _IntrinsicInlineEntity
@@ -15,6 +15,7 @@ import inspect
 
 _block_stack: list[Block] = []
 _entity_instantiation_handler = None
+_entity_template_handler = None
 
 
 def current_entity():
@@ -28,6 +29,11 @@ def _set_entity_instantiation_handler(fn):
     _entity_instantiation_handler = fn
 
 
+def _set_entity_template_handler(fn):
+    global _entity_template_handler
+    _entity_template_handler = fn
+
+
 def _enter_block(block: Block):
     if len(_block_stack) != 0:
         _block_stack[-1]._cohdl_block_info._subblocks.append(block)
@@ -104,9 +110,6 @@ class EntityInfo:
         extern: bool = False,
         attributes: dict | None = None,
     ):
-        if len(generics) != 0:
-            assert extern, "generics only supported to instantiate external entities"
-
         if extern:
             assert architecture in (
                 None,
@@ -260,6 +263,11 @@ class Entity(Block):
                 template_instance = type(self)(_cohdl_internal_ctor=True)
                 _block_stack = [template_instance]
 
+                if _entity_template_handler is not None:
+                    # called before the architecture, so the handler
+                    # can replace attributes of the template instance
+                    _entity_template_handler(template_instance)
+
                 info.non_dynamic_ports = set(info.ports)
                 info.instantiated = template_instance
                 info.architecture(template_instance)
@@ -291,6 +299,19 @@ class Entity(Block):
 
                 self._cohdl_port_definitions[name] = value
             elif name in info.generics:
+                generic = info.generics[name]
+
+                if isinstance(value, TypeQualifier):
+                    # generics can only be forwarded from the parent entity
+                    assert isinstance(
+                        value, Generic
+                    ), f"generic '{name}' must be set to a constant or a generic"
+                    assert (
+                        value.type is generic.type
+                    ), f"type mismatch for generic '{name}' (src={value}, target={generic})"
+                else:
+                    value = generic.type(value)
+
                 self._cohdl_generic_definitions[name] = value
             else:
                 raise AssertionError(f"invalid argument '{name}'")
@@ -18,6 +18,7 @@ from cohdl._core._type_qualifier import (
 )
 
 from cohdl._core._bit import Bit
+from cohdl._core._unsigned import Unsigned
 from cohdl._core._intrinsic import (
     _BitSignalEvent,
     _BitSignalEventGroup,
@@ -1053,6 +1054,10 @@ class _State(Statement):
     def __init__(self, code: CodeBlock, open_block: CodeBlock):
         self._code = code
         self._state_id = None
+        # virtual frame of the await or while statement, that starts
+        # the state or the source location of the coroutine for the
+        # first state (used by coverage reports)
+        self._origin: VirtualFrame | SourceLocation | None = None
 
         # a code block that is part of self._code
         # and used to add statments
@@ -1106,7 +1111,9 @@ class _State(Statement):
             def set_parent_state(self, state):
                 pass
 
-        return _State(self._code.copy(), cast(CodeBlock, DummyOpenBlock()))
+        result = _State(self._code.copy(), cast(CodeBlock, DummyOpenBlock()))
+        result._origin = self._origin
+        return result
 
     def empty(self) -> bool:
         return self._code.empty()
@@ -1295,6 +1302,83 @@ class StatemachineContext:
         self._states.append(state)
 
 
+class CoverPoint:
+    """
+    counter of a single state or transition in an instrumented statemachine
+
+    `origins` contains the virtual frames or source locations
+    of the statements, that define the point (most specific first)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        counter: Signal,
+        origins: list[VirtualFrame | SourceLocation | None],
+    ):
+        self.name = name
+        self.counter = counter
+        self.origins = origins
+
+
+class StatemachineCoverage:
+    """
+    counts how often each state of a statemachine is active
+    and how often each transition is taken
+
+    Created for statemachines in sequential contexts with a `coverage`
+    attribute. The counter logic is enclosed in translate_off/on pragmas,
+    so it is only present in simulation.
+    """
+
+    def __init__(self, name: str, state_signal: Signal, counter_width: int):
+        self.name = name
+        self._state_signal = state_signal
+        self._counter_width = counter_width
+        self.states: list[CoverPoint] = []
+        self.transitions: list[CoverPoint] = []
+        self._transition_map: dict[tuple[int, int], CoverPoint] = {}
+
+    def _counter(self, name: str):
+        return Signal[Unsigned[self._counter_width]](
+            0, name=f"{self._state_signal.name()}_cov_{name}", noreset=True
+        )
+
+    @staticmethod
+    def _increment(counter: Signal):
+        result = Temporary[counter.type]()
+        return CodeBlock(
+            [
+                Comment(["pragma translate_off"]),
+                BinOp(BinOp.Operator.ADD, counter, 1, result),
+                SignalAssignment(counter, result),
+                Comment(["pragma translate_on"]),
+            ],
+            None,
+        )
+
+    def count_state(self, nr: int, state: _State):
+        point = CoverPoint(f"state_{nr}", self._counter(f"{nr}"), [state._origin])
+        self.states.append(point)
+        state.code().addfront(self._increment(point.counter))
+
+    def count_transition(self, src: int, dst: int, transition: _Transition):
+        key = (src, dst)
+
+        if key not in self._transition_map:
+            # transitions without a location in user code (like the
+            # restart at the end of a coroutine) use the target location
+            point = CoverPoint(
+                f"state_{src} -> state_{dst}",
+                self._counter(f"{src}_to_{dst}"),
+                [transition._frame, transition._next_state._origin],
+            )
+            self.transitions.append(point)
+            self._transition_map[key] = point
+
+        return self._increment(self._transition_map[key].counter)
+
+
 class Statemachine(Statement):
     def __init__(self, ctx: StatemachineContext):
         super().__init__()
@@ -1332,18 +1416,54 @@ class Statemachine(Statement):
     def check_temporaries(self):
         self._ctx._check_temporaries()
 
-    def as_case_when(self):
-        def replace_transition(stmt):
-            if isinstance(stmt, _Transition):
-                return SignalAssignment(
-                    self._current_state, self._state_id[stmt._next_state], stmt._frame
-                )
-            else:
-                return stmt
+    def as_case_when(self, collector=None):
+        # collector is the coverage attribute of the sequential context
+        # (see std.Coverage), instrumented statemachines are added to it
+        coverage = None
+
+        if collector is not None:
+            coverage = StatemachineCoverage(
+                self._current_state.name(),
+                self._current_state,
+                collector.counter_width,
+            )
+            collector.statemachines.append(coverage)
+
+        state_nr = IdMap()
+
+        for nr, state in enumerate(self._ctx._states):
+            state_nr[state] = nr
 
         for state in self._ctx._states:
+
+            def replace_transition(stmt):
+                if isinstance(stmt, _Transition):
+                    assignment = SignalAssignment(
+                        self._current_state,
+                        self._state_id[stmt._next_state],
+                        stmt._frame,
+                    )
+
+                    if coverage is None:
+                        return assignment
+
+                    return CodeBlock(
+                        [
+                            coverage.count_transition(
+                                state_nr[state], state_nr[stmt._next_state], stmt
+                            ),
+                            assignment,
+                        ],
+                        None,
+                    )
+                else:
+                    return stmt
+
             state.visit(replace_transition)
 
+            if coverage is not None:
+                coverage.count_state(state_nr[state], state)
+
         return CaseWhen(
             self._current_state,
             [(self._state_id[state], state.code()) for state in self._ctx._states],
@@ -1644,7 +1764,7 @@ class Sequential(Context):
         def translate_statemachine(stmt):
             if isinstance(stmt, Statemachine):
                 stmt.check_temporaries()
-                return stmt.as_case_when()
+                return stmt.as_case_when(attributes.get("coverage", None))
             else:
                 return stmt
 
@@ -1716,6 +1836,11 @@ class EntityTemplate(Block):
                         f"writing to input port '{obj._root._name}' not allowed"
                     )
 
+                if isinstance(obj, Signal) and isinstance(obj._root, Generic):
+                    raise AssertionError(
+                        f"writing to generic '{obj._root._name}' not allowed"
+                    )
+
                 if isinstance(obj, (Signal, Variable, Temporary)):
                     obj_root = obj._root
                     if obj_root in written_in:
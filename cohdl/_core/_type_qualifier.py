@@ -1582,7 +1582,18 @@ class Temporary(TypeQualifier):
     _SubTypes = {}
 
 
-class Generic: ...
+class Generic(Signal):
+    """
+    read only entity parameter, translated to a VHDL generic
+
+    all instances of an entity share a single architecture,
+    the value of each generic is set in the generic map of the instantiation
+
+    the type of a generic is fixed by its declaration, width generics
+    (generics used as the width of ports or signals) are not supported
+    """
+
+    _SubTypes = {}
 
 
 Signal._Qualifier = Signal
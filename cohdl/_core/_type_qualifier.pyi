@@ -497,4 +497,34 @@ class Temporary(typing.Generic[T], TypeQualifier[T]):
     @bitvector.setter
     def bitvector(self, value: TypeQualifier[BitVector] | BitVector | str): ...
 
-class Generic: ...
+class Generic(typing.Generic[T], Signal[T]):
+    def __init__(
+        self,
+        value=None,
+        *,
+        name: str | None = None,
+        attributes: dict | None = None,
+    ) -> None:
+        """
+        Declares a read only entity parameter with the default `value`,
+        that is translated to a VHDL generic.
+
+        Generics are declared as class attributes of an entity and
+        overwritten by keyword arguments of the instantiation.
+
+        >>> class AddOffset(cohdl.Entity):
+        >>>     a = Port.input(Unsigned[8])
+        >>>     result = Port.output(Unsigned[8])
+        >>>
+        >>>     offset = Generic[Unsigned[8]](3)
+        >>>
+        >>>     def architecture(self):
+        >>>         ...
+        >>>
+        >>> AddOffset(a=x, result=y, offset=5)
+
+        All instances share a single architecture, so the type of a generic
+        is fixed by its declaration. Width generics (generics that define
+        the width of ports or signals) are not supported, entities
+        with different widths must be defined as separate entity classes.
+        """
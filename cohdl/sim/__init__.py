@@ -0,0 +1,14 @@
+from ._simulator import Simulator, SignalHandle, Snapshot
+from ._functional import FunctionalModel, FunctionalHandle
+from ._waveform import VcdWriter
+
+
+def __getattr__(name):
+    # the lane simulator depends on numpy,
+    # which is only imported when it is used
+    if name in ("LaneSimulator", "LaneHandle"):
+        from . import _lanes
+
+        return getattr(_lanes, name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
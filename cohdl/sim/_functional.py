@@ -0,0 +1,2088 @@
+from __future__ import annotations
+
+import ast
+import copy
+import inspect
+import linecache
+import operator
+import sys
+import textwrap
+import types
+import weakref
+
+from cohdl._core import (
+    Entity,
+    Array,
+    BitVector,
+    Unsigned,
+    Signed,
+    Integer,
+    Null,
+    Full,
+    true,
+    false,
+    TypeQualifier,
+    Signal,
+    Variable,
+    Port,
+)
+from cohdl._core import _context
+from cohdl._core import _intrinsic as intr
+from cohdl._core import _intrinsic_definitions as intr_def
+from cohdl._core._primitive_type import _PrimitiveType, is_primitive_type
+from cohdl._core._type_qualifier import Offset
+from cohdl._core._enum import Enum, DynamicEnum
+from cohdl._core._boolean import _Boolean
+from cohdl._core._intrinsic_operations import AssignMode
+from cohdl._core._collect_ast_and_scope import FunctionDefinition, _Unbound
+from cohdl._core._context import Block
+from cohdl.std.utility import add_entity_port
+
+from . import _packed as packed
+from ._simulator import _Ports
+
+#
+# A functional model runs the contexts of an entity as ordinary Python code.
+# The source of each function called from a context is rewritten once,
+# so that the statemachine semantics of the compiler are preserved:
+#
+#   * async functions become generators, each yield ends a clock cycle
+#   * `await cond` ends the current cycle and waits until cond is true
+#   * while loops in async functions end the cycle at the loop head
+#     and after each iteration
+#   * signal assignments are delayed until the end of the delta cycle
+#   * runtime indices into vectors and arrays are resolved to ints
+#
+# Intrinsic functions, that are handled by the compiler,
+# are replaced with implementations operating on the model.
+#
+
+# the process, that is currently executed
+_active: _Process | None = None
+
+
+def _snapshot(value):
+    # copy of an assigned value, that is not affected
+    # by later changes to the assignment source
+    value = TypeQualifier.decay(value)
+
+    if isinstance(value, (list, tuple)):
+        return [_snapshot(elem) for elem in value]
+    if isinstance(value, Array):
+        return [_snapshot(elem) for elem in _filled(value)._value]
+    if isinstance(value, (Enum, DynamicEnum)):
+        return value
+    if isinstance(value, _PrimitiveType):
+        return value.copy()
+    return value
+
+
+def _filled(value: Array) -> Array:
+    # native arrays only store explicitly initialized elements,
+    # create all remaining elements so they can be assigned
+    elems = value._value
+
+    if elems is None or len(elems) != value._count_:
+        elems = [] if elems is None else list(elems)
+
+        while len(elems) != value._count_:
+            elems.append(value[len(elems)])
+
+        value._value = elems
+
+    return value
+
+
+def _state(value):
+    # hashable representation of a primitive used
+    # to detect, which signals change in a delta cycle
+    if isinstance(value, Array):
+        return tuple(_state(elem) for elem in _filled(value)._value)
+    if isinstance(value, (Enum, DynamicEnum)):
+        return value
+    return str(value)
+
+
+def _write_value(current, value):
+    if isinstance(current, Array):
+        elems = _filled(current)._value
+
+        if value is Null or value is Full:
+            for elem in elems:
+                _write_value(elem, value)
+        else:
+            assert len(value) == len(
+                elems
+            ), f"width of source does not match width of target ({len(value)} != {len(elems)})"
+
+            for elem, new in zip(elems, value):
+                _write_value(elem, new)
+    else:
+        if isinstance(current, (Unsigned, Signed)) and isinstance(
+            value, (int, Integer)
+        ):
+            # integers wrap around like in the simulator
+            ptype = packed.packed_type(type(current))
+            value = packed.unpack(ptype, packed.pack(ptype, value))
+
+        current._assign(value)
+
+
+def _write(target: TypeQualifier, value):
+    if isinstance(target._value, (Enum, DynamicEnum)):
+        # enumeration members are immutable, so the value is
+        # replaced in the qualifier and the containing array
+        target._value = value
+
+        if len(target._ref_spec) != 0:
+            container = target._root._value
+
+            for nr, ref in enumerate(target._ref_spec):
+                assert isinstance(ref, Offset), "invalid reference to enum value"
+                index = _index(ref.offset) + sum(_index(off) for off in ref.base_offset)
+                elems = _filled(container)._value
+
+                if nr + 1 == len(target._ref_spec):
+                    elems[index] = value
+                else:
+                    container = elems[index]
+    else:
+        _write_value(target._value, value)
+
+
+def _index(value):
+    value = TypeQualifier.decay(value)
+
+    if hasattr(value, "to_int"):
+        return value.to_int()
+    if isinstance(value, BitVector):
+        return value.unsigned.to_int()
+    return int(value)
+
+
+#
+# source transformation
+#
+
+
+def _runtime(name: str, node: ast.AST):
+    return ast.copy_location(
+        ast.Attribute(
+            value=ast.Name(id="__cohdl__", ctx=ast.Load()), attr=name, ctx=ast.Load()
+        ),
+        node,
+    )
+
+
+def _call_runtime(name: str, args: list, node: ast.AST):
+    return ast.copy_location(
+        ast.Call(func=_runtime(name, node), args=args, keywords=[]), node
+    )
+
+
+def _function_def(node, **fields):
+    # FunctionDef with the fields of node,
+    # used to turn async functions into generators
+    fields = {
+        **{name: getattr(node, name, None) for name in ast.FunctionDef._fields},
+        **fields,
+    }
+
+    if "type_params" in fields and fields["type_params"] is None:
+        fields["type_params"] = []
+
+    return ast.copy_location(ast.FunctionDef(**fields), node)
+
+
+def _thunk(expr: ast.expr, node: ast.AST):
+    # lambda without arguments, that evaluates expr
+    args = ast.arguments(
+        posonlyargs=[],
+        args=[],
+        vararg=None,
+        kwonlyargs=[],
+        kw_defaults=[],
+        kwarg=None,
+        defaults=[],
+    )
+    return ast.copy_location(ast.Lambda(args=args, body=expr), node)
+
+
+_assign_ops = {
+    ast.LShift: "next",
+    ast.BitXor: "push",
+    ast.MatMult: "value",
+}
+
+
+_binary_ops = {
+    ast.Add: "add",
+    ast.Sub: "sub",
+    ast.Mult: "mul",
+    ast.MatMult: "matmul",
+    ast.Div: "truediv",
+    ast.FloorDiv: "floordiv",
+    ast.Mod: "mod",
+    ast.Pow: "pow",
+    ast.LShift: "lshift",
+    ast.RShift: "rshift",
+    ast.BitAnd: "and",
+    ast.BitOr: "or",
+    ast.BitXor: "xor",
+}
+
+_compare_ops = {
+    ast.Eq: "eq",
+    ast.NotEq: "ne",
+    ast.Lt: "lt",
+    ast.LtE: "le",
+    ast.Gt: "gt",
+    ast.GtE: "ge",
+}
+
+
+class _Transformer(ast.NodeTransformer):
+    def __init__(self, root, class_name: str | None):
+        self._root = root
+        self._is_async = isinstance(root, ast.AsyncFunctionDef)
+        self._class_name = class_name
+        self._loop_nr = 0
+        self._with_nr = 0
+
+        positional = [*root.args.posonlyargs, *root.args.args]
+        self._self_arg = positional[0].arg if len(positional) != 0 else None
+
+    def transform(self):
+        root = self._root
+        args = root.args
+
+        # defaults are copied from the original function object
+        # and annotations might reference names, that are not available
+        for arg in [*args.posonlyargs, *args.args, *args.kwonlyargs]:
+            arg.annotation = None
+        for arg in (args.vararg, args.kwarg):
+            if arg is not None:
+                arg.annotation = None
+
+        args.defaults = []
+        args.kw_defaults = [None] * len(args.kwonlyargs)
+
+        self.generic_visit(root)
+
+        if isinstance(root, ast.Lambda):
+            return root
+
+        body = root.body
+
+        if self._is_async:
+            # makes sure the result is a generator, even
+            # if the function never ends a clock cycle
+            dead = ast.If(
+                test=ast.Constant(value=False),
+                body=[ast.Expr(value=ast.Yield(value=None))],
+                orelse=[],
+            )
+            body = [ast.copy_location(dead, root), *body]
+
+        return _function_def(root, body=body, decorator_list=[], returns=None)
+
+    def _mangle(self, name: str):
+        if (
+            self._class_name is not None
+            and name.startswith("__")
+            and not name.endswith("__")
+        ):
+            return f"_{self._class_name.lstrip('_')}{name}"
+        return name
+
+    def _index_expr(self, node):
+        if isinstance(node, ast.Slice):
+            return _call_runtime(
+                "slice",
+                [
+                    self.visit(part) if part is not None else ast.Constant(value=None)
+                    for part in (node.lower, node.upper, node.step)
+                ],
+                node,
+            )
+        if isinstance(node, ast.Tuple):
+            return ast.copy_location(
+                ast.Tuple(
+                    elts=[self._index_expr(elt) for elt in node.elts], ctx=ast.Load()
+                ),
+                node,
+            )
+        return self.visit(node)
+
+    #
+    # nested definitions are transformed when they are called
+    #
+
+    def visit_FunctionDef(self, node):
+        return node
+
+    def visit_AsyncFunctionDef(self, node):
+        return node
+
+    def visit_Lambda(self, node):
+        return node
+
+    def visit_ClassDef(self, node):
+        return node
+
+    def visit_AsyncFor(self, node):
+        raise AssertionError("async for loops are not supported in functional models")
+
+    def visit_With(self, node: ast.With):
+        return self._with(node, False)
+
+    def visit_AsyncWith(self, node: ast.AsyncWith):
+        return self._with(node, True)
+
+    def _with(self, node, is_async: bool):
+        # context managers are entered and exited explicitly, so that
+        # __enter__/__exit__ are transformed like other functions
+        body = [self.visit(stmt) for stmt in node.body]
+        body = [
+            elem
+            for stmt in body
+            for elem in (stmt if isinstance(stmt, list) else [stmt])
+        ]
+
+        for item in node.items[::-1]:
+            self._with_nr += 1
+            name = f"__cohdl_with{self._with_nr}__"
+
+            def method(attr):
+                call = ast.Call(
+                    func=ast.Attribute(
+                        value=ast.Name(id=name, ctx=ast.Load()),
+                        attr=attr,
+                        ctx=ast.Load(),
+                    ),
+                    args=[],
+                    keywords=[],
+                )
+                return ast.YieldFrom(value=call) if is_async else call
+
+            stmts = [
+                ast.Assign(
+                    targets=[ast.Name(id=name, ctx=ast.Store())],
+                    value=_call_runtime(
+                        "context",
+                        [self.visit(item.context_expr), ast.Constant(value=is_async)],
+                        item.context_expr,
+                    ),
+                )
+            ]
+
+            if item.optional_vars is None:
+                stmts.append(ast.Expr(value=method("enter")))
+            else:
+                stmts.append(
+                    ast.Assign(
+                        targets=[self.visit(item.optional_vars)],
+                        value=method("enter"),
+                    )
+                )
+
+            # exit is skipped, when the generator is closed
+            handler = ast.ExceptHandler(
+                type=ast.Name(id="BaseException", ctx=ast.Load()),
+                name=None,
+                body=[ast.Expr(value=method("abort")), ast.Raise()],
+            )
+
+            stmts.append(
+                ast.Try(
+                    body=body,
+                    handlers=[handler],
+                    orelse=[],
+                    finalbody=[ast.Expr(value=method("exit"))],
+                )
+            )
+
+            body = [ast.copy_location(stmt, node) for stmt in stmts]
+
+        return body
+
+    #
+    # clock cycles
+    #
+
+    def visit_Await(self, node: ast.Await):
+        thunk = _thunk(self.visit(node.value), node)
+        return ast.copy_location(
+            ast.YieldFrom(value=_call_runtime("wait", [thunk], node)), node
+        )
+
+    def visit_While(self, node: ast.While):
+        node = self.generic_visit(node)
+
+        if not self._is_async:
+            node.test = _call_runtime("test", [node.test], node.test)
+            return node
+
+        # the loop head is a new state, the loop object
+        # decides if the first test requires a clock cycle
+        self._loop_nr += 1
+        name = f"__cohdl_loop{self._loop_nr}__"
+
+        head = ast.Assign(
+            targets=[ast.Name(id=name, ctx=ast.Store())],
+            value=ast.YieldFrom(
+                value=_call_runtime("loop", [_thunk(node.test, node)], node)
+            ),
+        )
+
+        node.test = ast.copy_location(
+            ast.Call(
+                func=ast.Attribute(
+                    value=ast.Name(id=name, ctx=ast.Load()), attr="test", ctx=ast.Load()
+                ),
+                args=[_thunk(node.test, node)],
+                keywords=[],
+            ),
+            node.test,
+        )
+
+        tick = ast.copy_location(ast.Expr(value=ast.Yield(value=None)), node)
+        node.body = [*node.body, tick]
+
+        return [ast.copy_location(head, node), node]
+
+    def visit_If(self, node: ast.If):
+        node = self.generic_visit(node)
+        node.test = _call_runtime("test", [node.test], node.test)
+        return node
+
+    def visit_Assert(self, node: ast.Assert):
+        node = self.generic_visit(node)
+        node.test = _call_runtime("check", [node.test], node.test)
+        return node
+
+    def visit_IfExp(self, node: ast.IfExp):
+        node = self.generic_visit(node)
+        node.test = _call_runtime("test", [node.test], node.test)
+        return node
+
+    #
+    # assignments
+    #
+
+    def visit_AugAssign(self, node: ast.AugAssign):
+        op = _assign_ops.get(type(node.op))
+
+        if op is None:
+            return self.generic_visit(node)
+
+        value = self.visit(node.value)
+        target = node.target
+        op = ast.Constant(value=op)
+
+        if isinstance(target, ast.Name):
+            load = ast.copy_location(ast.Name(id=target.id, ctx=ast.Load()), target)
+            return ast.copy_location(
+                ast.Assign(
+                    targets=[target],
+                    value=_call_runtime("aug", [op, load, value], node),
+                ),
+                node,
+            )
+
+        if isinstance(target, ast.Subscript):
+            call = _call_runtime(
+                "aug_item",
+                [op, self.visit(target.value), self._index_expr(target.slice), value],
+                node,
+            )
+        else:
+            assert isinstance(target, ast.Attribute)
+            call = _call_runtime(
+                "aug_attr",
+                [
+                    op,
+                    self.visit(target.value),
+                    ast.Constant(value=self._mangle(target.attr)),
+                    value,
+                ],
+                node,
+            )
+
+        return ast.copy_location(ast.Expr(value=call), node)
+
+    def visit_Assign(self, node: ast.Assign):
+        if len(node.targets) == 1:
+            target = node.targets[0]
+
+            if isinstance(target, ast.Attribute) and target.attr in (
+                "next",
+                "push",
+                "value",
+            ):
+                call = _call_runtime(
+                    "set_attr",
+                    [
+                        self.visit(target.value),
+                        ast.Constant(value=target.attr),
+                        self.visit(node.value),
+                    ],
+                    node,
+                )
+                return ast.copy_location(ast.Expr(value=call), node)
+
+        return self.generic_visit(node)
+
+    #
+    # expressions
+    #
+
+    def visit_UnaryOp(self, node: ast.UnaryOp):
+        node = self.generic_visit(node)
+
+        if isinstance(node.op, ast.Invert):
+            # the compiler maps the invert operator to __inv__
+            return _call_runtime("invert", [node.operand], node)
+
+        if isinstance(node.op, ast.Not):
+            # not of a runtime value is a runtime value
+            return _call_runtime("negate", [node.operand], node)
+
+        return node
+
+    def visit_BinOp(self, node: ast.BinOp):
+        node = self.generic_visit(node)
+        name = ast.Constant(_binary_ops[type(node.op)])
+        return _call_runtime("binary", [name, node.left, node.right], node)
+
+    def visit_Compare(self, node: ast.Compare):
+        node = self.generic_visit(node)
+        op = _compare_ops.get(type(node.ops[0]))
+
+        if op is None or len(node.ops) != 1:
+            return node
+
+        return _call_runtime(
+            "binary", [ast.Constant(op), node.left, node.comparators[0]], node
+        )
+
+    def visit_Subscript(self, node: ast.Subscript):
+        if not isinstance(node.ctx, ast.Load):
+            return self.generic_visit(node)
+
+        return _call_runtime(
+            "getitem", [self.visit(node.value), self._index_expr(node.slice)], node
+        )
+
+    def visit_Attribute(self, node: ast.Attribute):
+        node = self.generic_visit(node)
+        node.attr = self._mangle(node.attr)
+        return node
+
+    def visit_Call(self, node: ast.Call):
+        node = self.generic_visit(node)
+        func = node.func
+
+        if (
+            isinstance(func, ast.Name)
+            and func.id == "super"
+            and len(node.args) == 0
+            and self._self_arg is not None
+        ):
+            # zero argument super depends on the class cell
+            # of the original function
+            node.args = [
+                ast.Name(id="__class__", ctx=ast.Load()),
+                ast.Name(id=self._self_arg, ctx=ast.Load()),
+            ]
+            return node
+
+        if (
+            (isinstance(func, ast.Name) and func.id == "always")
+            or (isinstance(func, ast.Attribute) and func.attr == "always")
+        ) and (len(node.args), len(node.keywords)) == (1, 0):
+            # the argument of always is evaluated in each delta cycle
+            return _call_runtime(
+                "always", [func, _thunk(node.args[0], node.args[0])], node
+            )
+
+        node.func = _call_runtime("call", [func], func)
+        return node
+
+
+def _class_name(code: types.CodeType):
+    # name of the class, a function is defined in
+    # (required for the mangling of private names)
+    parts = getattr(code, "co_qualname", code.co_name).split(".")[:-1]
+
+    for nr in range(len(parts) - 1, -1, -1):
+        if parts[nr] == "<locals>":
+            continue
+        if nr + 1 < len(parts) and parts[nr + 1] == "<locals>":
+            return None
+        return parts[nr]
+
+    return None
+
+
+def _source_node(code: types.CodeType):
+    """
+    returns the syntax tree of the function
+    defined by code or None if the source is not available
+    """
+
+    if code.co_name == "<lambda>":
+        return _lambda_node(code)
+
+    try:
+        source = textwrap.dedent(inspect.getsource(code))
+        tree = ast.parse(source)
+    except (OSError, TypeError, SyntaxError):
+        return None
+
+    node = tree.body[0]
+
+    if (
+        not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+        or node.name != code.co_name
+    ):
+        return None
+
+    ast.increment_lineno(tree, code.co_firstlineno - 1)
+    return node
+
+
+_modules: dict[str, ast.Module | None] = {}
+
+
+def _lambda_node(code: types.CodeType):
+    # the source of lambdas is not a complete statement,
+    # so the lambda is searched in the tree of the whole file
+    filename = code.co_filename
+
+    if filename not in _modules:
+        try:
+            _modules[filename] = ast.parse("".join(linecache.getlines(filename)))
+        except SyntaxError:
+            _modules[filename] = None
+
+    tree = _modules[filename]
+
+    if tree is None:
+        return None
+
+    # multiple lambdas can start in the same line, the positions of
+    # the instructions identify the lambda, that defines code
+    # (empty positions belong to instructions added by the compiler)
+    positions = [
+        (line, col)
+        for line, end_line, col, end_col in code.co_positions()
+        if None not in (line, col) and (line, col) != (end_line, end_col)
+    ]
+
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, ast.Lambda)
+            and node.lineno == code.co_firstlineno
+            and all(
+                (node.lineno, node.col_offset)
+                <= position
+                <= (node.end_lineno, node.end_col_offset)
+                for position in positions
+            )
+        ):
+            # the tree is shared by all lambdas in the file
+            return copy.deepcopy(node)
+
+    return None
+
+
+_codes: dict[types.CodeType, types.CodeType | None] = {}
+
+
+def _transformed_code(code: types.CodeType) -> types.CodeType | None:
+    """
+    returns the code object of the transformed function
+    or None if the source of code is not available
+    """
+
+    try:
+        return _codes[code]
+    except KeyError:
+        pass
+
+    node = _source_node(code)
+
+    if node is None:
+        _codes[code] = None
+        return None
+
+    fn = _Transformer(node, _class_name(code)).transform()
+
+    if isinstance(fn, ast.Lambda):
+        body = [ast.Return(value=fn)]
+        name = "<lambda>"
+    else:
+        # the name of the function is not bound in the factory,
+        # recursive calls have to resolve to the original name
+        fn.name = name = "__cohdl_function__"
+        body = [fn, ast.Return(value=ast.Name(id=fn.name, ctx=ast.Load()))]
+
+    # the transformed function is defined in a factory function,
+    # so that all names of the original closure stay free variables
+    params = ["__cohdl__", *code.co_freevars]
+    factory = _function_def(
+        node,
+        name="__cohdl_factory__",
+        args=ast.arguments(
+            posonlyargs=[],
+            args=[ast.arg(arg=name) for name in params],
+            vararg=None,
+            kwonlyargs=[],
+            kw_defaults=[],
+            kwarg=None,
+            defaults=[],
+        ),
+        body=body,
+        decorator_list=[],
+        returns=None,
+    )
+
+    module = ast.fix_missing_locations(ast.Module(body=[factory], type_ignores=[]))
+    module_code = compile(module, code.co_filename, "exec")
+    (factory_code,) = [
+        const for const in module_code.co_consts if isinstance(const, types.CodeType)
+    ]
+    (result,) = [
+        const
+        for const in factory_code.co_consts
+        if isinstance(const, types.CodeType) and const.co_name == name
+    ]
+
+    if hasattr(code, "co_qualname"):
+        result = result.replace(co_name=code.co_name, co_qualname=code.co_qualname)
+    else:
+        result = result.replace(co_name=code.co_name)
+
+    _codes[code] = result
+    return result
+
+
+_runtime_cell = types.CellType()
+
+
+def _make_function(code, name, globals, cells: dict, defaults, kwdefaults):
+    cells = {**cells, "__cohdl__": _runtime_cell}
+    result = types.FunctionType(
+        code, globals, name, defaults, tuple(cells[name] for name in code.co_freevars)
+    )
+    result.__kwdefaults__ = kwdefaults
+    return result
+
+
+_skipped_modules = ("cohdl._core", "cohdl._compiler", "cohdl.sim", "cohdl.utility")
+# functions created in each run of a process (lambdas and closures)
+# should not be kept alive by the cache
+_functions = weakref.WeakKeyDictionary()
+
+
+def _captured_cells(obj, cells: dict[str, types.CellType]):
+    """
+    the compiler captures the closure of each context function
+    when the context is created, use the same values so closures
+    created in loops are not late bound
+    """
+
+    known = FunctionDefinition._known_definitions.get(id(obj))
+
+    if known is None or known[1] is not obj:
+        return cells
+
+    definition = known[0]
+
+    if hasattr(definition, "_scope_ref"):
+        captured = definition._scope_ref.capture()
+    else:
+        captured = definition.scope()
+
+    return {
+        name: (
+            types.CellType(captured[name])
+            if name in captured and captured[name] is not _Unbound
+            else cell
+        )
+        for name, cell in cells.items()
+    }
+
+
+def _function(fn: types.FunctionType):
+    """
+    returns the replacement of fn in functional models or None,
+    when fn is executed without changes
+    """
+
+    try:
+        return _functions[fn]
+    except KeyError:
+        pass
+
+    result = _replacements.get(fn)
+
+    if result is None and not (
+        intr._is_intrinsic(fn)
+        or intr._has_intrinsic_replacement(fn)
+        or "__cohdl__" in fn.__code__.co_freevars
+        or (fn.__module__ or "").startswith(_skipped_modules)
+        or fn.__code__.co_flags & (inspect.CO_GENERATOR | inspect.CO_ASYNC_GENERATOR)
+    ):
+        code = _transformed_code(fn.__code__)
+
+        if code is not None:
+            result = _make_function(
+                code,
+                fn.__name__,
+                fn.__globals__,
+                _captured_cells(
+                    fn, dict(zip(fn.__code__.co_freevars, fn.__closure__ or ()))
+                ),
+                fn.__defaults__,
+                fn.__kwdefaults__,
+            )
+
+    _functions[fn] = result
+    return result
+
+
+def _coroutine_function(coro):
+    """
+    returns a function, that creates generators executing
+    the transformed body of a coroutine object
+    """
+
+    code = _transformed_code(coro.cr_code)
+    assert code is not None, f"source of coroutine '{coro.__name__}' not available"
+
+    frame = coro.cr_frame
+    assert frame is not None, "coroutine already finished"
+
+    original = coro.cr_code
+    local_values = frame.f_locals
+    fn = _make_function(
+        code,
+        coro.__name__,
+        frame.f_globals,
+        _captured_cells(
+            coro,
+            {name: types.CellType(local_values[name]) for name in original.co_freevars},
+        ),
+        None,
+        None,
+    )
+
+    names = original.co_varnames
+    argcount = original.co_argcount
+    kwcount = original.co_kwonlyargcount
+    args = [local_values[name] for name in names[:argcount]]
+    kwargs = {name: local_values[name] for name in names[argcount : argcount + kwcount]}
+    rest = argcount + kwcount
+
+    if original.co_flags & inspect.CO_VARARGS:
+        args.extend(local_values[names[rest]])
+        rest += 1
+    if original.co_flags & inspect.CO_VARKEYWORDS:
+        kwargs.update(local_values[names[rest]])
+
+    return lambda: fn(*args, **kwargs)
+
+
+# keyword arguments of TypeQualifier.__init__
+_qualifier_args = ("name", "attributes", "noreset", "maybe_uninitialized")
+
+
+def _declare(cls):
+    def declare(*args, delayed_init: bool = False, **kwargs):
+        proc = _active
+        value = args[0] if len(args) != 0 else None
+
+        if isinstance(value, (list, tuple)) and issubclass(
+            getattr(cls, "_Wrapped", object), Array
+        ):
+            # the elements of native arrays are
+            # constructed from primitive values
+            value = _snapshot(value)
+            args = (value, *args[1:])
+
+        if proc is None or not issubclass(cls, (Signal, Variable)):
+            if value is not None and proc is not None:
+                # declarations with a value are assignments,
+                # that end the first state of a coroutine
+                proc.fresh = False
+            return cls(*args, **kwargs)
+
+        wrapped = getattr(cls, "_Wrapped", None)
+
+        if wrapped is None:
+            wrapped = type(TypeQualifier.decay(value))
+
+        if issubclass(wrapped, (tuple, list)):
+            # containers declare one object per element
+            return type(value)(
+                [declare(elem, delayed_init=delayed_init, **kwargs) for elem in value]
+            )
+
+        # local declarations describe a single object,
+        # that is reused in all runs of the process
+        key = proc.stack(sys._getframe(1))
+        obj = proc.declared.get(key)
+
+        if not is_primitive_type(wrapped):
+            # composite types (records, assignable types) are
+            # constructed once and assigned in all later runs
+            init = {
+                name: arg for name, arg in kwargs.items() if name not in _qualifier_args
+            }
+
+            if obj is None:
+                obj = proc.declared[key] = cls(*args, **kwargs)
+            elif len(args) != 0 or len(init) != 0:
+                if len(init) == 0 and isinstance(TypeQualifier.decay(value), wrapped):
+                    source = value
+                else:
+                    source = wrapped(*args, **init)
+
+                mode = AssignMode.NEXT if issubclass(cls, Signal) else AssignMode.VALUE
+                _resolve(type(obj)._assign_)(obj, source, mode)
+
+            if len(args) != 0 or len(init) != 0:
+                proc.fresh = False
+
+            return obj
+
+        if obj is None:
+            kind = cls if value is None else type(cls(value))
+            obj = proc.declared[key] = kind(**kwargs)
+
+        uninitialized = getattr(value, "_is_uninitialized", None)
+
+        if value is not None and not (
+            isinstance(value, _PrimitiveType)
+            and uninitialized is not None
+            and uninitialized()
+        ):
+            if isinstance(obj, Variable):
+                _assign("value", obj, value)
+            else:
+                _assign("next", obj, value)
+
+                if not delayed_init:
+                    # the declared signal is an alias of
+                    # the assigned value in the current state
+                    proc.model._alias(obj, value)
+
+        return obj
+
+    return declare
+
+
+def _instantiate(cls):
+    def instantiate(**kwargs):
+        # like local declarations, subinstances created
+        # by a context are reused in all runs of the process
+        proc = _active
+        key = proc.stack(sys._getframe(1))
+        obj = proc.declared.get(key)
+
+        if obj is None:
+            assert (
+                proc.model._elaborating
+            ), f"instance of '{cls.__name__}' not created in the first run of its context"
+            obj = proc.declared[key] = cls(**kwargs)
+
+        return obj
+
+    return instantiate
+
+
+def _constructor(cls):
+    # constructors of Python defined classes are transformed
+    # like other functions, because they might assign signals
+    init = cls.__init__
+
+    if type(cls).__call__ is not type.__call__ or type(init) is not types.FunctionType:
+        return cls
+
+    func = _function(init)
+
+    if func is None:
+        return cls
+
+    def construct(*args, **kwargs):
+        if cls.__new__ is object.__new__:
+            obj = object.__new__(cls)
+        else:
+            obj = cls.__new__(cls, *args, **kwargs)
+
+        if isinstance(obj, cls):
+            func(obj, *args, **kwargs)
+
+        return obj
+
+    return construct
+
+
+def _elaborated(fn):
+    def call(*args, **kwargs):
+        result = fn(*args, **kwargs)
+
+        if isinstance(result, (Signal, Variable)) and result._root is result:
+            # the compiler evaluates functions, that are not transformed,
+            # once per call, objects created by them (like std.Nonlocal
+            # signals) are reused in all runs of the process
+            proc = _active
+            return proc.declared.setdefault(proc.stack(sys._getframe(1)), result)
+
+        return result
+
+    return call
+
+
+def _call(fn):
+    # returns the callable used for calls in the transformed source
+    result = _resolve(fn)
+
+    if result is fn and not (
+        isinstance(fn, type) or type(fn) is types.BuiltinFunctionType
+    ):
+        return _elaborated(fn)
+
+    return result
+
+
+def _resolve(fn):
+    # returns the callable, that is used in place of fn
+    kind = type(fn)
+
+    if kind is types.FunctionType:
+        return _function(fn) or fn
+    if kind is types.BuiltinFunctionType or fn is bool:
+        return _replacements.get(fn, fn)
+    if kind is types.MethodType:
+        func = (
+            _function(fn.__func__) if type(fn.__func__) is types.FunctionType else None
+        )
+        return fn if func is None else types.MethodType(func, fn.__self__)
+    if isinstance(fn, type):
+        if issubclass(fn, TypeQualifier):
+            return _declare(fn)
+        if issubclass(fn, Entity):
+            return _instantiate(fn)
+        return _constructor(fn)
+    call = getattr(kind, "__call__", None)
+
+    if type(call) is types.FunctionType:
+        func = _function(call)
+
+        if func is not None:
+            return types.MethodType(func, fn)
+
+    return fn
+
+
+def _condition(value):
+    """
+    returns the result of the `__bool__` method of Python defined types,
+    the result is not converted to bool because the compiler
+    also accepts runtime values
+    """
+
+    method = getattr(type(value), "__bool__", None)
+
+    if type(method) is types.FunctionType:
+        func = _function(method)
+
+        if func is not None:
+            return _condition(func(value))
+
+    return value
+
+
+def _truth(value) -> bool:
+    return bool(_condition(value))
+
+
+_native_ops = {
+    "next": operator.lshift,
+    "push": operator.xor,
+    "value": operator.matmul,
+}
+
+_native_methods = {
+    "next": "__ilshift__",
+    "push": "__ixor__",
+    "value": "__imatmul__",
+}
+
+
+def _assign(op: str, target: TypeQualifier, value):
+    proc = _active
+    assert proc is not None, "assignment outside of a context"
+
+    if op == "value":
+        assert isinstance(
+            target, Variable
+        ), "only Variable objects can use value assignment"
+        _write(target, _snapshot(value))
+        proc.driven.add(target._root)
+        proc.fresh = False
+    else:
+        assert isinstance(
+            target, Signal
+        ), f"only Signal objects can use {op} assignment"
+        proc.model._schedule(proc, target, value, push=op == "push")
+
+
+_native_binary = {
+    name: getattr(operator, name if name not in ("and", "or") else f"{name}_")
+    for name in [*_binary_ops.values(), *_compare_ops.values()]
+}
+
+_reflected = {
+    **{name: f"__r{name}__" for name in _binary_ops.values()},
+    "eq": "__eq__",
+    "ne": "__ne__",
+    "lt": "__gt__",
+    "le": "__ge__",
+    "gt": "__lt__",
+    "ge": "__le__",
+}
+
+
+class _ContextManager:
+    def __init__(self, obj, is_async: bool):
+        self._obj = obj
+        self._is_async = is_async
+        self._aborted = False
+
+    def _method(self, name: str):
+        return _resolve(getattr(type(self._obj), name))
+
+    def enter(self):
+        if self._is_async:
+            return _awaitable(self._method("__aenter__")(self._obj))
+        return self._method("__enter__")(self._obj)
+
+    def abort(self):
+        self._aborted = True
+
+        if self._is_async:
+            return _awaitable(None)
+
+    def exit(self):
+        if self._is_async:
+            if self._aborted:
+                return _awaitable(None)
+            return _awaitable(self._method("__aexit__")(self._obj, None, None, None))
+
+        if not self._aborted:
+            self._method("__exit__")(self._obj, None, None, None)
+
+
+def _awaitable(value):
+    if inspect.isgenerator(value):
+        return (yield from value)
+    if inspect.iscoroutine(value):
+        return (yield from _coroutine_function(value)())
+    return value
+
+
+class _Loop:
+    def __init__(self, first: bool | None):
+        self._first = first
+
+    def test(self, thunk) -> bool:
+        first = self._first
+
+        if first is None:
+            return _Runtime.test(thunk())
+
+        self._first = None
+        return first
+
+
+class _Runtime:
+    """
+    functions used by the transformed source
+    """
+
+    slice = slice
+    call = staticmethod(_call)
+
+    @staticmethod
+    def loop(thunk):
+        if _active.fresh:
+            # loop at the start of a coroutine,
+            # the first test is done without a clock cycle
+            _active.fresh = False
+            return _Loop(_Runtime.test(thunk()))
+
+        pending = _active.model._pending
+        count = len(pending)
+        value = _condition(thunk())
+
+        if isinstance(value, (TypeQualifier, _PrimitiveType)):
+            # runtime conditions are tested in the new state,
+            # signal assignments done by the test are dropped
+            # because they are repeated in the next clock cycle
+            del pending[count:]
+            yield
+            return _Loop(None)
+
+        # like the compiler, constant false loops
+        # are treated as a single clock cycle delay
+        first = bool(value)
+        yield
+        return _Loop(first)
+
+    @staticmethod
+    def boundary():
+        proc = _active
+
+        if proc.fresh:
+            # the first state of a coroutine
+            # does not require a clock cycle
+            proc.fresh = False
+            return
+
+        yield
+
+    context = _ContextManager
+
+    @staticmethod
+    def wait(thunk):
+        value = thunk()
+
+        if inspect.isgenerator(value):
+            return (yield from value)
+        if inspect.iscoroutine(value):
+            return (yield from _coroutine_function(value)())
+
+        yield from _Runtime.boundary()
+
+        if value is false:
+            while True:
+                yield
+
+        if value is not true:
+            while not _truth(thunk()):
+                yield
+
+        return value
+
+    @staticmethod
+    def test(value) -> bool:
+        if type(value) is bool:
+            return value
+
+        if isinstance(value, (TypeQualifier, _PrimitiveType)) and _active is not None:
+            _active.fresh = False
+
+        return _truth(value)
+
+    @staticmethod
+    def check(value) -> bool:
+        value = _condition(value)
+
+        if isinstance(value, (TypeQualifier, _PrimitiveType)):
+            # like in the compiler, assertions of runtime values
+            # are not checked at elaboration time but when the design runs
+            if _active is not None and _active.model._elaborating:
+                return True
+
+        return bool(value)
+
+    @staticmethod
+    def always(fn, thunk):
+        if fn is not intr_def.always:
+            return _resolve(fn)(thunk())
+
+        proc = _active
+        site = proc.site(sys._getframe(1))
+        result = proc.always.get(site)
+
+        if result is None:
+            # always expressions are continuously
+            # evaluated by a separate process
+            value = TypeQualifier.decay(thunk())
+            result = proc.always[site] = Signal[type(value)](value)
+            proc.model._processes.append(_AlwaysExpr(proc, result, thunk))
+
+        return result
+
+    @staticmethod
+    def binary(name: str, lhs, rhs):
+        # operators of Python defined types are transformed,
+        # all other operators are evaluated natively
+        method = getattr(type(lhs), f"__{name}__", None)
+        reflected = getattr(type(rhs), _reflected[name], None)
+
+        if (
+            type(method) is not types.FunctionType
+            and type(reflected) is not types.FunctionType
+        ):
+            return _native_binary[name](lhs, rhs)
+
+        if method is not None:
+            result = _resolve(method)(lhs, rhs)
+
+            if result is not NotImplemented:
+                return result
+
+        if reflected is not None and type(lhs) is not type(rhs):
+            result = _resolve(reflected)(rhs, lhs)
+
+            if result is not NotImplemented:
+                return result
+
+        return _native_binary[name](lhs, rhs)
+
+    @staticmethod
+    def negate(value):
+        value = _bool(value)
+
+        if isinstance(value, _Boolean):
+            return _Boolean(not value)
+
+        return not value
+
+    @staticmethod
+    def invert(value):
+        method = getattr(type(value), "__inv__", None)
+
+        if method is None:
+            return ~value
+
+        return _resolve(method)(value)
+
+    @staticmethod
+    def aug(op: str, target, value):
+        if isinstance(target, TypeQualifier):
+            _assign(op, target, value)
+            return target
+
+        method = getattr(type(target), _native_methods[op], None)
+
+        if type(method) is types.FunctionType:
+            return (_function(method) or method)(target, value)
+
+        return _native_ops[op](target, value)
+
+    @staticmethod
+    def aug_item(op: str, obj, index, value):
+        target = _Runtime.getitem(obj, index)
+        result = _Runtime.aug(op, target, value)
+
+        if result is not target:
+            obj[index] = result
+
+    @staticmethod
+    def aug_attr(op: str, obj, name: str, value):
+        target = getattr(obj, name)
+        result = _Runtime.aug(op, target, value)
+
+        if result is not target:
+            setattr(obj, name, result)
+
+    @staticmethod
+    def set_attr(obj, name: str, value):
+        if isinstance(obj, TypeQualifier):
+            _assign(name, obj, value)
+            return
+
+        prop = getattr(type(obj), name, None)
+
+        if isinstance(prop, property) and type(prop.fset) is types.FunctionType:
+            _resolve(prop.fset)(obj, value)
+        else:
+            setattr(obj, name, value)
+
+    @staticmethod
+    def getitem(obj, index):
+        if isinstance(obj, (TypeQualifier, _PrimitiveType, list, tuple)):
+            if isinstance(obj, TypeQualifier) and isinstance(obj._value, Array):
+                _filled(obj._value)
+
+                if isinstance(index, (TypeQualifier, _PrimitiveType)):
+                    # negative runtime indices wrap around like in the simulator
+                    index = _index(index)
+
+                    if index < 0:
+                        index += obj._value._count_
+            elif isinstance(index, (TypeQualifier, _PrimitiveType)):
+                index = _index(index)
+        else:
+            method = getattr(type(obj), "__getitem__", None)
+
+            if type(method) is types.FunctionType:
+                return _resolve(method)(obj, index)
+
+        return obj[index]
+
+
+_runtime_cell.cell_contents = _Runtime
+
+#
+# replacements for intrinsic functions
+#
+
+
+def _identity(value, /):
+    return value
+
+
+_assign_modes = {
+    AssignMode.NEXT: "next",
+    AssignMode.PUSH: "push",
+    AssignMode.VALUE: "value",
+}
+
+
+def _assign_mode(target, value, assign_mode: AssignMode):
+    if assign_mode is AssignMode.AUTO:
+        assign_mode = (
+            AssignMode.NEXT if isinstance(target, Signal) else AssignMode.VALUE
+        )
+
+    assert assign_mode in _assign_modes, f"invalid assign_mode {assign_mode}"
+    _assign(_assign_modes[assign_mode], target, value)
+
+
+def _sensitivity_list(*signals):
+    proc = _active
+
+    if proc.sensitivity is None:
+        proc.sensitivity = {signal._root for signal in signals}
+
+
+def _sensitivity_all():
+    pass
+
+
+def _level(signal) -> bool:
+    return bool(TypeQualifier.decay(signal))
+
+
+def _rising_edge(signal):
+    return signal._root in _active.model._events and _level(signal)
+
+
+def _falling_edge(signal):
+    return signal._root in _active.model._events and not _level(signal)
+
+
+def _high_level(signal):
+    return _level(signal)
+
+
+def _low_level(signal):
+    return not _level(signal)
+
+
+def _reset_context():
+    proc = _active
+
+    for root in proc.driven:
+        if root._default is None or root._noreset:
+            continue
+
+        if isinstance(root, Signal):
+            proc.model._pending.append((root, _snapshot(root._default)))
+        else:
+            _write(root, _snapshot(root._default))
+
+    for coro in proc.coroutines.values():
+        coro.restart()
+
+
+def _reset_pushed():
+    proc = _active
+
+    for root in proc.pushed:
+        proc.model._pending.append((root, _snapshot(root._default)))
+
+
+def _coroutine_step(coro):
+    proc = _active
+    site = proc.site(sys._getframe(1))
+    state = proc.coroutines.get(site)
+
+    if state is None:
+        state = proc.coroutines[site] = _Coroutine()
+
+    state.step(proc, coro)
+
+
+def _select_key(value):
+    # like in the compiler, vectors are compared bitwise
+    if isinstance(value, BitVector):
+        return str(value.bitvector)
+    return _state(value)
+
+
+# branches of read only select tables (for example the memoized
+# lookup tables of std) by table identity and argument type
+_select_tables: dict[tuple, tuple] = {}
+
+
+def _select_table(arg_type, branches) -> dict:
+    key = (id(branches), arg_type)
+    cached = _select_tables.get(key)
+
+    # the table is stored in the cache entry, so its id cannot be reused
+    if cached is not None and cached[0] is branches:
+        return cached[1]
+
+    table = {}
+
+    for cond, value in branches.items():
+        table.setdefault(_select_key(arg_type(cond)), value)
+
+    _select_tables[key] = (branches, table)
+    return table
+
+
+def _select_default(branches, default):
+    # the compiler merges all branches into a common result type,
+    # so literal defaults are returned as that type
+    if isinstance(default, (int, str)) and not isinstance(default, bool):
+        for value in branches.values():
+            value = TypeQualifier.decay(value)
+
+            if isinstance(value, (BitVector, Integer)):
+                return type(value)(default)
+            break
+
+    return default
+
+
+def _select_with(arg, branches: dict, default=None):
+    arg = TypeQualifier.decay(arg)
+
+    if isinstance(branches, types.MappingProxyType):
+        table = _select_table(type(arg), branches)
+        key = _select_key(arg)
+
+        if key in table:
+            return table[key]
+        return _select_default(branches, default)
+
+    key = _select_key(arg)
+
+    for cond, value in branches.items():
+        # conditions are converted to the type of the argument
+        if _select_key(type(arg)(cond)) == key:
+            return value
+
+    return _select_default(branches, default)
+
+
+def _evaluated():
+    return True
+
+
+def _add_entity_port(entity, port, name: str | None = None):
+    # the port is created once (see _elaborated) but the code,
+    # that adds it to the entity, is repeated in each run
+    info = (entity if isinstance(entity, type) else type(entity))._cohdl_info
+
+    if any(existing is port for existing in info.ports.values()):
+        return port
+
+    return add_entity_port(entity, port, name)
+
+
+def _bool(value, /):
+    value = _condition(value)
+
+    if isinstance(value, (TypeQualifier, _PrimitiveType)):
+        # bool of a runtime value is a runtime value
+        return _Boolean(bool(value))
+
+    return bool(value)
+
+
+def _any(iterable, /):
+    return any([_truth(elem) for elem in iterable])
+
+
+def _all(iterable, /):
+    return all([_truth(elem) for elem in iterable])
+
+
+_replacements = {
+    intr.coroutine_step: _coroutine_step,
+    intr._Sensitivity.list: _sensitivity_list,
+    intr._Sensitivity.all: _sensitivity_all,
+    intr.reset_context: _reset_context,
+    intr.reset_pushed: _reset_pushed,
+    intr.rising_edge: _rising_edge,
+    intr.falling_edge: _falling_edge,
+    intr.high_level: _high_level,
+    intr.low_level: _low_level,
+    intr.select_with: _select_with,
+    intr_def.evaluated: _evaluated,
+    add_entity_port: _add_entity_port,
+    any: _any,
+    all: _all,
+    bool: _bool,
+    intr_def.expr: _identity,
+    TypeQualifier._assign_: _assign_mode,
+}
+
+#
+# model
+#
+
+
+class _Coroutine:
+    def __init__(self):
+        self._coro = None
+        self._start = None
+        self._gen = None
+
+    def restart(self):
+        self._gen = None
+
+    def _generator(self, coro):
+        if inspect.isgenerator(coro):
+            # created by a transformed async function
+            return coro
+
+        if coro is not self._coro:
+            self._coro = coro
+            self._start = _coroutine_function(coro)
+
+        return self._start()
+
+    def step(self, proc: _Process, coro):
+        if self._gen is None:
+            self._gen = self._generator(coro)
+            proc.fresh = True
+        else:
+            proc.fresh = False
+
+        try:
+            next(self._gen)
+        except StopIteration:
+            # the coroutine restarts in the next clock cycle
+            self._gen = None
+
+
+class _Process:
+    def __init__(self, model: FunctionalModel, fn, name: str, parent: Block):
+        self.model = model
+        self.name = name
+        self._fn = _resolve(fn)
+        self._parent = parent._cohdl_block_info
+        # signals, that trigger the process,
+        # None for processes, that run in each delta cycle
+        self.sensitivity: set | None = None
+        # root signals assigned/pushed by the process
+        self.driven = set()
+        self.pushed = set()
+        self.coroutines: dict[tuple, _Coroutine] = {}
+        self.always: dict[tuple, Signal] = {}
+        self.declared: dict[tuple, TypeQualifier] = {}
+        self.sites: dict[tuple, int] = {}
+        self.fresh = False
+
+    def stack(self, frame) -> tuple:
+        """
+        like site but identifies calls by all
+        positions in the call stack of the process
+        """
+
+        positions = []
+
+        while frame is not None and frame.f_code is not _Process.run.__code__:
+            positions.append((frame.f_code, frame.f_lasti))
+            frame = frame.f_back
+
+        site = tuple(positions)
+        count = self.sites.get(site, 0)
+        self.sites[site] = count + 1
+        return (site, count)
+
+    def site(self, frame) -> tuple:
+        """
+        identifies calls by their position in the source,
+        calls in loops are numbered in each run of the process
+        """
+
+        site = (frame.f_code, frame.f_lasti)
+        count = self.sites.get(site, 0)
+        self.sites[site] = count + 1
+        return (site, count)
+
+    def run(self):
+        global _active
+        prev = _active
+        prev_stack = _context._block_stack
+        _active = self
+        self.sites.clear()
+
+        # like in the compiler, blocks and contexts created by the process
+        # are registered in a dummy block, they are only used when they
+        # are created in the first run (see FunctionalModel._elaborate)
+        block = Block(self._parent._name, self._parent._attributes)
+        _context._block_stack = [block]
+
+        try:
+            self._fn()
+        finally:
+            _active = prev
+            _context._block_stack = prev_stack
+
+        if self.model._elaborating:
+            self.model._collect(block)
+
+
+class _AlwaysExpr:
+    sensitivity = None
+
+    def __init__(self, proc: _Process, target: Signal, thunk):
+        self._proc = proc
+        self._target = target
+        self._thunk = thunk
+
+    def run(self):
+        global _active
+        prev = _active
+        _active = self._proc
+        fresh = self._proc.fresh
+
+        try:
+            value = self._thunk()
+        finally:
+            _active = prev
+            self._proc.fresh = fresh
+
+        self._proc.model._pending.append((self._target, _snapshot(value)))
+
+
+class _Binding:
+    # connection of a port of a subinstance
+    sensitivity = None
+
+    def __init__(self, model: FunctionalModel, target, source):
+        self._model = model
+        self._target = target
+        self._source = source
+
+    def run(self):
+        self._model._pending.append((self._target, _snapshot(self._source)))
+
+
+def _copy_port(port: Port) -> Port:
+    # ports are class attributes shared by all instances of an entity,
+    # each model uses its own copy, that starts at the default value
+    result = type(port)(
+        port._default,
+        name=port._name,
+        attributes=port._attributes,
+        noreset=port._noreset,
+        maybe_uninitialized=port._maybe_uninitialized,
+    )
+
+    if result._default is None:
+        ptype = packed.packed_type(port.type)
+        _write(result, _snapshot(packed.unpack(ptype, packed.zero(ptype))))
+
+    return result
+
+
+class FunctionalHandle:
+    """
+    access to a port of a functional model
+
+    reading `value` settles all pending changes and returns
+    a copy of the current value, assigning `value` schedules
+    an update for the next `FunctionalModel.settle`
+    """
+
+    def __init__(self, model: FunctionalModel, obj: TypeQualifier, name: str):
+        self._model = model
+        self._obj = obj
+        self._name = name
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def type(self):
+        return self._obj.type
+
+    def _convert(self, value):
+        # values are converted like in the simulator, integers
+        # wrap around and uninitialized values become zero
+        ptype = packed.packed_type(self._obj.type)
+
+        if isinstance(value, Array):
+            value = _filled(value)
+
+        return packed.unpack(ptype, packed.pack(ptype, value))
+
+    @property
+    def value(self):
+        self._model.settle()
+        return self._convert(self._obj._value)
+
+    @value.setter
+    def value(self, value):
+        self._model._pending.append((self._obj, _snapshot(self._convert(value))))
+
+    def __repr__(self):
+        return f"FunctionalHandle({self.name}, {self._obj._value})"
+
+
+class FunctionalModel:
+    """
+    executes the contexts of an entity natively
+    without generating the IR
+
+    Coroutines are run as Python generators, that advance by one
+    state in each clock cycle and objects keep their values as
+    CoHDL primitives. Signal assignments follow the same delta cycle
+    semantics as `Simulator`, but subinstances are limited to one
+    instance per entity type without generic values.
+
+    Each model works on its own copies of the entity ports, so
+    several models of the same entity can run side by side.
+    Code, that runs at elaboration time in the compiler (declarations,
+    instantiations, `std.at_end_of_context` and similar),
+    is executed in the first run of each context and reused afterwards.
+    Such code in branches, that are not taken in the first run
+    (including the body of clocked contexts before the first clock edge),
+    is only executed, when the branch is reached.
+    """
+
+    def __init__(self, entity: type[Entity], *, max_deltas: int = 10000):
+        assert isinstance(entity, type) and issubclass(
+            entity, Entity
+        ), "functional models require an entity type"
+
+        self._max_deltas = max_deltas
+        self._pending: list[tuple[TypeQualifier, object]] = []
+        self._aliased: dict[TypeQualifier, object] = {}
+        # root signals changed in the last delta cycle
+        self._events = frozenset()
+        self._processes: list[_Process | _Binding] = []
+        # ports of all entities in the model and the copies used in their place
+        self._ports: dict[Port, Port] = {}
+        self._templates: list[Entity] = []
+        self._infos = []
+        self._inline: list[Entity] = []
+        self._elaborating = False
+
+        info = entity._cohdl_info
+        assert not info.extern, "extern entities cannot be executed"
+        self._infos.append(info)
+
+        handlers = (
+            _context._entity_template_handler,
+            _context._on_register_inline_entity_handler,
+        )
+
+        _context._set_entity_template_handler(self._use_port_copies)
+        _context._on_register_inline_entity(self._inline.append)
+
+        try:
+            self._collect(self._template(entity))
+            self._elaborate()
+
+            # ports added while the model was created are included,
+            # they are removed when the instantiation is discarded
+            ports = dict(info.ports)
+        finally:
+            _context._set_entity_template_handler(handlers[0])
+            _context._on_register_inline_entity(handlers[1])
+
+            # the next build reruns the architecture
+            for template in self._templates:
+                template_info = type(template)._cohdl_info
+
+                if template_info.instantiated is template:
+                    template_info._discard_instantiation()
+
+        self.dut = _Ports(
+            {
+                name: FunctionalHandle(
+                    self, self._ports.get(port, port), f"{info.name}.{name}"
+                )
+                for name, port in ports.items()
+            }
+        )
+
+    def _use_port_copies(self, template: Entity):
+        self._templates.append(template)
+
+        for name, port in template._cohdl_info.ports.items():
+            if port not in self._ports:
+                self._ports[port] = _copy_port(port)
+
+            setattr(template, name, self._ports[port])
+
+    def _template(self, entity: type[Entity]) -> Entity:
+        info = entity._cohdl_info
+
+        if info.instantiated is not None and not any(
+            template is info.instantiated for template in self._templates
+        ):
+            # instantiated before the model was created,
+            # the architecture has to use the copied ports
+            info._discard_instantiation()
+
+        entity(_cohdl_instantiate_only=True)
+        return info.instantiated
+
+    def _elaborate(self):
+        # the first run of each process executes the code, that the
+        # compiler evaluates during elaboration, processes and instances
+        # created in this run are added to the model and run as well
+        self._elaborating = True
+
+        try:
+            nr = 0
+
+            while nr != len(self._processes) or len(self._inline) != 0:
+                if nr != len(self._processes):
+                    self._processes[nr].run()
+                    nr += 1
+                else:
+                    self._add_instance(self._inline.pop(0))
+        finally:
+            self._elaborating = False
+
+    def _collect(self, block: Block):
+        block_info = block._cohdl_block_info
+
+        for ctx in block_info._subcontext:
+            self._processes.append(_Process(self, ctx._fn, ctx.name(), block))
+
+        for sub in block_info._subblocks:
+            if isinstance(sub, Entity):
+                self._add_instance(sub)
+            else:
+                self._collect(sub)
+
+    def _add_instance(self, sub: Entity):
+        info = type(sub)._cohdl_info
+
+        assert not info.extern, "extern entities cannot be executed"
+        assert (
+            info not in self._infos
+        ), f"functional models support only one instance of '{info.name}'"
+        assert (
+            len(sub._cohdl_generic_definitions) == 0
+        ), f"generic values of instance '{info.name}' not supported"
+
+        # derived entities share the port objects of their base
+        ports = {id(port) for info in self._infos for port in info.ports.values()}
+        assert all(
+            id(port) not in ports for port in info.ports.values()
+        ), f"entity '{info.name}' shares ports with another entity"
+
+        self._infos.append(info)
+        template = self._template(type(sub))
+
+        for name, port in info.ports.items():
+            port = self._ports.get(port, port)
+            actual = sub._cohdl_port_definitions[name]
+
+            if port.is_input():
+                self._processes.append(_Binding(self, port, actual))
+            else:
+                assert port.is_output(), "inout ports not supported"
+                self._processes.append(_Binding(self, actual, port))
+
+        self._collect(template)
+
+    def _schedule(self, proc: _Process, target: TypeQualifier, value, push: bool):
+        root = target._root
+        proc.driven.add(root)
+        proc.fresh = False
+
+        if push:
+            assert (
+                root._default is not None
+            ), f"pushed signal requires default value (name hint='{root._name}')"
+            proc.pushed.add(root)
+
+        self._pending.append((target, _snapshot(value)))
+
+    def _alias(self, target: Signal, value):
+        root = target._root
+
+        if root not in self._aliased:
+            self._aliased[root] = _state(root._value)
+
+        _write(target, _snapshot(value))
+
+    def _apply(self) -> set:
+        pending = self._pending
+
+        if len(pending) == 0:
+            return set()
+
+        # state of aliased signals before the alias was written
+        states = self._aliased
+        self._aliased = {}
+
+        for target, _ in pending:
+            root = target._root
+
+            if root not in states:
+                states[root] = _state(root._value)
+
+        for target, value in pending:
+            _write(target, value)
+
+        pending.clear()
+
+        return {root for root, state in states.items() if _state(root._value) != state}
+
+    def settle(self):
+        """
+        runs delta cycles until no signal changes
+        """
+
+        for _ in range(self._max_deltas):
+            changed = self._apply()
+
+            if len(changed) == 0:
+                self._events = frozenset()
+                return
+
+            self._events = changed
+
+            for proc in self._processes:
+                if proc.sensitivity is None or not proc.sensitivity.isdisjoint(changed):
+                    proc.run()
+
+        raise AssertionError(
+            f"design did not settle after {self._max_deltas} delta cycles"
+        )
+
+    def tick(self, clk: FunctionalHandle | str, cycles: int = 1):
+        """
+        applies a rising and a falling edge to clk for each cycle
+        """
+
+        if isinstance(clk, str):
+            clk = self.dut[clk]
+
+        for _ in range(cycles):
+            clk.value = True
+            self.settle()
+            clk.value = False
+            self.settle()
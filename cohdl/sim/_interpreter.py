@@ -0,0 +1,454 @@
+from __future__ import annotations
+
+from cohdl._core._ir import repr as ir
+from cohdl._core._type_qualifier import TypeQualifier, Generic
+
+from . import _packed as packed
+from ._packed import PackedType, Kind
+
+
+def _index_reader(values, index):
+    # returns a function evaluating a runtime index
+    # or the index itself if it is constant
+    if isinstance(index, int):
+        return index
+
+    const = index.const
+    readers = []
+
+    for location, ptype in index.parts:
+        read = _reader(values, location)
+        cvt = packed.convert(ptype, location.ptype)
+        readers.append(
+            (lambda read, cvt, ptype: lambda: packed.to_int(ptype, cvt(read())))(
+                read, cvt, ptype
+            )
+        )
+
+    if len(readers) == 1 and const == 0:
+        return readers[0]
+    return lambda: const + sum(read() for read in readers)
+
+
+def _step_functions(values, step, array: bool):
+    """
+    returns the extract and insert functions of a single location step
+    """
+
+    index = _index_reader(values, step.index)
+
+    if array:
+        if callable(index):
+            extract = lambda value: value[index()]
+
+            def insert(value, new):
+                value = list(value)
+                value[index()] = new
+                return value
+
+        else:
+            extract = lambda value: value[index]
+
+            def insert(value, new):
+                value = list(value)
+                value[index] = new
+                return value
+
+        return extract, insert
+
+    mask = 1 if step.width is None else (1 << step.width) - 1
+
+    if callable(index):
+        extract = lambda value: (value >> index()) & mask
+
+        def insert(value, new):
+            nr = index()
+            return (value & ~(mask << nr)) | (new << nr)
+
+    else:
+        shifted = mask << index
+        extract = lambda value: (value >> index) & mask
+        insert = lambda value, new: (value & ~shifted) | (new << index)
+
+    return extract, insert
+
+
+def _chain(outer_extract, outer_insert, inner_extract, inner_insert):
+    def extract(value):
+        return inner_extract(outer_extract(value))
+
+    def insert(value, new):
+        return outer_insert(value, inner_insert(outer_extract(value), new))
+
+    return extract, insert
+
+
+def _location_functions(values, location):
+    """
+    returns functions, that extract the referenced part from a slot value
+    and that insert a new part into a slot value
+    (both None, when the location references the entire slot)
+    """
+
+    extract = None
+    insert = None
+    ptype = location.slot.ptype
+
+    for step in location.steps:
+        step_extract, step_insert = _step_functions(
+            values, step, ptype.kind is Kind.ARRAY
+        )
+        ptype = step.ptype
+
+        if extract is None:
+            extract, insert = step_extract, step_insert
+        else:
+            extract, insert = _chain(extract, insert, step_extract, step_insert)
+
+    return extract, insert
+
+
+def _reader(values, location):
+    nr = location.slot.nr
+    extract, _ = _location_functions(values, location)
+
+    if extract is None:
+        return lambda: values[nr]
+    return lambda: extract(values[nr])
+
+
+class Interpreter:
+    """
+    translates the statements of a process into a tree
+    of closures, that operate on the packed values of the simulator
+    """
+
+    def __init__(self, instance):
+        self._instance = instance
+        self._values = instance._sim._values
+        self._pending = instance._sim._pending
+        self._last = instance._sim._last
+
+    def process(self, code: ir.CodeBlock, reads: set):
+        """
+        returns a function, that executes code once,
+        all signals read by code are added to reads
+        """
+
+        return self._block(code, reads) or (lambda: None)
+
+    #
+    # value access
+    #
+
+    def _reader(self, obj: TypeQualifier, reads: set | None):
+        ptype = packed.packed_type(obj.type)
+        location = self._instance.location(obj, reads)
+
+        if reads is not None and location.slot.is_signal:
+            reads.add(location.slot.nr)
+
+        read = _reader(self._values, location)
+        cvt = packed.convert(ptype, location.ptype)
+
+        if cvt is packed._identity:
+            return read, ptype
+        return (lambda: cvt(read())), ptype
+
+    def _operand(self, value, hint: PackedType | None, reads: set):
+        """
+        returns a function, that evaluates value and the packed type of the result
+        """
+
+        if isinstance(value, TypeQualifier):
+            return self._reader(value, reads)
+
+        ptype = packed.constant_type(value)
+
+        if ptype is None:
+            assert hint is not None, f"cannot determine type of constant '{value}'"
+            ptype = hint
+
+        const = packed.constant(ptype, value)
+        return (lambda: const), ptype
+
+    def _operands(self, lhs, rhs, reads):
+        # constants without a type of their own (Null/Full)
+        # use the type of the other operand
+        if isinstance(lhs, TypeQualifier) or not isinstance(rhs, TypeQualifier):
+            lhs_read, lhs_type = self._operand(lhs, None, reads)
+            rhs_read, rhs_type = self._operand(rhs, lhs_type, reads)
+        else:
+            rhs_read, rhs_type = self._operand(rhs, None, reads)
+            lhs_read, lhs_type = self._operand(lhs, rhs_type, reads)
+
+        return lhs_read, lhs_type, rhs_read, rhs_type
+
+    def _writer(self, obj: TypeQualifier, reads: set):
+        """
+        returns a function that assigns a packed value
+        of type obj.type to obj
+        """
+
+        ptype = packed.packed_type(obj.type)
+        location = self._instance.location(obj, reads)
+        slot = location.slot
+        nr = slot.nr
+        values = self._values
+        pending = self._pending
+
+        assert not isinstance(
+            slot.root, Generic
+        ), f"writing to generic '{slot.name()}' not allowed"
+
+        cvt = packed.convert(location.ptype, ptype)
+        _, insert = _location_functions(values, location)
+
+        if slot.is_signal:
+            if insert is None:
+                if cvt is packed._identity:
+
+                    def write(value):
+                        pending[nr] = value
+
+                else:
+
+                    def write(value):
+                        pending[nr] = cvt(value)
+
+            else:
+
+                def write(value):
+                    base = pending[nr] if nr in pending else values[nr]
+                    pending[nr] = insert(base, cvt(value))
+
+        else:
+            if insert is None:
+
+                def write(value):
+                    values[nr] = cvt(value)
+
+            else:
+
+                def write(value):
+                    values[nr] = insert(values[nr], cvt(value))
+
+        return write, ptype
+
+    def _assignment(self, target, source, reads):
+        write, ptype = self._writer(target, reads)
+
+        if isinstance(source, (tuple, list)):
+            assert ptype.kind is Kind.ARRAY, "list assigned to non array object"
+            elems = [self._operand(elem, ptype.elem, reads) for elem in source]
+            elems = [
+                (read, packed.convert(ptype.elem, elem_type))
+                for read, elem_type in elems
+            ]
+            rest = [packed.zero(ptype.elem)] * (ptype.count - len(elems))
+
+            return lambda: write([cvt(read()) for read, cvt in elems] + rest)
+
+        read, source_type = self._operand(source, ptype, reads)
+        cvt = packed.convert(ptype, source_type)
+
+        if cvt is packed._identity:
+            return lambda: write(read())
+        return lambda: write(cvt(read()))
+
+    #
+    # statements
+    #
+
+    def _event(self, event, reads):
+        if isinstance(event, ir.EventGroup):
+            events = [self._event(sub, reads) for sub in event.events]
+
+            if event.operation is ir.EventGroup.Operation.AND:
+                return lambda: all(ev() for ev in events)
+            return lambda: any(ev() for ev in events)
+
+        location = self._instance.location(event.sig, reads)
+        nr = location.slot.nr
+        extract, _ = _location_functions(self._values, location)
+        extract = extract or packed._identity
+        values = self._values
+        last = self._last
+        Type = ir.Event.Type
+        event_type = event.event_type
+
+        if reads is not None and location.slot.is_signal:
+            reads.add(nr)
+
+        if event_type is Type.HIGH:
+            return lambda: extract(values[nr]) == 1
+        if event_type is Type.LOW:
+            return lambda: extract(values[nr]) == 0
+
+        def changed():
+            if nr not in last:
+                return None
+            prev = extract(last[nr])
+            current = extract(values[nr])
+            return None if prev == current else current
+
+        if event_type is Type.RISING:
+            return lambda: changed() == 1
+        if event_type is Type.FALLING:
+            return lambda: changed() == 0
+        if event_type is Type.BOTH_EDGES:
+            return lambda: changed() is not None
+
+        raise AssertionError(f"invalid event type {event_type}")
+
+    def _block(self, block: ir.CodeBlock, reads):
+        stmts = [self._stmt(stmt, reads) for stmt in block.content()]
+        stmts = [stmt for stmt in stmts if stmt is not None]
+
+        if len(stmts) == 0:
+            return None
+        if len(stmts) == 1:
+            return stmts[0]
+
+        def run():
+            for stmt in stmts:
+                stmt()
+
+        return run
+
+    def _stmt(self, stmt: ir.Statement, reads):
+        if isinstance(stmt, ir.CodeBlock):
+            return self._block(stmt, reads)
+
+        if isinstance(stmt, (ir.Nop, ir.Comment)):
+            return None
+
+        if isinstance(
+            stmt, (ir.SignalAssignment, ir.SignalPush, ir.VariableAssignment)
+        ):
+            return self._assignment(stmt._target, stmt._source, reads)
+
+        if isinstance(stmt, ir.If):
+            if isinstance(stmt._test, (ir.Event, ir.EventGroup)):
+                test = self._event(stmt._test, reads)
+            else:
+                read, ptype = self._operand(stmt._test, None, reads)
+                packed.truth(ptype)
+                test = read
+
+            body = self._block(stmt._body, reads)
+            orelse = self._block(stmt._orelse, reads)
+
+            if body is None and orelse is None:
+                return None
+
+            if orelse is None:
+
+                def run():
+                    if test():
+                        body()
+
+            elif body is None:
+
+                def run():
+                    if not test():
+                        orelse()
+
+            else:
+
+                def run():
+                    if test():
+                        body()
+                    else:
+                        orelse()
+
+            return run
+
+        if isinstance(stmt, ir.CaseWhen):
+            read, ptype = self._operand(stmt._value, None, reads)
+            nop = lambda: None
+            table = {}
+
+            for branch in stmt._branches:
+                key = packed.constant(ptype, branch.cond)
+                table.setdefault(key, self._block(branch.code, reads) or nop)
+
+            default = nop
+
+            if stmt._default is not None:
+                default = self._block(stmt._default, reads) or nop
+
+            return lambda: table.get(read(), default)()
+
+        if isinstance(stmt, ir.Assert):
+            read, ptype = self._operand(stmt._cond, None, reads)
+            packed.truth(ptype)
+            msg = stmt._msg
+
+            def run():
+                if not read():
+                    raise AssertionError(f"simulation assertion failed: {msg}")
+
+            return run
+
+        if isinstance(stmt, ir.Expression):
+            return self._expression(stmt, reads)
+
+        if isinstance(stmt, ir.InlineCode):
+            raise AssertionError("inline code cannot be simulated")
+
+        raise AssertionError(f"statement {type(stmt)} cannot be simulated")
+
+    def _expression(self, stmt: ir.Expression, reads):
+        write, result = self._writer(stmt.result(), reads)
+
+        if isinstance(stmt, ir.BinOp):
+            lhs, lhs_type, rhs, rhs_type = self._operands(stmt._lhs, stmt._rhs, reads)
+            op = packed.binary_op(stmt._op, lhs_type, rhs_type, result)
+            return lambda: write(op(lhs(), rhs()))
+
+        if isinstance(stmt, ir.UnaryOp):
+            arg, arg_type = self._operand(stmt._arg, result, reads)
+            op = packed.unary_op(stmt._op, arg_type, result)
+            return lambda: write(op(arg()))
+
+        if isinstance(stmt, ir.Compare):
+            lhs, lhs_type, rhs, rhs_type = self._operands(stmt._lhs, stmt._rhs, reads)
+            op = packed.compare_op(stmt._op, lhs_type, rhs_type)
+            return lambda: write(op(lhs(), rhs()))
+
+        if isinstance(stmt, ir.Boolean):
+            arg, arg_type = self._operand(stmt._arg, None, reads)
+            packed.truth(arg_type)
+            return lambda: write(1 if arg() else 0)
+
+        if isinstance(stmt, (ir.All, ir.Any)):
+            args = [self._operand(arg, None, reads)[0] for arg in stmt._args]
+            combine = all if isinstance(stmt, ir.All) else any
+            return lambda: write(1 if combine(arg() for arg in args) else 0)
+
+        if isinstance(stmt, ir.SelectWith):
+            read, ptype = self._operand(stmt._arg, None, reads)
+            table = {}
+
+            for cond, value in stmt._branches:
+                key = packed.constant(ptype, cond)
+
+                if key not in table:
+                    value_read, value_type = self._operand(value, result, reads)
+                    table[key] = (value_read, packed.convert(result, value_type))
+
+            if stmt._default is None:
+                const = packed.zero(result)
+                default = ((lambda: const), packed._identity)
+            else:
+                value_read, value_type = self._operand(stmt._default, result, reads)
+                default = (value_read, packed.convert(result, value_type))
+
+            def run():
+                value_read, cvt = table.get(read(), default)
+                write(cvt(value_read()))
+
+            return run
+
+        raise AssertionError(f"expression {type(stmt)} cannot be simulated")
@@ -0,0 +1,949 @@
+from __future__ import annotations
+
+import numpy as np
+
+from cohdl._core._ir import repr as ir
+from cohdl._core._type_qualifier import TypeQualifier, Generic
+from cohdl._core._intrinsic_operations import (
+    UnaryOperator,
+    BinaryOperator,
+    ComparisonOperator,
+)
+
+from . import _packed as packed
+from ._packed import PackedType, Kind
+from ._simulator import Simulator, SignalHandle
+
+#
+# Each slot stores a NumPy array with one entry per lane (the first axis).
+# Vectors up to _native_width bits use int64 entries, so that all
+# intermediate results of the packed operations fit into 64 bits.
+# Wider vectors use object arrays of Python ints.
+#
+
+_native_width = 62
+_vector_kinds = (Kind.VECTOR, Kind.UNSIGNED, Kind.SIGNED)
+
+
+def lane_dtype(ptype: PackedType):
+    if ptype.kind is Kind.ARRAY:
+        return lane_dtype(ptype.elem)
+    if ptype.kind in _vector_kinds and ptype.width > _native_width:
+        return object
+    return np.int64
+
+
+def _elem_shape(ptype: PackedType):
+    if ptype.kind is Kind.ARRAY:
+        return (ptype.count, *_elem_shape(ptype.elem))
+    return ()
+
+
+_enum_members: dict[type, list] = {}
+
+
+def _members(ptype: PackedType) -> list:
+    members = _enum_members.get(ptype.type)
+
+    if members is None:
+        members = ptype.type.__members__
+
+        if hasattr(members, "values"):
+            members = list(members.values())
+
+        members = _enum_members[ptype.type] = list(members)
+
+    return members
+
+
+def _lane_element(ptype: PackedType, value):
+    # converts a packed value to the entry stored in a lane,
+    # enumeration members are replaced with their index
+    if ptype.kind is Kind.ENUM:
+        for nr, member in enumerate(_members(ptype)):
+            if member is value:
+                return nr
+        raise AssertionError(f"{value} is not a member of {ptype.type}")
+    if ptype.kind is Kind.ARRAY:
+        return [_lane_element(ptype.elem, elem) for elem in value]
+    return value
+
+
+def broadcast(ptype: PackedType, value, lanes: int):
+    """
+    converts a packed value to a lane array, with value in all lanes
+    """
+
+    elem = np.array(_lane_element(ptype, value), dtype=lane_dtype(ptype))
+    return np.broadcast_to(elem, (lanes, *elem.shape)).copy()
+
+
+def _cast(value: np.ndarray, dtype):
+    if value.dtype != dtype:
+        return value.astype(dtype)
+    return value
+
+
+def _bool(value: np.ndarray):
+    return (value != 0).astype(np.int64)
+
+
+def _to_int(ptype: PackedType, value):
+    if ptype.kind is Kind.SIGNED:
+        sign = 1 << (ptype.width - 1)
+        return (value ^ sign) - sign
+    return value
+
+
+def _wrap(ptype: PackedType, value):
+    if ptype.kind is Kind.INTEGER:
+        return value
+    return value & ptype.mask
+
+
+def _work_dtype(*ptypes: PackedType):
+    # dtype used for intermediate results, object
+    # whenever one of the operands or the result is wide
+    if any(lane_dtype(ptype) is object for ptype in ptypes):
+        return object
+    return np.int64
+
+
+#
+# lane versions of the operations in _packed
+#
+
+
+def convert(target: PackedType, source: PackedType):
+    """
+    returns a function, that converts lane arrays
+    of source to the representation of target
+    """
+
+    # raises an error for invalid conversions
+    scalar = packed.convert(target, source)
+    work = _work_dtype(target, source)
+    result = lane_dtype(target)
+
+    if scalar is packed._identity or scalar is list:
+        if lane_dtype(source) == result:
+            return packed._identity
+        return lambda value: _cast(value, result)
+
+    tk = target.kind
+    sk = source.kind
+
+    if tk is Kind.ARRAY:
+        elem = convert(target.elem, source.elem)
+        return lambda value: _cast(elem(value), result)
+
+    if tk in _vector_kinds:
+        mask = target.mask
+
+        if sk is Kind.SIGNED:
+            return lambda value: _cast(
+                _to_int(source, _cast(value, work)) & mask, result
+            )
+        return lambda value: _cast(_cast(value, work) & mask, result)
+
+    if tk in (Kind.BIT, Kind.BOOL):
+        return _bool
+
+    if tk is Kind.INTEGER:
+        return lambda value: _cast(_to_int(source, value), result)
+
+    raise AssertionError(f"cannot convert {source.type} to {target.type}")
+
+
+def truncdiv(lhs, rhs):
+    zero = rhs == 0
+    divisor = np.where(zero, 1, rhs)
+    result = abs(lhs) // abs(divisor)
+    result = np.where((lhs < 0) != (divisor < 0), -result, result)
+    return np.where(zero, 0, result)
+
+
+def rem(lhs, rhs):
+    return np.where(rhs == 0, 0, lhs - rhs * truncdiv(lhs, rhs))
+
+
+def mod(lhs, rhs):
+    zero = rhs == 0
+    return np.where(zero, 0, lhs % np.where(zero, 1, rhs))
+
+
+def lshift(lhs, rhs):
+    if lhs.dtype == object:
+        return lhs << np.maximum(rhs, 0)
+    return np.where(rhs >= 64, 0, lhs << np.clip(rhs, 0, 63))
+
+
+def rshift(lhs, rhs):
+    if lhs.dtype == object:
+        return lhs >> np.maximum(rhs, 0)
+    return lhs >> np.clip(rhs, 0, 63)
+
+
+_arithmetic = {
+    BinaryOperator.ADD: lambda a, b: a + b,
+    BinaryOperator.SUB: lambda a, b: a - b,
+    BinaryOperator.MUL: lambda a, b: a * b,
+    BinaryOperator.DIV: truncdiv,
+    BinaryOperator.TRUNC_DIV: truncdiv,
+    BinaryOperator.MOD: mod,
+    BinaryOperator.REM: rem,
+}
+
+_bitwise = {
+    BinaryOperator.BIT_AND: lambda a, b: a & b,
+    BinaryOperator.BIT_OR: lambda a, b: a | b,
+    BinaryOperator.BIT_XOR: lambda a, b: a ^ b,
+}
+
+_comparison = {
+    ComparisonOperator.EQ: lambda a, b: a == b,
+    ComparisonOperator.NE: lambda a, b: a != b,
+    ComparisonOperator.GT: lambda a, b: a > b,
+    ComparisonOperator.LT: lambda a, b: a < b,
+    ComparisonOperator.GE: lambda a, b: a >= b,
+    ComparisonOperator.LE: lambda a, b: a <= b,
+}
+
+
+def unary_op(op: UnaryOperator, arg: PackedType, result: PackedType):
+    work = _work_dtype(arg, result)
+    out = lane_dtype(result)
+
+    if op is UnaryOperator.BOOL:
+        return _bool
+    if op is UnaryOperator.NOT:
+        return lambda a: (a == 0).astype(np.int64)
+    if op is UnaryOperator.INV:
+        mask = arg.mask
+        cvt = convert(result, arg)
+        return lambda a: cvt(a ^ mask)
+    if op is UnaryOperator.NEG:
+        return lambda a: _cast(_wrap(result, -_to_int(arg, _cast(a, work))), out)
+    if op is UnaryOperator.POS:
+        return lambda a: _cast(_wrap(result, _to_int(arg, _cast(a, work))), out)
+    if op is UnaryOperator.ABS:
+        return lambda a: _cast(_wrap(result, abs(_to_int(arg, _cast(a, work)))), out)
+
+    raise AssertionError(f"unary operator {op} not supported")
+
+
+def binary_op(
+    op: BinaryOperator,
+    lhs: PackedType,
+    rhs: PackedType,
+    result: PackedType,
+):
+    work = _work_dtype(lhs, rhs, result)
+    out = lane_dtype(result)
+
+    if op is BinaryOperator.AND:
+        return lambda a, b: ((a != 0) & (b != 0)).astype(np.int64)
+    if op is BinaryOperator.OR:
+        return lambda a, b: ((a != 0) | (b != 0)).astype(np.int64)
+
+    if op in _bitwise:
+        fn = _bitwise[op]
+        cvt_lhs = convert(result, lhs)
+        cvt_rhs = convert(result, rhs)
+        return lambda a, b: fn(cvt_lhs(a), cvt_rhs(b))
+
+    if op in _arithmetic:
+        fn = _arithmetic[op]
+
+        if lhs.kind is Kind.SIGNED or rhs.kind is Kind.SIGNED:
+            return lambda a, b: _cast(
+                _wrap(
+                    result,
+                    fn(_to_int(lhs, _cast(a, work)), _to_int(rhs, _cast(b, work))),
+                ),
+                out,
+            )
+
+        return lambda a, b: _cast(
+            _wrap(result, fn(_cast(a, work), _cast(b, work))), out
+        )
+
+    if op is BinaryOperator.CONCAT:
+        shift = rhs.width
+        return lambda a, b: _cast((_cast(a, work) << shift) | _cast(b, work), out)
+
+    if op is BinaryOperator.LSHIFT:
+        return lambda a, b: _cast(
+            _wrap(result, lshift(_cast(a, work), _to_int(rhs, b))), out
+        )
+
+    if op is BinaryOperator.RSHIFT:
+        if lhs.kind is Kind.SIGNED:
+            return lambda a, b: _cast(
+                _wrap(result, rshift(_to_int(lhs, _cast(a, work)), _to_int(rhs, b))),
+                out,
+            )
+        return lambda a, b: _cast(rshift(_cast(a, work), _to_int(rhs, b)), out)
+
+    raise AssertionError(f"binary operator {op} not supported")
+
+
+def compare_op(op: ComparisonOperator, lhs: PackedType, rhs: PackedType):
+    fn = _comparison[op]
+    work = _work_dtype(lhs, rhs)
+
+    if lhs.kind is Kind.ARRAY:
+        # arrays are equal when all elements are equal
+        axes = tuple(range(1, 1 + len(_elem_shape(lhs))))
+        equal = lambda a, b: (a == b).all(axis=axes)
+
+        if op is ComparisonOperator.EQ:
+            return lambda a, b: equal(a, b).astype(np.int64)
+        if op is ComparisonOperator.NE:
+            return lambda a, b: (~equal(a, b)).astype(np.int64)
+
+    if lhs.kind is Kind.SIGNED or rhs.kind is Kind.SIGNED:
+        return lambda a, b: fn(
+            _to_int(lhs, _cast(a, work)), _to_int(rhs, _cast(b, work))
+        ).astype(np.int64)
+
+    return lambda a, b: fn(_cast(a, work), _cast(b, work)).astype(np.int64)
+
+
+#
+# locations
+#
+
+
+def _index_reader(values, index, count: int | None, dtype):
+    # returns a function evaluating a runtime index
+    # or the index itself if it is constant,
+    # runtime indices are also evaluated in inactive lanes
+    # so they are clipped to the valid range
+    # (negative array indices count from the end like Python lists)
+    if isinstance(index, int):
+        return index
+
+    const = index.const
+    readers = []
+
+    for location, ptype in index.parts:
+        read = _reader(values, location)
+        cvt = convert(ptype, location.ptype)
+        readers.append(
+            (lambda read, cvt, ptype: lambda: _to_int(ptype, cvt(read())))(
+                read, cvt, ptype
+            )
+        )
+
+    def run():
+        result = const
+
+        for read in readers:
+            result = result + read()
+
+        if count is None:
+            return _cast(np.maximum(result, 0), dtype)
+
+        result = np.where(result < 0, result + count, result)
+        return np.clip(result, 0, count - 1)
+
+    return run
+
+
+def _step_functions(values, parent: PackedType, step, lanes):
+    """
+    returns the extract and insert functions of a single location step
+    """
+
+    parent_dtype = lane_dtype(parent)
+    result_dtype = lane_dtype(step.ptype)
+
+    if parent.kind is Kind.ARRAY:
+        index = _index_reader(values, step.index, parent.count, np.int64)
+
+        if callable(index):
+
+            def extract(value):
+                return value[lanes, index()]
+
+            def insert(value, new):
+                value = value.copy()
+                value[lanes, index()] = new
+                return value
+
+        else:
+
+            def extract(value):
+                return value[:, index]
+
+            def insert(value, new):
+                value = value.copy()
+                value[:, index] = new
+                return value
+
+        return extract, insert
+
+    mask = 1 if step.width is None else (1 << step.width) - 1
+    index = _index_reader(values, step.index, None, parent_dtype)
+
+    if callable(index):
+
+        def extract(value):
+            return _cast((value >> index()) & mask, result_dtype)
+
+        def insert(value, new):
+            nr = index()
+            return (value & ~(mask << nr)) | (_cast(new, parent_dtype) << nr)
+
+    else:
+        inverted = ~(mask << index)
+
+        def extract(value):
+            return _cast((value >> index) & mask, result_dtype)
+
+        def insert(value, new):
+            return (value & inverted) | (_cast(new, parent_dtype) << index)
+
+    return extract, insert
+
+
+def _chain(outer_extract, outer_insert, inner_extract, inner_insert):
+    def extract(value):
+        return inner_extract(outer_extract(value))
+
+    def insert(value, new):
+        return outer_insert(value, inner_insert(outer_extract(value), new))
+
+    return extract, insert
+
+
+def _location_functions(values, location):
+    """
+    returns functions, that extract the referenced part from a slot value
+    and that insert a new part into a slot value
+    (both None, when the location references the entire slot)
+    """
+
+    extract = None
+    insert = None
+    ptype = location.slot.ptype
+    lanes = np.arange(len(values[location.slot.nr]))
+
+    for step in location.steps:
+        step_extract, step_insert = _step_functions(values, ptype, step, lanes)
+        ptype = step.ptype
+
+        if extract is None:
+            extract, insert = step_extract, step_insert
+        else:
+            extract, insert = _chain(extract, insert, step_extract, step_insert)
+
+    return extract, insert
+
+
+def _reader(values, location):
+    nr = location.slot.nr
+    extract, _ = _location_functions(values, location)
+
+    if extract is None:
+        return lambda: values[nr]
+    return lambda: extract(values[nr])
+
+
+class LaneInterpreter:
+    """
+    translates the statements of a process into closures,
+    that evaluate all lanes at once
+
+    Each statement receives a boolean mask of the lanes it applies to.
+    Conditional statements narrow the mask for their branches and
+    assignments only modify the selected lanes.
+    """
+
+    def __init__(self, instance):
+        self._instance = instance
+        sim = instance._sim
+        self._values = sim._values
+        self._pending = sim._pending
+        self._last = sim._last
+        self._lanes = sim._lanes
+
+    def process(self, code: ir.CodeBlock, reads: set):
+        """
+        returns a function, that executes code once,
+        all signals read by code are added to reads
+        """
+
+        block = self._block(code, reads)
+
+        if block is None:
+            return lambda: None
+
+        full = np.ones(self._lanes, dtype=bool)
+        return lambda: block(full)
+
+    #
+    # value access
+    #
+
+    def _reader(self, obj: TypeQualifier, reads: set | None):
+        ptype = packed.packed_type(obj.type)
+        location = self._instance.location(obj, reads)
+
+        if reads is not None and location.slot.is_signal:
+            reads.add(location.slot.nr)
+
+        read = _reader(self._values, location)
+        cvt = convert(ptype, location.ptype)
+
+        if cvt is packed._identity:
+            return read, ptype
+        return (lambda: cvt(read())), ptype
+
+    def _operand(self, value, hint: PackedType | None, reads: set):
+        """
+        returns a function, that evaluates value and the packed type of the result
+        """
+
+        if isinstance(value, TypeQualifier):
+            return self._reader(value, reads)
+
+        ptype = packed.constant_type(value)
+
+        if ptype is None:
+            assert hint is not None, f"cannot determine type of constant '{value}'"
+            ptype = hint
+
+        const = broadcast(ptype, packed.constant(ptype, value), self._lanes)
+        return (lambda: const), ptype
+
+    def _operands(self, lhs, rhs, reads):
+        # constants without a type of their own (Null/Full)
+        # use the type of the other operand
+        if isinstance(lhs, TypeQualifier) or not isinstance(rhs, TypeQualifier):
+            lhs_read, lhs_type = self._operand(lhs, None, reads)
+            rhs_read, rhs_type = self._operand(rhs, lhs_type, reads)
+        else:
+            rhs_read, rhs_type = self._operand(rhs, None, reads)
+            lhs_read, lhs_type = self._operand(lhs, rhs_type, reads)
+
+        return lhs_read, lhs_type, rhs_read, rhs_type
+
+    def _writer(self, obj: TypeQualifier, reads: set):
+        """
+        returns a function that assigns a lane array
+        of type obj.type to the lanes of obj selected by a mask
+        """
+
+        ptype = packed.packed_type(obj.type)
+        location = self._instance.location(obj, reads)
+        slot = location.slot
+        nr = slot.nr
+        values = self._values
+        pending = self._pending
+
+        assert not isinstance(
+            slot.root, Generic
+        ), f"writing to generic '{slot.name()}' not allowed"
+
+        cvt = convert(location.ptype, ptype)
+        _, insert = _location_functions(values, location)
+        dtype = lane_dtype(slot.ptype)
+        mask_shape = (self._lanes, *(1 for _ in _elem_shape(slot.ptype)))
+
+        def write(value, mask):
+            value = cvt(value)
+
+            if slot.is_signal:
+                base = pending[nr] if nr in pending else values[nr]
+            else:
+                base = values[nr]
+
+            if insert is not None:
+                value = insert(base, value)
+
+            value = _cast(np.where(mask.reshape(mask_shape), value, base), dtype)
+
+            if slot.is_signal:
+                pending[nr] = value
+            else:
+                values[nr] = value
+
+        return write, ptype
+
+    def _assignment(self, target, source, reads):
+        write, ptype = self._writer(target, reads)
+
+        if isinstance(source, (tuple, list)):
+            assert ptype.kind is Kind.ARRAY, "list assigned to non array object"
+            elems = [self._operand(elem, ptype.elem, reads) for elem in source]
+            elems = [
+                (read, convert(ptype.elem, elem_type)) for read, elem_type in elems
+            ]
+            rest = [
+                broadcast(ptype.elem, packed.zero(ptype.elem), self._lanes)
+                for _ in range(ptype.count - len(elems))
+            ]
+
+            return lambda mask: write(
+                np.stack([cvt(read()) for read, cvt in elems] + rest, axis=1), mask
+            )
+
+        read, source_type = self._operand(source, ptype, reads)
+        cvt = convert(ptype, source_type)
+
+        if cvt is packed._identity:
+            return lambda mask: write(read(), mask)
+        return lambda mask: write(cvt(read()), mask)
+
+    #
+    # statements
+    #
+
+    def _event(self, event, reads):
+        if isinstance(event, ir.EventGroup):
+            events = [self._event(sub, reads) for sub in event.events]
+
+            if event.operation is ir.EventGroup.Operation.AND:
+                return lambda: np.logical_and.reduce([ev() for ev in events])
+            return lambda: np.logical_or.reduce([ev() for ev in events])
+
+        location = self._instance.location(event.sig, reads)
+        nr = location.slot.nr
+        extract, _ = _location_functions(self._values, location)
+        extract = extract or packed._identity
+        values = self._values
+        last = self._last
+        Type = ir.Event.Type
+        event_type = event.event_type
+        none = np.zeros(self._lanes, dtype=bool)
+
+        if reads is not None and location.slot.is_signal:
+            reads.add(nr)
+
+        if event_type is Type.HIGH:
+            return lambda: extract(values[nr]) == 1
+        if event_type is Type.LOW:
+            return lambda: extract(values[nr]) == 0
+
+        def edge(level):
+            def run():
+                if nr not in last:
+                    return none
+                current = extract(values[nr])
+                return (current == level) & (extract(last[nr]) != level)
+
+            return run
+
+        if event_type is Type.RISING:
+            return edge(1)
+        if event_type is Type.FALLING:
+            return edge(0)
+        if event_type is Type.BOTH_EDGES:
+
+            def run():
+                if nr not in last:
+                    return none
+                return extract(values[nr]) != extract(last[nr])
+
+            return run
+
+        raise AssertionError(f"invalid event type {event_type}")
+
+    def _block(self, block: ir.CodeBlock, reads):
+        stmts = [self._stmt(stmt, reads) for stmt in block.content()]
+        stmts = [stmt for stmt in stmts if stmt is not None]
+
+        if len(stmts) == 0:
+            return None
+        if len(stmts) == 1:
+            return stmts[0]
+
+        def run(mask):
+            for stmt in stmts:
+                stmt(mask)
+
+        return run
+
+    def _truth(self, value, reads):
+        read, ptype = self._operand(value, None, reads)
+        packed.truth(ptype)
+        return lambda: read() != 0
+
+    def _stmt(self, stmt: ir.Statement, reads):
+        if isinstance(stmt, ir.CodeBlock):
+            return self._block(stmt, reads)
+
+        if isinstance(stmt, (ir.Nop, ir.Comment)):
+            return None
+
+        if isinstance(
+            stmt, (ir.SignalAssignment, ir.SignalPush, ir.VariableAssignment)
+        ):
+            return self._assignment(stmt._target, stmt._source, reads)
+
+        if isinstance(stmt, ir.If):
+            if isinstance(stmt._test, (ir.Event, ir.EventGroup)):
+                test = self._event(stmt._test, reads)
+            else:
+                test = self._truth(stmt._test, reads)
+
+            body = self._block(stmt._body, reads)
+            orelse = self._block(stmt._orelse, reads)
+
+            if body is None and orelse is None:
+                return None
+
+            def run(mask):
+                result = test()
+
+                if body is not None:
+                    selected = mask & result
+
+                    if selected.any():
+                        body(selected)
+
+                if orelse is not None:
+                    selected = mask & ~result
+
+                    if selected.any():
+                        orelse(selected)
+
+            return run
+
+        if isinstance(stmt, ir.CaseWhen):
+            read, ptype = self._operand(stmt._value, None, reads)
+            branches = {}
+
+            for branch in stmt._branches:
+                key = _lane_element(ptype, packed.constant(ptype, branch.cond))
+
+                if key not in branches:
+                    branches[key] = self._block(branch.code, reads)
+
+            branches = list(branches.items())
+            default = None
+
+            if stmt._default is not None:
+                default = self._block(stmt._default, reads)
+
+            def run(mask):
+                value = read()
+
+                for key, code in branches:
+                    matches = value == key
+
+                    if code is not None:
+                        selected = mask & matches
+
+                        if selected.any():
+                            code(selected)
+
+                    mask = mask & ~matches
+
+                if default is not None and mask.any():
+                    default(mask)
+
+            return run
+
+        if isinstance(stmt, ir.Assert):
+            test = self._truth(stmt._cond, reads)
+            msg = stmt._msg
+
+            def run(mask):
+                failed = mask & ~test()
+
+                if failed.any():
+                    raise AssertionError(
+                        f"simulation assertion failed: {msg} "
+                        f"(lanes {np.flatnonzero(failed).tolist()})"
+                    )
+
+            return run
+
+        if isinstance(stmt, ir.Expression):
+            return self._expression(stmt, reads)
+
+        if isinstance(stmt, ir.InlineCode):
+            raise AssertionError("inline code cannot be simulated")
+
+        raise AssertionError(f"statement {type(stmt)} cannot be simulated")
+
+    def _expression(self, stmt: ir.Expression, reads):
+        write, result = self._writer(stmt.result(), reads)
+
+        if isinstance(stmt, ir.BinOp):
+            lhs, lhs_type, rhs, rhs_type = self._operands(stmt._lhs, stmt._rhs, reads)
+            op = binary_op(stmt._op, lhs_type, rhs_type, result)
+            return lambda mask: write(op(lhs(), rhs()), mask)
+
+        if isinstance(stmt, ir.UnaryOp):
+            arg, arg_type = self._operand(stmt._arg, result, reads)
+            op = unary_op(stmt._op, arg_type, result)
+            return lambda mask: write(op(arg()), mask)
+
+        if isinstance(stmt, ir.Compare):
+            lhs, lhs_type, rhs, rhs_type = self._operands(stmt._lhs, stmt._rhs, reads)
+            op = compare_op(stmt._op, lhs_type, rhs_type)
+            return lambda mask: write(op(lhs(), rhs()), mask)
+
+        if isinstance(stmt, ir.Boolean):
+            arg = self._truth(stmt._arg, reads)
+            return lambda mask: write(arg().astype(np.int64), mask)
+
+        if isinstance(stmt, (ir.All, ir.Any)):
+            args = [self._truth(arg, reads) for arg in stmt._args]
+            combine = (
+                np.logical_and.reduce
+                if isinstance(stmt, ir.All)
+                else np.logical_or.reduce
+            )
+            return lambda mask: write(
+                combine([arg() for arg in args]).astype(np.int64), mask
+            )
+
+        if isinstance(stmt, ir.SelectWith):
+            read, ptype = self._operand(stmt._arg, None, reads)
+            branches = {}
+
+            for cond, value in stmt._branches:
+                key = _lane_element(ptype, packed.constant(ptype, cond))
+
+                if key not in branches:
+                    value_read, value_type = self._operand(value, result, reads)
+                    branches[key] = (value_read, convert(result, value_type))
+
+            if stmt._default is None:
+                const = broadcast(result, packed.zero(result), self._lanes)
+                default = ((lambda: const), packed._identity)
+            else:
+                value_read, value_type = self._operand(stmt._default, result, reads)
+                default = (value_read, convert(result, value_type))
+
+            # the first matching branch is selected,
+            # so the branches are applied in reverse order
+            branches = list(branches.items())[::-1]
+            shape = (self._lanes, *(1 for _ in _elem_shape(result)))
+
+            def run(mask):
+                value = read()
+                default_read, default_cvt = default
+                selected = default_cvt(default_read())
+
+                for key, (value_read, cvt) in branches:
+                    selected = np.where(
+                        (value == key).reshape(shape), cvt(value_read()), selected
+                    )
+
+                write(selected, mask)
+
+            return run
+
+        raise AssertionError(f"expression {type(stmt)} cannot be simulated")
+
+
+class LaneHandle(SignalHandle):
+    """
+    access to a simulated object in all lanes
+
+    `value` is a NumPy array with one entry per lane
+    (signed vectors are sign extended, enumerations are returned
+    as their members), assigning a scalar sets all lanes
+    """
+
+    @property
+    def value(self):
+        self._sim.settle()
+        ptype = self._slot.ptype
+        value = self._sim._values[self._slot.nr]
+
+        if ptype.kind is Kind.SIGNED:
+            return _to_int(ptype, value)
+        if ptype.kind is Kind.ENUM:
+            return np.array(_members(ptype), dtype=object)[value]
+        return value
+
+    @value.setter
+    def value(self, value):
+        self._sim._pending[self._slot.nr] = self._sim._lane_value(
+            self._slot.ptype, value
+        )
+
+    def mismatches(self, expected) -> np.ndarray:
+        """
+        returns the indices of all lanes, in which
+        the value differs from expected
+        """
+        return np.flatnonzero(self.value != expected)
+
+    def __repr__(self):
+        return f"LaneHandle({self.name}, {self._sim._values[self._slot.nr]})"
+
+
+class LaneSimulator(Simulator):
+    """
+    simulates `lanes` independent copies of an entity at once
+
+    All lanes share the same clock and delta cycles.
+    The values of each object are stored in NumPy arrays with one
+    entry per lane. Conditional statements are evaluated for all lanes
+    and only the lanes, where the condition holds, are updated.
+    """
+
+    _Handle = LaneHandle
+
+    def __init__(self, entity, lanes: int, *, max_deltas: int = 10000):
+        assert lanes > 0, "at least one lane required"
+        self._lanes = lanes
+        super().__init__(entity, max_deltas=max_deltas)
+
+    @property
+    def lanes(self) -> int:
+        return self._lanes
+
+    def _compiler_type(self, compiled: bool):
+        assert not compiled, "lane simulation does not support compiled processes"
+        return LaneInterpreter
+
+    def _store(self, ptype: PackedType, value):
+        return broadcast(ptype, value, self._lanes)
+
+    def _count(self, value) -> int:
+        return int(np.sum(value))
+
+    def _lane_value(self, ptype: PackedType, value):
+        # converts a value assigned via a LaneHandle to a lane array
+        if not isinstance(value, (np.ndarray, list, tuple)) or (
+            ptype.kind is Kind.ARRAY and not isinstance(value, np.ndarray)
+        ):
+            return self._store(ptype, packed.pack(ptype, value))
+
+        shape = (self._lanes, *_elem_shape(ptype))
+        dtype = lane_dtype(ptype)
+
+        if ptype.kind is Kind.ENUM:
+            value = [_lane_element(ptype, elem) for elem in value]
+        elif ptype.kind in (Kind.BIT, Kind.BOOL):
+            value = [1 if elem else 0 for elem in np.asarray(value).flat]
+        elif ptype.kind is not Kind.INTEGER:
+            mask = ptype.mask
+            value = [int(elem) & mask for elem in np.asarray(value).flat]
+
+        value = np.array(value, dtype=dtype).reshape(-1, *shape[1:])
+        assert value.shape == shape, f"expected lane array of shape {shape}"
+        return value
+
+    def _update(self):
+        values = self._values
+        last = self._last
+        last.clear()
+
+        for nr, value in self._pending.items():
+            prev = values[nr]
+
+            if prev is not value and not np.array_equal(prev, value):
+                last[nr] = prev
+                values[nr] = value
+
+        self._pending.clear()
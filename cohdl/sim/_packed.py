@@ -0,0 +1,436 @@
+from __future__ import annotations
+
+import enum
+
+from cohdl._core import (
+    Bit,
+    BitVector,
+    Unsigned,
+    Signed,
+    Integer,
+    Array,
+    Null,
+    _NullFullType,
+    _Boolean,
+)
+from cohdl._core import _enum as cohdl_enum
+from cohdl._core._intrinsic_operations import (
+    UnaryOperator,
+    BinaryOperator,
+    ComparisonOperator,
+)
+
+
+class Kind(enum.Enum):
+    BIT = enum.auto()
+    BOOL = enum.auto()
+    VECTOR = enum.auto()
+    UNSIGNED = enum.auto()
+    SIGNED = enum.auto()
+    INTEGER = enum.auto()
+    ENUM = enum.auto()
+    ARRAY = enum.auto()
+
+
+_vector_kinds = (Kind.VECTOR, Kind.UNSIGNED, Kind.SIGNED)
+_bit_kinds = (Kind.BIT, Kind.BOOL)
+_numeric_kinds = (Kind.UNSIGNED, Kind.SIGNED, Kind.INTEGER, Kind.BIT, Kind.BOOL)
+
+
+class PackedType:
+    """
+    describes how values of a CoHDL type are stored in the simulator
+
+    Bits and booleans are stored as 0/1, all vector types as
+    unsigned Python ints (signed vectors in two's complement),
+    Integers as Python ints, enumerations as their members
+    and arrays as lists of packed elements.
+    """
+
+    def __init__(self, type: type):
+        self.type = type
+        self.width = 1
+        self.elem: PackedType | None = None
+        self.count = 0
+
+        if issubclass(type, Bit):
+            self.kind = Kind.BIT
+        elif issubclass(type, _Boolean):
+            self.kind = Kind.BOOL
+        elif issubclass(type, BitVector):
+            if issubclass(type, Signed):
+                self.kind = Kind.SIGNED
+            elif issubclass(type, Unsigned):
+                self.kind = Kind.UNSIGNED
+            else:
+                self.kind = Kind.VECTOR
+            self.width = type.width
+        elif issubclass(type, Integer):
+            self.kind = Kind.INTEGER
+            self.width = 0
+        elif issubclass(type, (cohdl_enum.Enum, cohdl_enum.DynamicEnum)):
+            self.kind = Kind.ENUM
+            self.width = 0
+        elif issubclass(type, Array):
+            self.kind = Kind.ARRAY
+            self.width = 0
+            self.elem = packed_type(type._elemtype_)
+            self.count = type._count_
+        else:
+            raise AssertionError(f"type '{type}' is not supported by the simulator")
+
+        self.mask = (1 << self.width) - 1
+
+    def is_vector(self):
+        return self.kind in _vector_kinds
+
+    def is_bit(self):
+        return self.kind in _bit_kinds
+
+    def __repr__(self):
+        return f"PackedType({self.type})"
+
+
+_packed_types: dict[type, PackedType] = {}
+
+
+def packed_type(type: type) -> PackedType:
+    if type is bool:
+        type = _Boolean
+    elif type is int:
+        type = Integer
+
+    result = _packed_types.get(type)
+
+    if result is None:
+        result = _packed_types[type] = PackedType(type)
+
+    return result
+
+
+def constant_type(value) -> PackedType | None:
+    """
+    type of a constant operand, None for Null/Full
+    that adapt to the other operand
+    """
+
+    if isinstance(value, _NullFullType):
+        return None
+    if isinstance(value, str):
+        return packed_type(BitVector[len(value)])
+    if isinstance(value, bool):
+        return packed_type(_Boolean)
+    if isinstance(value, int):
+        return packed_type(Integer)
+    return packed_type(type(value))
+
+
+#
+# conversion between packed and primitive values
+#
+
+
+def zero(ptype: PackedType):
+    if ptype.kind is Kind.ENUM:
+        if issubclass(ptype.type, cohdl_enum.DynamicEnum):
+            return ptype.type.__members__[0]
+        return next(iter(ptype.type.__members__.values()))
+    if ptype.kind is Kind.ARRAY:
+        return [zero(ptype.elem) for _ in range(ptype.count)]
+    return 0
+
+
+def pack(ptype: PackedType, value):
+    """
+    converts a primitive value or a Python constant
+    to the packed representation of ptype
+    """
+
+    if value is None:
+        return zero(ptype)
+
+    kind = ptype.kind
+
+    if isinstance(value, _NullFullType):
+        if kind is Kind.ARRAY:
+            return [pack(ptype.elem, value) for _ in range(ptype.count)]
+        if kind is Kind.INTEGER or kind is Kind.ENUM:
+            raise AssertionError(f"cannot assign {value} to {ptype.type}")
+        return 0 if value is Null else ptype.mask
+
+    if kind is Kind.ENUM:
+        return value
+
+    if kind is Kind.ARRAY:
+        if isinstance(value, Array):
+            value = value._value
+        assert len(value) <= ptype.count, "too many elements in array value"
+        return [pack(ptype.elem, elem) for elem in value] + [
+            zero(ptype.elem) for _ in range(ptype.count - len(value))
+        ]
+
+    if isinstance(value, BitVector):
+        result = 0
+        for nr, bit in enumerate(value._value):
+            if bit:
+                result |= 1 << nr
+
+        source = packed_type(type(value))
+        return convert(ptype, source)(result)
+
+    if isinstance(value, str):
+        assert kind in _vector_kinds, f"cannot assign string to {ptype.type}"
+        assert len(value) == ptype.width, "width mismatch in string assignment"
+        return int(value, 2)
+
+    if kind is Kind.INTEGER:
+        return int(value)
+
+    if kind in _bit_kinds:
+        return 1 if value else 0
+
+    return wrap(ptype, int(value))
+
+
+def unpack(ptype: PackedType, value):
+    """
+    converts a packed value back to a CoHDL primitive
+    """
+
+    kind = ptype.kind
+
+    if kind is Kind.BIT:
+        return Bit(value)
+    if kind is Kind.BOOL:
+        return bool(value)
+    if kind is Kind.UNSIGNED:
+        return ptype.type(value)
+    if kind is Kind.SIGNED:
+        return ptype.type(to_int(ptype, value))
+    if kind is Kind.VECTOR:
+        return ptype.type(format(value, f"0{ptype.width}b"))
+    if kind is Kind.INTEGER:
+        return Integer(value)
+    if kind is Kind.ENUM:
+        return value
+    return ptype.type([unpack(ptype.elem, elem) for elem in value])
+
+
+#
+# numeric interpretation
+#
+
+
+def to_int(ptype: PackedType, value):
+    if ptype.kind is Kind.SIGNED:
+        width = ptype.width
+        return value - (((value >> (width - 1)) & 1) << width)
+    return value
+
+
+def wrap(ptype: PackedType, value):
+    """
+    packs the mathematical result of an operation into ptype
+    """
+
+    if ptype.kind is Kind.INTEGER:
+        return value
+    return value & ptype.mask
+
+
+def truncdiv(lhs, rhs):
+    # division rounding towards zero, division by zero returns 0
+    # (same as the CoHDL primitive types)
+    if rhs == 0:
+        return 0
+    result = abs(lhs) // abs(rhs)
+    return -result if (lhs < 0) != (rhs < 0) else result
+
+
+def rem(lhs, rhs):
+    if rhs == 0:
+        return 0
+    return lhs - rhs * truncdiv(lhs, rhs)
+
+
+def mod(lhs, rhs):
+    if rhs == 0:
+        return 0
+    return lhs % rhs
+
+
+def _identity(value):
+    return value
+
+
+def convert(target: PackedType, source: PackedType | None):
+    """
+    returns a function, that converts packed values
+    of source to the representation of target
+    """
+
+    if source is None or source is target:
+        return _identity
+
+    tk = target.kind
+    sk = source.kind
+
+    if tk in _vector_kinds:
+        if sk in _vector_kinds and source.width == target.width:
+            return _identity
+
+        mask = target.mask
+
+        if sk is Kind.SIGNED:
+            return lambda value: to_int(source, value) & mask
+        if sk in _vector_kinds or sk in _bit_kinds or sk is Kind.INTEGER:
+            return lambda value: value & mask
+    elif tk in _bit_kinds:
+        if sk in _bit_kinds:
+            return _identity
+        if sk in _vector_kinds and source.width == 1:
+            return _identity
+        if sk is Kind.INTEGER:
+            return lambda value: 1 if value else 0
+    elif tk is Kind.INTEGER:
+        if sk is Kind.INTEGER or sk in _bit_kinds or sk is Kind.UNSIGNED:
+            return _identity
+        if sk is Kind.SIGNED:
+            return lambda value: to_int(source, value)
+    elif tk is Kind.ENUM:
+        if sk is Kind.ENUM:
+            return _identity
+    elif tk is Kind.ARRAY:
+        if sk is Kind.ARRAY and source.count == target.count:
+            elem = convert(target.elem, source.elem)
+
+            if elem is _identity:
+                return list
+            return lambda value: [elem(v) for v in value]
+
+    raise AssertionError(f"cannot convert {source.type} to {target.type}")
+
+
+def constant(target: PackedType, value):
+    """
+    converts a constant operand to a packed value of target
+    """
+
+    if isinstance(value, _NullFullType) or target.kind is Kind.ARRAY:
+        return pack(target, value)
+
+    source = constant_type(value)
+    return convert(target, source)(pack(source, value))
+
+
+def truth(ptype: PackedType):
+    if ptype.kind is Kind.ENUM or ptype.kind is Kind.ARRAY:
+        raise AssertionError(f"cannot convert {ptype.type} to bool")
+    return bool
+
+
+#
+# operations
+#
+
+
+def unary_op(op: UnaryOperator, arg: PackedType, result: PackedType):
+    if op is UnaryOperator.BOOL:
+        return lambda a: 1 if a else 0
+    if op is UnaryOperator.NOT:
+        return lambda a: 0 if a else 1
+    if op is UnaryOperator.INV:
+        mask = arg.mask
+        cvt = convert(result, arg)
+        return lambda a: cvt(a ^ mask)
+    if op is UnaryOperator.NEG:
+        return lambda a: wrap(result, -to_int(arg, a))
+    if op is UnaryOperator.POS:
+        return lambda a: wrap(result, to_int(arg, a))
+    if op is UnaryOperator.ABS:
+        return lambda a: wrap(result, abs(to_int(arg, a)))
+
+    raise AssertionError(f"unary operator {op} not supported")
+
+
+_arithmetic = {
+    BinaryOperator.ADD: lambda a, b: a + b,
+    BinaryOperator.SUB: lambda a, b: a - b,
+    BinaryOperator.MUL: lambda a, b: a * b,
+    BinaryOperator.DIV: truncdiv,
+    BinaryOperator.TRUNC_DIV: truncdiv,
+    BinaryOperator.MOD: mod,
+    BinaryOperator.REM: rem,
+}
+
+_bitwise = {
+    BinaryOperator.BIT_AND: lambda a, b: a & b,
+    BinaryOperator.BIT_OR: lambda a, b: a | b,
+    BinaryOperator.BIT_XOR: lambda a, b: a ^ b,
+}
+
+
+def binary_op(
+    op: BinaryOperator,
+    lhs: PackedType,
+    rhs: PackedType,
+    result: PackedType,
+):
+    if op is BinaryOperator.AND:
+        return lambda a, b: 1 if (a and b) else 0
+    if op is BinaryOperator.OR:
+        return lambda a, b: 1 if (a or b) else 0
+
+    if op in _bitwise:
+        fn = _bitwise[op]
+        cvt_lhs = convert(result, lhs)
+        cvt_rhs = convert(result, rhs)
+        return lambda a, b: fn(cvt_lhs(a), cvt_rhs(b))
+
+    if op in _arithmetic:
+        fn = _arithmetic[op]
+
+        if lhs.kind is Kind.SIGNED or rhs.kind is Kind.SIGNED:
+            return lambda a, b: wrap(result, fn(to_int(lhs, a), to_int(rhs, b)))
+        if result.kind is Kind.INTEGER:
+            return fn
+        return lambda a, b: wrap(result, fn(a, b))
+
+    if op is BinaryOperator.CONCAT:
+        shift = rhs.width
+        return lambda a, b: (a << shift) | b
+
+    if op is BinaryOperator.LSHIFT:
+        return lambda a, b: wrap(result, a << to_int(rhs, b))
+
+    if op is BinaryOperator.RSHIFT:
+        if lhs.kind is Kind.SIGNED:
+            return lambda a, b: wrap(result, to_int(lhs, a) >> to_int(rhs, b))
+        return lambda a, b: a >> to_int(rhs, b)
+
+    raise AssertionError(f"binary operator {op} not supported")
+
+
+_comparison = {
+    ComparisonOperator.EQ: lambda a, b: 1 if a == b else 0,
+    ComparisonOperator.NE: lambda a, b: 1 if a != b else 0,
+    ComparisonOperator.GT: lambda a, b: 1 if a > b else 0,
+    ComparisonOperator.LT: lambda a, b: 1 if a < b else 0,
+    ComparisonOperator.GE: lambda a, b: 1 if a >= b else 0,
+    ComparisonOperator.LE: lambda a, b: 1 if a <= b else 0,
+}
+
+
+def compare_op(op: ComparisonOperator, lhs: PackedType, rhs: PackedType):
+    fn = _comparison[op]
+
+    if lhs.kind is Kind.SIGNED or rhs.kind is Kind.SIGNED:
+        return lambda a, b: fn(to_int(lhs, a), to_int(rhs, b))
+
+    if lhs.kind is Kind.ENUM:
+        if op is ComparisonOperator.EQ:
+            return lambda a, b: 1 if a is b else 0
+        if op is ComparisonOperator.NE:
+            return lambda a, b: 0 if a is b else 1
+
+    return fn
@@ -0,0 +1,554 @@
+from __future__ import annotations
+
+from cohdl._core._ir import repr as ir
+from cohdl._core._type_qualifier import (
+    TypeQualifier,
+    Signal,
+    Generic,
+    Offset,
+    Slice,
+)
+from cohdl._core._intrinsic import _SensitivityList
+from cohdl._core import BitVector
+from cohdl.utility import IdMap
+
+from . import _packed as packed
+from ._packed import PackedType
+from ._interpreter import Interpreter
+
+
+class _Slot:
+    """
+    storage location of a single root object
+    """
+
+    def __init__(self, nr: int, path: tuple, root: TypeQualifier, ptype: PackedType):
+        self.nr = nr
+        self.path = path
+        self.root = root
+        self.ptype = ptype
+        self.is_signal = isinstance(root, Signal) and not isinstance(root, Generic)
+
+    def name(self):
+        return ".".join(self.path)
+
+
+class _Index:
+    """
+    index computed at runtime from a constant part
+    and a list of objects (location and packed type of the object)
+    """
+
+    def __init__(self, const: int, parts: list[tuple[_Location, PackedType]]):
+        self.const = const
+        self.parts = parts
+
+
+class _Step:
+    """
+    single step of a location, either an array element/vector bit
+    (width is None) or a range of bits
+    """
+
+    def __init__(self, ptype: PackedType, index: int | _Index, width: int | None):
+        self.ptype = ptype
+        self.index = index
+        self.width = width
+
+
+class _Location:
+    """
+    reference to a (part of) the value stored in a slot
+
+    steps describes the path from the slot value
+    to the referenced part
+    """
+
+    def __init__(self, slot: _Slot, ptype: PackedType, steps: tuple = ()):
+        self.slot = slot
+        self.ptype = ptype
+        self.steps = steps
+
+    def index(self, ptype: PackedType, index: int | _Index):
+        return _Location(self.slot, ptype, (*self.steps, _Step(ptype, index, None)))
+
+    def range(self, low: int | _Index, width: int):
+        ptype = packed.packed_type(BitVector[width])
+        return _Location(self.slot, ptype, (*self.steps, _Step(ptype, low, width)))
+
+
+class _Process:
+    def __init__(self, nr: int, name: str, run, sensitivity: set[int]):
+        self.nr = nr
+        self.name = name
+        self.run = run
+        self.sensitivity = sensitivity
+
+
+class _Instance:
+    """
+    elaborated entity, all instances of an entity template
+    share the IR but have separate storage for all objects
+    """
+
+    def __init__(
+        self,
+        sim: Simulator,
+        template: ir.EntityTemplate,
+        path: tuple,
+        bindings: IdMap[TypeQualifier, _Location] | None = None,
+    ):
+        assert (
+            not template.extern()
+        ), f"extern entity '{template.name()}' cannot be simulated"
+
+        self._sim = sim
+        self._path = path
+        self._locations: IdMap[TypeQualifier, _Location] = (
+            IdMap() if bindings is None else bindings
+        )
+
+        # ports and generics are allocated first, so they
+        # use the declared names
+        for name, port in template.port_declarations().items():
+            self._root_location(port, name)
+
+        for name, generic in template.generic_declarations().items():
+            self._root_location(generic, name)
+
+        self._child_names: dict[str, int] = {}
+        self._elaborate(template)
+
+    #
+    # object locations
+    #
+
+    def _root_location(self, root: TypeQualifier, name: str | None = None):
+        if root in self._locations:
+            return self._locations[root]
+
+        if name is None:
+            name = root.name()
+
+        location = self._sim._allocate(self._path, root, name)
+        self._locations[root] = location
+        return location
+
+    def location(self, obj: TypeQualifier, reads: set | None) -> _Location:
+        """
+        resolves obj to a location, the slots of all signals
+        read to determine dynamic indices are added to reads
+        """
+
+        location = self._root_location(obj._root)
+
+        for ref in obj._ref_spec:
+            if isinstance(ref, Offset):
+                index = self._index(ref.offset, ref.base_offset, reads)
+                elem_type = type(TypeQualifier.decay(ref.obj))
+                location = location.index(packed.packed_type(elem_type), index)
+            else:
+                assert isinstance(ref, Slice)
+                low = min(ref.start, ref.stop)
+                width = abs(ref.start - ref.stop) + 1
+                location = location.range(
+                    self._index(low, ref.base_offset, reads), width
+                )
+
+        return location
+
+    def _index(self, offset, base_offset: list, reads):
+        parts = [offset, *base_offset]
+        const = sum(part for part in parts if not isinstance(part, TypeQualifier))
+        dynamic = []
+
+        for part in parts:
+            if isinstance(part, TypeQualifier):
+                location = self.location(part, reads)
+
+                if reads is not None and location.slot.is_signal:
+                    reads.add(location.slot.nr)
+
+                dynamic.append((location, packed.packed_type(part.type)))
+
+        if len(dynamic) == 0:
+            return const
+        return _Index(const, dynamic)
+
+    #
+    # elaboration
+    #
+
+    def _elaborate(self, block: ir.Block):
+        for ctx in block.contexts():
+            if isinstance(ctx, ir.Sequential):
+                if ctx._always_expr is not None:
+                    self._add_process(ctx._always_expr, None)
+                self._add_process(ctx, ctx._sensitivity)
+            else:
+                self._add_process(ctx, None)
+
+        for sub in block.subblocks():
+            if isinstance(sub, ir.Entity):
+                self._instantiate(sub)
+            else:
+                self._elaborate(sub)
+
+    def _add_process(self, ctx: ir.Context, sensitivity):
+        reads = set()
+        run = self._sim._compiler(self).process(ctx.code(), reads)
+
+        if isinstance(sensitivity, _SensitivityList):
+            reads = set()
+
+            for sig in sensitivity.signals:
+                location = self.location(sig, reads)
+
+                if location.slot.is_signal:
+                    reads.add(location.slot.nr)
+
+        name = ".".join((*self._path, str(ctx.name())))
+        processes = self._sim._processes
+        processes.append(_Process(len(processes), name, run, reads))
+
+    def _instantiate(self, entity: ir.Entity):
+        template = entity.get_template()
+        name = entity.name()
+
+        count = self._child_names.get(name, 0)
+        self._child_names[name] = count + 1
+
+        if count != 0:
+            name = f"{name}{count}"
+
+        bindings = IdMap()
+        path = (*self._path, name)
+
+        def bind(decl: TypeQualifier, decl_name: str, actual):
+            if isinstance(actual, TypeQualifier):
+                bindings[decl] = self.location(actual, None)
+            else:
+                # constant actuals get their own slot
+                location = self._sim._allocate(path, decl, decl_name)
+                ptype = packed.packed_type(decl.type)
+                self._sim._values[location.slot.nr] = self._sim._store(
+                    ptype, packed.constant(ptype, actual)
+                )
+                bindings[decl] = location
+
+        for port_name, actual in entity.get_ports().items():
+            bind(template.port_declarations()[port_name], port_name, actual)
+
+        for generic_name, actual in entity.get_generics().items():
+            bind(template.generic_declarations()[generic_name], generic_name, actual)
+
+        _Instance(self._sim, template, path, bindings)
+
+
+class SignalHandle:
+    """
+    access to a simulated object
+
+    reading `value` settles all pending changes and returns
+    the current value as a CoHDL primitive,
+    assigning `value` schedules an update for the next `Simulator.settle`
+    """
+
+    def __init__(self, sim: Simulator, slot: _Slot):
+        self._sim = sim
+        self._slot = slot
+
+    @property
+    def name(self) -> str:
+        return self._slot.name()
+
+    @property
+    def type(self):
+        return self._slot.ptype.type
+
+    @property
+    def value(self):
+        self._sim.settle()
+        return packed.unpack(self._slot.ptype, self._sim._values[self._slot.nr])
+
+    @value.setter
+    def value(self, value):
+        self._sim._pending[self._slot.nr] = packed.pack(self._slot.ptype, value)
+
+    @property
+    def packed(self):
+        """
+        current value in the packed representation of the simulator
+        """
+        self._sim.settle()
+        return self._sim._values[self._slot.nr]
+
+    def __repr__(self):
+        return f"SignalHandle({self.name}, {self._sim._values[self._slot.nr]})"
+
+
+def _copy(value):
+    # packed values are immutable except for arrays (lists)
+    # and the NumPy arrays of lane simulations
+    if isinstance(value, list):
+        return [_copy(elem) for elem in value]
+
+    copy = getattr(value, "copy", None)
+    return value if copy is None else copy()
+
+
+class Snapshot:
+    """
+    saved state of a simulation, created by `Simulator.snapshot`
+
+    contains the values of all objects (including statemachine states)
+    and all pending assignments
+    """
+
+    def __init__(self, sim: Simulator):
+        self._template = sim._template
+        self._values = [_copy(value) for value in sim._values]
+        self._pending = {nr: _copy(value) for nr, value in sim._pending.items()}
+        self._initialized = sim._initialized
+
+
+class _Ports:
+    def __init__(self, handles: dict[str, SignalHandle]):
+        self.__dict__.update(handles)
+
+    def __getitem__(self, name: str) -> SignalHandle:
+        return self.__dict__[name]
+
+    def __iter__(self):
+        return iter(self.__dict__.values())
+
+
+class Simulator:
+    """
+    cycle based simulator, that executes the IR of an entity directly
+
+    Signal updates follow VHDL semantics. Assignments are applied at the
+    end of each delta cycle and processes are rerun until no more signals
+    change. All ports of the top entity are available via `dut`.
+
+    By default processes are interpreted. When `compiled` is set,
+    each process is translated to Python source code and compiled
+    before the simulation starts. This takes longer but
+    speeds up long simulations considerably.
+    """
+
+    def __init__(self, entity, *, max_deltas: int = 10000, compiled: bool = False):
+        if isinstance(entity, ir.EntityTemplate):
+            template = entity
+        else:
+            from cohdl._compiler.frontend import generate_internal_representation
+
+            template = generate_internal_representation(entity)
+
+        self._template = template
+        self._max_deltas = max_deltas
+        self._compiler = self._compiler_type(compiled)
+
+        self._slots: list[_Slot] = []
+        self._values: list = []
+        self._pending: dict[int, object] = {}
+        # previous values of all slots changed in the last delta cycle
+        self._last: dict[int, object] = {}
+        self._processes: list[_Process] = []
+        self._initialized = False
+
+        top = _Instance(self, template, (template.name(),))
+
+        self._triggers: list[list[_Process]] = [[] for _ in self._slots]
+
+        for proc in self._processes:
+            for nr in sorted(proc.sensitivity):
+                self._triggers[nr].append(proc)
+
+        self.dut = _Ports(
+            {
+                name: self._Handle(self, top._locations[port].slot)
+                for name, port in template.port_declarations().items()
+            }
+        )
+
+    _Handle = SignalHandle
+
+    def _compiler_type(self, compiled: bool):
+        if compiled:
+            from cohdl._compiler.backend.python import PythonCodegen
+
+            return PythonCodegen
+        return Interpreter
+
+    def _store(self, ptype: PackedType, value):
+        """
+        converts a packed value to the representation
+        stored in the value list
+        """
+        return value
+
+    def _allocate(self, path: tuple, root: TypeQualifier, name: str | None):
+        ptype = packed.packed_type(root.type)
+        nr = len(self._slots)
+
+        if name is None:
+            name = f"obj{nr}"
+
+        slot = _Slot(nr, (*path, name), root, ptype)
+        self._slots.append(slot)
+
+        if root.has_default():
+            self._values.append(self._store(ptype, packed.pack(ptype, root.default())))
+        else:
+            self._values.append(self._store(ptype, packed.zero(ptype)))
+
+        return _Location(slot, ptype)
+
+    def signals(self) -> list[SignalHandle]:
+        """
+        returns handles for all signals of the design
+        """
+        return [self._Handle(self, slot) for slot in self._slots if slot.is_signal]
+
+    def signal(self, name: str) -> SignalHandle:
+        """
+        returns the handle of the signal with the given
+        hierarchical name (for example 'Top.Sub.result')
+        """
+        for slot in self._slots:
+            if slot.name() == name:
+                return self._Handle(self, slot)
+
+        raise AssertionError(f"no signal named '{name}'")
+
+    def _count(self, value) -> int:
+        # converts the stored value of a coverage counter to an int
+        return value
+
+    def coverage_report(self, coverage) -> str:
+        """
+        returns the report of the statemachine coverage counters
+        collected in `coverage` (see `std.Coverage`),
+        the counts of multiple instances of an entity are added
+        """
+
+        counters = IdMap()
+
+        for counter in coverage.counters():
+            counters[counter] = True
+
+        counts: IdMap[TypeQualifier, int] = IdMap()
+
+        for slot in self._slots:
+            if slot.root in counters:
+                count = self._count(self._values[slot.nr])
+                counts[slot.root] = (
+                    counts[slot.root] + count if slot.root in counts else count
+                )
+
+        return coverage.report(
+            lambda counter: counts[counter] if counter in counts else None
+        )
+
+    def snapshot(self) -> Snapshot:
+        """
+        saves the current state of the simulation, that can
+        be restored later with `restore` to skip repeated
+        initialization sequences
+
+        Snapshots can also be restored in other simulators,
+        that were created from the same IR.
+        """
+        return Snapshot(self)
+
+    def restore(self, snapshot: Snapshot):
+        """
+        resets the simulation to the state saved in snapshot
+        """
+
+        # enumeration values (like statemachine states)
+        # are only valid for the IR they were created from
+        assert (
+            snapshot._template is self._template
+        ), "snapshot was created for a different IR"
+
+        # the processes reference the value list and the pending dict,
+        # so both are updated in place
+        self._values[:] = [_copy(value) for value in snapshot._values]
+        self._pending.clear()
+        self._pending.update(
+            {nr: _copy(value) for nr, value in snapshot._pending.items()}
+        )
+        self._last.clear()
+        self._initialized = snapshot._initialized
+
+    def _update(self):
+        values = self._values
+        last = self._last
+        last.clear()
+
+        for nr, value in self._pending.items():
+            prev = values[nr]
+
+            if prev != value:
+                last[nr] = prev
+                values[nr] = value
+
+        self._pending.clear()
+
+    def settle(self):
+        """
+        runs delta cycles until no signal changes
+        """
+
+        if not self._initialized:
+            # all processes run once during initialization
+            self._initialized = True
+
+            for proc in self._processes:
+                proc.run()
+
+        triggers = self._triggers
+
+        for _ in range(self._max_deltas):
+            if len(self._pending) == 0:
+                self._last.clear()
+                return
+
+            self._update()
+
+            triggered = {}
+
+            for nr in self._last:
+                for proc in triggers[nr]:
+                    triggered[proc.nr] = proc
+
+            for nr in sorted(triggered):
+                triggered[nr].run()
+
+        raise AssertionError(
+            f"design did not settle after {self._max_deltas} delta cycles"
+        )
+
+    def tick(self, clk: SignalHandle | str, cycles: int = 1):
+        """
+        applies a rising and a falling edge to clk for each cycle
+        """
+
+        if isinstance(clk, str):
+            clk = self.dut[clk]
+
+        # write the packed values directly, to avoid
+        # the conversion from Bit in each cycle
+        nr = clk._slot.nr
+        high = self._store(clk._slot.ptype, 1)
+        low = self._store(clk._slot.ptype, 0)
+        pending = self._pending
+        settle = self.settle
+
+        for _ in range(cycles):
+            pending[nr] = high
+            settle()
+            pending[nr] = low
+            settle()
@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import fnmatch
+import gzip
+import io
+
+from . import _packed as packed
+from ._packed import Kind, PackedType
+
+#
+# VCD output
+#
+# Value changes are written as soon as they are sampled.
+# The writer only keeps the last written value of each
+# variable, so the memory usage does not depend on the
+# length of the simulation.
+#
+
+
+def _identifier(nr: int) -> str:
+    # VCD identifiers use the printable ASCII characters
+    result = ""
+
+    while True:
+        result += chr(33 + nr % 94)
+        nr //= 94
+
+        if nr == 0:
+            return result
+
+
+class _Var:
+    """
+    single VCD variable, arrays are split into one variable per element
+    """
+
+    def __init__(self, path: tuple, ptype: PackedType, ident: str):
+        self.path = path
+        self.ptype = ptype
+        self.ident = ident
+        self.last = None
+
+        if ptype.kind is Kind.INTEGER:
+            self.kind, self.width = "integer", 32
+        elif ptype.kind is Kind.ENUM:
+            self.kind, self.width = "string", 1
+        else:
+            self.kind, self.width = "wire", ptype.width
+
+    def format(self, value) -> str:
+        if self.ptype.kind is Kind.ENUM:
+            return f"s{value.name} {self.ident}"
+
+        if isinstance(value, str):
+            # bit strings of external simulators may contain
+            # states like 'U', that are not part of VCD
+            bits = "".join(c if c in "01xz" else "x" for c in value.lower())
+        else:
+            bits = format(value & ((1 << self.width) - 1), f"0{self.width}b")
+
+        if self.width == 1 and self.kind == "wire":
+            return f"{bits}{self.ident}"
+        return f"b{bits} {self.ident}"
+
+
+class _Probe:
+    def __init__(self, read, variables: list[_Var]):
+        self.read = read
+        self.variables = variables
+
+
+class VcdWriter:
+    """
+    streams value changes to a VCD file
+
+    Signals are registered with `probe` (or all signals of a simulator
+    with `probe_simulator`) and written each time `sample` is called.
+    Hierarchical names separated by '.' are written as nested scopes.
+
+    `include` and `exclude` are glob patterns matched against the
+    hierarchical names, only values sampled between `start` and
+    `stop` are written. Files with the suffix '.gz' (or when
+    `compress` is set) are compressed with gzip.
+    """
+
+    def __init__(
+        self,
+        file,
+        *,
+        include: str | list[str] = "*",
+        exclude: str | list[str] = (),
+        start: int = 0,
+        stop: int | None = None,
+        timescale: str = "1 ns",
+        compress: bool | None = None,
+    ):
+        if isinstance(file, io.IOBase):
+            assert not compress, "compression requires a file name"
+            self._file = file
+            self._owned = False
+        else:
+            file = str(file)
+
+            if compress is None:
+                compress = file.endswith(".gz")
+
+            self._file = (
+                gzip.open(file, "wt", encoding="ascii")
+                if compress
+                else open(file, "w", encoding="ascii")
+            )
+            self._owned = True
+
+        self._include = [include] if isinstance(include, str) else list(include)
+        self._exclude = [exclude] if isinstance(exclude, str) else list(exclude)
+        self._start = start
+        self._stop = stop
+        self._timescale = timescale
+
+        self._probes: list[_Probe] = []
+        # called before the values are read
+        self._settle = []
+        self._var_cnt = 0
+        self._header_written = False
+        self._dumped = False
+        self._time = None
+
+    def _selected(self, name: str):
+        return any(
+            fnmatch.fnmatchcase(name, pattern) for pattern in self._include
+        ) and not any(fnmatch.fnmatchcase(name, pattern) for pattern in self._exclude)
+
+    def _variables(self, path: tuple, ptype: PackedType) -> list[_Var]:
+        if ptype.kind is Kind.ARRAY:
+            return [
+                var
+                for nr in range(ptype.count)
+                for var in self._variables(
+                    (*path[:-1], f"{path[-1]}[{nr}]"), ptype.elem
+                )
+            ]
+
+        var = _Var(path, ptype, _identifier(self._var_cnt))
+        self._var_cnt += 1
+        return [var]
+
+    def probe(self, name: str, type, read) -> bool:
+        """
+        registers a signal with the hierarchical name `name`
+        and the CoHDL type `type`, `read` is called without arguments
+        and returns the current value in the packed representation
+        of the simulator (vectors may also be returned as bit strings)
+
+        returns False, when the name is filtered out
+        """
+
+        assert not self._header_written, "probes must be added before the first sample"
+
+        if not self._selected(name):
+            return False
+
+        ptype = type if isinstance(type, PackedType) else packed.packed_type(type)
+        self._probes.append(
+            _Probe(read, self._variables(tuple(name.split(".")), ptype))
+        )
+        return True
+
+    def probe_simulator(self, sim):
+        """
+        registers all signals of a `Simulator`
+        or all ports of a `FunctionalModel`
+        """
+
+        from ._simulator import Simulator, SignalHandle
+
+        if isinstance(sim, Simulator):
+            assert all(
+                type(handle) is SignalHandle for handle in sim.signals()
+            ), "lane simulators cannot be traced"
+            values = sim._values
+            self._settle.append(sim.settle)
+
+            for handle in sim.signals():
+                slot = handle._slot
+                self.probe(slot.name(), slot.ptype, lambda nr=slot.nr: values[nr])
+        else:
+            for handle in sim.dut:
+                ptype = packed.packed_type(handle.type)
+                self.probe(
+                    handle.name,
+                    ptype,
+                    lambda handle=handle, ptype=ptype: packed.pack(ptype, handle.value),
+                )
+
+    def _write_header(self):
+        write = self._file.write
+        write(f"$timescale {self._timescale} $end\n")
+
+        scope = ()
+
+        for probe in self._probes:
+            for var in probe.variables:
+                parent = var.path[:-1]
+                common = 0
+
+                while (
+                    common < min(len(scope), len(parent))
+                    and scope[common] == parent[common]
+                ):
+                    common += 1
+
+                for _ in scope[common:]:
+                    write("$upscope $end\n")
+                for name in parent[common:]:
+                    write(f"$scope module {name} $end\n")
+
+                scope = parent
+                write(f"$var {var.kind} {var.width} {var.ident} {var.path[-1]} $end\n")
+
+        for _ in scope:
+            write("$upscope $end\n")
+
+        write("$enddefinitions $end\n")
+        self._header_written = True
+
+    def sample(self, time: int):
+        """
+        writes all values, that changed since the last sample
+        """
+
+        if not self._header_written:
+            self._write_header()
+
+        if time < self._start or (self._stop is not None and time > self._stop):
+            return
+
+        assert self._time is None or time > self._time, "time must increase"
+
+        for settle in self._settle:
+            settle()
+
+        lines = []
+
+        for probe in self._probes:
+            value = probe.read()
+            variables = probe.variables
+
+            if len(variables) == 1:
+                var = variables[0]
+
+                if var.last != value:
+                    var.last = value
+                    lines.append(var.format(value))
+            else:
+                for var, elem in zip(variables, _flatten(value)):
+                    if var.last != elem:
+                        var.last = elem
+                        lines.append(var.format(elem))
+
+        write = self._file.write
+
+        if not self._dumped:
+            # the first sample in the window contains all values
+            self._dumped = True
+            write(f"#{time}\n$dumpvars\n")
+
+            for line in lines:
+                write(line + "\n")
+
+            write("$end\n")
+        elif len(lines) != 0:
+            write(f"#{time}\n")
+
+            for line in lines:
+                write(line + "\n")
+
+        self._time = time
+
+    def close(self):
+        if not self._header_written:
+            self._write_header()
+
+        if self._owned:
+            self._file.close()
+        else:
+            self._file.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def _flatten(value):
+    # elements of (nested) packed arrays in declaration order
+    for elem in value:
+        if isinstance(elem, list):
+            yield from _flatten(elem)
+        else:
+            yield elem
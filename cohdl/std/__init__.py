@@ -121,6 +121,13 @@ from .utility import (
     stringify,
     DelayLine,
     delayed,
+    pipelined_fold,
+    pipelined_sum,
+    pipelined_count_set_bits,
+    pipelined_min_element,
+    pipelined_max_element,
+    pipelined_min_index,
+    pipelined_max_index,
     debounce,
     max_int,
     int_log_2,
@@ -134,6 +141,7 @@ from .utility import (
     SyncFlag,
     Mailbox,
     Fifo,
+    AsyncFifo,
     StackMode,
     Stack,
 )
@@ -143,6 +151,15 @@ from ._prefix import prefix, name, NamedQualifier
 from . import spi
 from . import bitfield
 from . import _crc as crc
+from ._coverage import Coverage
+from ._memory import (
+    ReadDuringWrite,
+    RamPort,
+    SinglePortRam,
+    SimpleDualPortRam,
+    TrueDualPortRam,
+    BlockRamFifo,
+)
 from . import uart
 
 from ._template import Template, TemplateArg
@@ -3,6 +3,8 @@ import os
 from cohdl._compiler.frontend import generate_internal_representation
 from cohdl._compiler.backend import generate_vhdl
 
+from ._formal import _Properties
+
 
 class VhdlCompiler:
     @classmethod
@@ -10,16 +12,58 @@ class VhdlCompiler:
         return generate_internal_representation(entity)
 
     @classmethod
-    def to_vhdl_library(cls, top_entity, *, additional_reserved_names: set[str] = None):
+    def to_vhdl_library(
+        cls,
+        top_entity,
+        *,
+        additional_reserved_names: set[str] = None,
+        process_all: bool = False,
+        compact: bool = False,
+        deduplicate: bool = False,
+    ):
+        """
+        When `process_all` is set, sequential contexts without an
+        explicit sensitivity list are emitted as VHDL-2008 `process(all)`
+        instead of listing all signals read in the process.
+
+        When `compact` is set, temporaries that are only read once
+        are inlined into the reading expression, output ports that
+        are never read internally are driven without a buffer signal
+        and redundant type conversions are omitted.
+
+        When `deduplicate` is set, entities with identical ports
+        and architectures are emitted as a single VHDL entity,
+        even when they are defined by different classes.
+        """
+
         ir = generate_internal_representation(top_entity)
-        return generate_vhdl(ir, additional_reserved_names=additional_reserved_names)
+        return generate_vhdl(
+            ir,
+            additional_reserved_names=additional_reserved_names,
+            process_all=process_all,
+            compact=compact,
+            deduplicate=deduplicate,
+        )
 
     @classmethod
-    def to_string(cls, top_entity, *, additional_reserved_names: set[str] = None):
+    def to_string(
+        cls,
+        top_entity,
+        *,
+        additional_reserved_names: set[str] = None,
+        process_all: bool = False,
+        compact: bool = False,
+        deduplicate: bool = False,
+        jobs: int | None = None,
+    ):
         return str(
             cls.to_vhdl_library(
-                top_entity, additional_reserved_names=additional_reserved_names
-            ).write()
+                top_entity,
+                additional_reserved_names=additional_reserved_names,
+                process_all=process_all,
+                compact=compact,
+                deduplicate=deduplicate,
+            ).write(jobs=jobs)
         )
 
     @classmethod
@@ -30,6 +74,10 @@ class VhdlCompiler:
         *,
         mkdir: bool = False,
         additional_reserved_names: set[str] = None,
+        process_all: bool = False,
+        compact: bool = False,
+        deduplicate: bool = False,
+        jobs: int | None = None,
     ) -> list[str]:
         if not os.path.exists(target_dir):
             if mkdir:
@@ -38,5 +86,84 @@ class VhdlCompiler:
                 raise AssertionError(f"target directory '{target_dir}' does not exist")
 
         return cls.to_vhdl_library(
-            top_entity, additional_reserved_names=additional_reserved_names
-        ).write_dir(target_dir)
+            top_entity,
+            additional_reserved_names=additional_reserved_names,
+            process_all=process_all,
+            compact=compact,
+            deduplicate=deduplicate,
+        ).write_dir(target_dir, jobs=jobs)
+
+    @classmethod
+    def to_sby(
+        cls,
+        top_entity,
+        target_dir,
+        *,
+        mode: str = "bmc",
+        depth: int | None = None,
+        engine: str = "smtbmc",
+        mkdir: bool = False,
+        **kwargs,
+    ) -> str:
+        """
+        formal build mode, writes the VHDL sources of `top_entity` and a
+        SymbiYosys project file (using the ghdl plugin of yosys)
+        to `target_dir` and returns the path of the project file
+
+        The bounded depth of each property emitted through a `Checker`
+        is derived from the history referenced via `prev` and the
+        length of its sequences. The project uses the largest of
+        these depths unless `depth` is given explicitly (required,
+        when a property is unbounded).
+
+        The remaining keyword arguments are passed to `to_dir`.
+        """
+
+        _Properties.reset()
+
+        try:
+            files = cls.to_dir(top_entity, target_dir, mkdir=mkdir, **kwargs)
+            properties = _Properties.properties
+        finally:
+            _Properties.reset()
+
+        required = [prop.depth() for prop in properties]
+
+        if depth is None:
+            assert len(properties) != 0, "design contains no formal properties"
+            assert (
+                None not in required
+            ), "design contains unbounded properties, the depth must be set explicitly"
+            depth = max(required)
+
+        names = [os.path.basename(file) for file in files]
+        top = os.path.splitext(names[-1])[0]
+
+        lines = ["# bounded depth required by each property"]
+        lines += [
+            f"#   {prop.kind} {prop.label}: {'unbounded' if req is None else req}"
+            for prop, req in zip(properties, required)
+        ]
+        lines += [
+            "",
+            "[options]",
+            f"mode {mode}",
+            f"depth {depth}",
+            "",
+            "[engines]",
+            engine,
+            "",
+            "[script]",
+            f"ghdl --std=08 {' '.join(names)} -e {top}",
+            f"prep -top {top}",
+            "",
+            "[files]",
+            *names,
+        ]
+
+        project = os.path.join(target_dir, f"{top}.sby")
+
+        with open(project, "w") as file:
+            print("\n".join(lines), file=file)
+
+        return project
@@ -414,6 +414,7 @@ def _sequential_impl(
     comment=None,
     attributes: dict | None = None,
     capture_lazy: bool = False,
+    coverage=None,
     wrapped_fn,
     on_reset=None,
 ):
@@ -432,6 +433,7 @@ def _sequential_impl(
                 comment=comment,
                 attributes=attributes,
                 capture_lazy=capture_lazy,
+                coverage=coverage,
                 wrapped_fn=wrapped_fn,
             )
 
@@ -451,6 +453,10 @@ def _sequential_impl(
         assert "comment" not in attributes, "comment attribute already set"
         attributes["comment"] = comment
 
+    if coverage is not None:
+        assert "coverage" not in attributes, "coverage attribute already set"
+        attributes["coverage"] = coverage
+
     if step_cond is None:
         step_cond = lambda: True
 
@@ -585,6 +591,7 @@ def sequential(
     on_reset=None,
     attributes: dict | None = None,
     capture_lazy: bool = False,
+    coverage=None,
 ):
     if isinstance(trigger, Clock):
         return SequentialContext(
@@ -595,6 +602,7 @@ def sequential(
             on_reset=on_reset,
             attributes=attributes,
             capture_lazy=capture_lazy,
+            coverage=coverage,
         )
 
     return _sequential_impl(
@@ -605,6 +613,7 @@ def sequential(
         on_reset=on_reset,
         attributes=attributes,
         capture_lazy=capture_lazy,
+        coverage=coverage,
         wrapped_fn=None,
     )
 
@@ -680,10 +689,18 @@ class SequentialContext:
         on_reset=None,
         attributes: dict | None = None,
         capture_lazy: bool = False,
+        coverage=None,
     ):
         assert isinstance(clk, Clock)
         assert reset is None or isinstance(reset, Reset)
 
+        if coverage is not None:
+            # the coverage collector is passed to the ir as an attribute,
+            # so it is inherited by all copies of the context
+            attributes = {**({} if attributes is None else attributes)}
+            assert "coverage" not in attributes, "coverage attribute already set"
+            attributes["coverage"] = coverage
+
         self._clk = clk
         self._reset = reset
         self._step_cond = step_cond
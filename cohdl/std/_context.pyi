@@ -8,6 +8,8 @@ import cohdl
 from cohdl import BitSignalEvent, Bit, Signal
 from cohdl.utility.source_location import SourceLocation
 
+from ._coverage import Coverage
+
 T = TypeVar("T")
 
 class Reset:
@@ -310,6 +312,7 @@ def sequential(
     comment: str | None = None,
     attributes: dict | None = None,
     capture_lazy: bool = False,
+    coverage: Coverage | None = None,
 ):
     """
     turns the decorated function into a synthesizable sequential context
@@ -329,6 +332,9 @@ def sequential(
     When a `comment` is set it will be added to the VHDL representation
     before the converted process.
 
+    When a `coverage` collector is set, the states and transitions
+    of coroutine statemachines in the context are counted (see `Coverage`).
+
     For now the parameters `attributes` and `capture_lazy` are only used
     internally by cohdl.
     """
@@ -368,6 +374,7 @@ class SequentialContext:
         *,
         step_cond: Callable[[], bool] | None = None,
         attributes: dict | None = None,
+        coverage: Coverage | None = None,
     ):
         """
         creates an instance of SequentialContext
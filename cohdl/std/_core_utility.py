@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import functools
 import inspect
+import types
 import typing
 
 from typing import Any
@@ -40,6 +42,22 @@ from ._exception import RefQualifierFail, SerializationFail
 class _PrivateNone: ...
 
 
+# maximum number of constant lookup tables kept per table function
+_TABLE_CACHE_SIZE = 64
+
+
+def _constant_table(fn):
+    # memoizes lookup tables of constant values used in select statements,
+    # tables are returned as read only mappings so they can be shared
+    # between all calls with the same width
+
+    @functools.lru_cache(maxsize=_TABLE_CACHE_SIZE)
+    def wrapper(*args):
+        return types.MappingProxyType(fn(*args))
+
+    return functools.update_wrapper(wrapper, fn)
+
+
 def nop(*args, **kwargs):
     pass
 
@@ -378,6 +396,7 @@ def one_hot(width: int, bit_pos: int | Unsigned) -> BitVector:
 
 
 @_intrinsic
+@_constant_table
 def _one_hot_map(l):
     return {one_hot(l, bit): True for bit in range(l)}
 
@@ -651,6 +670,7 @@ def batched_fold(fn, args, *, batch_size=2):
                 batched_fold(fn, batch, batch_size=batch_size)
                 for batch in _batch_args(args, batch_size)
             ],
+            batch_size=batch_size,
         )
 
 
@@ -970,6 +990,7 @@ def count(container, /, value=_PrivateNone, *, check=_PrivateNone):
 
 
 @_intrinsic
+@_constant_table
 def _set_bit_map(w: int):
     T = Unsigned.upto(w)
     return {nr: T(nr.bit_count()) for nr in range(2**w)}
@@ -995,6 +1016,7 @@ def count_set_bits(vector: BitVector, /, *, batch_size: int = 6):
 
 
 @_intrinsic
+@_constant_table
 def _clear_bit_map(w: int):
     T = Unsigned.upto(w)
     return {nr: T(w - nr.bit_count()) for nr in range(2**w)}
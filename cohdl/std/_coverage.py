@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import os
+from typing import Callable
+
+from cohdl._core._ir._repr import CoverPoint, StatemachineCoverage
+from cohdl.utility.source_location import SourceLocation
+from cohdl.utility.virtual_traceback import VirtualFrame
+
+# root directory of the cohdl package
+_cohdl_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) + os.sep
+
+
+def _user_location(frame: VirtualFrame | None) -> SourceLocation | None:
+    # frames in library code (like the coroutines of cohdl.std) are
+    # replaced with the first parent frame in user code
+    while frame is not None:
+        location = frame.location()
+
+        if location.file is not None:
+            if not os.path.abspath(location.file).startswith(_cohdl_dir):
+                return location
+
+        frame = frame._parent
+
+    return None
+
+
+class Coverage:
+    """
+    Collects state and transition counters of coroutine statemachines.
+
+    Statemachines are instrumented, when the coverage object
+    is passed to the sequential context, that contains them.
+
+    >>> coverage = std.Coverage()
+    >>>
+    >>> @std.sequential(clk, coverage=coverage)
+    >>> async def proc():
+    >>>     ...
+
+    After the design is compiled `statemachines` contains one entry
+    per instrumented statemachine. The counter logic is
+    enclosed in translate_off/on pragmas, so it is only present in simulation.
+    """
+
+    def __init__(self, counter_width: int = 32):
+        self.counter_width = counter_width
+        self.statemachines: list[StatemachineCoverage] = []
+
+    def counters(self):
+        """
+        returns the counter signals of all states and transitions
+        """
+
+        return [
+            point.counter
+            for sm in self.statemachines
+            for point in [*sm.states, *sm.transitions]
+        ]
+
+    @staticmethod
+    def location(point: CoverPoint) -> SourceLocation | None:
+        """
+        returns the location of the first origin of `point` in user code
+        """
+
+        for origin in point.origins:
+            if isinstance(origin, SourceLocation):
+                return origin
+
+            location = _user_location(origin)
+
+            if location is not None:
+                return location
+
+        return None
+
+    def report(self, read: Callable[[object], int | None]) -> str:
+        """
+        returns a text report of all states and transitions,
+        `read` is called with the counter signal of each point and returns
+        its current value (or None, when the counter is not part of the design)
+        """
+
+        lines = []
+        covered = total = 0
+
+        for sm in self.statemachines:
+            section = []
+
+            for point in [*sm.states, *sm.transitions]:
+                count = read(point.counter)
+
+                if count is None:
+                    continue
+
+                total += 1
+                covered += count != 0
+                location = Coverage.location(point)
+                location = "" if location is None else str(location)
+                mark = " " if count != 0 else "!"
+                section.append(f" {mark} {point.name:24} {count:>10}  {location}")
+
+            if len(section) != 0:
+                lines.append(f"{sm.name}:")
+                lines.extend(section)
+
+        lines.append(f"{covered}/{total} states and transitions covered")
+        return "\n".join(lines)
@@ -1,10 +1,17 @@
 from cohdl._core import (
     Bit,
     BitVector,
+    Unsigned,
     Signal,
     Null,
 )
 
+from ._core_utility import batched_fold, concat, reverse_bits, select
+
+
+def _xor_impl(a, b):
+    return a ^ b
+
 
 class BitwiseCrc:
     def __init__(self, poly: BitVector, initial_value=Null, invert_result=False):
@@ -41,3 +48,181 @@ class BitwiseCrc:
             return ~self._reg
         else:
             return self._reg.copy()
+
+
+#
+# parallel crc
+#
+# The CRC register update is linear over GF(2), so the register
+# after processing a complete data word can be computed directly.
+# Each register and data bit toggles a fixed set of bits of the next
+# register (a column of the update matrix). The columns are determined
+# at elaboration time by running the bitwise algorithm for each single
+# input bit. The next register is the XOR of the columns of all set bits.
+#
+
+
+def _crc_step(state: int, bit: int, poly: int, width: int) -> int:
+    # single step of the bitwise algorithm (same as BitwiseCrc.update)
+    msb = (state >> (width - 1)) & 1
+    state = (state << 1) & ((1 << width) - 1)
+    return state ^ poly if msb ^ bit else state
+
+
+def _crc_unstep_zero(state: int, poly: int, width: int) -> int:
+    # inverse of _crc_step with a zero input bit, the shifted in bit
+    # is always zero, so a set lsb means the polynomial was applied
+    if state & 1:
+        return ((state ^ poly) >> 1) | (1 << (width - 1))
+    return state >> 1
+
+
+class ParallelCrc:
+    """
+    CRC engine, that processes `data_width` bits in one clock cycle
+
+    The register uses the same representation as `BitwiseCrc`
+    (`poly` without the leading coefficient). The bits of each data word
+    are processed starting at the msb, when `reflect_input` is set
+    starting at the lsb (so byte 0 of little endian words comes first).
+    `reflect_output` reverses the result before `final_xor` is applied.
+
+    Ethernet CRC32 uses `poly=0x04C11DB7`, an initial value and final xor
+    of all ones and reflected input and output.
+    """
+
+    def __init__(
+        self,
+        poly: BitVector,
+        data_width: int,
+        *,
+        initial_value=Null,
+        reflect_input: bool = False,
+        reflect_output: bool = False,
+        final_xor: BitVector | None = None,
+    ):
+        width = poly.width
+        poly_int = poly.unsigned.to_int()
+
+        self._width = width
+        self._data_width = data_width
+        self._initial_value = initial_value
+        self._reflect_input = reflect_input
+        self._reflect_output = reflect_output
+        self._final_xor = None if final_xor is None else final_xor.bitvector
+        self._reg = Signal[BitVector[width]](initial_value)
+        self._zero = BitVector[width](Null)
+
+        order = range(data_width) if reflect_input else reversed(range(data_width))
+        order = list(order)
+
+        def run(state, data):
+            for nr in order:
+                state = _crc_step(state, (data >> nr) & 1, poly_int, width)
+            return state
+
+        def column(value: int):
+            return Unsigned[width](value).bitvector
+
+        self._state_cols = [column(run(1 << nr, 0)) for nr in range(width)]
+        self._data_cols = [column(run(0, 1 << nr)) for nr in range(data_width)]
+
+        # Partial words are processed as complete words with the
+        # invalid bytes set to zero. The trailing zero bytes are removed
+        # from the result by applying the inverse of the zero input steps.
+        # The columns of this matrix are selected by the byte count,
+        # so only a single matrix is applied for all byte counts.
+        self._byte_cnt = data_width // 8
+        self._residue_cols = None
+
+        if data_width % 8 == 0 and poly_int & 1:
+            self._residue_cols = []
+
+            for nr in range(width):
+                state = 1 << nr
+                options = {}
+
+                for valid in reversed(range(1, self._byte_cnt)):
+                    for _ in range(8):
+                        state = _crc_unstep_zero(state, poly_int, width)
+
+                    options[valid] = column(state)
+
+                self._residue_cols.append((options, column(1 << nr)))
+
+        # bytes (with their position in processing order)
+        # in msb first order as expected by concat
+        self._byte_order = [
+            (nr, nr if reflect_input else self._byte_cnt - 1 - nr)
+            for nr in reversed(range(self._byte_cnt))
+        ]
+
+    def _terms(self, cols, vec):
+        # the columns selected by the set bits of vec
+        return [col if vec[nr] else self._zero for nr, col in enumerate(cols)]
+
+    def _xor(self, terms):
+        return batched_fold(_xor_impl, terms)
+
+    def _masked(self, data: BitVector, valid_bytes):
+        return concat(
+            *[
+                (data[8 * nr + 7 : 8 * nr] if valid_bytes > pos else BitVector[8](Null))
+                for nr, pos in self._byte_order
+            ]
+        )
+
+    def clear(self):
+        self._reg <<= self._initial_value
+
+    def next(self, data: BitVector, valid_bytes=None) -> BitVector:
+        """
+        returns the register value after processing `data`
+
+        When `valid_bytes` is set, only the first `valid_bytes` bytes
+        of the word (in processing order) are used. A value of zero
+        returns the current register value.
+        """
+
+        assert len(data) == self._data_width, "invalid data width"
+
+        if valid_bytes is None:
+            return self._xor(
+                [
+                    *self._terms(self._state_cols, self._reg),
+                    *self._terms(self._data_cols, data),
+                ]
+            )
+        else:
+            assert (
+                self._residue_cols is not None
+            ), "partial words require a data width of full bytes and a polynomial with a constant term"
+
+            full = self._xor(
+                [
+                    *self._terms(self._state_cols, self._reg),
+                    *self._terms(self._data_cols, self._masked(data, valid_bytes)),
+                ]
+            )
+
+            if self._byte_cnt == 1:
+                result = full
+            else:
+                residue_cols = [
+                    select(valid_bytes, options, default=identity)
+                    for options, identity in self._residue_cols
+                ]
+                result = self._xor(self._terms(residue_cols, full))
+
+            return self._reg if valid_bytes == 0 else result
+
+    def update(self, data: BitVector, valid_bytes=None):
+        self._reg <<= self.next(data, valid_bytes)
+
+    def result(self):
+        result = reverse_bits(self._reg) if self._reflect_output else self._reg.copy()
+
+        if self._final_xor is None:
+            return result
+        else:
+            return result ^ self._final_xor
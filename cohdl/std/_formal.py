@@ -36,6 +36,60 @@ class ConfigFormal:
     disable_assume = True
 
 
+#
+# bounded depth of properties
+#
+
+
+class FormalProperty:
+    """
+    assertion, assumption or cover statement emitted by a `Checker`
+
+    `history` is the largest number of past cycles referenced via `prev`,
+    `span` the number of cycles covered by the property itself
+    (None for unbounded sequences)
+    """
+
+    def __init__(self, label: str, kind: str, history: int, span: int | None):
+        self.label = label
+        self.kind = kind
+        self.history = history
+        self.span = span
+
+    def depth(self) -> int | None:
+        """
+        minimal number of cycles a bounded check requires
+        to evaluate the property, None when it is unbounded
+        """
+        return None if self.span is None else self.history + self.span
+
+
+class _Properties:
+    # all properties emitted since the last reset
+    properties: list[FormalProperty] = []
+    # history referenced since the last property was added
+    _history = 0
+
+    @staticmethod
+    @pyeval
+    def track_history(cnt):
+        _Properties._history = max(_Properties._history, cnt)
+
+    @staticmethod
+    @pyeval
+    def add(label, kind, cond):
+        _Properties.properties.append(
+            FormalProperty(label, kind, _Properties._history, _span(cond))
+        )
+        _Properties._history = 0
+
+    @staticmethod
+    def reset():
+        _Properties.properties = []
+        _Properties._history = 0
+        PrevCache.caches = {}
+
+
 #
 #
 #
@@ -64,6 +118,18 @@ def conv_seq(s):
 class Formal:
     def write(self): ...
 
+    def span(self) -> int | None:
+        """
+        number of clock cycles covered by the expression,
+        None when the length is unbounded
+        """
+        ...
+
+
+def _span(obj) -> int | None:
+    # plain conditions are evaluated in a single cycle
+    return obj.span() if isinstance(obj, Formal) else 1
+
 
 class When(Formal):
     @pyeval
@@ -100,6 +166,15 @@ class When(Formal):
         else:
             return f"{vhdl:({conv(self.precond)} |=> {conv(self.postcond)})}"
 
+    def span(self):
+        pre, post = _span(self.precond), _span(self.postcond)
+
+        if pre is None or post is None:
+            return None
+
+        # |-> starts the postcondition in the last cycle of the precondition
+        return pre + post - 1 if self.immediate else pre + post
+
 
 class State(Formal):
     def __init__(self, cond, times=None, consecutive=True):
@@ -127,6 +202,20 @@ class State(Formal):
     def write(self):
         return f"{vhdl:{conv(self.cond)}{self.write_times()}}"
 
+    def span(self):
+        if self.times is None:
+            return _span(self.cond)
+        elif not self.consecutive:
+            # non consecutive repetitions [=a to b] can be
+            # interleaved with an unbounded number of cycles
+            return None
+        elif isinstance(self.times, tuple) and len(self.times) == 2:
+            cond = _span(self.cond)
+            return None if cond is None else cond * self.times[1]
+        else:
+            # [*] and goto repetitions wait for an unbounded time
+            return None
+
 
 class Next(State):
     def __init__(self, cond, times=None, consecutive=True):
@@ -143,6 +232,11 @@ class Then(State):
     def write(self):
         return f"{vhdl: : {conv(self.cond)}{self.write_times()}}"
 
+    def span(self):
+        # fusion overlaps with the last cycle of the previous element
+        result = super().span()
+        return None if result is None else result - 1
+
 
 class Wait(State):
     def __init__(self, times=None):
@@ -151,6 +245,16 @@ class Wait(State):
     def write(self):
         return f"{vhdl: ; true {self.write_times()}}"
 
+    def span(self):
+        if isinstance(self.times, int):
+            # goto repetition of true, always takes exactly times cycles
+            return self.times
+        elif isinstance(self.times, tuple) and len(self.times) == 2:
+            return self.times[1]
+        elif self.times is None:
+            return 1
+        return None
+
 
 class Sequence(Formal):
     def __init__(self, start, *seq):
@@ -179,12 +283,18 @@ class Sequence(Formal):
     def write(self):
         return f"{vhdl:<%{conv(self.start)}{conv_seq(self.seq)}%>}"
 
+    def span(self):
+        spans = [_span(self.start), *[_span(elem) for elem in self.seq]]
+        return None if None in spans else sum(spans)
+
 
 def stable(arg):
     return f"{vhdl[bool]:stable({arg!r})}"
 
 
 def prev(state, cnt=None):
+    _Properties.track_history(1 if cnt is None else cnt)
+
     if cnt is None:
         return f"{vhdl[state.type]:prev({state!r})}"
     else:
@@ -218,16 +328,21 @@ class PrevCache:
     @staticmethod
     @pyeval
     def get_cache(signal) -> PrevCache:
-        for key, val in PrevCache.caches.items():
-            if key == id(signal):
-                return val
+        cache = PrevCache.caches.get(id(signal), None)
+
+        # ids are reused after an object is garbage collected,
+        # the cache is only shared with the same signal
+        if cache is None or cache.signal is not signal:
+            cache = PrevCache(signal)
+            PrevCache.caches[id(signal)] = cache
 
-        new_cache = PrevCache(signal)
-        PrevCache.caches[id(signal)] = new_cache
-        return new_cache
+        return cache
 
 
 def all_prev(state, cnt: int, *, exact=False):
+    # cached expressions do not call prev again,
+    # so the history is tracked here
+    _Properties.track_history(cnt + 1 if exact else cnt)
     cache = PrevCache.get_cache(state)
 
     cached = cache.get(cnt)
@@ -304,6 +419,8 @@ class Checker:
         else:
             reset_guard = self.valid_since_reset(since_reset)
 
+        _Properties.add(lbl, "assert", cond)
+
         if start_guard is True and reset_guard is True:
             f"{vhdl:{lbl} : assert always {conv(cond)};}"
         else:
@@ -333,20 +450,26 @@ class Checker:
         else:
             reset_guard = self.valid_since_reset(since_reset)
 
+        _Properties.add(lbl, "assume", cond)
+
         if start_guard is True and reset_guard is True:
             f"{vhdl:{lbl} : assume always {conv(cond)};}"
         else:
             f"{vhdl:{label} : assume always {conv(When(start_guard and reset_guard, cond))};}"
 
     def assume_initial(self, label, cond):
-        f"{vhdl:{self._complete_label(label)} : assume {conv(cond)};}"
+        lbl = self._complete_label(label)
+        _Properties.add(lbl, "assume", cond)
+        f"{vhdl:{lbl} : assume {conv(cond)};}"
 
     #
     #
     #
 
     def cover(self, label, cond):
-        f"{vhdl:{self._complete_label(label)} : cover <% {conv(cond)} %>;}"
+        lbl = self._complete_label(label)
+        _Properties.add(lbl, "cover", cond)
+        f"{vhdl:{lbl} : cover <% {conv(cond)} %>;}"
 
     #
     #
@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import enum
+
+from cohdl import pyeval, Bit, Unsigned, Signal
+from cohdl._core._intrinsic import _intrinsic
+
+from ._core_utility import Value, NoresetSignal
+from ._context import SequentialContext, concurrent, at_end_of_context
+from ._prefix import prefix
+from ._template import Template
+from .utility import Array, int_log_2, is_pow_two
+
+#
+# block ram primitives
+#
+# The memory and the read data registers are noreset signals,
+# so they are never part of the reset branch of a process. All read and write
+# methods of a port must be called from one sequential context, and emit
+# the read/write templates synthesis tools map to block rams. To get the
+# canonical templates, the ports can be used in dedicated processes without reset.
+#
+
+
+class ReadDuringWrite(enum.Enum):
+    """
+    defines the read data of a port, that writes in the same clock cycle
+    """
+
+    # the read data contains the previous value of the written address
+    READ_FIRST = enum.auto()
+    # the written value is forwarded to the read data
+    WRITE_FIRST = enum.auto()
+    # the read data is not changed by writes
+    NO_CHANGE = enum.auto()
+
+
+class _RamArgs:
+    def __init__(self, arg):
+        self.elemtype, self.count = arg
+        assert isinstance(self.elemtype, type)
+        assert isinstance(self.count, int) and self.count >= 2
+
+    def __hash__(self) -> int:
+        return hash((self.elemtype, self.count))
+
+    def __eq__(self, other: _RamArgs) -> bool:
+        return self.elemtype is other.elemtype and self.count == other.count
+
+
+@pyeval
+def _bind_context(obj, attr: str, what: str) -> bool:
+    # binds obj to the current sequential context,
+    # returns True when this is the first use
+    ctx = SequentialContext.current()
+    assert ctx is not None, f"{what} can only be used in sequential contexts"
+    bound = getattr(obj, attr)
+
+    if bound is None:
+        setattr(obj, attr, ctx)
+        return True
+
+    assert bound is ctx, f"{what} used in more than one sequential context"
+    return False
+
+
+class RamPort:
+    """
+    single port of a block ram
+    """
+
+    def __init__(self, ram: _Ram, name: str, mode: ReadDuringWrite, *, read, write):
+        self._ram = ram
+        self._mode = mode
+        self._read = read
+        self._write = write
+        self._ctx = None
+
+        if read:
+            self._data = NoresetSignal[ram._elemtype_](name=name)
+
+    def write(self, addr: Unsigned, data):
+        """
+        writes `data` to the address `addr`, in the mode
+        `ReadDuringWrite.WRITE_FIRST` the data is also forwarded to the read data
+        """
+
+        assert self._write, "port does not support writes"
+        _bind_context(self, "_ctx", "std.RamPort")
+        self._ram._write(addr, data)
+
+        if self._mode is ReadDuringWrite.WRITE_FIRST:
+            self._data <<= data
+
+    def read(self, addr: Unsigned):
+        """
+        reads the value at address `addr`,
+        the result is available in the next clock cycle via `data`
+        """
+
+        assert self._read, "port does not support reads"
+        _bind_context(self, "_ctx", "std.RamPort")
+        self._data <<= self._ram._mem.get_elem(addr)
+
+    def access(self, addr: Unsigned, data, write_enable):
+        """
+        reads `addr` and writes `data` when `write_enable` is set,
+        the read data follows the read during write mode of the port
+        """
+
+        if self._mode is ReadDuringWrite.READ_FIRST:
+            if write_enable:
+                self.write(addr, data)
+            self.read(addr)
+        else:
+            if write_enable:
+                self.write(addr, data)
+            else:
+                self.read(addr)
+
+    def data(self):
+        """
+        returns the read data register
+        """
+
+        assert self._read, "port does not support reads"
+        return Value(self._data)
+
+
+class _Ram(Template[_RamArgs]):
+    _elemtype_: _RamArgs.elemtype
+    _count_: _RamArgs.count
+
+    def _init_mem(self):
+        # the array applies the active prefix to its name
+        self._write_ctx = None
+        self._mem = Array[self._elemtype_, self._count_](
+            name="mem", _qualifier_=NoresetSignal
+        )
+
+    def _write(self, addr, data):
+        # all ports writing to the memory must use the same process
+        _bind_context(self, "_write_ctx", "writes to std block rams")
+        self._mem.set_elem(addr, data)
+
+    @_intrinsic
+    def __len__(self):
+        return self._count_
+
+
+class SinglePortRam(_Ram):
+    """
+    block ram with one read/write port `port`
+    """
+
+    def __init__(self, *, mode=ReadDuringWrite.READ_FIRST, name="ram"):
+        with prefix(name) as p:
+            self._init_mem()
+            self.port = RamPort(self, p.name("data"), mode, read=True, write=True)
+
+
+class SimpleDualPortRam(_Ram):
+    """
+    block ram with a write port `wr_port` and a read port `rd_port`
+
+    The ports can be used in contexts with different clocks.
+    Reads of an address written in the same clock cycle
+    return the previous value.
+    """
+
+    def __init__(self, *, name="ram"):
+        with prefix(name) as p:
+            self._init_mem()
+            self.wr_port = RamPort(
+                self,
+                p.name("wr_data"),
+                ReadDuringWrite.NO_CHANGE,
+                read=False,
+                write=True,
+            )
+            self.rd_port = RamPort(
+                self,
+                p.name("rd_data"),
+                ReadDuringWrite.NO_CHANGE,
+                read=True,
+                write=False,
+            )
+
+
+class TrueDualPortRam(_Ram):
+    """
+    block ram with two read/write ports `port_a` and `port_b`
+
+    Both ports write the same memory signal, so writes
+    must be done from the same sequential context. The result of writing
+    the same address from both ports in one cycle is undefined.
+    """
+
+    def __init__(
+        self,
+        *,
+        mode_a=ReadDuringWrite.READ_FIRST,
+        mode_b=ReadDuringWrite.READ_FIRST,
+        name="ram",
+    ):
+        with prefix(name) as p:
+            self._init_mem()
+            self.port_a = RamPort(self, p.name("data_a"), mode_a, read=True, write=True)
+            self.port_b = RamPort(self, p.name("data_b"), mode_b, read=True, write=True)
+
+
+#
+# first word fall through fifo
+#
+
+
+class BlockRamFifo(Template[_RamArgs]):
+    """
+    first-in-first-out buffer stored in a `SimpleDualPortRam`
+
+    The element at the front is prefetched into the read data register
+    of the block ram (first word fall through), so `front` and `pop`
+    do not add a cycle of latency. Pushed elements are available
+    two clock cycles after the push. The fifo can hold up to `N+1` elements,
+    `N` in the block ram and one in the read data register.
+
+    `push` and `pop` can be used in different contexts of the same clock.
+    `N` must be a power of two.
+    """
+
+    _elemtype_: _RamArgs.elemtype
+    _count_: _RamArgs.count
+
+    def __init__(self, *, name="bram_fifo"):
+        count = self._count_
+        assert is_pow_two(count), "the size of std.BlockRamFifo must be a power of two"
+
+        self._addr_width = int_log_2(count)
+        self._pop_ctx = None
+        PtrType = Unsigned[self._addr_width + 1]
+
+        with prefix(name) as p:
+            self._ram = SimpleDualPortRam[self._elemtype_, count](name="ram")
+            self._wr_ptr = Signal[PtrType](0, name=p.name("wr_ptr"))
+            self._rd_ptr = Signal[PtrType](0, name=p.name("rd_ptr"))
+            self._valid = Signal[Bit](False, name=p.name("valid"))
+            self._full = Signal[Bit](name=p.name("full"))
+
+        @concurrent
+        def logic():
+            self._full <<= (self._wr_ptr - self._rd_ptr) == count
+
+    def _fetch(self):
+        # loads the next element from the block ram into the read data register
+        if self._wr_ptr != self._rd_ptr:
+            self._ram.rd_port.read(self._rd_ptr.lsb(self._addr_width).unsigned)
+            self._rd_ptr <<= self._rd_ptr + 1
+            self._valid <<= True
+        else:
+            self._valid <<= False
+
+    async def _impl_prefetch(self):
+        if not self._valid:
+            self._fetch()
+
+    def push(self, data):
+        assert not self._full, "writing to full fifo"
+        self._ram.wr_port.write(self._wr_ptr.lsb(self._addr_width).unsigned, data)
+        self._wr_ptr <<= self._wr_ptr + 1
+
+    def pop(self, *, qualifier=Value):
+        if _bind_context(self, "_pop_ctx", "std.BlockRamFifo.pop"):
+            at_end_of_context(self._impl_prefetch)
+
+        assert self._valid, "reading from empty fifo"
+        result = self.front(qualifier=qualifier)
+        self._fetch()
+        return result
+
+    def front(self, *, qualifier=Value):
+        return qualifier(self._ram.rd_port._data)
+
+    def empty(self):
+        return not self._valid
+
+    def full(self):
+        return Value(self._full)
+
+    async def receive(self, *, qualifier=Value):
+        await self._valid
+        return self.pop(qualifier=qualifier)
@@ -1 +1,3 @@
 from . import axi4_light
+from . import axi4
+from . import axi4_stream
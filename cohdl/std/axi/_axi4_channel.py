@@ -13,6 +13,12 @@ class Channel:
 
         self._signals = kwargs
 
+    def _payload(self):
+        return [sig for sig in self._signals.values() if sig is not None]
+
+    def _payload_names(self):
+        return [name for name, sig in self._signals.items() if sig is not None]
+
     async def send(self, **kwargs):
         for name, value in kwargs.items():
             self._signals[name] <<= value
@@ -0,0 +1 @@
+from .base import Axi4, Channel, ReadMaster, WriteMaster
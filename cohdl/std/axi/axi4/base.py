@@ -0,0 +1,636 @@
+from __future__ import annotations
+
+from cohdl.std._context import SequentialContext, concurrent
+from cohdl.std.axi._axi4_channel import Channel
+from cohdl.std._core_utility import Value, concat
+from cohdl.std._prefix import prefix
+from cohdl.std.utility import Fifo, int_log_2, is_pow_two
+
+import cohdl
+from cohdl import Bit, Unsigned, BitVector, Signal, Null, Full
+
+
+class Axi4:
+    """
+    AXI4 memory mapped interface with burst support
+
+    In contrast to `Axi4Light` the read and write channels are
+    handled by pipelines, that accept multiple outstanding transactions
+    and transfer one beat per clock cycle.
+    """
+
+    class RespConstants:
+        OKAY = "00"
+        EXOKAY = "01"
+        SLVERR = "10"
+        DECERR = "11"
+
+    class Burst:
+        FIXED = "00"
+        INCR = "01"
+        WRAP = "10"
+
+    class WrAddr(Channel):
+        def __init__(
+            self,
+            valid,
+            ready,
+            awid,
+            awaddr,
+            awlen,
+            awsize,
+            awburst,
+            awprot=None,
+            **kwargs,
+        ):
+            super().__init__(
+                valid,
+                ready,
+                awid=awid,
+                awaddr=awaddr,
+                awlen=awlen,
+                awsize=awsize,
+                awburst=awburst,
+                awprot=awprot,
+                **kwargs,
+            )
+
+            self.awid = awid
+            self.awaddr = awaddr
+            self.awlen = awlen
+            self.awsize = awsize
+            self.awburst = awburst
+            self.awprot = awprot
+
+    class WrData(Channel):
+        def __init__(self, valid, ready, wdata, wstrb, wlast, **kwargs):
+            super().__init__(
+                valid, ready, wdata=wdata, wstrb=wstrb, wlast=wlast, **kwargs
+            )
+
+            self.wdata = wdata
+            self.wstrb = wstrb
+            self.wlast = wlast
+
+    class WrResp(Channel):
+        def __init__(self, valid, ready, bid, bresp, **kwargs):
+            super().__init__(valid, ready, bid=bid, bresp=bresp, **kwargs)
+
+            self.bid = bid
+            self.bresp = bresp
+
+    class RdAddr(Channel):
+        def __init__(
+            self,
+            valid,
+            ready,
+            arid,
+            araddr,
+            arlen,
+            arsize,
+            arburst,
+            arprot=None,
+            **kwargs,
+        ):
+            super().__init__(
+                valid,
+                ready,
+                arid=arid,
+                araddr=araddr,
+                arlen=arlen,
+                arsize=arsize,
+                arburst=arburst,
+                arprot=arprot,
+                **kwargs,
+            )
+
+            self.arid = arid
+            self.araddr = araddr
+            self.arlen = arlen
+            self.arsize = arsize
+            self.arburst = arburst
+            self.arprot = arprot
+
+    class RdData(Channel):
+        def __init__(self, valid, ready, rid, rdata, rresp, rlast, **kwargs):
+            super().__init__(
+                valid,
+                ready,
+                rid=rid,
+                rdata=rdata,
+                rresp=rresp,
+                rlast=rlast,
+                **kwargs,
+            )
+
+            self.rid = rid
+            self.rdata = rdata
+            self.rresp = rresp
+            self.rlast = rlast
+
+    @staticmethod
+    def signal(
+        clk,
+        reset,
+        addr_width,
+        data_width=32,
+        id_width=4,
+        prot_width=3,
+        prefix="",
+    ):
+        S = cohdl.Signal
+
+        def vec(width, name):
+            return S[BitVector[width]](Null, name=f"{prefix}{name}")
+
+        def bit(name):
+            return S[Bit](Null, name=f"{prefix}{name}")
+
+        strb_width = data_width // 8
+
+        wraddr = Axi4.WrAddr(
+            bit("awvalid"),
+            bit("awready"),
+            vec(id_width, "awid"),
+            vec(addr_width, "awaddr"),
+            vec(8, "awlen"),
+            vec(3, "awsize"),
+            vec(2, "awburst"),
+            vec(prot_width, "awprot") if prot_width is not None else None,
+        )
+
+        wrdata = Axi4.WrData(
+            bit("wvalid"),
+            bit("wready"),
+            vec(data_width, "wdata"),
+            vec(strb_width, "wstrb"),
+            bit("wlast"),
+        )
+
+        wrresp = Axi4.WrResp(
+            bit("bvalid"),
+            bit("bready"),
+            vec(id_width, "bid"),
+            vec(2, "bresp"),
+        )
+
+        rdaddr = Axi4.RdAddr(
+            bit("arvalid"),
+            bit("arready"),
+            vec(id_width, "arid"),
+            vec(addr_width, "araddr"),
+            vec(8, "arlen"),
+            vec(3, "arsize"),
+            vec(2, "arburst"),
+            vec(prot_width, "arprot") if prot_width is not None else None,
+        )
+
+        rddata = Axi4.RdData(
+            bit("rvalid"),
+            bit("rready"),
+            vec(id_width, "rid"),
+            vec(data_width, "rdata"),
+            vec(2, "rresp"),
+            bit("rlast"),
+        )
+
+        return Axi4(clk, reset, wraddr, wrdata, wrresp, rdaddr, rddata)
+
+    def __init__(
+        self,
+        clk,
+        reset,
+        wraddr: Axi4.WrAddr,
+        wrdata: Axi4.WrData,
+        wrresp: Axi4.WrResp,
+        rdaddr: Axi4.RdAddr,
+        rddata: Axi4.RdData,
+    ):
+        self.clk = clk
+        self.reset = reset
+        self.wraddr = wraddr
+        self.wrdata = wrdata
+        self.wrresp = wrresp
+        self.rdaddr = rdaddr
+        self.rddata = rddata
+
+        self._addr_width = rdaddr.araddr.width
+        self._data_width = rddata.rdata.width
+        self._id_width = rddata.rid.width
+
+        assert is_pow_two(self._data_width) and self._data_width >= 8
+
+    def addr_width(self):
+        return self._addr_width
+
+    def data_width(self):
+        return self._data_width
+
+    def id_width(self):
+        return self._id_width
+
+    def _context(self):
+        return SequentialContext(self.clk, self.reset)
+
+    def read_slave(self, read, *, outstanding=4, name="axi_rd"):
+        """
+        implements the read channels of a slave
+
+        `read(addr)` is called with the byte address of each beat and
+        returns the data word, that is registered in `rdata`.
+        Up to `outstanding` read requests are buffered, one beat is
+        transferred per clock cycle and bursts are sent back to back.
+        """
+
+        ar = self.rdaddr
+        r = self.rddata
+        layout = _RequestLayout(self._id_width, self._addr_width, 8, 3, 2)
+
+        with prefix(name) as p:
+            requests = Fifo[BitVector[layout.width], outstanding + 1](name="requests")
+            burst = Signal[BitVector[layout.width]](Null, name=p.name("burst"))
+            remaining = Signal[Unsigned[8]](0, name=p.name("remaining"))
+            active = Signal[Bit](False, name=p.name("active"))
+            valid = Signal[Bit](False, name=p.name("valid"))
+
+        @concurrent
+        def proc_rd_ready():
+            ar.ready <<= not requests.full()
+            r.valid <<= valid
+
+        @self._context()
+        def proc_rd_slave():
+            if ar.valid and not requests.full():
+                requests.push(
+                    layout.pack(ar.arid, ar.araddr, ar.arlen, ar.arsize, ar.arburst)
+                )
+
+            if r.ready or not valid:
+                if active or not requests.empty():
+                    current = Value(burst) if active else requests.front()
+
+                    if not active:
+                        requests.pop()
+
+                    beat_id, addr, length, size, burst_type = layout.unpack(current)
+                    left = Value(remaining) if active else length.unsigned
+
+                    r.rid <<= beat_id
+                    r.rdata <<= read(addr.unsigned)
+                    r.rresp <<= Axi4.RespConstants.OKAY
+                    r.rlast <<= left == 0
+                    valid.next = True
+                    active.next = left != 0
+                    remaining.next = left - 1
+
+                    burst.next = layout.pack(
+                        beat_id,
+                        _next_burst_addr(addr, size, burst_type, length),
+                        length,
+                        size,
+                        burst_type,
+                    )
+                else:
+                    valid.next = False
+
+    def write_slave(self, write, *, outstanding=4, name="axi_wr"):
+        """
+        implements the write channels of a slave
+
+        `write(addr, data, strb)` is called with the byte address,
+        data and strobe of each beat. Up to `outstanding` write requests
+        and responses are buffered, one beat is accepted per clock cycle.
+        """
+
+        aw = self.wraddr
+        w = self.wrdata
+        b = self.wrresp
+        layout = _RequestLayout(self._id_width, self._addr_width, 8, 3, 2)
+
+        with prefix(name) as p:
+            requests = Fifo[BitVector[layout.width], outstanding + 1](name="requests")
+            responses = Fifo[BitVector[self._id_width], outstanding + 1](
+                name="responses"
+            )
+            burst = Signal[BitVector[layout.width]](Null, name=p.name("burst"))
+            active = Signal[Bit](False, name=p.name("active"))
+            valid = Signal[Bit](False, name=p.name("valid"))
+
+        @concurrent
+        def proc_wr_ready():
+            aw.ready <<= not requests.full()
+            w.ready <<= (active or not requests.empty()) and not responses.full()
+            b.valid <<= valid
+
+        @self._context()
+        def proc_wr_slave():
+            if aw.valid and not requests.full():
+                requests.push(
+                    layout.pack(aw.awid, aw.awaddr, aw.awlen, aw.awsize, aw.awburst)
+                )
+
+            if w.valid and (active or not requests.empty()) and not responses.full():
+                current = Value(burst) if active else requests.front()
+
+                if not active:
+                    requests.pop()
+
+                beat_id, addr, length, size, burst_type = layout.unpack(current)
+                write(addr.unsigned, w.wdata, w.wstrb)
+
+                if w.wlast:
+                    active.next = False
+                    responses.push(beat_id)
+                else:
+                    active.next = True
+                    burst.next = layout.pack(
+                        beat_id,
+                        _next_burst_addr(addr, size, burst_type, length),
+                        length,
+                        size,
+                        burst_type,
+                    )
+
+            if b.ready or not valid:
+                if not responses.empty():
+                    b.bid <<= responses.pop()
+                    b.bresp <<= Axi4.RespConstants.OKAY
+                    valid.next = True
+                else:
+                    valid.next = False
+
+    def read_master(self, on_beat, *, ready=True, outstanding=4, name="axi_rd_master"):
+        """
+        returns a `ReadMaster` issuing read bursts on this interface
+        """
+        return ReadMaster(
+            self, on_beat, ready=ready, outstanding=outstanding, name=name
+        )
+
+    def write_master(
+        self,
+        data,
+        *,
+        data_valid=True,
+        on_response=None,
+        outstanding=4,
+        name="axi_wr_master",
+    ):
+        """
+        returns a `WriteMaster` issuing write bursts on this interface
+        """
+        return WriteMaster(
+            self,
+            data,
+            data_valid=data_valid,
+            on_response=on_response,
+            outstanding=outstanding,
+            name=name,
+        )
+
+
+#
+# burst masters
+#
+
+
+class ReadMaster:
+    """
+    issues read bursts requested with `request`
+
+    Up to `outstanding` bursts are in flight at the same time.
+    `on_beat(id, data, resp, last)` is called in the context of the
+    interface for each received beat. `ready` is driven to `rready`
+    and can be used to stall the read data channel.
+    """
+
+    def __init__(
+        self,
+        axi: Axi4,
+        on_beat,
+        *,
+        ready=True,
+        outstanding=4,
+        name="axi_rd_master",
+    ):
+        ar = axi.rdaddr
+        r = axi.rddata
+        size = Unsigned[3](int_log_2(axi.data_width() // 8)).bitvector
+
+        self._layout = layout = _RequestLayout(axi.id_width(), axi.addr_width(), 8, 2)
+
+        with prefix(name) as p:
+            self._requests = requests = Fifo[BitVector[layout.width], outstanding + 1](
+                name="requests"
+            )
+            valid = Signal[Bit](False, name=p.name("valid"))
+            pending = Signal[Unsigned.upto(outstanding)](0, name=p.name("pending"))
+
+        @concurrent
+        def proc_rd_master_ready():
+            ar.valid <<= valid
+            r.ready <<= ready
+
+        @axi._context()
+        def proc_rd_master():
+            issue = (
+                (not valid or ar.ready)
+                and not requests.empty()
+                and pending != outstanding
+            )
+            done = r.valid and ready and r.rlast
+
+            if not valid or ar.ready:
+                if issue:
+                    beat_id, addr, length, burst_type = layout.unpack(requests.pop())
+                    ar.arid <<= beat_id
+                    ar.araddr <<= addr
+                    ar.arlen <<= length
+                    ar.arsize <<= size
+                    ar.arburst <<= burst_type
+                    valid.next = True
+                else:
+                    valid.next = False
+
+            if r.valid and ready:
+                on_beat(r.rid, r.rdata, r.rresp, r.rlast)
+
+            pending.next = _update_pending(pending, issue, done)
+
+    def full(self):
+        return self._requests.full()
+
+    def request(self, addr, length, *, id=0, burst=Axi4.Burst.INCR):
+        """
+        requests a read burst of `length+1` beats (`length` is the AXI `arlen`)
+        starting at the byte address `addr`
+        """
+
+        assert not self._requests.full(), "read request queue is full"
+        self._requests.push(self._layout.pack(id, addr, length, burst))
+
+
+class WriteMaster:
+    """
+    issues write bursts requested with `request`
+
+    `data()` is called in the context of the interface, once for each
+    beat sent on the write data channel, and returns the data word.
+    Beats are only sent while `data_valid` is set. Up to `outstanding`
+    bursts are in flight at the same time, `on_response(id, resp)`
+    is called for each received write response.
+    """
+
+    def __init__(
+        self,
+        axi: Axi4,
+        data,
+        *,
+        data_valid=True,
+        on_response=None,
+        outstanding=4,
+        name="axi_wr_master",
+    ):
+        aw = axi.wraddr
+        w = axi.wrdata
+        b = axi.wrresp
+        size = Unsigned[3](int_log_2(axi.data_width() // 8)).bitvector
+
+        self._layout = layout = _RequestLayout(axi.id_width(), axi.addr_width(), 8, 2)
+
+        with prefix(name) as p:
+            self._requests = requests = Fifo[BitVector[layout.width], outstanding + 1](
+                name="requests"
+            )
+            bursts = Fifo[BitVector[8], outstanding + 1](name="bursts")
+            aw_valid = Signal[Bit](False, name=p.name("aw_valid"))
+            w_valid = Signal[Bit](False, name=p.name("w_valid"))
+            w_active = Signal[Bit](False, name=p.name("w_active"))
+            remaining = Signal[Unsigned[8]](0, name=p.name("remaining"))
+            pending = Signal[Unsigned.upto(outstanding)](0, name=p.name("pending"))
+
+        @concurrent
+        def proc_wr_master_ready():
+            aw.valid <<= aw_valid
+            w.valid <<= w_valid
+            b.ready <<= True
+
+        @axi._context()
+        def proc_wr_master():
+            issue = (
+                (not aw_valid or aw.ready)
+                and not requests.empty()
+                and pending != outstanding
+            )
+
+            if not aw_valid or aw.ready:
+                if issue:
+                    beat_id, addr, length, burst_type = layout.unpack(requests.pop())
+                    aw.awid <<= beat_id
+                    aw.awaddr <<= addr
+                    aw.awlen <<= length
+                    aw.awsize <<= size
+                    aw.awburst <<= burst_type
+                    aw_valid.next = True
+                    bursts.push(length)
+                else:
+                    aw_valid.next = False
+
+            if not w_valid or w.ready:
+                if (w_active or not bursts.empty()) and data_valid:
+                    left = Value(remaining) if w_active else bursts.front().unsigned
+
+                    if not w_active:
+                        bursts.pop()
+
+                    w.wdata <<= data()
+                    w.wstrb <<= Full
+                    w.wlast <<= left == 0
+                    remaining.next = left - 1
+                    w_active.next = left != 0
+                    w_valid.next = True
+                else:
+                    w_valid.next = False
+
+            if b.valid:
+                if on_response is not None:
+                    on_response(b.bid, b.bresp)
+
+            pending.next = _update_pending(pending, issue, b.valid)
+
+    def full(self):
+        return self._requests.full()
+
+    def request(self, addr, length, *, id=0, burst=Axi4.Burst.INCR):
+        """
+        requests a write burst of `length+1` beats (`length` is the AXI `awlen`)
+        starting at the byte address `addr`
+        """
+
+        assert not self._requests.full(), "write request queue is full"
+        self._requests.push(self._layout.pack(id, addr, length, burst))
+
+
+#
+# helpers
+#
+
+
+class _RequestLayout:
+    # packs the fields of a burst request into a single bitvector,
+    # so requests can be buffered in a std.Fifo
+
+    def __init__(self, *widths: int):
+        # field widths from msb to lsb
+        self.width = sum(widths)
+        self._widths = widths
+        self._slices = []
+
+        high = self.width - 1
+
+        for width in widths:
+            self._slices.append((high, high - width + 1))
+            high -= width
+
+    def pack(self, *fields):
+        return concat(
+            *[
+                Value[Unsigned[width]](field).bitvector
+                for width, field in zip(self._widths, fields)
+            ]
+        )
+
+    def unpack(self, packed):
+        return [packed[high:low] for high, low in self._slices]
+
+
+def _next_burst_addr(addr: BitVector, size: BitVector, burst: BitVector, length):
+    # address of the next beat, the mask selects the address bits
+    # that change between beats (none for FIXED bursts, all for INCR bursts
+    # and the bits below the wrap boundary for WRAP bursts)
+    width = addr.width
+    step = Unsigned[width](1) << size.unsigned
+    low_bits = (step - 1).bitvector
+    wrap_bits = (Value[Unsigned[width]](length.unsigned) << size.unsigned).bitvector
+
+    mask = (
+        Value[BitVector[width]](Null)
+        if burst == Axi4.Burst.FIXED
+        else (
+            wrap_bits | low_bits
+            if burst == Axi4.Burst.WRAP
+            else Value[BitVector[width]](Full)
+        )
+    )
+
+    aligned = (addr & ~low_bits).unsigned
+    return (addr & ~mask) | ((aligned + step).bitvector & mask)
+
+
+def _update_pending(pending, issue, done):
+    # number of bursts in flight after one clock cycle
+    return (
+        pending + 1
+        if issue and not done
+        else (pending - 1 if done and not issue else Value(pending))
+    )
@@ -2,8 +2,8 @@ from __future__ import annotations
 
 from cohdl.std._context import SequentialContext
 from cohdl.std.axi._axi4_channel import Channel
-from cohdl.std._core_utility import Mask, stretch, as_awaitable
-from cohdl.std._context import Clock, Reset, ClockEdge, Frequency
+from cohdl.std._core_utility import Mask, stretch, as_awaitable, select
+from cohdl.std._context import Clock, Reset, ClockEdge, Frequency, concurrent
 
 from cohdl.std.reg import RegisterObject, reg32
 
@@ -261,7 +261,129 @@ class Axi4Light:
         await self.wrresp.ready
         self.wrresp.valid <<= False
 
-    def connect_addr_map(self, addr_map):
+    def _connect_read_tree(self, ctx, readable_regs, read_stages, decode_bits):
+        # reads are decoded by a tree of selected assignments, each level
+        # of the tree handles `decode_bits` bits of the word address
+        # registers are placed between groups of levels and
+        # on the read data channel, a global stall signal
+        # allows one read per cycle
+
+        assert all(
+            reg._has_plain_read_() for reg in readable_regs
+        ), "decode tree requires registers, that are read without side effects"
+        assert decode_bits > 0, "decode_bits must be positive"
+
+        word_bits = self._addr_width - 2
+        used_bits = min(
+            word_bits,
+            max(
+                [1, *[reg._global_word_offset_().bit_length() for reg in readable_regs]]
+            ),
+        )
+
+        levels = [
+            (lo, min(lo + decode_bits, used_bits))
+            for lo in range(0, used_bits, decode_bits)
+        ]
+
+        if used_bits != word_bits:
+            # addresses above all registers return zero
+            levels.append((used_bits, word_bits))
+
+        assert 0 <= read_stages < len(levels), (
+            f"read_stages must be smaller than the number of decoder levels"
+            f" ({len(levels)})"
+        )
+
+        # the levels are split into read_stages+1 groups,
+        # a register stage follows each group
+        stage_ends = {
+            len(levels) * (stage + 1) // (read_stages + 1) - 1
+            for stage in range(read_stages + 1)
+        }
+
+        S = cohdl.Signal
+        Word = BitVector[32]
+
+        advance = S[Bit](name="rd_advance")
+        valid_out = S[Bit](False, name="rd_valid")
+
+        stage_addr = [S[BitVector[word_bits]](name="rd_addr_0")]
+        stage_valid = [S[Bit](name="rd_valid_0")]
+
+        nodes = {
+            reg._global_word_offset_(): S[Word](name=f"rd_{reg._name_}")
+            for reg in readable_regs
+        }
+        read_values = list(zip(readable_regs, nodes.values()))
+
+        comb_groups = []
+        reg_groups = []
+
+        for nr, (lo, hi) in enumerate(levels):
+            addr = stage_addr[-1]
+            sel = addr[hi - 1 : lo].unsigned
+            last = nr == len(levels) - 1
+
+            tables = {}
+
+            for key, node in nodes.items():
+                tables.setdefault(key >> (hi - lo), {})[
+                    key & ((1 << (hi - lo)) - 1)
+                ] = node
+
+            if last:
+                targets = {group: self.rddata.rdata for group in tables}
+            else:
+                targets = {
+                    group: S[Word](name=f"rd_mux_{nr}_{group}") for group in tables
+                }
+
+            (reg_groups if nr in stage_ends else comb_groups).extend(
+                (targets[group], sel, table) for group, table in tables.items()
+            )
+
+            nodes = targets
+
+            if nr in stage_ends and not last:
+                stage_addr.append(
+                    S[BitVector[word_bits]](name=f"rd_addr_{len(stage_addr)}")
+                )
+                stage_valid.append(S[Bit](False, name=f"rd_valid_{len(stage_valid)}"))
+
+        stages = list(zip(stage_addr[1:], stage_addr, stage_valid[1:], stage_valid))
+
+        @concurrent
+        def proc_read_tree():
+            advance.next = self.rddata.ready | ~valid_out
+            self.rdaddr.ready <<= advance
+            self.rddata.valid <<= valid_out
+
+            stage_addr[0].next = self.rdaddr.araddr.bitvector.msb(rest=2)
+            stage_valid[0].next = self.rdaddr.valid & advance
+
+            for reg, wire in read_values:
+                wire.next = reg._plain_read_()
+
+            for target, sel, table in comb_groups:
+                target.next = select(sel, table, default=Null)
+
+        @ctx
+        def proc_read_stages():
+            if advance:
+                valid_out.next = stage_valid[-1]
+                self.rddata.rresp <<= Null
+
+                for next_addr, addr, next_valid, valid in stages:
+                    next_addr.next = addr
+                    next_valid.next = valid
+
+                for target, sel, table in reg_groups:
+                    target.next = select(sel, table, default=Null)
+
+    def connect_addr_map(
+        self, addr_map, *, decode_tree=False, read_stages=0, decode_bits=4
+    ):
         from cohdl.std.reg import RegisterTools
         from cohdl.std._core_utility import as_awaitable
 
@@ -279,23 +401,28 @@ class Axi4Light:
         readable_regs = [reg for reg in regs if reg._readable_]
         writable_regs = [reg for reg in regs if reg._writable_]
 
-        @ctx
-        async def proc_read():
-            while True:
-                request = await self.await_read_request()
-                assert isinstance(request.addr, cohdl.Signal)
+        if decode_tree:
+            self._connect_read_tree(ctx, readable_regs, read_stages, decode_bits)
+        else:
+            assert read_stages == 0, "read_stages requires decode_tree=True"
 
-                result = cohdl.Variable[cohdl.BitVector[32]](cohdl.Null)
+            @ctx
+            async def proc_read():
+                while True:
+                    request = await self.await_read_request()
+                    assert isinstance(request.addr, cohdl.Signal)
 
-                for reg in readable_regs:
-                    if reg._contains_addr_(request.addr.unsigned):
-                        result @= await as_awaitable(
-                            reg._basic_read_, request.addr.unsigned, None
-                        )
-                        break
+                    result = cohdl.Variable[cohdl.BitVector[32]](cohdl.Null)
 
-                await self.send_read_resp(result)
-                continue
+                    # registers do not overlap, see proc_write
+                    for reg in readable_regs:
+                        if reg._contains_addr_(request.addr.unsigned):
+                            result @= await as_awaitable(
+                                reg._basic_read_, request.addr.unsigned, None
+                            )
+
+                    await self.send_read_resp(result)
+                    continue
 
         @ctx
         async def proc_write():
@@ -304,6 +431,9 @@ class Axi4Light:
                 assert isinstance(request.addr, cohdl.Signal)
                 mask = cohdl.Variable(stretch(request.strb, 8))
 
+                # registers do not overlap, so each register is
+                # checked independently instead of in a chain of
+                # nested else branches that grows with the map size
                 for reg in writable_regs:
                     if reg._contains_addr_(request.addr.unsigned):
                         await as_awaitable(
@@ -313,7 +443,6 @@ class Axi4Light:
                             Mask(mask),
                             None,
                         )
-                        break
 
                 await self.send_write_response()
                 continue
@@ -431,6 +560,9 @@ def addr_map_entity(
     active_high_reset=False,
     addr_map=None,
     entity_name=None,
+    decode_tree=False,
+    read_stages=0,
+    decode_bits=4,
 ):
     Base = base_entity(
         addr_width=addr_width,
@@ -446,7 +578,12 @@ def addr_map_entity(
 
             # connect the AXI signals to the address map
             # defined in the exampled derived below
-            self.interface_connection().connect_addr_map(AddrMap())
+            self.interface_connection().connect_addr_map(
+                AddrMap(),
+                decode_tree=decode_tree,
+                read_stages=read_stages,
+                decode_bits=decode_bits,
+            )
 
         @classmethod
         @pyeval
@@ -142,9 +142,29 @@ class Axi4Light:
         Send `resp` to the AXI master using the bresp channel.
         """
 
-    def connect_addr_map(self, addr_map: reg32.AddrMap):
+    def connect_addr_map(
+        self,
+        addr_map: reg32.AddrMap,
+        *,
+        decode_tree: bool = False,
+        read_stages: int = 0,
+        decode_bits: int = 4,
+    ):
         """
         Connect an abstract register definition to the AXI interface.
+
+        By default reads are handled by a process, that compares
+        the requested address with each register and
+        accepts a new read request after the previous response
+        was sent.
+
+        When `decode_tree` is set, the read data is selected by a tree of
+        multiplexers. Each level decodes `decode_bits` bits of the word address.
+        `read_stages` adds register stages between the levels of the tree
+        (the read latency is `1 + read_stages` cycles).
+        Read requests are accepted back to back.
+        All readable registers must be read without side effects
+        (see `RegisterObject._has_plain_read_`).
         """
 
 class _CommonBase(cohdl.Entity):
@@ -272,6 +292,9 @@ def addr_map_entity(
     active_high_reset=False,
     addr_map: str | type[reg32.AddrMap] | None = None,
     entity_name: str | None = None,
+    decode_tree: bool = False,
+    read_stages: int = 0,
+    decode_bits: int = 4,
 ) -> type[_CommonAddrMap]:
     """
     Define a AXI slave entity based on a generic address map.
@@ -281,6 +304,9 @@ def addr_map_entity(
     When `entity_name` is set, it is used as the name of the
     generated HDL entity. Defaults to the name of the Python class.
 
+    `decode_tree`, `read_stages` and `decode_bits` are forwarded
+    to `Axi4Light.connect_addr_map`.
+
     There are three ways to define the register interface
     implemented by the entity:
 
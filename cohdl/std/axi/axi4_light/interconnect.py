@@ -1,5 +1,9 @@
 import cohdl
-from cohdl.std._context import concurrent, sequential
+from cohdl import Bit, Unsigned, Signal, Null, pyeval
+from cohdl.std._context import SequentialContext, concurrent, sequential
+from cohdl.std._core_utility import select, batched_fold
+from cohdl.std.utility import Fifo
+from cohdl.std.axi.axi4_stream import skid_buffer
 
 
 from .base import Axi4Light
@@ -35,7 +39,106 @@ def background_range(clk, reset, addr_width):
     return axi
 
 
+def _signal_like(axi: Axi4Light, prefix):
+    prot = axi.rdaddr.arprot
+
+    return Axi4Light.signal(
+        axi.clk,
+        axi.reset,
+        addr_width=axi.addr_width(),
+        data_width=axi.data_width(),
+        prot_width=None if prot is None else prot.width,
+        prefix=prefix,
+    )
+
+
+def register_slice(master: Axi4Light, slave: Axi4Light | None = None, name="slice"):
+    """
+    inserts a skid buffer in each of the five channels between `master`
+    and `slave`, when `slave` is not specified a new interface is created
+
+    All paths between both interfaces are registered,
+    the throughput of one transfer per channel and clock cycle is kept.
+    Returns the slave side interface.
+    """
+
+    if slave is None:
+        slave = _signal_like(master, f"{name}_")
+
+    ctx = SequentialContext(master.clk, master.reset)
+
+    skid_buffer(ctx, master.wraddr, slave.wraddr, name=f"{name}_aw")
+    skid_buffer(ctx, master.wrdata, slave.wrdata, name=f"{name}_w")
+    skid_buffer(ctx, slave.wrresp, master.wrresp, name=f"{name}_b")
+    skid_buffer(ctx, master.rdaddr, slave.rdaddr, name=f"{name}_ar")
+    skid_buffer(ctx, slave.rddata, master.rddata, name=f"{name}_r")
+
+    return slave
+
+
+def _or(a, b):
+    return a or b
+
+
+class _Request:
+    # registered address channel of the pipelined interconnect
+    def __init__(self, addr, prot, name):
+        self.valid = Signal[Bit](False, name=f"{name}_valid")
+        self.addr = Signal[cohdl.BitVector[addr.width]](Null, name=f"{name}_addr")
+        self.prot = (
+            None
+            if prot is None
+            else Signal[cohdl.BitVector[prot.width]](Null, name=f"{name}_prot")
+        )
+        self.ready = Signal[Bit](False, name=f"{name}_ready")
+        self.issue = Signal[Bit](False, name=f"{name}_issue")
+        self.advance = Signal[Bit](False, name=f"{name}_advance")
+
+
+class _Routing:
+    # signals, that depend on the number of connected slaves
+    def __init__(self, slave_cnt, outstanding):
+        width = max(1, (slave_cnt - 1).bit_length())
+        Index = Unsigned[width]
+
+        self.ar_index = Signal[Index](0, name="ic_ar_index")
+        self.aw_index = Signal[Index](0, name="ic_aw_index")
+
+        # slave index of each outstanding transaction in the order
+        # of the requests, responses are returned in the same order
+        self.rd_order = Fifo[Index, outstanding + 1](name="ic_rd_order")
+        self.wr_order = Fifo[Index, outstanding + 1](name="ic_wr_order")
+        self.b_order = Fifo[Index, outstanding + 1](name="ic_b_order")
+
+        # slaves, that set the bits of the index
+        self.index_bits = [
+            (bit, [nr for nr in range(1, slave_cnt) if nr & (1 << bit)])
+            for bit in range(width)
+            if slave_cnt > 1
+        ]
+
+
 class Interconnect:
+    """
+    connects one AXI4-Lite master to multiple slaves,
+    addresses outside all slave ranges receive a DECERR response
+
+    By default only one read and one write transaction is active at a time.
+
+    When `pipelined` is set, the address decode is registered and
+    read and write requests are forwarded once per cycle. Up to `outstanding`
+    transactions per direction can be active across all slaves, the slave
+    index of each request is tracked so responses are returned in order.
+    Full throughput requires `outstanding` to cover the response latency
+    of the slaves.
+
+    `register_slices` inserts a register slice (see `register_slice`)
+    at the master port and at each slave port. Without register slices
+    the pipelined `arready`/`awready` of the master depend combinationally
+    on the ready signal of the selected slave
+    (through `rd.advance`/`wr.advance` in `_connect_pipelined`).
+    """
+
     class SlaveWrapper:
         def __init__(self, offset: int, size: int, axi: Axi4Light):
             assert size.bit_count() == 1, "size must be a power of 2"
@@ -43,6 +146,8 @@ class Interconnect:
 
             self.range_start = offset
             self.range_end = offset + size - 1
+            self.range_bits = size.bit_length() - 1
+            self.range_index = offset // size
             self.axi = axi
             self.rd_active = cohdl.Signal[cohdl.Bit](False)
             self.wr_active = cohdl.Signal[cohdl.Bit](False)
@@ -53,6 +158,11 @@ class Interconnect:
         def contains_addr(self, addr):
             return self.range_start <= addr.unsigned <= self.range_end
 
+        def matches_addr(self, addr):
+            # ranges are aligned powers of two,
+            # only the address bits above the range are compared
+            return addr.msb(rest=self.range_bits).unsigned == self.range_index
+
         def overlapps(self, offset, size):
             return (
                 (self.range_start <= offset <= self.range_end)
@@ -64,7 +174,14 @@ class Interconnect:
     def _all_slaves(self):
         return [*self._slaves, self._background]
 
-    def __init__(self, master: Axi4Light):
+    def __init__(
+        self,
+        master: Axi4Light,
+        *,
+        pipelined=False,
+        outstanding=4,
+        register_slices=False,
+    ):
         addr_width = master.addr_width()
 
         self._clk = master.clk
@@ -73,7 +190,44 @@ class Interconnect:
             0, 2**addr_width, background_range(self._clk, self._reset, addr_width)
         )
         self._slaves: list[Interconnect.SlaveWrapper] = []
+        self._register_slices = register_slices
+        self._outstanding = outstanding
+        self._routing = None
+
+        if register_slices:
+            master = register_slice(master, name="ic_master")
+
+        if pipelined:
+            assert outstanding > 0, "outstanding must be positive"
+            self._connect_pipelined(master)
+        else:
+            self._connect_serialized(master)
+
+    @pyeval
+    def _routing_signals(self) -> _Routing:
+        # the number of slaves is only known after all slaves
+        # are connected, so the routing signals are created on first use
+        if self._routing is None:
+            self._routing = _Routing(len(self._slaves) + 1, self._outstanding)
+
+        return self._routing
+
+    @pyeval
+    def _indexed_slaves(self):
+        # the background range is selected by index 0,
+        # when no slave contains an address
+        return [*enumerate([self._background, *self._slaves])]
+
+    def _decode(self, index, addr):
+        routing = self._routing_signals()
+        slaves = self._indexed_slaves()
+
+        for bit, members in routing.index_bits:
+            index[bit] <<= batched_fold(
+                _or, [slaves[nr][1].matches_addr(addr) for nr in members]
+            )
 
+    def _connect_serialized(self, master: Axi4Light):
         @sequential
         def proc_connect():
             for slv in self._all_slaves():
@@ -131,6 +285,149 @@ class Interconnect:
             for slv in self._all_slaves():
                 slv.wr_active <<= False
 
+    def _connect_pipelined(self, master: Axi4Light):
+        ctx = SequentialContext(self._clk, self._reset)
+
+        ar, r = master.rdaddr, master.rddata
+        aw, w, b = master.wraddr, master.wrdata, master.wrresp
+
+        rd = _Request(ar.araddr, ar.arprot, "ic_ar")
+        wr = _Request(aw.awaddr, aw.awprot, "ic_aw")
+
+        # handshake signals of the slaves selected by the response order
+        r_valid = Signal[Bit](False, name="ic_r_valid")
+        w_ready = Signal[Bit](False, name="ic_w_ready")
+        b_valid = Signal[Bit](False, name="ic_b_valid")
+
+        @concurrent
+        def proc_route_read():
+            routing = self._routing_signals()
+            order = routing.rd_order
+            index = routing.ar_index
+            head = order.front()
+            active = not order.empty()
+
+            slaves = self._indexed_slaves()
+
+            rd.ready <<= select(
+                index, {nr: slv.axi.rdaddr.ready for nr, slv in slaves}, default=Null
+            )
+            rd.issue <<= rd.valid and rd.ready and not order.full()
+
+            rd.advance <<= rd.issue or not rd.valid
+            ar.ready <<= rd.advance
+
+            for nr, slv in slaves:
+                slv.axi.rdaddr.valid <<= rd.valid and index == nr and not order.full()
+                slv.axi.rdaddr.araddr <<= rd.addr.lsb(slv.axi.addr_width())
+
+                if slv.axi.rdaddr.arprot is not None:
+                    slv.axi.rdaddr.arprot <<= rd.prot
+
+                slv.axi.rddata.ready <<= active and head == nr and r.ready
+
+            r_valid.next = select(
+                head, {nr: slv.axi.rddata.valid for nr, slv in slaves}, default=Null
+            )
+            r.valid <<= active and r_valid
+            r.rdata <<= select(
+                head, {nr: slv.axi.rddata.rdata for nr, slv in slaves}, default=Null
+            )
+            r.rresp <<= select(
+                head, {nr: slv.axi.rddata.rresp for nr, slv in slaves}, default=Null
+            )
+
+        @ctx
+        def proc_pipeline_read():
+            routing = self._routing_signals()
+
+            if rd.advance:
+                rd.valid <<= ar.valid
+                rd.addr <<= ar.araddr
+
+                if rd.prot is not None:
+                    rd.prot <<= ar.arprot
+
+                self._decode(routing.ar_index, ar.araddr)
+
+            if rd.issue:
+                routing.rd_order.push(routing.ar_index)
+
+            if r.valid and r.ready:
+                routing.rd_order.pop()
+
+        @concurrent
+        def proc_route_write():
+            routing = self._routing_signals()
+            index = routing.aw_index
+            wr_order = routing.wr_order
+            b_order = routing.b_order
+            blocked = wr_order.full() or b_order.full()
+
+            w_head = wr_order.front()
+            w_active = not wr_order.empty()
+            b_head = b_order.front()
+            b_active = not b_order.empty()
+
+            slaves = self._indexed_slaves()
+
+            wr.ready <<= select(
+                index, {nr: slv.axi.wraddr.ready for nr, slv in slaves}, default=Null
+            )
+            wr.issue <<= wr.valid and wr.ready and not blocked
+
+            wr.advance <<= wr.issue or not wr.valid
+            aw.ready <<= wr.advance
+
+            for nr, slv in slaves:
+                slv.axi.wraddr.valid <<= wr.valid and index == nr and not blocked
+                slv.axi.wraddr.awaddr <<= wr.addr.lsb(slv.axi.addr_width())
+
+                if slv.axi.wraddr.awprot is not None:
+                    slv.axi.wraddr.awprot <<= wr.prot
+
+                slv.axi.wrdata.valid <<= w.valid and w_active and w_head == nr
+                slv.axi.wrdata.wdata <<= w.wdata
+                slv.axi.wrdata.wstrb <<= w.wstrb
+
+                slv.axi.wrresp.ready <<= b_active and b_head == nr and b.ready
+
+            w_ready.next = select(
+                w_head, {nr: slv.axi.wrdata.ready for nr, slv in slaves}, default=Null
+            )
+            w.ready <<= w_active and w_ready
+
+            b_valid.next = select(
+                b_head, {nr: slv.axi.wrresp.valid for nr, slv in slaves}, default=Null
+            )
+            b.valid <<= b_active and b_valid
+            b.bresp <<= select(
+                b_head, {nr: slv.axi.wrresp.bresp for nr, slv in slaves}, default=Null
+            )
+
+        @ctx
+        def proc_pipeline_write():
+            routing = self._routing_signals()
+
+            if wr.advance:
+                wr.valid <<= aw.valid
+                wr.addr <<= aw.awaddr
+
+                if wr.prot is not None:
+                    wr.prot <<= aw.awprot
+
+                self._decode(routing.aw_index, aw.awaddr)
+
+            if wr.issue:
+                routing.wr_order.push(routing.aw_index)
+                routing.b_order.push(routing.aw_index)
+
+            if w.valid and w.ready:
+                routing.wr_order.pop()
+
+            if b.valid and b.ready:
+                routing.b_order.pop()
+
     def reserve(self, offset: int, size: int, prefix="") -> Axi4Light:
         assert size.bit_count() == 1, "size must be a power of 2"
         addr_width = size.bit_length() - 1
@@ -150,4 +447,14 @@ class Interconnect:
         for slv in self._slaves:
             assert not slv.overlapps(offset, actual_size)
 
+        assert (
+            self._routing is None
+        ), "slaves cannot be connected after the interconnect is used"
+
+        if self._register_slices:
+            name = f"ic_slave_{len(self._slaves)}"
+            port = _signal_like(axi, f"{name}_")
+            register_slice(port, axi, name=name)
+            axi = port
+
         self._slaves.append(Interconnect.SlaveWrapper(offset, actual_size, axi))
@@ -0,0 +1,8 @@
+from .base import (
+    Axi4Stream,
+    skid_buffer,
+    upsizer,
+    downsizer,
+    packet_fifo,
+    round_robin_mux,
+)
@@ -0,0 +1,551 @@
+from __future__ import annotations
+
+from cohdl.std._context import SequentialContext, concurrent
+from cohdl.std.axi._axi4_channel import Channel
+from cohdl.std._core_utility import Value, concat, base_type
+from cohdl.std._prefix import prefix
+from cohdl.std.utility import Fifo
+
+import cohdl
+from cohdl import Bit, Unsigned, BitVector, Signal, Variable, Null, Full
+
+
+class Axi4Stream(Channel):
+    """
+    AXI4-Stream channel
+
+    `tlast` and `tkeep` are optional and can be set to None.
+    The stream functions in this module (`skid_buffer`, `upsizer`, `downsizer`,
+    `packet_fifo` and `round_robin_mux`) transfer one beat per clock cycle.
+    They take the input stream and an optional output stream,
+    when `out` is not specified a new stream of signals is created.
+    All functions return the output stream.
+    """
+
+    def __init__(self, valid, ready, tdata, tlast=None, tkeep=None, **kwargs):
+        payload = {"tdata": tdata, "tlast": tlast, "tkeep": tkeep, **kwargs}
+
+        super().__init__(
+            valid,
+            ready,
+            **{name: sig for name, sig in payload.items() if sig is not None},
+        )
+
+        self.tdata = tdata
+        self.tlast = tlast
+        self.tkeep = tkeep
+
+    @staticmethod
+    def signal(data_width, *, last=True, keep=False, prefix=""):
+        S = cohdl.Signal
+        assert not keep or data_width % 8 == 0, "tkeep requires a byte aligned tdata"
+
+        return Axi4Stream(
+            S[Bit](False, name=f"{prefix}tvalid"),
+            S[Bit](False, name=f"{prefix}tready"),
+            S[BitVector[data_width]](Null, name=f"{prefix}tdata"),
+            S[Bit](False, name=f"{prefix}tlast") if last else None,
+            (
+                S[BitVector[data_width // 8]](Null, name=f"{prefix}tkeep")
+                if keep
+                else None
+            ),
+        )
+
+    def data_width(self):
+        return self.tdata.width
+
+
+#
+# helpers
+#
+
+
+def _output_stream(inp: Axi4Stream, out: Axi4Stream | None, name: str, data_width=None):
+    if out is None:
+        return Axi4Stream.signal(
+            inp.data_width() if data_width is None else data_width,
+            last=inp.tlast is not None,
+            keep=inp.tkeep is not None,
+            prefix=f"{name}_out_",
+        )
+
+    assert (
+        inp._payload_names() == out._payload_names()
+    ), "input and output streams must have the same signals"
+
+    return out
+
+
+def _registers(signals, p, suffix):
+    return [
+        Signal[base_type(sig)](Null, name=p.name(f"{suffix}_{nr}"))
+        for nr, sig in enumerate(signals)
+    ]
+
+
+def _width(sig):
+    return 1 if base_type(sig) is Bit else sig.width
+
+
+def _pack(signals):
+    return concat(*signals)
+
+
+def _slices(signals):
+    # positions of the signals in a vector packed by _pack,
+    # the low index is None for single bits
+    result = []
+    high = sum(_width(sig) for sig in signals) - 1
+
+    for sig in signals:
+        if base_type(sig) is Bit:
+            result.append((high, None))
+        else:
+            result.append((high, high - sig.width + 1))
+
+        high -= _width(sig)
+
+    return result
+
+
+def _unpack(packed, slices):
+    return [packed[high] if low is None else packed[high:low] for high, low in slices]
+
+
+#
+# skid buffer
+#
+
+
+def skid_buffer(
+    ctx: SequentialContext,
+    inp: Axi4Stream,
+    out: Axi4Stream | None = None,
+    *,
+    name="skid",
+):
+    """
+    registered skid buffer
+
+    Both `tready` of the input stream and the output payload are registers,
+    so the buffer breaks all combinatorial paths between the streams
+    while keeping a throughput of one beat per clock cycle.
+
+    When `out` is specified, `inp` and `out` can be any pair of
+    AXI channels with the same payload signals.
+    """
+
+    out = _output_stream(inp, out, name)
+    src = inp._payload()
+    dst = out._payload()
+
+    with prefix(name) as p:
+        valid = Signal[Bit](False, name=p.name("valid"))
+        skid_valid = Signal[Bit](False, name=p.name("skid_valid"))
+        skid = _registers(src, p, "skid")
+
+    fields = list(zip(src, dst, skid))
+
+    @concurrent
+    def proc_skid_ready():
+        inp.ready <<= not skid_valid
+        out.valid <<= valid
+
+    @ctx
+    def proc_skid():
+        if out.ready or not valid:
+            if skid_valid:
+                for _, target, buffered in fields:
+                    target <<= buffered
+
+                valid.next = True
+                skid_valid.next = False
+            else:
+                for source, target, _ in fields:
+                    target <<= source
+
+                valid.next = inp.valid
+        elif inp.valid and not skid_valid:
+            for source, _, buffered in fields:
+                buffered <<= source
+
+            skid_valid.next = True
+
+    return out
+
+
+#
+# width converters
+#
+
+
+def _keep_of(stream: Axi4Stream, count: int):
+    # keep bits of a beat, streams without tkeep always use all bytes
+    return (
+        Value(stream.tkeep)
+        if stream.tkeep is not None
+        else Value[BitVector[count]](Full)
+    )
+
+
+def upsizer(
+    ctx: SequentialContext,
+    inp: Axi4Stream,
+    out: Axi4Stream | None = None,
+    *,
+    ratio: int | None = None,
+    name="upsizer",
+):
+    """
+    combines `ratio` consecutive beats of `inp` into one beat of `out`
+
+    The first beat is placed in the least significant bits. Packets
+    ending (`tlast`) before all slots are filled are sent early,
+    unused slots are zero and cleared in `tkeep`.
+    """
+
+    if out is None:
+        assert ratio is not None, "ratio required when out is not specified"
+        out = _output_stream(inp, None, name, inp.data_width() * ratio)
+
+    width = inp.data_width()
+    ratio = out.data_width() // width
+    assert ratio * width == out.data_width(), "output width must be a multiple"
+    assert ratio >= 2
+    assert (inp.tlast is None) == (out.tlast is None)
+    assert inp.tkeep is None or out.tkeep is not None
+
+    keep_width = width // 8 if out.tkeep is not None else 0
+
+    with prefix(name) as p:
+        valid = Signal[Bit](False, name=p.name("valid"))
+        slot = Signal[Unsigned.upto(ratio - 1)](0, name=p.name("slot"))
+        words = [
+            Signal[BitVector[width]](Null, name=p.name(f"word_{nr}"))
+            for nr in range(ratio - 1)
+        ]
+        keeps = [
+            Signal[BitVector[keep_width]](Null, name=p.name(f"keep_{nr}"))
+            for nr in range(ratio - 1 if keep_width != 0 else 0)
+        ]
+
+    def word(nr):
+        # word in slot nr of the output beat, when the current input
+        # beat is placed in the current slot
+        if nr == ratio - 1:
+            return inp.tdata if slot == nr else Value[BitVector[width]](Null)
+        else:
+            return (
+                inp.tdata
+                if slot == nr
+                else (Value(words[nr]) if slot > nr else Value[BitVector[width]](Null))
+            )
+
+    def keep(nr):
+        inp_keep = _keep_of(inp, keep_width)
+
+        if nr == ratio - 1:
+            return inp_keep if slot == nr else Value[BitVector[keep_width]](Null)
+        else:
+            return (
+                inp_keep
+                if slot == nr
+                else (
+                    Value(keeps[nr])
+                    if slot > nr
+                    else Value[BitVector[keep_width]](Null)
+                )
+            )
+
+    @concurrent
+    def proc_upsizer_ready():
+        inp.ready <<= out.ready or not valid
+        out.valid <<= valid
+
+    @ctx
+    def proc_upsizer():
+        complete = slot == ratio - 1 or (inp.tlast is not None and inp.tlast)
+
+        if out.ready or not valid:
+            valid.next = False
+
+            if inp.valid:
+                if complete:
+                    out.tdata <<= concat(*[word(nr) for nr in range(ratio - 1, -1, -1)])
+
+                    if out.tkeep is not None:
+                        out.tkeep <<= concat(
+                            *[keep(nr) for nr in range(ratio - 1, -1, -1)]
+                        )
+
+                    if out.tlast is not None:
+                        out.tlast <<= inp.tlast
+
+                    valid.next = True
+                    slot.next = 0
+                else:
+                    for nr in range(ratio - 1):
+                        if slot == nr:
+                            words[nr].next = inp.tdata
+
+                            if keep_width != 0:
+                                keeps[nr].next = _keep_of(inp, keep_width)
+
+                    slot.next = slot + 1
+
+    return out
+
+
+def downsizer(
+    ctx: SequentialContext,
+    inp: Axi4Stream,
+    out: Axi4Stream | None = None,
+    *,
+    ratio: int | None = None,
+    name="downsizer",
+):
+    """
+    splits each beat of `inp` into `ratio` beats of `out`
+
+    The least significant part is sent first. When `inp` has a `tkeep`
+    signal, empty parts at the end of a packet are skipped.
+    """
+
+    if out is None:
+        assert ratio is not None, "ratio required when out is not specified"
+        out = _output_stream(inp, None, name, inp.data_width() // ratio)
+
+    width = out.data_width()
+    ratio = inp.data_width() // width
+    assert ratio * width == inp.data_width(), "input width must be a multiple"
+    assert ratio >= 2
+    assert (inp.tlast is None) == (out.tlast is None)
+    assert out.tkeep is None or inp.tkeep is not None
+
+    keep_width = width // 8 if inp.tkeep is not None else 0
+    in_width = inp.data_width()
+
+    with prefix(name) as p:
+        valid = Signal[Bit](False, name=p.name("valid"))
+        busy = Signal[Bit](False, name=p.name("busy"))
+        slot = Signal[Unsigned.upto(ratio - 1)](0, name=p.name("slot"))
+        data = Signal[BitVector[in_width]](Null, name=p.name("data"))
+        last = Signal[Bit](False, name=p.name("last"))
+        keep = (
+            Signal[BitVector[keep_width * ratio]](Null, name=p.name("keep"))
+            if keep_width != 0
+            else None
+        )
+
+    def is_final(index, keep_bits, is_last):
+        # part `index` is the final part of the input beat
+        if keep_width == 0:
+            return index == ratio - 1
+        else:
+            return index == ratio - 1 or (
+                is_last and not keep_bits[2 * keep_width - 1 : keep_width]
+            )
+
+    def send(data_bits, keep_bits, is_last, index):
+        final = is_final(index, keep_bits, is_last)
+
+        out.tdata <<= data_bits.lsb(width)
+
+        if out.tkeep is not None:
+            out.tkeep <<= keep_bits.lsb(keep_width)
+
+        if out.tlast is not None:
+            out.tlast <<= is_last and final
+
+        busy.next = not final
+        slot.next = index + 1
+        data.next = concat(
+            Value[BitVector[width]](Null), data_bits.msb(in_width - width)
+        )
+
+        if keep_width != 0:
+            keep.next = concat(
+                Value[BitVector[keep_width]](Null),
+                keep_bits.msb(keep_width * (ratio - 1)),
+            )
+
+    @concurrent
+    def proc_downsizer_ready():
+        inp.ready <<= not busy and (out.ready or not valid)
+        out.valid <<= valid
+
+    @ctx
+    def proc_downsizer():
+        if out.ready or not valid:
+            if busy:
+                send(data, keep, last, slot)
+                valid.next = True
+            elif inp.valid:
+                in_last = inp.tlast if inp.tlast is not None else False
+                last.next = in_last
+                in_keep = Value(inp.tkeep) if keep_width != 0 else None
+                send(inp.tdata, in_keep, in_last, 0)
+                valid.next = True
+            else:
+                valid.next = False
+
+    return out
+
+
+#
+# packet fifo
+#
+
+
+def packet_fifo(
+    ctx: SequentialContext,
+    inp: Axi4Stream,
+    out: Axi4Stream | None = None,
+    *,
+    depth: int,
+    name="packet_fifo",
+):
+    """
+    store and forward fifo for up to `depth` beats
+
+    Beats are buffered in a `std.Fifo` and sent once the last beat (`tlast`)
+    of their packet is stored, so packets are never interrupted
+    on the output side.
+
+    Packets longer than `depth` beats do not fit into the fifo. When the fifo
+    is full and contains no complete packet, the partial packet is forwarded
+    in cut-through mode until its last beat is sent. Such packets
+    can be interrupted on the output side, when the input stalls.
+    """
+
+    assert inp.tlast is not None, "packet_fifo requires tlast"
+
+    out = _output_stream(inp, out, name)
+    src = inp._payload()
+    dst = out._payload()
+    payload_width = sum(_width(sig) for sig in src)
+
+    with prefix(name) as p:
+        fifo = Fifo[BitVector[payload_width], depth + 1](name="fifo")
+        valid = Signal[Bit](False, name=p.name("valid"))
+        packets = Signal[Unsigned.upto(depth)](0, name=p.name("packets"))
+        # set while an oversized packet is forwarded
+        forward = Signal[Bit](False, name=p.name("forward"))
+
+    slices = _slices(src)
+    last_index = inp._payload_names().index("tlast")
+
+    @concurrent
+    def proc_packet_fifo_ready():
+        inp.ready <<= not fifo.full()
+        out.valid <<= valid
+
+    @ctx
+    def proc_packet_fifo():
+        stored = inp.valid and not fifo.full() and inp.tlast
+        sent = Variable[Bit](False)
+
+        if inp.valid and not fifo.full():
+            fifo.push(_pack(src))
+
+        # without cut-through a packet, that fills the fifo,
+        # would block the input forever
+        oversized = forward or (fifo.full() and packets == 0)
+
+        if out.ready or not valid:
+            if packets != 0 or (oversized and not fifo.empty()):
+                beat = _unpack(fifo.pop(), slices)
+
+                for target, value in zip(dst, beat):
+                    target <<= value
+
+                sent @= beat[last_index]
+                valid.next = True
+            else:
+                valid.next = False
+
+        forward.next = oversized and not sent
+
+        packets.next = (
+            packets + 1
+            if stored and not sent
+            else (packets - 1 if sent and not stored else Value(packets))
+        )
+
+    return out
+
+
+#
+# arbiter
+#
+
+
+def round_robin_mux(
+    ctx: SequentialContext,
+    inputs: list[Axi4Stream],
+    out: Axi4Stream | None = None,
+    *,
+    name="rr_mux",
+):
+    """
+    forwards beats of multiple input streams to one output stream
+
+    Inputs are granted in round robin order. When the streams have
+    a `tlast` signal, the grant is held until the end of the packet.
+    """
+
+    assert len(inputs) >= 2
+    out = _output_stream(inputs[0], out, name)
+    dst = out._payload()
+    count = len(inputs)
+    packets = inputs[0].tlast is not None
+
+    for inp in inputs:
+        assert inp._payload_names() == inputs[0]._payload_names()
+
+    IndexType = Unsigned.upto(count - 1)
+
+    with prefix(name) as p:
+        valid = Signal[Bit](False, name=p.name("valid"))
+        locked = Signal[Bit](False, name=p.name("locked"))
+        # the first input is granted first after reset
+        current = Signal[IndexType](count - 1, name=p.name("current"))
+        grant = Signal[IndexType](0, name=p.name("grant"))
+
+    def choose(nr=0):
+        # first requesting input after the current one, the inputs
+        # are checked twice so the search wraps around
+        if nr == 2 * count:
+            return Value(current)
+        else:
+            idx = nr % count
+            req = inputs[idx].valid and (nr >= count or current < idx)
+            return IndexType(idx) if req else choose(nr + 1)
+
+    @concurrent
+    def proc_rr_grant():
+        selected = Value(current) if locked else choose()
+        grant.next = selected
+        out.valid <<= valid
+
+        for nr, inp in enumerate(inputs):
+            inp.ready <<= (out.ready or not valid) and selected == nr
+
+    @ctx
+    def proc_rr_mux():
+        if out.ready or not valid:
+            valid.next = False
+
+            for nr, inp in enumerate(inputs):
+                if grant == nr and inp.valid:
+                    for target, source in zip(dst, inp._payload()):
+                        target <<= source
+
+                    valid.next = True
+                    current.next = nr
+
+                    if packets:
+                        locked.next = not inp.tlast
+
+    return out
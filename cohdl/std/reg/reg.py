@@ -325,6 +325,14 @@ class RegisterObject(StdTemplate[GenericArg]):
     def _basic_write_(self, addr, data, mask, meta):
         return None
 
+    def _has_plain_read_(self):
+        # true, when reads have no side effects and the
+        # read value is available as an expression via _plain_read_
+        return False
+
+    def _plain_read_(self):
+        raise AssertionError(f"{self} does not support plain reads")
+
     def _info_(self):
         pass
 
@@ -531,6 +539,17 @@ class GenericRegister(RegisterObject):
     def _on_write_(self, data, mask):
         pass
 
+    def _has_plain_read_(self):
+        cls = type(self)
+        return cls._basic_read_ is GenericRegister._basic_read_ and (
+            cls._on_read_ is GenericRegister._on_read_
+            or cls._on_read_ is Word._on_read_
+            or cls._on_read_ is Input._on_read_
+        )
+
+    def _plain_read_(self):
+        return self._on_read_()
+
 
 class Word(GenericRegister):
     _cohdlstd_vector_type = BitVector
@@ -1188,6 +1207,20 @@ class Register(GenericRegister):
     def _on_read_(self) -> Register:
         return self
 
+    def _has_plain_read_(self):
+        cls = type(self)
+        return (
+            cls._basic_read_ is Register._basic_read_
+            and cls._on_read_ is Register._on_read_
+            and not any(
+                value._cohdlstd_notify_mode is _NotifyOnRead
+                for value in self._notifications_.values()
+            )
+        )
+
+    def _plain_read_(self):
+        return self._to_bits_()
+
     def _on_write_(self, data):
         return data
 
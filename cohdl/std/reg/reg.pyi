@@ -204,6 +204,22 @@ class RegisterTools(Generic[W]):
             Currently always set to None.
             """
 
+        def _has_plain_read_(self) -> bool:
+            """
+            Returns True when reads of this object have no side effects
+            and complete in the same cycle. The read value of such objects
+            is available as an expression via `_plain_read_`.
+
+            Registers, that use the default read methods, are plain.
+            Objects with customized read methods are not.
+            """
+
+        def _plain_read_(self) -> BitVector:
+            """
+            Returns the read value of an object, for which
+            `_has_plain_read_` returns True.
+            """
+
         def _info_(self): ...
         def __init_subclass__(cls, readonly=False, writeonly=False): ...
 
@@ -40,14 +40,29 @@ from ._core_utility import (
     is_qualified,
     instance_check,
     as_pyeval,
+    batched_fold,
+    batched,
+    identity,
+    _safe_add_unsigned,
+    _count_set_bits_impl,
+    _lt,
+    _gt,
 )
 from ._template import Template, TemplateArg
 from ._assignable_type import AssignableType
 
 from cohdl._core._intrinsic import _intrinsic
+from cohdl import pyeval
 
 
-from ._context import Duration, SequentialContext, concurrent, at_end_of_context
+from ._context import (
+    Clock,
+    Reset,
+    Duration,
+    SequentialContext,
+    concurrent,
+    at_end_of_context,
+)
 from ._prefix import prefix, name, NamedQualifier
 from ._exception import StdExceptionHandler, RefQualifierFail
 from cohdl._core import Entity
@@ -627,6 +642,188 @@ def delayed(inp, delay: int, initial=_None):
     return DelayLine(inp, delay, initial=initial).last()
 
 
+#
+# pipelined reductions
+#
+# The reduction tree is split into stages of `levels_per_stage`
+# tree levels. Each stage is a list of registers, that fold consecutive
+# groups of the previous stage (or the inputs for the first stage).
+#
+
+
+def _tree_levels(cnt: int, batch_size: int):
+    levels = 0
+
+    while cnt > 1:
+        cnt = -(-cnt // batch_size)
+        levels += 1
+
+    return levels
+
+
+def _make_register(value, name: str):
+    # a register (or nested tuple of registers) that can hold value
+    if isinstance(value, tuple):
+        return tuple(
+            _make_register(elem, f"{name}_{nr}") for nr, elem in enumerate(value)
+        )
+
+    return Signal[base_type(value)](name=name)
+
+
+def _decay_value(value):
+    # copy of value, that supports all operations outside of synthesizable contexts
+    if isinstance(value, tuple):
+        return tuple(_decay_value(elem) for elem in value)
+    elif is_qualified(value):
+        return Value(value)
+    else:
+        return value
+
+
+def _assign_register(target, value):
+    if isinstance(target, tuple):
+        for elem_target, elem_value in zip(target, value):
+            _assign_register(elem_target, elem_value)
+    else:
+        target <<= value
+
+
+def pipelined_fold(
+    ctx: SequentialContext,
+    fn,
+    args,
+    *,
+    batch_size: int = 2,
+    levels_per_stage: int | None = None,
+    stages: int | None = None,
+    transform=None,
+    name: str = "fold",
+):
+    args = list(args)
+    assert len(args) != 0, "pipelined_fold requires at least one argument"
+    assert batch_size >= 2, "batch_size must be at least two"
+
+    levels = max(1, _tree_levels(len(args), batch_size))
+
+    if stages is not None:
+        assert (
+            levels_per_stage is None
+        ), "only one of stages and levels_per_stage can be set"
+        assert 1 <= stages <= levels, f"stages must be in the range [1, {levels}]"
+        levels_per_stage = -(-levels // stages)
+    elif levels_per_stage is None:
+        levels_per_stage = 1
+
+    assert levels_per_stage >= 1, "levels_per_stage must be positive"
+    group_size = batch_size**levels_per_stage
+
+    # list of stages, each stage is a list of (register, inputs)
+    pipeline = []
+    inputs = args
+    stage_map = identity if transform is None else transform
+
+    with prefix(name) as p:
+        while len(pipeline) == 0 or len(inputs) != 1:
+            stage = []
+
+            for nr in range(0, len(inputs), group_size):
+                group = inputs[nr : nr + group_size]
+                # evaluated once here, to get the types of the registers
+                value = batched_fold(
+                    fn,
+                    [stage_map(_decay_value(elem)) for elem in group],
+                    batch_size=batch_size,
+                )
+                register = _make_register(
+                    value, p.name(f"s{len(pipeline)}_{nr // group_size}")
+                )
+                stage.append((register, group))
+
+            pipeline.append((stage_map, stage))
+            inputs = [register for register, _ in stage]
+            stage_map = identity
+
+    @ctx
+    def proc_pipelined_fold():
+        for stage_map, stage in pipeline:
+            for register, group in stage:
+                _assign_register(
+                    register,
+                    batched_fold(
+                        fn, [stage_map(elem) for elem in group], batch_size=batch_size
+                    ),
+                )
+
+    return inputs[0], len(pipeline)
+
+
+def pipelined_sum(ctx: SequentialContext, args, **kwargs):
+    return pipelined_fold(ctx, _safe_add_unsigned, args, **kwargs)
+
+
+def _count_set_bits_batch(vector: BitVector):
+    # typed result, so the register type is also known,
+    # when the count is evaluated outside of synthesizable contexts
+    return Value[Unsigned.upto(vector.width)](_count_set_bits_impl(vector))
+
+
+def pipelined_count_set_bits(
+    ctx: SequentialContext, vector: BitVector, *, batch_size: int = 6, **kwargs
+):
+    return pipelined_fold(
+        ctx,
+        _safe_add_unsigned,
+        batched(vector, batch_size, allow_partial=True),
+        transform=_count_set_bits_batch,
+        **kwargs,
+    )
+
+
+def pipelined_min_element(
+    ctx: SequentialContext, container, *, key=identity, cmp=_lt, **kwargs
+):
+    Index = Unsigned.upto(len(container))
+    # reversed, so the first found minimum is returned (same as std.min_element)
+    indexed_container = [(Index(nr), elem) for nr, elem in enumerate(container)]
+
+    def select_min(a, b):
+        return a if cmp(key(a[1]), key(b[1])) else b
+
+    return pipelined_fold(ctx, select_min, indexed_container[::-1], **kwargs)
+
+
+def pipelined_max_element(
+    ctx: SequentialContext, container, *, key=identity, cmp=_gt, **kwargs
+):
+    return pipelined_min_element(ctx, container, key=key, cmp=cmp, **kwargs)
+
+
+def pipelined_min_index(
+    ctx: SequentialContext, container, *, key=identity, cmp=_lt, **kwargs
+):
+    Index = Unsigned.upto(len(container))
+    indexed_container = [(Index(nr), elem) for nr, elem in enumerate(container)]
+
+    # only the keys are stored in the pipeline registers
+    def apply_key(elem):
+        return (elem[0], key(elem[1]))
+
+    def select_min(a, b):
+        return a if cmp(a[1], b[1]) else b
+
+    (index, _), latency = pipelined_fold(
+        ctx, select_min, indexed_container[::-1], transform=apply_key, **kwargs
+    )
+    return index, latency
+
+
+def pipelined_max_index(
+    ctx: SequentialContext, container, *, key=identity, cmp=_gt, **kwargs
+):
+    return pipelined_min_index(ctx, container, key=key, cmp=cmp, **kwargs)
+
+
 def debounce(
     ctx: SequentialContext,
     inp: Signal[Bit],
@@ -1603,6 +1800,182 @@ class Fifo(Template[_FifoArgs]):
         return self.pop(qualifier=qualifier)
 
 
+#
+# dual clock fifo
+#
+# The read and write pointers have one more bit than required
+# to address the memory, to distinguish between a full and an empty fifo.
+# Both pointers are also stored as Gray codes, where only one bit changes
+# per increment. So the synchronized copies in the other clock domain
+# are always either the old or the new pointer value.
+#
+
+
+class AsyncFifo(Template[_FifoArgs]):
+    _elemtype_: _FifoArgs.elemtype
+    _count_: _FifoArgs.count
+
+    @staticmethod
+    @pyeval
+    def _check_clk(clk: Clock, action: str, domain: str):
+        ctx = SequentialContext.current()
+        assert (
+            ctx is not None and ctx.clk().signal() is clk.signal()
+        ), f"std.AsyncFifo: {action} must be called in a context of the {domain} clock"
+
+    def _to_gray(self, value):
+        return value.bitvector ^ (value >> 1).bitvector
+
+    def _from_gray(self, gray):
+        # each binary bit is the xor of all more significant gray bits
+        return concat(
+            *[
+                batched_fold(lambda a, b: a ^ b, [gray[bit] for bit in bits])
+                for bits in self._gray_terms
+            ]
+        )
+
+    @_intrinsic
+    def __len__(self):
+        return self._count_
+
+    def __init__(
+        self,
+        wr_clk: Clock,
+        rd_clk: Clock,
+        *,
+        wr_reset: Reset | None = None,
+        rd_reset: Reset | None = None,
+        name="async_fifo",
+        sync_stages: int = 2,
+        almost_full: int | None = None,
+        almost_empty: int | None = None,
+    ):
+        count = self._count_
+
+        assert count >= 2 and is_pow_two(
+            count
+        ), "the size of std.AsyncFifo must be a power of two"
+        assert sync_stages >= 2, "at least two synchronizer stages are required"
+        assert almost_full is None or 0 < almost_full <= count
+        assert almost_empty is None or 0 <= almost_empty < count
+
+        addr_width = int_log_2(count)
+        ptr_width = addr_width + 1
+        PtrType = Unsigned[ptr_width]
+
+        self._wr_clk = wr_clk
+        self._rd_clk = rd_clk
+        self._addr_width = addr_width
+        self._gray_terms = [
+            list(range(nr, ptr_width)) for nr in range(addr_width, -1, -1)
+        ]
+        self._almost_full_threshold = almost_full
+        self._almost_empty_threshold = almost_empty
+
+        # the write pointer is full, when it is one wrap ahead of the read pointer
+        # in Gray code this inverts the two most significant bits
+        full_mask = Unsigned[ptr_width](3 << (ptr_width - 2)).bitvector
+
+        with prefix(name) as p:
+            self._mem = Array[self._elemtype_, count](
+                name=p.name("mem"), _qualifier_=Signal
+            )
+
+            self._wr_bin = Signal[PtrType](0, name=p.name("wr_bin"))
+            self._wr_gray = Signal[BitVector[ptr_width]](Null, name=p.name("wr_gray"))
+            self._rd_bin = Signal[PtrType](0, name=p.name("rd_bin"))
+            self._rd_gray = Signal[BitVector[ptr_width]](Null, name=p.name("rd_gray"))
+
+            # copies of the pointers in the opposite clock domain
+            wr_gray_sync = [
+                Signal[BitVector[ptr_width]](Null, name=p.name(f"wr_gray_sync_{nr}"))
+                for nr in range(sync_stages)
+            ]
+            rd_gray_sync = [
+                Signal[BitVector[ptr_width]](Null, name=p.name(f"rd_gray_sync_{nr}"))
+                for nr in range(sync_stages)
+            ]
+
+            self._empty = Signal[Bit](name=p.name("empty"))
+            self._full = Signal[Bit](name=p.name("full"))
+
+            if almost_full is not None:
+                self._almost_full = Signal[Bit](name=p.name("almost_full"))
+
+            if almost_empty is not None:
+                self._almost_empty = Signal[Bit](name=p.name("almost_empty"))
+
+        @SequentialContext(rd_clk, rd_reset)
+        def proc_sync_wr_ptr():
+            for src, target in zip([self._wr_gray, *wr_gray_sync], wr_gray_sync):
+                target <<= src
+
+        @SequentialContext(wr_clk, wr_reset)
+        def proc_sync_rd_ptr():
+            for src, target in zip([self._rd_gray, *rd_gray_sync], rd_gray_sync):
+                target <<= src
+
+        @concurrent
+        def logic():
+            self._empty <<= self._rd_gray == wr_gray_sync[-1]
+            self._full <<= self._wr_gray == (rd_gray_sync[-1] ^ full_mask)
+
+            # fill levels, as seen from the respective clock domain
+            if almost_full is not None:
+                wr_level = self._wr_bin - self._from_gray(rd_gray_sync[-1]).unsigned
+                self._almost_full <<= wr_level >= almost_full
+
+            if almost_empty is not None:
+                rd_level = self._from_gray(wr_gray_sync[-1]).unsigned - self._rd_bin
+                self._almost_empty <<= rd_level <= almost_empty
+
+    def push(self, data):
+        self._check_clk(self._wr_clk, "push", "write")
+        assert not self._full, "writing to full fifo"
+
+        next_ptr = self._wr_bin + 1
+        self._mem.set_elem(self._wr_bin.lsb(self._addr_width).unsigned, data)
+        self._wr_bin <<= next_ptr
+        self._wr_gray <<= self._to_gray(next_ptr)
+
+    def pop(self, *, qualifier=Value):
+        self._check_clk(self._rd_clk, "pop", "read")
+        assert not self._empty, "reading from empty fifo"
+
+        next_ptr = self._rd_bin + 1
+        self._rd_bin <<= next_ptr
+        self._rd_gray <<= self._to_gray(next_ptr)
+        return self.front(qualifier=qualifier)
+
+    def front(self, *, qualifier=Value):
+        return self._mem.get_elem(
+            self._rd_bin.lsb(self._addr_width).unsigned, qualifier=qualifier
+        )
+
+    def empty(self):
+        return Value(self._empty)
+
+    def full(self):
+        return Value(self._full)
+
+    def almost_full(self):
+        assert (
+            self._almost_full_threshold is not None
+        ), "almost_full threshold not specified"
+        return Value(self._almost_full)
+
+    def almost_empty(self):
+        assert (
+            self._almost_empty_threshold is not None
+        ), "almost_empty threshold not specified"
+        return Value(self._almost_empty)
+
+    async def receive(self, *, qualifier=Value):
+        await expr(not self.empty())
+        return self.pop(qualifier=qualifier)
+
+
 #
 #
 #
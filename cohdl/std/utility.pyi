@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import enum
-from typing import TypeVar, Generic, overload, NoReturn, Literal, Iterator
+from typing import TypeVar, Generic, overload, NoReturn, Literal, Iterator, Callable
 
 from cohdl._core import (
     Entity,
@@ -15,8 +15,8 @@ from cohdl._core import (
 )
 
 from ._assignable_type import AssignableType
-from ._core_utility import Value, Ref, nop
-from ._context import Duration, Context, SequentialContext
+from ._core_utility import Value, Ref, nop, identity
+from ._context import Duration, Context, SequentialContext, Clock, Reset
 
 T = TypeVar("T")
 U = TypeVar("U")
@@ -358,6 +358,91 @@ def delayed(inp, delay: int, inital) -> Signal:
 
 @overload
 def delayed(inp, delay: int) -> Signal: ...
+
+#
+# pipelined reductions
+#
+
+def pipelined_fold(
+    ctx: SequentialContext,
+    fn: Callable[[T, T], T],
+    args: list[T],
+    *,
+    batch_size: int = 2,
+    levels_per_stage: int | None = None,
+    stages: int | None = None,
+    transform: Callable[[U], T] | None = None,
+    name: str = "fold",
+) -> tuple[T, int]:
+    """
+    Pipelined version of `std.batched_fold`.
+
+    The balanced reduction tree over `args` is split into register stages,
+    that are updated in the sequential context `ctx`. Each stage contains
+    `levels_per_stage` levels of the tree (default 1). Alternatively
+    `stages` defines the total number of register stages.
+
+    `transform` is applied to each argument in the first stage.
+    Tuples returned by `fn` are stored in tuples of registers.
+
+    Returns the register containing the result and the latency
+    (the number of register stages) in clock cycles.
+
+    >>> ctx = std.SequentialContext(clk)
+    >>> result, latency = std.pipelined_fold(ctx, lambda a, b: a ^ b, list(vec))
+    """
+
+def pipelined_sum(
+    ctx: SequentialContext, args: list[Unsigned], **kwargs
+) -> tuple[Unsigned, int]:
+    """
+    Pipelined adder tree, the result is wide enough to not overflow.
+    `kwargs` are forwarded to `pipelined_fold`.
+    """
+
+def pipelined_count_set_bits(
+    ctx: SequentialContext, vector: BitVector, *, batch_size: int = 6, **kwargs
+) -> tuple[Unsigned, int]:
+    """
+    Pipelined version of `std.count_set_bits`. Bits are counted in
+    groups of `batch_size` bits in the first stage, the counts
+    are added in a pipelined adder tree.
+    `kwargs` are forwarded to `pipelined_fold`.
+    """
+
+def pipelined_min_element(
+    ctx: SequentialContext, container, *, key=identity, cmp=lambda a, b: a < b, **kwargs
+) -> tuple[tuple[Unsigned, T], int]:
+    """
+    Pipelined version of `std.min_element`.
+    `kwargs` are forwarded to `pipelined_fold`.
+    """
+
+def pipelined_max_element(
+    ctx: SequentialContext, container, *, key=identity, cmp=lambda a, b: a > b, **kwargs
+) -> tuple[tuple[Unsigned, T], int]:
+    """
+    Pipelined version of `std.max_element`.
+    `kwargs` are forwarded to `pipelined_fold`.
+    """
+
+def pipelined_min_index(
+    ctx: SequentialContext, container, *, key=identity, cmp=lambda a, b: a < b, **kwargs
+) -> tuple[Unsigned, int]:
+    """
+    Pipelined version of `std.min_index`, only the index
+    and the key of each element are stored in the pipeline registers.
+    `kwargs` are forwarded to `pipelined_fold`.
+    """
+
+def pipelined_max_index(
+    ctx: SequentialContext, container, *, key=identity, cmp=lambda a, b: a > b, **kwargs
+) -> tuple[Unsigned, int]:
+    """
+    Pipelined version of `std.max_index`.
+    `kwargs` are forwarded to `pipelined_fold`.
+    """
+
 def debounce(
     ctx: SequentialContext,
     inp: Signal[Bit],
@@ -979,6 +1064,96 @@ class Fifo(Generic[T, N]):
         Waits until fifo is non-empty, then calls self.pop() and returns the result.
         """
 
+class AsyncFifo(Generic[T, N]):
+    """
+    A first-in-first-out container for clock domain crossings
+    that can hold up to `N` elements of type `T`.
+
+    Data is pushed in the write clock domain and popped in the read
+    clock domain. The read and write pointers are exchanged as Gray codes
+    over synchronizer chains, so both sides can transfer one element
+    per clock cycle. `N` must be a power of two.
+    """
+
+    def __init__(
+        self,
+        wr_clk: Clock,
+        rd_clk: Clock,
+        *,
+        wr_reset: Reset | None = None,
+        rd_reset: Reset | None = None,
+        name="async_fifo",
+        sync_stages: int = 2,
+        almost_full: int | None = None,
+        almost_empty: int | None = None,
+    ):
+        """
+        Create an AsyncFifo that can hold data of the given generic type `T`.
+
+        `push` must be called in a context of `wr_clk` and `pop` in
+        a context of `rd_clk`. The synchronizer chains of the pointers
+        use `sync_stages` registers and are reset by `wr_reset`/`rd_reset`
+        (the reset of the opposite clock domain).
+        The same resets should be used for the contexts, that call `push` and `pop`.
+
+        `almost_full` and `almost_empty` are optional fill level
+        thresholds for the methods of the same name.
+        """
+
+    def push(self, data: T) -> None:
+        """
+        Push one element onto the AsyncFifo.
+
+        May only be called once per clock cycle of the write clock.
+        May not be called on a full AsyncFifo.
+        """
+
+    def pop(self, *, qualifier=Value) -> T:
+        """
+        Remove one element from the AsyncFifo.
+        Returns the removed element (after applying `qualifier` to it).
+
+        May not be called on an empty AsyncFifo.
+        """
+
+    def front(self, *, qualifier=Value) -> T:
+        """
+        Returns the state of the element at the front of the AsyncFifo
+        i.e. the next value returned by `pop` without removing it.
+
+        The result is undefined while the AsyncFifo is empty.
+        """
+
+    def empty(self) -> Bit:
+        """
+        Check if the AsyncFifo is empty, as seen from the read clock domain.
+        Data pushed in the write clock domain becomes visible
+        after the synchronizer delay.
+        """
+
+    def full(self) -> Bit:
+        """
+        Check if the AsyncFifo is full, as seen from the write clock domain.
+        Space released by `pop` becomes visible after the synchronizer delay.
+        """
+
+    def almost_full(self) -> Bit:
+        """
+        True, when at least `almost_full` elements are stored
+        (as seen from the write clock domain).
+        """
+
+    def almost_empty(self) -> Bit:
+        """
+        True, when at most `almost_empty` elements are stored
+        (as seen from the read clock domain).
+        """
+
+    async def receive(self, *, qualifier=Value) -> T:
+        """
+        Waits until fifo is non-empty, then calls self.pop() and returns the result.
+        """
+
 class StackMode(enum.Enum):
     """
     Defines the overflow behavior of a `Stack`.
@@ -2,8 +2,12 @@ from __future__ import annotations
 
 
 import random
-from .cocotb_util import ConstraindValue, SequentialTest, step
+from collections import deque
+
+from cohdl import BitVector
+from cohdl.sim._waveform import VcdWriter
 
+from .cocotb_util import ConstraindValue, SequentialTest, step
 
 #
 # test code
@@ -11,12 +15,16 @@ from .cocotb_util import ConstraindValue, SequentialTest, step
 
 
 class ValuePair:
+    # number of recorded values kept for dump_record,
+    # complete traces are written to a waveform file
+    history_depth = 64
+
     def __init__(self, dutValue, mockValue: ConstraindValue, name: str | None = None):
         self.dutValue = dutValue
         self.mockValue = mockValue
         self.name = name
         self.is_set = False
-        self.history = []
+        self.history = deque(maxlen=self.history_depth)
 
     def record(self):
         self.history.append((str(self.mockValue), str(self.dutValue)))
@@ -81,26 +89,68 @@ class OutPair(ValuePair):
 
 
 class MockBase:
-    def __init__(self, clk, *, reset_cond=lambda: False, record=False, no_assert=False):
+    def __init__(
+        self,
+        clk,
+        *,
+        reset_cond=lambda: False,
+        record=False,
+        no_assert=False,
+        waveform: str | None = None,
+    ):
         self._seq = SequentialTest(clk)
 
         self._running_mock_sim = self._mock_simulation()
         self._reset_cond = reset_cond
 
         self._pairs: list[ValuePair] = []
-        self._record = record
+        self._record = record or waveform is not None
         self._no_assert = no_assert
 
+        # recorded values are streamed to the waveform file
+        # instead of being kept in memory
+        self._waveform_file = waveform
+        self._waveform: VcdWriter | None = None
+        self._record_cnt = 0
+
     def _mock_simulation(self):
         yield
         while True:
             yield from self.mock()
             yield
 
+    def _open_waveform(self):
+        self._waveform = VcdWriter(self._waveform_file)
+
+        for nr, pair in enumerate(self._pairs):
+            name = pair.name if pair.name is not None else f"pair{nr}"
+            width = pair.mockValue.width
+            self._waveform.probe(
+                f"mock.{name}", BitVector[width], lambda pair=pair: pair.mockValue.value
+            )
+            self._waveform.probe(
+                f"dut.{name}",
+                BitVector[width],
+                lambda pair=pair: str(pair.dutValue.value),
+            )
+
     def record(self):
         for pair in self._pairs:
             pair.record()
 
+        if self._waveform_file is not None:
+            if self._waveform is None:
+                self._open_waveform()
+
+            self._waveform.sample(self._record_cnt)
+
+        self._record_cnt += 1
+
+    def close_waveform(self):
+        if self._waveform is not None:
+            self._waveform.close()
+            self._waveform = None
+
     def _reset(self):
         for pair in self._pairs:
             if isinstance(pair, OutPair):
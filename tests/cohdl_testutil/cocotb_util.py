@@ -2,10 +2,12 @@ from __future__ import annotations
 
 from typing import Tuple, Any
 
+import hashlib
 import os
 import pathlib
 import random
 import shutil
+import tempfile
 from cocotb_test import simulator
 import cocotb
 from cocotb.clock import Clock
@@ -262,6 +264,77 @@ class TestValue:
         self.val = value
 
 
+# when set to a list, run_cocotb_tests only generates the VHDL
+# sources and appends the arguments of the simulator run,
+# used by the parallel regression runner (see regression.py)
+_deferred_runs: list[dict] | None = None
+
+
+# number of runs per test directory in this process,
+# see _test_dir
+_run_counts: dict[str, int] = {}
+
+
+def _test_dir(root: str, module, entity_name: str) -> str:
+    """
+    returns a directory below root, that is used by a single run
+
+    Parameterized tests run the same entity multiple times with different
+    globals or extra_env. Each run gets a numbered directory, so deferred
+    runs do not simulate sources that were overwritten by a later run
+    and the parallel regression runner never shares a directory.
+    The numbering is deterministic, so directories are reused
+    across test sessions.
+    """
+
+    test_dir = f"{root}/{str(module).rsplit('.', 1)[-1]}/{entity_name}"
+    count = _run_counts.get(test_dir, 0)
+    _run_counts[test_dir] = count + 1
+    return test_dir if count == 0 else f"{test_dir}_{count}"
+
+
+def _file_hash(path: str):
+    with open(path, "rb") as file:
+        return hashlib.sha256(file.read()).digest()
+
+
+def _sync_build(entity, build_dir: str, compact: bool = False) -> list[str]:
+    """
+    generates the VHDL sources of entity into build_dir
+
+    Files with unchanged content are not rewritten. Their modification
+    time is preserved, so the simulator skips the analysis when
+    none of the sources changed since the last run.
+    """
+
+    pathlib.Path(build_dir).mkdir(parents=True, exist_ok=True)
+    staging = tempfile.mkdtemp(dir=build_dir, prefix=".staging")
+
+    try:
+        result = []
+
+        for generated in std.VhdlCompiler.to_dir(
+            entity, staging, compact=compact
+        ):
+            target = os.path.join(build_dir, os.path.basename(generated))
+
+            if not os.path.isfile(target) or _file_hash(target) != _file_hash(
+                generated
+            ):
+                os.replace(generated, target)
+
+            result.append(target)
+    finally:
+        shutil.rmtree(staging)
+
+    # remove sources of previous builds
+    for path in pathlib.Path(build_dir).iterdir():
+        if path.is_file() and str(path) not in result:
+            path.unlink()
+
+    return result
+
+
 def run_cocotb_tests(
     entity,
     file,
@@ -273,6 +346,7 @@ def run_cocotb_tests(
     relatilve_vhdl_sources=None,
     vhdl_sources=None,
     sim_args=None,
+    compact=False,
     **kwargs,
 ):
     entity_name = entity.__name__
@@ -290,20 +364,28 @@ def run_cocotb_tests(
         for path in relatilve_vhdl_sources:
             vhdl_sources.append(f"{local_dir}/{path}")
 
+    # each run uses separate directories, that are kept
+    # between sessions so unchanged sources are not analyzed again
+    # (set COHDL_CLEAN_BUILD to start from empty directories),
+    # runs without build use the sources in the shared build directory
+    sim_dir = _test_dir(sim_dir, module, entity_name)
+
     if not no_build:
-        if pathlib.Path(build_dir).exists():
-            shutil.rmtree(build_dir)
-        if pathlib.Path(sim_dir).exists():
-            shutil.rmtree(sim_dir)
+        build_dir = _test_dir(build_dir, module, entity_name)
 
-        pathlib.Path(build_dir).mkdir()
-        pathlib.Path(sim_dir).mkdir()
+    if os.environ.get("COHDL_CLEAN_BUILD"):
+        for path in (build_dir, sim_dir) if not no_build else (sim_dir,):
+            if pathlib.Path(path).exists():
+                shutil.rmtree(path)
 
-        build_result = std.VhdlCompiler.to_dir(entity, build_dir)
+    if not no_build:
+        build_result = _sync_build(entity, build_dir, compact=compact)
     else:
         build_result = []
 
-    simulator.run(
+    pathlib.Path(sim_dir).mkdir(parents=True, exist_ok=True)
+
+    run_args = dict(
         simulator="ghdl",
         sim_args=["--vcd=waveform.vcd", *sim_args],
         sim_build=sim_dir,
@@ -318,6 +400,11 @@ def run_cocotb_tests(
         **kwargs,
     )
 
+    if _deferred_runs is not None:
+        _deferred_runs.append(run_args)
+    else:
+        simulator.run(**run_args)
+
 
 async def step():
     await cocotb.triggers.Timer(1)
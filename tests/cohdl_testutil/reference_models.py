@@ -0,0 +1,302 @@
+"""
+cycle accurate reference models of std components
+
+The models process complete stimulus arrays in one call instead of
+single values per clock cycle. Stimulus arrays have the shape
+(cycles,) or (cycles, lanes), independent lanes are computed
+at once with NumPy (matching the lanes of `cohdl.sim.LaneSimulator`).
+All results are sampled after the rising clock edge of each cycle.
+
+Each model describes a small wrapper around the std component,
+that is documented in the model class.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+def _lanes(*arrays):
+    # converts all stimulus arrays to the shape (cycles, lanes)
+    arrays = [np.asarray(arr) for arr in arrays]
+    squeeze = all(arr.ndim == 1 for arr in arrays)
+    arrays = [arr[:, None] if arr.ndim == 1 else arr for arr in arrays]
+    cycles, lanes = np.broadcast_shapes(*[arr.shape for arr in arrays])
+    return (
+        squeeze,
+        cycles,
+        lanes,
+        [np.broadcast_to(arr, (cycles, lanes)) for arr in arrays],
+    )
+
+
+def _result(squeeze: bool, **outputs):
+    return {
+        name: (value[:, 0] if squeeze else value) for name, value in outputs.items()
+    }
+
+
+def check(expected: dict[str, np.ndarray], actual: dict[str, np.ndarray]):
+    """
+    compares all expected outputs with the actual values and raises an
+    AssertionError describing the first mismatch (cycle and lane)
+    """
+
+    for name, exp in expected.items():
+        act = np.asarray(actual[name])
+        assert (
+            act.shape == exp.shape
+        ), f"{name}: shape {act.shape} does not match expected shape {exp.shape}"
+
+        mismatches = np.argwhere(act != exp)
+
+        if len(mismatches) != 0:
+            pos = tuple(mismatches[0])
+            where = f"cycle {pos[0]}" + (f" lane {pos[1]}" if len(pos) > 1 else "")
+            raise AssertionError(
+                f"{name}: {len(mismatches)} mismatches, first in {where}: "
+                f"expected {exp[pos]}, got {act[pos]}"
+            )
+
+
+def simulate(sim, stimulus: dict[str, np.ndarray], outputs: list[str], clk="clk"):
+    """
+    applies stimulus arrays with the shape (cycles, lanes) to a
+    `LaneSimulator` and returns the outputs sampled after each clock cycle
+    """
+
+    cycles = len(next(iter(stimulus.values())))
+    result = {name: [] for name in outputs}
+
+    for cycle in range(cycles):
+        for name, values in stimulus.items():
+            sim.dut[name].value = values[cycle]
+
+        sim.tick(clk)
+
+        for name in outputs:
+            result[name].append(np.array(sim.dut[name].value, dtype=np.int64))
+
+    return {name: np.stack(values) for name, values in result.items()}
+
+
+class _Model:
+    def run(self, **stimulus) -> dict[str, np.ndarray]: ...
+
+    def check(self, actual: dict[str, np.ndarray], **stimulus):
+        """
+        runs the model and compares the result with actual
+        """
+        check(self.run(**stimulus), actual)
+
+
+class FifoModel(_Model):
+    """
+    model of `std.Fifo[T, count]` (without delay) in the wrapper
+
+        if pop and not fifo.empty():
+            data_out <<= fifo.pop()
+        if push and not fifo.full():
+            fifo.push(data_in)
+
+    returns data_out (initially `initial`) and the
+    concurrent flags empty/full of the fifo
+    """
+
+    def __init__(self, count: int, initial: int = 0):
+        self.count = count
+        self.initial = initial
+
+    def run(self, *, push, data_in, pop):
+        squeeze, cycles, lanes, (push, data_in, pop) = _lanes(push, data_in, pop)
+        lane = np.arange(lanes)
+
+        mem = np.zeros((lanes, self.count), dtype=np.int64)
+        wr = np.zeros(lanes, dtype=np.int64)
+        rd = np.zeros(lanes, dtype=np.int64)
+        data = np.full(lanes, self.initial, dtype=np.int64)
+
+        data_out = np.empty((cycles, lanes), dtype=np.int64)
+        empty = np.empty((cycles, lanes), dtype=np.int64)
+        full = np.empty((cycles, lanes), dtype=np.int64)
+
+        for cycle in range(cycles):
+            is_empty = wr == rd
+            is_full = (wr + 1) % self.count == rd
+
+            do_pop = (pop[cycle] != 0) & ~is_empty
+            do_push = (push[cycle] != 0) & ~is_full
+
+            data = np.where(do_pop, mem[lane, rd], data)
+            mem[lane[do_push], wr[do_push]] = data_in[cycle][do_push]
+
+            rd = np.where(do_pop, (rd + 1) % self.count, rd)
+            wr = np.where(do_push, (wr + 1) % self.count, wr)
+
+            data_out[cycle] = data
+            empty[cycle] = wr == rd
+            full[cycle] = (wr + 1) % self.count == rd
+
+        return _result(squeeze, data_out=data_out, empty=empty, full=full)
+
+
+class StackModel(_Model):
+    """
+    model of `std.Stack[T, count]` in the wrapper
+
+        if pop and not stack.empty():
+            data_out <<= stack.pop()
+        elif push and (drop_old or not stack.full()):
+            stack.push(data_in)
+
+    `drop_old` selects `std.StackMode.DROP_OLD`, returns data_out
+    and the flags empty/full of the stack
+    """
+
+    def __init__(self, count: int, *, drop_old: bool = False, initial: int = 0):
+        self.count = count
+        self.drop_old = drop_old
+        self.initial = initial
+
+    def run(self, *, push, data_in, pop):
+        squeeze, cycles, lanes, (push, data_in, pop) = _lanes(push, data_in, pop)
+        lane = np.arange(lanes)
+        count = self.count
+
+        mem = np.zeros((lanes, count), dtype=np.int64)
+        index = np.zeros(lanes, dtype=np.int64)
+        cnt = np.zeros(lanes, dtype=np.int64)
+        data = np.full(lanes, self.initial, dtype=np.int64)
+
+        data_out = np.empty((cycles, lanes), dtype=np.int64)
+        empty = np.empty((cycles, lanes), dtype=np.int64)
+        full = np.empty((cycles, lanes), dtype=np.int64)
+
+        for cycle in range(cycles):
+            do_pop = (pop[cycle] != 0) & (cnt != 0)
+            do_push = (push[cycle] != 0) & ~do_pop
+
+            if not self.drop_old:
+                do_push &= cnt != count
+
+            prev = (index - 1) % count
+            data = np.where(do_pop, mem[lane, prev], data)
+            mem[lane[do_push], index[do_push] % count] = data_in[cycle][do_push]
+
+            index = np.where(do_pop, prev, index)
+            cnt = np.where(do_pop, cnt - 1, cnt)
+
+            if self.drop_old:
+                index = np.where(do_push, (index + 1) % count, index)
+                cnt = np.where(do_push, np.minimum(cnt + 1, count), cnt)
+            else:
+                index = np.where(do_push, index + 1, index)
+                cnt = index
+
+            data_out[cycle] = data
+            empty[cycle] = cnt == 0
+            full[cycle] = cnt == count
+
+        return _result(squeeze, data_out=data_out, empty=empty, full=full)
+
+
+class DelayLineModel(_Model):
+    """
+    model of `std.DelayLine(inp, delay, initial, ctx)`,
+    returns the last element of the delay line as `data_out`
+    """
+
+    def __init__(self, delay: int, initial: int = 0):
+        self.delay = delay
+        self.initial = initial
+
+    def run(self, *, inp):
+        squeeze, cycles, lanes, (inp,) = _lanes(inp)
+        data_out = np.full((cycles, lanes), self.initial, dtype=np.int64)
+
+        if self.delay == 0:
+            data_out[:] = inp
+        else:
+            # the first register samples the input
+            # in the same clock cycle
+            shift = self.delay - 1
+            data_out[shift:] = inp[: cycles - shift]
+
+        return _result(squeeze, data_out=data_out)
+
+
+class SyncFlagModel(_Model):
+    """
+    model of `std.SyncFlag()` (without delay) set and cleared
+    in two sequential contexts
+
+        if set_in:
+            flag.set()
+        ...
+        if clear_in:
+            flag.clear()
+
+    returns the concurrent `is_set` state of the flag
+    """
+
+    def run(self, *, set_in, clear_in):
+        squeeze, cycles, lanes, (set_in, clear_in) = _lanes(set_in, clear_in)
+
+        tx = np.zeros(lanes, dtype=np.int64)
+        rx = np.zeros(lanes, dtype=np.int64)
+        is_set = np.empty((cycles, lanes), dtype=np.int64)
+
+        for cycle in range(cycles):
+            new_tx = np.where(set_in[cycle] != 0, 1 - rx, tx)
+            rx = np.where(clear_in[cycle] != 0, tx, rx)
+            tx = new_tx
+            is_set[cycle] = tx != rx
+
+        return _result(squeeze, is_set=is_set)
+
+
+class MailboxModel(_Model):
+    """
+    model of `std.Mailbox[T]()` (without delay) in the wrappers
+
+        if send:
+            mailbox.send(data_in)
+        ...
+        if receive and mailbox.is_set():
+            data_out <<= mailbox.data()
+            mailbox.clear()
+
+    returns data_out and the concurrent `is_set` state of the mailbox
+    """
+
+    def __init__(self, initial: int = 0):
+        self.initial = initial
+
+    def run(self, *, send, data_in, receive):
+        squeeze, cycles, lanes, (send, data_in, receive) = _lanes(
+            send, data_in, receive
+        )
+
+        tx = np.zeros(lanes, dtype=np.int64)
+        rx = np.zeros(lanes, dtype=np.int64)
+        data = np.zeros(lanes, dtype=np.int64)
+        received = np.full(lanes, self.initial, dtype=np.int64)
+
+        data_out = np.empty((cycles, lanes), dtype=np.int64)
+        is_set = np.empty((cycles, lanes), dtype=np.int64)
+
+        for cycle in range(cycles):
+            do_send = send[cycle] != 0
+            do_receive = (receive[cycle] != 0) & (tx != rx)
+
+            received = np.where(do_receive, data, received)
+            data = np.where(do_send, data_in[cycle], data)
+
+            new_tx = np.where(do_send, 1 - rx, tx)
+            rx = np.where(do_receive, tx, rx)
+            tx = new_tx
+
+            data_out[cycle] = received
+            is_set[cycle] = tx != rx
+
+        return _result(squeeze, data_out=data_out, is_set=is_set)
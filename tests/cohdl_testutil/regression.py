@@ -0,0 +1,148 @@
+"""
+parallel regression runner for the cocotb based reference builds
+
+All designs are generated first (in this process, because the
+CoHDL compiler is not thread safe), then the simulations run
+in a process pool. Each test uses separate build directories,
+that are kept between runs, so unchanged VHDL sources are not analyzed again.
+
+usage (from the tests directory):
+
+    python -m cohdl_testutil.regression [-j JOBS] [--timing FILE] [PATH ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import importlib
+import json
+import os
+import pathlib
+import sys
+import time
+import traceback
+import unittest
+
+from . import cocotb_util
+
+
+class _Result:
+    def __init__(self, name: str, phase: str, seconds: float, error: str | None):
+        self.name = name
+        self.phase = phase
+        self.seconds = seconds
+        self.error = error
+
+    def ok(self):
+        return self.error is None
+
+
+def _module_names(paths: list[pathlib.Path], root: pathlib.Path):
+    for path in paths:
+        files = [path] if path.is_file() else sorted(path.rglob("test_*.py"))
+
+        for file in files:
+            parts = file.resolve().relative_to(root).with_suffix("").parts
+            yield ".".join(parts)
+
+
+def _generate(module_name: str) -> tuple[list[dict], list[_Result]]:
+    """
+    runs the unittests of a module, that only generate the designs
+    and collect the simulator runs
+    """
+
+    cocotb_util._deferred_runs = runs = []
+    start = time.perf_counter()
+
+    try:
+        module = importlib.import_module(module_name)
+        suite = unittest.defaultTestLoader.loadTestsFromModule(module)
+        result = unittest.TestResult()
+        suite.run(result)
+        errors = [text for _, text in [*result.errors, *result.failures]]
+    except BaseException:
+        errors = [traceback.format_exc()]
+    finally:
+        cocotb_util._deferred_runs = None
+
+    seconds = time.perf_counter() - start
+    error = "\n".join(errors) if len(errors) != 0 else None
+    return runs, [_Result(module_name, "generate", seconds, error)]
+
+
+def _simulate(run_args: dict) -> _Result:
+    name = f"{run_args['module']}.{run_args['toplevel']}"
+    start = time.perf_counter()
+
+    try:
+        cocotb_util.simulator.run(**run_args)
+        error = None
+    except BaseException:
+        error = traceback.format_exc()
+
+    return _Result(name, "simulate", time.perf_counter() - start, error)
+
+
+def run(paths: list[str], jobs: int | None = None) -> list[_Result]:
+    root = pathlib.Path(__file__).resolve().parent.parent
+
+    if str(root) not in sys.path:
+        sys.path.insert(0, str(root))
+
+    results: list[_Result] = []
+    runs: list[dict] = []
+
+    for module_name in _module_names([pathlib.Path(p) for p in paths], root):
+        module_runs, module_results = _generate(module_name)
+        runs.extend(module_runs)
+        results.extend(module_results)
+
+    with concurrent.futures.ProcessPoolExecutor(jobs) as executor:
+        results.extend(executor.map(_simulate, runs))
+
+    return results
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("paths", nargs="*", default=["reference_builds"])
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count())
+    parser.add_argument("--timing", help="write the time of each test to a JSON file")
+    args = parser.parse_args(argv)
+
+    results = run(args.paths, args.jobs)
+
+    for result in sorted(results, key=lambda result: -result.seconds):
+        status = "ok" if result.ok() else "FAILED"
+        print(f"{result.seconds:8.2f}s {result.phase:9} {status:6} {result.name}")
+
+    failed = [result for result in results if not result.ok()]
+
+    for result in failed:
+        print(f"\n{result.phase} {result.name}:\n{result.error}")
+
+    print(f"\n{len(results) - len(failed)} passed, {len(failed)} failed")
+
+    if args.timing is not None:
+        with open(args.timing, "w") as file:
+            json.dump(
+                [
+                    {
+                        "name": result.name,
+                        "phase": result.phase,
+                        "seconds": result.seconds,
+                        "ok": result.ok(),
+                    }
+                    for result in results
+                ],
+                file,
+                indent=2,
+            )
+
+    return 0 if len(failed) == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
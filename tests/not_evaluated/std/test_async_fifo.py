@@ -0,0 +1,201 @@
+import random
+import unittest
+
+import cohdl
+from cohdl import Bit, Unsigned, Port
+from cohdl import std
+from cohdl.sim import Simulator
+
+COUNT = 8
+
+
+class AsyncFifoEntity(cohdl.Entity):
+    wr_clk = Port.input(Bit)
+    rd_clk = Port.input(Bit)
+    reset = Port.input(Bit)
+
+    push = Port.input(Bit)
+    data_in = Port.input(Unsigned[8])
+    full = Port.output(Bit)
+    almost_full = Port.output(Bit)
+
+    pop = Port.input(Bit)
+    data_out = Port.output(Unsigned[8], default=0)
+    valid = Port.output(Bit, default=0)
+    empty = Port.output(Bit)
+    almost_empty = Port.output(Bit)
+
+    def architecture(self):
+        wr_clk = std.Clock(self.wr_clk)
+        rd_clk = std.Clock(self.rd_clk)
+
+        fifo = std.AsyncFifo[Unsigned[8], COUNT](
+            wr_clk,
+            rd_clk,
+            wr_reset=std.Reset(self.reset),
+            rd_reset=std.Reset(self.reset),
+            sync_stages=3,
+            almost_full=6,
+            almost_empty=1,
+        )
+
+        @std.concurrent
+        def proc_flags():
+            self.full <<= fifo.full()
+            self.almost_full <<= fifo.almost_full()
+            self.empty <<= fifo.empty()
+            self.almost_empty <<= fifo.almost_empty()
+
+        @std.sequential(wr_clk, std.Reset(self.reset))
+        def proc_write():
+            if self.push and not fifo.full():
+                fifo.push(self.data_in)
+
+        @std.sequential(rd_clk, std.Reset(self.reset))
+        def proc_read():
+            self.valid <<= False
+
+            if self.pop and not fifo.empty():
+                self.data_out <<= fifo.pop()
+                self.valid <<= True
+
+
+class WrongClockEntity(cohdl.Entity):
+    wr_clk = Port.input(Bit)
+    rd_clk = Port.input(Bit)
+    data_out = Port.output(Unsigned[8], default=0)
+
+    def architecture(self):
+        fifo = std.AsyncFifo[Unsigned[8], 4](
+            std.Clock(self.wr_clk), std.Clock(self.rd_clk)
+        )
+
+        @std.sequential(std.Clock(self.wr_clk))
+        def proc():
+            self.data_out <<= fifo.pop()
+
+
+class AsyncFifoTester(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.sim = Simulator(AsyncFifoEntity)
+
+    def run_fifo(self, wr_period, rd_period, cycles, seed):
+        sim = self.sim
+        dut = sim.dut
+        rng = random.Random(seed)
+
+        dut.reset.value = Bit(1)
+        sim.tick("wr_clk", 4)
+        sim.tick("rd_clk", 4)
+        dut.reset.value = Bit(0)
+
+        self.assertTrue(dut.empty.value)
+        self.assertFalse(dut.full.value)
+
+        sent, received = [], []
+        next_data = 0
+        was_full = False
+
+        for time in range(1, cycles + 1):
+            if time % wr_period == 0:
+                dut.push.value = Bit(rng.random() < 0.8)
+                dut.data_in.value = Unsigned[8](next_data)
+
+                if dut.push.value and not dut.full.value:
+                    sent.append(next_data)
+                    next_data = (next_data + 1) % 256
+
+                was_full |= bool(dut.full.value)
+                sim.tick("wr_clk")
+
+            if time % rd_period == 0:
+                dut.pop.value = Bit(rng.random() < 0.8)
+                sim.tick("rd_clk")
+
+                if dut.valid.value:
+                    received.append(dut.data_out.value.to_int())
+
+        dut.push.value = Bit(0)
+        dut.pop.value = Bit(1)
+
+        for _ in range(2 * COUNT):
+            sim.tick("wr_clk")
+            sim.tick("rd_clk")
+
+            if dut.valid.value:
+                received.append(dut.data_out.value.to_int())
+
+        self.assertEqual(sent, received)
+        self.assertTrue(dut.empty.value)
+        self.assertTrue(dut.almost_empty.value)
+        return len(sent), was_full
+
+    def test_fast_writer(self):
+        cnt, was_full = self.run_fifo(1, 3, 600, 1)
+        self.assertGreater(cnt, 100)
+        self.assertTrue(was_full)
+
+    def test_fast_reader(self):
+        cnt, _ = self.run_fifo(3, 1, 600, 2)
+        self.assertGreater(cnt, 100)
+
+    def test_same_rate(self):
+        cnt, _ = self.run_fifo(1, 1, 300, 3)
+        self.assertGreater(cnt, 150)
+
+    def test_throughput(self):
+        # one word per cycle on both sides once data arrived in the read domain
+        sim = self.sim
+        dut = sim.dut
+
+        dut.reset.value = Bit(1)
+        sim.tick("wr_clk", 2)
+        sim.tick("rd_clk", 2)
+        dut.reset.value = Bit(0)
+        dut.push.value = Bit(1)
+        dut.pop.value = Bit(1)
+
+        received = []
+
+        for nr in range(40):
+            dut.data_in.value = Unsigned[8](nr)
+            self.assertFalse(dut.full.value)
+            sim.tick("wr_clk")
+            sim.tick("rd_clk")
+
+            if dut.valid.value:
+                received.append(dut.data_out.value.to_int())
+
+        self.assertEqual(received, list(range(len(received))))
+        self.assertGreaterEqual(len(received), 35)
+
+    def test_almost_full(self):
+        sim = self.sim
+        dut = sim.dut
+
+        dut.reset.value = Bit(1)
+        sim.tick("wr_clk", 2)
+        sim.tick("rd_clk", 2)
+        dut.reset.value = Bit(0)
+        dut.pop.value = Bit(0)
+        dut.push.value = Bit(1)
+
+        for nr in range(COUNT):
+            self.assertEqual(bool(dut.almost_full.value), nr >= 6)
+            self.assertFalse(dut.full.value)
+            sim.tick("wr_clk")
+
+        self.assertTrue(dut.full.value)
+
+    def test_wrong_clock(self):
+        self.assertRaisesRegex(
+            AssertionError,
+            "pop must be called",
+            std.VhdlCompiler.to_string,
+            WrongClockEntity,
+        )
+
+    def test_vhdl(self):
+        vhdl = std.VhdlCompiler.to_string(AsyncFifoEntity)
+        self.assertEqual(vhdl.count("rd_gray_sync"), vhdl.count("wr_gray_sync"))
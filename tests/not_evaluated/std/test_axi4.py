@@ -0,0 +1,164 @@
+import unittest
+
+import cohdl
+from cohdl import Bit, BitVector, Unsigned, Port, Signal
+from cohdl import std
+from cohdl.sim import Simulator
+from cohdl.std.axi.axi4 import Axi4
+
+
+class Axi4Entity(cohdl.Entity):
+    clk = Port.input(Bit)
+    reset = Port.input(Bit)
+
+    wr_start = Port.input(Bit)
+    rd_start = Port.input(Bit)
+    addr = Port.input(Unsigned[8])
+    length = Port.input(Unsigned[8])
+    burst = Port.input(BitVector[2])
+    id = Port.input(Unsigned[2])
+
+    beat = Port.output(Bit)
+    beat_id = Port.output(Unsigned[2])
+    beat_data = Port.output(Unsigned[32])
+    beat_last = Port.output(Bit)
+    responses = Port.output(Unsigned[8])
+
+    def architecture(self):
+        clk = std.Clock(self.clk)
+        reset = std.Reset(self.reset)
+        ctx = std.SequentialContext(clk, reset)
+
+        axi = Axi4.signal(clk, reset, addr_width=8, id_width=2)
+        mem = std.Array[BitVector[32], 64](name="mem")
+        counter = Signal[Unsigned[32]](1, name="counter")
+
+        def read(addr):
+            return mem.get_elem(addr.msb(6).unsigned)
+
+        def write(addr, data, strb):
+            mem.set_elem(addr.msb(6).unsigned, data)
+
+        def data():
+            counter.next = counter + 1
+            return counter.bitvector
+
+        def on_beat(rid, rdata, rresp, rlast):
+            pass
+
+        def on_response(bid, bresp):
+            self.responses.next = self.responses + 1
+
+        axi.read_slave(read)
+        axi.write_slave(write)
+        rd_master = axi.read_master(on_beat)
+        wr_master = axi.write_master(data, on_response=on_response)
+
+        @ctx
+        def proc_requests():
+            if self.wr_start:
+                wr_master.request(self.addr, self.length, id=self.id, burst=self.burst)
+            if self.rd_start:
+                rd_master.request(self.addr, self.length, id=self.id, burst=self.burst)
+
+        @std.concurrent
+        def proc_beats():
+            self.beat <<= axi.rddata.valid & axi.rddata.ready
+            self.beat_id <<= axi.rddata.rid.unsigned
+            self.beat_data <<= axi.rddata.rdata.unsigned
+            self.beat_last <<= axi.rddata.rlast
+
+
+class Axi4Tester(unittest.TestCase):
+    def setUp(self):
+        self.sim = Simulator(Axi4Entity)
+        self.dut = self.sim.dut
+        self.dut.reset.value = True
+        self.sim.tick("clk")
+        self.dut.reset.value = False
+        self.beats = []
+
+    def tick(self, cycles=1):
+        for _ in range(cycles):
+            self.sim.tick("clk")
+            dut = self.dut
+
+            if dut.beat.value:
+                self.beats.append(
+                    (
+                        int(dut.beat_id.value),
+                        int(dut.beat_data.value),
+                        bool(dut.beat_last.value),
+                    )
+                )
+
+    def request(self, port, addr, length, id=0, burst=Axi4.Burst.INCR):
+        dut = self.dut
+        dut.addr.value = addr
+        dut.length.value = length
+        dut.id.value = id
+        dut.burst.value = BitVector[2](burst)
+        port.value = True
+        self.tick()
+        port.value = False
+
+    def test_bursts(self):
+        dut = self.dut
+
+        # two back to back write bursts
+        self.request(dut.wr_start, 0, 7, id=1)
+        self.request(dut.wr_start, 32, 7, id=2)
+        self.tick(24)
+        self.assertEqual(int(dut.responses.value), 2)
+
+        # two outstanding read bursts
+        self.request(dut.rd_start, 0, 7, id=1)
+        self.request(dut.rd_start, 32, 7, id=2)
+        self.tick(24)
+
+        self.assertEqual(
+            self.beats,
+            [(1, nr + 1, nr == 7) for nr in range(8)]
+            + [(2, nr + 9, nr == 7) for nr in range(8)],
+        )
+
+        # wrapping burst from the third word of a 16 byte block
+        self.beats = []
+        self.request(dut.rd_start, 40, 3, id=3, burst=Axi4.Burst.WRAP)
+        self.tick(8)
+        self.assertEqual([data for _, data, _ in self.beats], [11, 12, 9, 10])
+
+        # fixed burst repeats the same address
+        self.beats = []
+        self.request(dut.rd_start, 4, 2, burst=Axi4.Burst.FIXED)
+        self.tick(8)
+        self.assertEqual([data for _, data, _ in self.beats], [2, 2, 2])
+
+    def test_throughput(self):
+        dut = self.dut
+
+        for nr in range(4):
+            self.request(dut.wr_start, 64 * nr, 15, id=nr)
+
+        # 64 write beats with a few cycles of latency
+        self.tick(66)
+        self.assertEqual(int(dut.responses.value), 4)
+
+        cycles = []
+
+        for nr in range(4):
+            self.request(dut.rd_start, 64 * nr, 15, id=nr)
+            cycles.append(len(self.beats))
+
+        # all read bursts are transferred back to back, one beat per cycle
+        while len(self.beats) < 64:
+            self.tick()
+            cycles.append(len(self.beats))
+
+        first = next(nr for nr, cnt in enumerate(cycles) if cnt != 0)
+        self.assertEqual(cycles[first:], list(range(1, 65)))
+        self.assertEqual([data for _, data, _ in self.beats], list(range(1, 65)))
+        self.assertEqual(
+            [id for id, _, _ in self.beats],
+            [nr // 16 for nr in range(64)],
+        )
@@ -0,0 +1,225 @@
+import random
+import unittest
+
+import cohdl
+from cohdl import Bit, BitVector, Port
+from cohdl import std
+from cohdl.sim import Simulator
+from cohdl.std.axi import axi4_stream
+from cohdl.std.axi.axi4_stream import Axi4Stream
+
+
+def stream_ports(prefix, direction, width):
+    inp = direction == "input"
+    inv = "output" if inp else "input"
+    return {
+        f"{prefix}_valid": getattr(Port, direction)(Bit),
+        f"{prefix}_ready": getattr(Port, inv)(Bit),
+        f"{prefix}_data": getattr(Port, direction)(BitVector[width]),
+        f"{prefix}_last": getattr(Port, direction)(Bit),
+    }
+
+
+def port_stream(entity, prefix):
+    return Axi4Stream(
+        getattr(entity, f"{prefix}_valid"),
+        getattr(entity, f"{prefix}_ready"),
+        getattr(entity, f"{prefix}_data"),
+        getattr(entity, f"{prefix}_last"),
+    )
+
+
+class StreamChain(cohdl.Entity):
+    clk = Port.input(Bit)
+    reset = Port.input(Bit)
+
+    locals().update(stream_ports("inp", "input", 8))
+    locals().update(stream_ports("out", "output", 8))
+
+    def architecture(self):
+        ctx = std.SequentialContext(std.Clock(self.clk), std.Reset(self.reset))
+
+        inp = axi4_stream.skid_buffer(ctx, port_stream(self, "inp"), name="inp_skid")
+        wide = axi4_stream.upsizer(
+            ctx, inp, Axi4Stream.signal(32, keep=True, prefix="wide_")
+        )
+        stored = axi4_stream.packet_fifo(ctx, wide, depth=4)
+        narrow = axi4_stream.downsizer(
+            ctx, stored, Axi4Stream.signal(8, prefix="narrow_")
+        )
+        axi4_stream.skid_buffer(ctx, narrow, port_stream(self, "out"), name="out_skid")
+
+
+class StreamMux(cohdl.Entity):
+    clk = Port.input(Bit)
+    reset = Port.input(Bit)
+
+    locals().update(stream_ports("a", "input", 8))
+    locals().update(stream_ports("b", "input", 8))
+    locals().update(stream_ports("c", "input", 8))
+    locals().update(stream_ports("out", "output", 8))
+
+    def architecture(self):
+        ctx = std.SequentialContext(std.Clock(self.clk), std.Reset(self.reset))
+
+        axi4_stream.round_robin_mux(
+            ctx,
+            [port_stream(self, name) for name in "abc"],
+            port_stream(self, "out"),
+        )
+
+
+class Source:
+    # drives a stream input with a list of (data, last) beats
+    def __init__(self, dut, prefix, beats, rng=None):
+        self.dut = dut
+        self.prefix = prefix
+        self.beats = list(beats)
+        self.rng = rng
+
+    def port(self, name):
+        return getattr(self.dut, f"{self.prefix}_{name}")
+
+    def drive(self):
+        active = len(self.beats) != 0 and (self.rng is None or self.rng.random() < 0.7)
+        self.port("valid").value = active
+
+        if active:
+            data, last = self.beats[0]
+            self.port("data").value = BitVector[8](cohdl.Unsigned[8](data))
+            self.port("last").value = last
+
+    def sample(self):
+        # called before the clock edge
+        if self.port("valid").value and self.port("ready").value:
+            self.beats.pop(0)
+
+
+class StreamTester(unittest.TestCase):
+    def packets(self, rng, count):
+        beats = []
+
+        for _ in range(count):
+            length = rng.randint(1, 9)
+            beats += [(rng.randrange(256), nr == length - 1) for nr in range(length)]
+
+        return beats
+
+    def simulator(self, entity):
+        sim = Simulator(entity)
+        sim.dut.reset.value = True
+        sim.tick("clk")
+        sim.dut.reset.value = False
+        return sim
+
+    def run_sim(self, sim, sources, cycles, rng):
+        dut = sim.dut
+
+        received = []
+        transfers = []
+
+        for _ in range(cycles):
+            for src in sources:
+                src.drive()
+
+            dut.out_ready.value = rng is None or rng.random() < 0.7
+            sim.settle()
+
+            for src in sources:
+                src.sample()
+
+            transfer = bool(dut.out_valid.value and dut.out_ready.value)
+            transfers.append(transfer)
+
+            if transfer:
+                received.append(
+                    (dut.out_data.value.unsigned.to_int(), bool(dut.out_last.value))
+                )
+
+            sim.tick("clk")
+
+        return received, transfers
+
+    def test_chain(self):
+        rng = random.Random(3)
+        beats = self.packets(rng, 20)
+        sim = self.simulator(StreamChain)
+
+        received, _ = self.run_sim(sim, [Source(sim.dut, "inp", beats, rng)], 400, rng)
+        self.assertEqual(received, beats)
+
+    def test_chain_throughput(self):
+        # a packet, that fits into the packet fifo, is accepted
+        # and sent at one beat per cycle
+        beats = [(nr, nr == 15) for nr in range(16)]
+        sim = self.simulator(StreamChain)
+        src = Source(sim.dut, "inp", beats)
+
+        received, transfers = self.run_sim(sim, [src], 17, None)
+        self.assertEqual(len(src.beats), 0)
+
+        received, transfers = self.run_sim(sim, [], 32, None)
+        self.assertEqual(received, beats)
+
+        first = transfers.index(True)
+        self.assertTrue(all(transfers[first : first + 16]))
+
+    def test_chain_oversized(self):
+        # packets longer than the packet fifo are forwarded
+        # in cut-through mode instead of blocking the input
+        rng = random.Random(7)
+        beats = [(nr % 256, nr == 39) for nr in range(40)]
+        beats += self.packets(rng, 4)
+        beats += [(nr % 256, nr == 63) for nr in range(64)]
+        sim = self.simulator(StreamChain)
+        src = Source(sim.dut, "inp", beats, rng)
+
+        received, _ = self.run_sim(sim, [src], 600, rng)
+        self.assertEqual(len(src.beats), 0)
+        self.assertEqual(received, beats)
+
+    def test_mux(self):
+        rng = random.Random(5)
+        inputs = {name: self.packets(rng, 8) for name in "abc"}
+        sim = self.simulator(StreamMux)
+        sources = [Source(sim.dut, name, beats, rng) for name, beats in inputs.items()]
+
+        received, _ = self.run_sim(sim, sources, 600, rng)
+
+        # packets are not interleaved and each input keeps its order
+        remaining = {name: list(beats) for name, beats in inputs.items()}
+        pos = 0
+
+        while pos < len(received):
+            for name, beats in remaining.items():
+                if len(beats) == 0:
+                    continue
+
+                length = next(nr for nr, (_, last) in enumerate(beats) if last) + 1
+
+                if received[pos : pos + length] == beats[:length]:
+                    del beats[:length]
+                    pos += length
+                    break
+            else:
+                self.fail(f"unexpected beat at position {pos}")
+
+        self.assertTrue(all(len(beats) == 0 for beats in remaining.values()))
+
+    def test_mux_round_robin(self):
+        # single beat packets of all inputs alternate
+        # and are forwarded one beat per cycle
+        sim = self.simulator(StreamMux)
+        sources = [
+            Source(sim.dut, name, [(16 * nr + idx, True) for idx in range(4)])
+            for nr, name in enumerate("abc")
+        ]
+
+        received, transfers = self.run_sim(sim, sources, 20, None)
+        self.assertEqual(
+            [data for data, _ in received],
+            [16 * nr + idx for idx in range(4) for nr in range(3)],
+        )
+
+        first = transfers.index(True)
+        self.assertTrue(all(transfers[first : first + 12]))
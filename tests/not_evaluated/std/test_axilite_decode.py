@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import random
+import unittest
+
+import cohdl
+from cohdl import BitVector, Unsigned, Null
+from cohdl import std
+from cohdl.sim import Simulator
+from cohdl.std.reg import reg32
+from cohdl.std.axi import axi4_light as axi
+
+
+class ReadReverse(reg32.Register):
+    data: reg32.MemField[31:0]
+
+    def _on_read_(self):
+        return self(data=std.reverse_bits(self.data.val()))
+
+
+class Fields(reg32.Register):
+    low: reg32.MemUField[7:0]
+    high: reg32.MemUField[31:16, Null]
+
+
+class DecodeAddrMap(reg32.AddrMap):
+    word_0: reg32.MemWord[0x00]
+    word_1: reg32.MemUWord[0x04]
+    fields: Fields[0x0C]
+    words: reg32.Array[reg32.MemWord, 0x20:0x40:0x04]
+    word_far: reg32.MemWord[0x84]
+
+
+class DecodeEntity(
+    axi.addr_map_entity(
+        addr_width=10,
+        addr_map=DecodeAddrMap,
+        decode_tree=True,
+        read_stages=1,
+        decode_bits=2,
+    )
+): ...
+
+
+class AxiMaster:
+    def __init__(self, sim):
+        self.sim = sim
+        self.dut = sim.dut
+
+    def write(self, addr, data):
+        dut = self.dut
+        dut.axi_awaddr.value = addr
+        dut.axi_wdata.value = BitVector[32](Unsigned[32](data))
+        dut.axi_wstrb.value = BitVector[4]("1111")
+        dut.axi_awvalid.value = True
+        dut.axi_wvalid.value = True
+        dut.axi_bready.value = True
+
+        for _ in range(16):
+            self.sim.settle()
+            addr_done = bool(dut.axi_awready.value)
+            data_done = bool(dut.axi_wready.value)
+            done = bool(dut.axi_bvalid.value)
+
+            self.sim.tick("axi_clk")
+
+            if addr_done:
+                dut.axi_awvalid.value = False
+            if data_done:
+                dut.axi_wvalid.value = False
+            if done:
+                break
+
+        dut.axi_awvalid.value = False
+        dut.axi_wvalid.value = False
+        dut.axi_bready.value = False
+
+    def read(self, addrs, rng=None, cycles=200):
+        # issues all reads as fast as possible, returns the read data
+        # and the cycles in which read requests were accepted
+        dut = self.dut
+        pending = list(addrs)
+        received = []
+        accepted = []
+
+        for cycle in range(cycles):
+            dut.axi_arvalid.value = len(pending) != 0
+
+            if len(pending) != 0:
+                dut.axi_araddr.value = pending[0]
+
+            dut.axi_rready.value = rng is None or rng.random() < 0.6
+            self.sim.settle()
+
+            if dut.axi_arvalid.value and dut.axi_arready.value:
+                pending.pop(0)
+                accepted.append(cycle)
+
+            if dut.axi_rvalid.value and dut.axi_rready.value:
+                received.append(dut.axi_rdata.value.unsigned.to_int())
+
+            self.sim.tick("axi_clk")
+
+            if len(received) == len(addrs):
+                break
+
+        dut.axi_arvalid.value = False
+        return received, accepted
+
+
+class DecodeTester(unittest.TestCase):
+    def setUp(self):
+        self.sim = Simulator(DecodeEntity)
+        dut = self.sim.dut
+
+        for port in ["awvalid", "wvalid", "bready", "arvalid", "rready"]:
+            getattr(dut, f"axi_{port}").value = False
+
+        dut.axi_reset.value = False
+        self.sim.tick("axi_clk")
+        dut.axi_reset.value = True
+
+        self.master = AxiMaster(self.sim)
+        self.expected = {addr: 0 for addr in range(0, 0x100, 4)}
+
+        rng = random.Random(11)
+
+        for addr in [0x00, 0x04, 0x84, *range(0x20, 0x40, 4)]:
+            value = rng.getrandbits(32)
+            self.master.write(addr, value)
+            self.expected[addr] = value
+
+        self.master.write(0x0C, 0x12345678)
+        self.expected[0x0C] = 0x12340078
+
+    def test_back_to_back(self):
+        addrs = list(self.expected)
+        received, accepted = self.master.read(addrs)
+
+        self.assertEqual(received, [self.expected[addr] for addr in addrs])
+        # one read request is accepted per cycle
+        self.assertEqual(accepted, list(range(len(addrs))))
+
+    def test_stalls(self):
+        rng = random.Random(5)
+        addrs = [rng.randrange(0, 0x100, 4) for _ in range(100)]
+        received, _ = self.master.read(addrs, rng=rng, cycles=1000)
+
+        self.assertEqual(received, [self.expected[addr] for addr in addrs])
+
+    def test_side_effects(self):
+        class ReverseEntity(
+            axi.addr_map_entity(addr_width=8, decode_tree=True, entity_name="rev")
+        ):
+            word: reg32.MemWord[0x00]
+            reverse: ReadReverse[0x04]
+
+        with self.assertRaises(AssertionError):
+            Simulator(ReverseEntity)
+
+
+class LargeAddrMap(reg32.AddrMap):
+    words: reg32.Array[reg32.MemWord, 0x000:0x800:0x04]
+
+
+class LargeEntity(
+    axi.addr_map_entity(
+        addr_width=12,
+        addr_map=LargeAddrMap,
+        decode_tree=True,
+        read_stages=1,
+        entity_name="large",
+    )
+): ...
+
+
+class LargeMapTester(unittest.TestCase):
+    def test_large_map(self):
+        # 512 registers, the write decoder must not nest
+        # one branch per register
+        sim = Simulator(LargeEntity)
+        dut = sim.dut
+
+        for port in ["awvalid", "wvalid", "bready", "arvalid", "rready"]:
+            getattr(dut, f"axi_{port}").value = False
+
+        dut.axi_reset.value = False
+        sim.tick("axi_clk")
+        dut.axi_reset.value = True
+
+        master = AxiMaster(sim)
+        rng = random.Random(3)
+        expected = {addr: 0 for addr in [0x000, 0x004, 0x400, 0x7FC]}
+
+        for addr in [0x004, 0x400, 0x7FC]:
+            expected[addr] = rng.getrandbits(32)
+            master.write(addr, expected[addr])
+
+        received, _ = master.read(list(expected))
+        self.assertEqual(received, list(expected.values()))
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import random
+import unittest
+
+from cohdl import BitVector, Unsigned
+from cohdl.sim import Simulator
+from cohdl.std.reg import reg32
+from cohdl.std.axi import axi4_light as axi
+from cohdl.std.axi.axi4_light.interconnect import Interconnect
+
+from .test_axilite_decode import AxiMaster
+
+OKAY = 0
+DECERR = 3
+
+
+class SlaveMap(reg32.AddrMap):
+    word_0: reg32.MemWord[0x00]
+    word_1: reg32.MemWord[0x04]
+    word_2: reg32.MemWord[0x08]
+    word_3: reg32.MemWord[0x0C]
+
+
+def interconnect_entity(register_slices, outstanding):
+    class InterconnectEntity(axi.base_entity(addr_width=16)):
+        def architecture(self):
+            ic = Interconnect(
+                self.interface_connection(),
+                pipelined=True,
+                outstanding=outstanding,
+                register_slices=register_slices,
+            )
+
+            fast = ic.reserve(0x1000, 0x100, prefix="fast_")
+            slow = ic.reserve(0x2000, 0x100, prefix="slow_")
+
+            fast.connect_addr_map(
+                SlaveMap(), decode_tree=True, read_stages=1, decode_bits=1
+            )
+            slow.connect_addr_map(SlaveMap())
+
+    return InterconnectEntity
+
+
+# the register slices add two cycles of latency to each slave port,
+# more outstanding reads are required to keep the throughput
+PipelinedEntity = interconnect_entity(False, outstanding=4)
+SlicedEntity = interconnect_entity(True, outstanding=8)
+
+
+class InterconnectMaster(AxiMaster):
+    def read(self, addrs, rng=None, cycles=400):
+        # same as AxiMaster.read but returns (rdata, rresp) pairs
+        dut = self.dut
+        pending = list(addrs)
+        received = []
+        accepted = []
+
+        for cycle in range(cycles):
+            dut.axi_arvalid.value = len(pending) != 0
+
+            if len(pending) != 0:
+                dut.axi_araddr.value = pending[0]
+
+            dut.axi_rready.value = rng is None or rng.random() < 0.6
+            self.sim.settle()
+
+            if dut.axi_arvalid.value and dut.axi_arready.value:
+                pending.pop(0)
+                accepted.append(cycle)
+
+            if dut.axi_rvalid.value and dut.axi_rready.value:
+                received.append(
+                    (
+                        dut.axi_rdata.value.unsigned.to_int(),
+                        dut.axi_rresp.value.unsigned.to_int(),
+                    )
+                )
+
+            self.sim.tick("axi_clk")
+
+            if len(received) == len(addrs):
+                break
+
+        dut.axi_arvalid.value = False
+        return received, accepted
+
+    def write_many(self, writes, rng=None, cycles=400):
+        # drives the write address and data channels independently,
+        # returns the write responses and the largest number
+        # of accepted writes without a response
+        dut = self.dut
+        aw_pending = list(writes)
+        w_pending = list(writes)
+        responses = []
+        accepted = 0
+        max_outstanding = 0
+
+        dut.axi_wstrb.value = BitVector[4]("1111")
+
+        for _ in range(cycles):
+            dut.axi_awvalid.value = len(aw_pending) != 0
+            dut.axi_wvalid.value = len(w_pending) != 0
+
+            if len(aw_pending) != 0:
+                dut.axi_awaddr.value = aw_pending[0][0]
+
+            if len(w_pending) != 0:
+                dut.axi_wdata.value = BitVector[32](Unsigned[32](w_pending[0][1]))
+
+            dut.axi_bready.value = rng is None or rng.random() < 0.4
+            self.sim.settle()
+
+            if dut.axi_awvalid.value and dut.axi_awready.value:
+                aw_pending.pop(0)
+                accepted += 1
+
+            if dut.axi_wvalid.value and dut.axi_wready.value:
+                w_pending.pop(0)
+
+            if dut.axi_bvalid.value and dut.axi_bready.value:
+                responses.append(dut.axi_bresp.value.unsigned.to_int())
+
+            max_outstanding = max(max_outstanding, accepted - len(responses))
+            self.sim.tick("axi_clk")
+
+            if len(responses) == len(writes):
+                break
+
+        dut.axi_awvalid.value = False
+        dut.axi_wvalid.value = False
+        dut.axi_bready.value = False
+        return responses, max_outstanding
+
+
+class InterconnectTester:
+    entity = None
+
+    def setUp(self):
+        self.sim = Simulator(self.entity)
+        dut = self.sim.dut
+
+        for port in ["awvalid", "wvalid", "bready", "arvalid", "rready"]:
+            getattr(dut, f"axi_{port}").value = False
+
+        dut.axi_reset.value = False
+        self.sim.tick("axi_clk")
+        dut.axi_reset.value = True
+
+        self.master = InterconnectMaster(self.sim)
+        self.expected = {}
+
+        rng = random.Random(3)
+
+        for base in [0x1000, 0x2000]:
+            for offset in range(0, 0x10, 4):
+                value = rng.getrandbits(32)
+                self.master.write(base + offset, value)
+                self.expected[base + offset] = (value, OKAY)
+
+        for addr in [0x1010, 0x2080, 0x3000, 0x0000, 0xFFFC]:
+            self.expected[addr] = (0, DECERR if addr >= 0x3000 or addr < 0x1000 else 0)
+
+    def test_back_to_back(self):
+        # reads of a pipelined slave are accepted once per cycle
+        addrs = [0x1000 + 4 * (nr % 4) for nr in range(32)]
+        received, accepted = self.master.read(addrs)
+
+        self.assertEqual(received, [self.expected[addr] for addr in addrs])
+        self.assertEqual(accepted, list(range(accepted[0], accepted[0] + 32)))
+
+    def test_across_slaves(self):
+        # reads alternating between two slaves are outstanding
+        # at the same time and do not reduce the throughput
+        addrs = [0x1000 + 4 * (nr % 4) if nr % 2 else 0x3000 for nr in range(32)]
+        received, accepted = self.master.read(addrs)
+
+        self.assertEqual(received, [self.expected[addr] for addr in addrs])
+        self.assertEqual(accepted, list(range(accepted[0], accepted[0] + 32)))
+
+    def test_outstanding(self):
+        # responses of different slaves and the background range
+        # are returned in request order
+        rng = random.Random(9)
+        addrs = [rng.choice(list(self.expected)) for _ in range(150)]
+        received, _ = self.master.read(addrs, rng=rng, cycles=2000)
+
+        self.assertEqual(received, [self.expected[addr] for addr in addrs])
+
+    def test_alternating_slaves(self):
+        # reads alternating between the decode tree slave (fast_)
+        # and the coroutine slave (slow_) are returned in order
+        addrs = [(0x1000 if nr % 2 else 0x2000) + 4 * (nr % 4) for nr in range(32)]
+        received, _ = self.master.read(addrs)
+        self.assertEqual(received, [self.expected[addr] for addr in addrs])
+
+        rng = random.Random(11)
+        received, _ = self.master.read(addrs, rng=rng, cycles=2000)
+        self.assertEqual(received, [self.expected[addr] for addr in addrs])
+
+    def test_outstanding_writes(self):
+        # multiple writes to both slaves and the background range
+        # are outstanding at the same time, responses are returned in order
+        rng = random.Random(13)
+        writes = [
+            (rng.choice([0x1000, 0x2000, 0x3000]) + 4 * rng.randrange(4), nr)
+            for nr in range(40)
+        ]
+
+        responses, max_outstanding = self.master.write_many(writes, rng=rng)
+
+        self.assertEqual(
+            responses, [DECERR if addr >= 0x3000 else OKAY for addr, _ in writes]
+        )
+        self.assertGreater(max_outstanding, 1)
+
+        # the last write to each register is visible
+        for addr, value in writes:
+            if addr < 0x3000:
+                self.expected[addr] = (value, OKAY)
+
+        addrs = sorted(self.expected)
+        received, _ = self.master.read(addrs)
+        self.assertEqual(received, [self.expected[addr] for addr in addrs])
+
+    def test_write_response(self):
+        self.master.write(0x2008, 1234)
+        self.master.write(0x3008, 5678)
+
+        received, _ = self.master.read([0x2008, 0x3008, 0x1008])
+        self.assertEqual(received[0], (1234, OKAY))
+        self.assertEqual(received[1], (0, DECERR))
+        self.assertEqual(received[2], self.expected[0x1008])
+
+
+class PipelinedTester(InterconnectTester, unittest.TestCase):
+    entity = PipelinedEntity
+
+
+class SlicedTester(InterconnectTester, unittest.TestCase):
+    entity = SlicedEntity
@@ -0,0 +1,72 @@
+import random
+import unittest
+
+import cohdl
+from cohdl import Bit, BitVector, Unsigned, Port
+from cohdl import std
+from cohdl.sim import Simulator
+from cohdl.std import _core_utility
+from cohdl._compiler.frontend import _prepare_ast
+
+
+class BitTableEntity(cohdl.Entity):
+    a = Port.input(BitVector[12])
+    b = Port.input(BitVector[12])
+
+    cnt_a = Port.output(Unsigned[4])
+    cnt_b = Port.output(Unsigned[4])
+    clr_a = Port.output(Unsigned[4])
+    hot_a = Port.output(Bit)
+    hot_b = Port.output(Bit)
+
+    def architecture(self):
+        @std.concurrent
+        def proc():
+            self.cnt_a <<= std.count_set_bits(self.a)
+            self.cnt_b <<= std.count_set_bits(self.b)
+            self.clr_a <<= std.count_clear_bits(self.a)
+            self.hot_a <<= std.is_one_hot(self.a.lsb(6))
+            self.hot_b <<= std.is_one_hot(self.b.lsb(6))
+
+
+class BitTableTester(unittest.TestCase):
+    def test_shared_tables(self):
+        table = _core_utility._set_bit_map(6)
+        self.assertIs(table, _core_utility._set_bit_map(6))
+        self.assertIsNot(table, _core_utility._set_bit_map(5))
+        self.assertIs(_core_utility._one_hot_map(8), _core_utility._one_hot_map(8))
+
+        self.assertEqual(len(table), 64)
+        self.assertEqual(table[63], 6)
+        self.assertEqual(_core_utility._clear_bit_map(6)[1], 5)
+
+        # tables are shared, so they must not be modified
+        with self.assertRaises(TypeError):
+            table[0] = 1
+
+    def test_simulation(self):
+        sim = Simulator(BitTableEntity)
+        rng = random.Random(7)
+
+        # the converted branches of the shared tables are reused
+        table = _core_utility._set_bit_map(6)
+        self.assertTrue(
+            any(
+                entry[0] is table
+                for entry in _prepare_ast._select_branch_cache.values()
+            )
+        )
+
+        for _ in range(64):
+            a = rng.getrandbits(12)
+            b = 1 << rng.randrange(8)
+
+            sim.dut.a.value = BitVector[12](Unsigned[12](a))
+            sim.dut.b.value = BitVector[12](Unsigned[12](b))
+            sim.settle()
+
+            self.assertEqual(sim.dut.cnt_a.value, a.bit_count())
+            self.assertEqual(sim.dut.cnt_b.value, 1)
+            self.assertEqual(sim.dut.clr_a.value, 12 - a.bit_count())
+            self.assertEqual(bool(sim.dut.hot_a.value), (a & 63).bit_count() == 1)
+            self.assertEqual(bool(sim.dut.hot_b.value), b < 64)
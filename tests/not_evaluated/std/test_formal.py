@@ -0,0 +1,95 @@
+import os
+import tempfile
+import unittest
+
+import cohdl
+from cohdl import Bit, Port
+from cohdl import std
+from cohdl.std import _formal as formal
+
+
+class FormalEntity(cohdl.Entity):
+    clk = Port.input(Bit)
+    req = Port.input(Bit)
+    ack = Port.output(Bit, default=0)
+
+    def architecture(self):
+        @std.sequential(std.Clock(self.clk))
+        def proc():
+            self.ack <<= self.req
+
+        chk = formal.Checker(std.Clock(self.clk))
+
+        @std.concurrent
+        def proc_formal():
+            chk.always("follow", formal.When(formal.prev(self.req), self.ack))
+            chk.always("stable_a", self.ack | ~self.ack, since_start=3)
+            chk.always("stable_b", self.req | ~self.req, since_start=3)
+            chk.cover("seq", formal.Sequence(self.req).next(self.ack).wait((1, 3)))
+
+
+class UnboundedEntity(cohdl.Entity):
+    clk = Port.input(Bit)
+    req = Port.input(Bit)
+
+    def architecture(self):
+        chk = formal.Checker(std.Clock(self.clk))
+
+        @std.concurrent
+        def proc_formal():
+            chk.cover("eventually", formal.State(self.req, times=2))
+
+
+class FormalTester(unittest.TestCase):
+    def test_span(self):
+        self.assertEqual(formal.State("a").span(), 1)
+        self.assertEqual(formal.State("a", (1, 4)).span(), 4)
+        self.assertEqual(formal.State("a", ()).span(), None)
+        self.assertEqual(formal.State("a", (1, 4), consecutive=False).span(), None)
+        self.assertEqual(
+            formal.Sequence("a").then("b", (2, 3), consecutive=False).span(), None
+        )
+        self.assertEqual(formal.Sequence("a").next("b").wait(2).span(), 4)
+        self.assertEqual(formal.Sequence("a").then("b", (2, 3)).span(), 3)
+        self.assertEqual(formal.When("a", "b").span(), 1)
+        self.assertEqual(formal.When("a").next("b").span(), 2)
+
+    def test_to_sby(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            project = std.VhdlCompiler.to_sby(FormalEntity, tmp)
+            self.assertEqual(project, os.path.join(tmp, "FormalEntity.sby"))
+
+            with open(project) as file:
+                lines = file.read().splitlines()
+
+            self.assertIn("#   assert follow: 2", lines)
+            self.assertIn("#   assert stable_a: 4", lines)
+            self.assertIn("#   cover seq: 5", lines)
+            self.assertIn("depth 5", lines)
+            self.assertIn("ghdl --std=08 FormalEntity.vhd -e FormalEntity", lines)
+            self.assertEqual(lines[-1], "FormalEntity.vhd")
+
+            with open(os.path.join(tmp, "FormalEntity.vhd")) as file:
+                vhdl = file.read()
+
+            # both properties share the delayed values of past_exists
+            self.assertEqual(vhdl.count("prev(past_exists, 3)"), 1)
+
+            project = std.VhdlCompiler.to_sby(FormalEntity, tmp, mode="prove", depth=8)
+
+            with open(project) as file:
+                content = file.read()
+
+            self.assertIn("mode prove\ndepth 8\n", content)
+
+    def test_unbounded(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertRaises(
+                AssertionError, std.VhdlCompiler.to_sby, UnboundedEntity, tmp
+            )
+
+            with open(std.VhdlCompiler.to_sby(UnboundedEntity, tmp, depth=10)) as file:
+                content = file.read()
+
+            self.assertIn("#   cover eventually: unbounded", content)
+            self.assertIn("depth 10", content)
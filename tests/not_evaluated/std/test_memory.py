@@ -0,0 +1,248 @@
+import collections
+import random
+import unittest
+
+import cohdl
+from cohdl import Bit, Unsigned, Port
+from cohdl import std
+from cohdl.sim import Simulator
+
+Mode = std.ReadDuringWrite
+
+
+def single_port_entity(mode):
+    class SinglePortEntity(cohdl.Entity):
+        clk = Port.input(Bit)
+        we = Port.input(Bit)
+        addr = Port.input(Unsigned[4])
+        din = Port.input(Unsigned[8])
+        dout = Port.output(Unsigned[8])
+
+        def architecture(self):
+            ram = std.SinglePortRam[Unsigned[8], 16](mode=mode)
+
+            @std.sequential(std.Clock(self.clk))
+            def proc_ram():
+                ram.port.access(self.addr, self.din, self.we)
+
+            @std.concurrent
+            def proc_out():
+                self.dout <<= ram.port.data()
+
+    return SinglePortEntity
+
+
+class TrueDualPortEntity(cohdl.Entity):
+    clk = Port.input(Bit)
+    we_a = Port.input(Bit)
+    addr_a = Port.input(Unsigned[4])
+    din_a = Port.input(Unsigned[8])
+    dout_a = Port.output(Unsigned[8])
+    addr_b = Port.input(Unsigned[4])
+    dout_b = Port.output(Unsigned[8])
+
+    def architecture(self):
+        ram = std.TrueDualPortRam[Unsigned[8], 16](mode_b=Mode.WRITE_FIRST)
+
+        @std.sequential(std.Clock(self.clk))
+        def proc_ram():
+            ram.port_a.access(self.addr_a, self.din_a, self.we_a)
+            ram.port_b.write(self.addr_b, self.din_a + 1)
+
+        @std.concurrent
+        def proc_out():
+            self.dout_a <<= ram.port_a.data()
+            self.dout_b <<= ram.port_b.data()
+
+
+class FifoEntity(cohdl.Entity):
+    clk = Port.input(Bit)
+    reset = Port.input(Bit)
+    push = Port.input(Bit)
+    data_in = Port.input(Unsigned[8])
+    full = Port.output(Bit)
+    pop = Port.input(Bit)
+    data_out = Port.output(Unsigned[8], default=0)
+    valid = Port.output(Bit, default=0)
+    empty = Port.output(Bit)
+
+    def architecture(self):
+        fifo = std.BlockRamFifo[Unsigned[8], 8]()
+        clk = std.Clock(self.clk)
+
+        @std.concurrent
+        def proc_flags():
+            self.full <<= fifo.full()
+            self.empty <<= fifo.empty()
+
+        @std.sequential(clk, std.Reset(self.reset))
+        def proc_write():
+            if self.push and not fifo.full():
+                fifo.push(self.data_in)
+
+        @std.sequential(clk, std.Reset(self.reset))
+        def proc_read():
+            self.valid <<= False
+
+            if self.pop and not fifo.empty():
+                self.data_out <<= fifo.pop()
+                self.valid <<= True
+
+
+class MemoryTester(unittest.TestCase):
+    def test_single_port(self):
+        for mode in Mode:
+            sim = Simulator(single_port_entity(mode))
+            dut = sim.dut
+            rng = random.Random(mode.value)
+            mem = [None] * 16
+            dout = None
+
+            for _ in range(200):
+                we = rng.random() < 0.5
+                addr = rng.randrange(4)
+                din = rng.randrange(256)
+
+                dut.we.value = Bit(we)
+                dut.addr.value = Unsigned[4](addr)
+                dut.din.value = Unsigned[8](din)
+                sim.tick("clk")
+
+                if not we or mode is Mode.READ_FIRST:
+                    dout = mem[addr]
+                elif mode is Mode.WRITE_FIRST:
+                    dout = din
+
+                if we:
+                    mem[addr] = din
+
+                if dout is not None:
+                    self.assertEqual(dut.dout.value.to_int(), dout, mode)
+
+    def test_true_dual_port(self):
+        sim = Simulator(TrueDualPortEntity)
+        dut = sim.dut
+
+        dut.we_a.value = Bit(1)
+        dut.addr_a.value = Unsigned[4](3)
+        dut.addr_b.value = Unsigned[4](5)
+        dut.din_a.value = Unsigned[8](10)
+        sim.tick("clk")
+        self.assertEqual(dut.dout_b.value.to_int(), 11)
+
+        dut.we_a.value = Bit(0)
+        sim.tick("clk")
+        self.assertEqual(dut.dout_a.value.to_int(), 10)
+
+        dut.addr_a.value = Unsigned[4](5)
+        dut.addr_b.value = Unsigned[4](6)
+        sim.tick("clk")
+        self.assertEqual(dut.dout_a.value.to_int(), 11)
+
+    def test_fifo(self):
+        sim = Simulator(FifoEntity)
+        dut = sim.dut
+
+        dut.reset.value = Bit(1)
+        sim.tick("clk")
+        dut.reset.value = Bit(0)
+
+        for push_rate, pop_rate in [(0.8, 0.4), (0.4, 0.8), (1.0, 1.0)]:
+            rng = random.Random(int(10 * push_rate + pop_rate))
+            expected = collections.deque()
+            was_full = False
+            received = 0
+
+            for nr in range(300):
+                push = rng.random() < push_rate
+                pop = rng.random() < pop_rate
+
+                dut.push.value = Bit(push)
+                dut.pop.value = Bit(pop)
+                dut.data_in.value = Unsigned[8](nr % 256)
+
+                if push and not dut.full.value:
+                    expected.append(nr % 256)
+                was_full |= bool(dut.full.value)
+
+                sim.tick("clk")
+
+                if dut.valid.value:
+                    self.assertEqual(dut.data_out.value.to_int(), expected.popleft())
+                    received += 1
+
+            if push_rate == pop_rate:
+                # one element per cycle after the initial latency
+                self.assertGreaterEqual(received, 297)
+
+            # the fifo holds N elements in the block ram and one in the output register
+            self.assertEqual(was_full, push_rate > pop_rate)
+
+            dut.push.value = Bit(0)
+            dut.pop.value = Bit(1)
+
+            for _ in range(12):
+                sim.tick("clk")
+
+                if dut.valid.value:
+                    self.assertEqual(dut.data_out.value.to_int(), expected.popleft())
+
+            self.assertEqual(len(expected), 0)
+            self.assertTrue(dut.empty.value)
+
+    def test_fifo_capacity(self):
+        sim = Simulator(FifoEntity)
+        dut = sim.dut
+
+        dut.reset.value = Bit(1)
+        sim.tick("clk")
+        dut.reset.value = Bit(0)
+        dut.push.value = Bit(1)
+
+        cnt = 0
+
+        while not dut.full.value:
+            sim.tick("clk")
+            cnt += 1
+
+        self.assertEqual(cnt, 9)
+
+    def test_vhdl(self):
+        vhdl = std.VhdlCompiler.to_string(FifoEntity)
+        # the memory and the read data register are not reset
+        reset_branches = [
+            part.split("else")[0] for part in vhdl.split("reset = '1';")[1:]
+        ]
+        self.assertNotEqual(len(reset_branches), 0)
+
+        for branch in reset_branches:
+            self.assertNotIn("mem", branch)
+            self.assertNotIn("rd_data", branch)
+
+        # the memory uses the same prefix as the read data register
+        self.assertIn("signal bram_fifo_ram_mem : array_type;", vhdl)
+        self.assertIn("signal bram_fifo_ram_rd_data : unsigned(7 downto 0);", vhdl)
+
+    def test_wrong_context(self):
+        class TwoWriters(cohdl.Entity):
+            clk = Port.input(Bit)
+            addr = Port.input(Unsigned[2])
+            data = Port.input(Unsigned[8])
+
+            def architecture(self):
+                ram = std.TrueDualPortRam[Unsigned[8], 4]()
+
+                @std.sequential(std.Clock(self.clk))
+                def proc_a():
+                    ram.port_a.write(self.addr, self.data)
+
+                @std.sequential(std.Clock(self.clk))
+                def proc_b():
+                    ram.port_b.write(self.addr, self.data)
+
+        self.assertRaisesRegex(
+            AssertionError,
+            "more than one sequential context",
+            std.VhdlCompiler.to_string,
+            TwoWriters,
+        )
@@ -0,0 +1,120 @@
+import binascii
+import unittest
+
+import cohdl
+from cohdl import Bit, BitVector, Unsigned, Port
+from cohdl import std
+from cohdl.sim import Simulator
+
+
+def crc_entity(width, partial, **crc_args):
+    class CrcEntity(cohdl.Entity):
+        clk = Port.input(Bit)
+        clear = Port.input(Bit)
+        valid = Port.input(Bit)
+        data = Port.input(BitVector[width])
+        count = Port.input(Unsigned[(width // 8).bit_length()])
+        result = Port.output(BitVector[len(crc_args["poly"])])
+
+        def architecture(self):
+            crc = std.crc.ParallelCrc(data_width=width, **crc_args)
+
+            # the byte count is only used for partial words
+            count = self.count if partial else None
+
+            @std.sequential(std.Clock(self.clk))
+            def proc():
+                if self.clear:
+                    crc.clear()
+                elif self.valid:
+                    crc.update(self.data, count)
+
+            @std.concurrent
+            def proc_out():
+                self.result <<= crc.result()
+
+    return CrcEntity
+
+
+CRC32 = dict(
+    poly=Unsigned[32](0x04C11DB7),
+    initial_value=Unsigned[32](0xFFFFFFFF),
+    reflect_input=True,
+    reflect_output=True,
+    final_xor=Unsigned[32](0xFFFFFFFF),
+)
+
+# CRC-16/CCITT-FALSE
+CRC16 = dict(poly=Unsigned[16](0x1021), initial_value=Unsigned[16](0xFFFF))
+
+
+def crc16_reference(msg: bytes):
+    state = 0xFFFF
+
+    for byte in msg:
+        for nr in reversed(range(8)):
+            feedback = ((state >> 15) ^ (byte >> nr)) & 1
+            state = ((state << 1) & 0xFFFF) ^ (0x1021 if feedback else 0)
+
+    return state
+
+
+MESSAGES = [b"123456789", b"a", b"ab", b"abc", bytes(range(37))]
+
+
+class ParallelCrcTester(unittest.TestCase):
+    def run_crc(self, sim, width, msg, byteorder, partial):
+        step = width // 8
+
+        sim.dut.clear.value = Bit(1)
+        sim.dut.valid.value = Bit(0)
+        sim.tick("clk")
+        sim.dut.clear.value = Bit(0)
+        sim.dut.valid.value = Bit(1)
+
+        for pos in range(0, len(msg), step):
+            chunk = msg[pos : pos + step]
+            word = chunk.ljust(step, b"\xaa")
+            sim.dut.data.value = Unsigned[width](int.from_bytes(word, byteorder))
+
+            if partial:
+                sim.dut.count.value = Unsigned[step.bit_length()](len(chunk))
+
+            sim.tick("clk")
+
+        sim.dut.valid.value = Bit(0)
+        return sim.dut.result.value.unsigned.to_int()
+
+    def test_crc32_bytes(self):
+        sim = Simulator(crc_entity(8, False, **CRC32))
+
+        for msg in MESSAGES:
+            self.assertEqual(
+                self.run_crc(sim, 8, msg, "little", False), binascii.crc32(msg)
+            )
+
+    def test_crc32_partial_words(self):
+        sim = Simulator(crc_entity(16, True, **CRC32))
+
+        for msg in MESSAGES:
+            self.assertEqual(
+                self.run_crc(sim, 16, msg, "little", True), binascii.crc32(msg)
+            )
+
+    def test_crc32_partial_wide_words(self):
+        sim = Simulator(crc_entity(64, True, **CRC32))
+
+        for msg in [*MESSAGES, *[bytes(range(n)) for n in range(8, 16)]]:
+            self.assertEqual(
+                self.run_crc(sim, 64, msg, "little", True), binascii.crc32(msg)
+            )
+
+    def test_crc16_partial_words(self):
+        sim = Simulator(crc_entity(16, True, **CRC16))
+
+        for msg in MESSAGES:
+            self.assertEqual(
+                self.run_crc(sim, 16, msg, "big", True), crc16_reference(msg)
+            )
+
+        self.assertEqual(crc16_reference(b"123456789"), 0x29B1)
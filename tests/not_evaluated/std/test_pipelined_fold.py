@@ -0,0 +1,162 @@
+import random
+import unittest
+
+import cohdl
+from cohdl import Bit, BitVector, Unsigned, Port
+from cohdl import std
+from cohdl.sim import Simulator
+
+COUNT = 19
+
+# latency of each output, set during elaboration
+LATENCY = {}
+
+
+def xor(a, b):
+    return a ^ b
+
+
+def low_bits(x):
+    return x.lsb(3).unsigned
+
+
+class PipelinedEntity(cohdl.Entity):
+    clk = Port.input(Bit)
+    vec = Port.input(BitVector[40])
+    values = Port.input(BitVector[4 * COUNT])
+
+    popcount = Port.output(Unsigned[8])
+    total = Port.output(Unsigned[10])
+    parity = Port.output(Bit)
+    argmin = Port.output(Unsigned[5])
+    argmax = Port.output(Unsigned[5])
+    minimum = Port.output(Unsigned[4])
+
+    def architecture(self):
+        ctx = std.SequentialContext(std.Clock(self.clk))
+        values = [self.values[4 * nr + 3 : 4 * nr].unsigned for nr in range(COUNT)]
+
+        popcount, LATENCY["popcount"] = std.pipelined_count_set_bits(
+            ctx, self.vec, name="popcount"
+        )
+        total, LATENCY["total"] = std.pipelined_sum(
+            ctx, values, batch_size=3, stages=2, name="total"
+        )
+        parity, LATENCY["parity"] = std.pipelined_fold(
+            ctx, xor, list(self.vec), levels_per_stage=2, name="parity"
+        )
+        argmin, LATENCY["argmin"] = std.pipelined_min_index(ctx, values, name="argmin")
+        argmax, LATENCY["argmax"] = std.pipelined_max_index(
+            ctx, values, batch_size=4, name="argmax"
+        )
+        (_, minimum), LATENCY["minimum"] = std.pipelined_min_element(
+            ctx, values, key=low_bits, stages=1, name="minimum"
+        )
+
+        @std.concurrent
+        def proc_out():
+            self.popcount <<= popcount
+            self.total <<= total
+            self.parity <<= parity
+            self.argmin <<= argmin
+            self.argmax <<= argmax
+            self.minimum <<= minimum
+
+
+def reference(vec, values):
+    keys = [v & 7 for v in values]
+    return {
+        "popcount": bin(vec).count("1"),
+        "total": sum(values),
+        "parity": bin(vec).count("1") % 2,
+        "argmin": values.index(min(values)),
+        "argmax": values.index(max(values)),
+        "minimum": values[keys.index(min(keys))],
+    }
+
+
+class PipelinedFoldTester(unittest.TestCase):
+    def test_latency(self):
+        sim = Simulator(PipelinedEntity)
+        latency = LATENCY
+
+        # 40 bits in batches of 6 bits -> 7 partial sums -> 3 levels
+        self.assertEqual(latency["popcount"], 3)
+        # 19 values with batch size 3 -> 3 levels in 2 stages
+        self.assertEqual(latency["total"], 2)
+        # 40 bits -> 6 levels with 2 levels per stage
+        self.assertEqual(latency["parity"], 3)
+        self.assertEqual(latency["argmin"], 5)
+        self.assertEqual(latency["argmax"], 3)
+        self.assertEqual(latency["minimum"], 1)
+
+        rng = random.Random(1)
+        history = []
+
+        for cycle in range(60):
+            vec = rng.getrandbits(40)
+            values = [rng.randrange(16) for _ in range(COUNT)]
+            history.append(reference(vec, values))
+
+            sim.dut.vec.value = Unsigned[40](vec).bitvector
+
+            packed = sum(value << (4 * nr) for nr, value in enumerate(values))
+            sim.dut.values.value = Unsigned[4 * COUNT](packed).bitvector
+
+            sim.tick("clk")
+
+            for name, delay in latency.items():
+                if cycle + 1 >= delay:
+                    expected = history[cycle + 1 - delay][name]
+                    actual = sim.dut[name].value
+                    actual = bool(actual) if name == "parity" else actual.to_int()
+                    self.assertEqual(actual, expected, f"{name} in cycle {cycle}")
+
+    def test_invalid_stages(self):
+        class InvalidEntity(cohdl.Entity):
+            clk = Port.input(Bit)
+            vec = Port.input(BitVector[8])
+
+            def architecture(self):
+                ctx = std.SequentialContext(std.Clock(self.clk))
+                std.pipelined_fold(ctx, xor, list(self.vec), stages=4)
+
+        self.assertRaisesRegex(
+            AssertionError,
+            "range \\[1, 3\\]",
+            std.VhdlCompiler.to_string,
+            InvalidEntity,
+        )
+
+    def test_stage_depth(self):
+        # each addition widens the result by one bit, so the width of
+        # the result register is the input width plus the longest
+        # chain of additions in the stage
+        depth = {}
+
+        def make_entity(batch_size, levels_per_stage):
+            class DepthEntity(cohdl.Entity):
+                clk = Port.input(Bit)
+                vec = Port.input(BitVector[batch_size**levels_per_stage])
+
+                def architecture(self):
+                    ctx = std.SequentialContext(std.Clock(self.clk))
+                    result, latency = std.pipelined_sum(
+                        ctx,
+                        [self.vec[nr:nr].unsigned for nr in range(len(self.vec))],
+                        batch_size=batch_size,
+                        levels_per_stage=levels_per_stage,
+                    )
+                    assert latency == 1
+                    depth[batch_size, levels_per_stage] = result.width - 1
+
+            return DepthEntity
+
+        for batch_size, levels_per_stage in [(2, 3), (3, 2), (4, 1), (4, 2)]:
+            std.VhdlCompiler.to_string(make_entity(batch_size, levels_per_stage))
+
+            # each tree level in the stage folds batches of batch_size
+            self.assertEqual(
+                depth[batch_size, levels_per_stage],
+                levels_per_stage * (batch_size - 1),
+            )
@@ -0,0 +1,104 @@
+import os
+import tempfile
+import unittest
+
+import cohdl
+from cohdl import Bit, BitVector, Port
+from cohdl import std
+
+from tests.cohdl_testutil import cocotb_util
+
+
+def constant_entity(value: str):
+    # entities with the same name and different content,
+    # like the variants of a parameterized test
+    class Variant(cohdl.Entity):
+        result = Port.output(BitVector[4])
+
+        def architecture(self):
+            @std.concurrent
+            def logic():
+                self.result <<= BitVector[4](value)
+
+    return Variant
+
+
+def read_sources(paths):
+    result = []
+
+    for path in paths:
+        with open(path) as file:
+            result.append(file.read())
+
+    return result
+
+
+class SyncBuildTester(unittest.TestCase):
+    def test_sync_build(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            build_dir = os.path.join(tmp, "build")
+
+            (first,) = cocotb_util._sync_build(constant_entity("0001"), build_dir)
+            self.assertEqual(first, os.path.join(build_dir, "Variant.vhd"))
+            mtime = os.stat(first).st_mtime_ns
+
+            # unchanged sources are not rewritten
+            os.utime(first, ns=(mtime - 10**9, mtime - 10**9))
+            cocotb_util._sync_build(constant_entity("0001"), build_dir)
+            self.assertEqual(os.stat(first).st_mtime_ns, mtime - 10**9)
+
+            # changed sources are replaced
+            cocotb_util._sync_build(constant_entity("0010"), build_dir)
+            self.assertIn('"0010"', read_sources([first])[0])
+
+            # sources of previous builds and staging directories are removed
+            stale = os.path.join(build_dir, "Stale.vhd")
+            open(stale, "w").close()
+            cocotb_util._sync_build(constant_entity("0010"), build_dir)
+            self.assertEqual(os.listdir(build_dir), ["Variant.vhd"])
+
+    def test_deferred(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            file = os.path.join(tmp, "test_variant.py")
+            cocotb_util._deferred_runs = runs = []
+
+            try:
+                for value in ["0001", "0010", "0100"]:
+                    cocotb_util.run_cocotb_tests(
+                        constant_entity(value),
+                        file,
+                        "tests.test_variant",
+                        extra_env={"value": value},
+                    )
+
+                cocotb_util.run_cocotb_tests(
+                    constant_entity("1000"),
+                    file,
+                    "tests.test_variant",
+                    no_build=True,
+                    build_files=["Variant.vhd"],
+                )
+            finally:
+                cocotb_util._deferred_runs = None
+
+            self.assertEqual(len(runs), 4)
+
+            # every run uses its own directories
+            sim_dirs = [run["sim_build"] for run in runs]
+            self.assertEqual(len(set(sim_dirs)), 4)
+            self.assertTrue(all(os.path.isdir(path) for path in sim_dirs))
+
+            build_dirs = [os.path.dirname(run["vhdl_sources"][0]) for run in runs]
+            self.assertEqual(len(set(build_dirs[:3])), 3)
+
+            # the sources of earlier runs are not overwritten by later runs
+            for run, value in zip(runs, ["0001", "0010", "0100"]):
+                self.assertEqual(run["extra_env"], {"value": value})
+                (content,) = read_sources(run["vhdl_sources"])
+                self.assertIn(f'"{value}"', content)
+
+            # runs without build use the shared build directory
+            self.assertEqual(
+                runs[3]["vhdl_sources"],
+                [os.path.join(tmp, "test_build", "Variant.vhd")],
+            )
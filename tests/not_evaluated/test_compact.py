@@ -0,0 +1,141 @@
+import unittest
+
+import cohdl
+from cohdl import Bit, BitVector, Unsigned, Port, Variable
+from cohdl import std
+
+
+class CompactEntity(cohdl.Entity):
+    clk = Port.input(Bit)
+
+    a = Port.input(Bit)
+    b = Port.input(Bit)
+    c = Port.input(Bit)
+    vec = Port.input(BitVector[8])
+    num = Port.input(Unsigned[8])
+
+    result_and = Port.output(Bit)
+    result_slice = Port.output(BitVector[4])
+    result_sum = Port.output(Unsigned[8])
+    result_read = Port.output(Bit)
+    result_seq = Port.output(Unsigned[8])
+
+    def architecture(self):
+        @std.concurrent
+        def logic():
+            self.result_and <<= (self.a & self.b) | self.c
+            self.result_slice <<= self.vec[3:0]
+            self.result_sum <<= self.num + self.vec.unsigned
+            self.result_read <<= self.a ^ self.b
+
+        @std.sequential(std.Clock(self.clk))
+        def proc():
+            # reads the output port, requires a buffer
+            if self.result_read:
+                self.result_seq <<= self.num + 1
+            else:
+                self.result_seq <<= self.result_seq - self.num[3:0].unsigned
+
+
+class VariableEntity(cohdl.Entity):
+    clk = Port.input(Bit)
+
+    a = Port.input(Bit)
+    b = Port.input(Bit)
+    c = Port.input(Bit)
+
+    result = Port.output(Bit)
+
+    def architecture(self):
+        v = Variable[Bit](False)
+
+        @std.sequential(std.Clock(self.clk))
+        def proc():
+            v.value = self.a
+            tmp = v ^ self.b
+            v.value = self.c
+            self.result <<= tmp | v
+
+
+class CaseEntity(cohdl.Entity):
+    clk = Port.input(Bit)
+
+    vec = Port.input(BitVector[8])
+    num = Port.input(Unsigned[8])
+
+    result_case = Port.output(BitVector[2])
+    result_select = Port.output(BitVector[2])
+
+    def architecture(self):
+        @std.sequential(std.Clock(self.clk))
+        def proc():
+            match self.vec[3:0]:
+                case "0000":
+                    self.result_case <<= "01"
+                case _:
+                    self.result_case <<= "10"
+
+            self.result_select <<= cohdl.select_with(
+                self.num[7:6],
+                {"00": BitVector[2]("11"), "01": BitVector[2]("01")},
+                default=BitVector[2]("00"),
+            )
+
+
+def declarations(vhdl: str):
+    return [
+        line.strip()
+        for line in vhdl.splitlines()
+        if line.strip().startswith(("signal ", "variable "))
+    ]
+
+
+class CompactTester(unittest.TestCase):
+    def test_default_unchanged(self):
+        vhdl = std.VhdlCompiler.to_string(CompactEntity)
+
+        self.assertIn("signal buffer_result_and : std_logic;", declarations(vhdl))
+        self.assertIn("-- CONCURRENT BLOCK (buffer assignment)", vhdl)
+        self.assertIn("std_logic_vector(vec(3 downto 0))", vhdl)
+
+    def test_compact(self):
+        default = std.VhdlCompiler.to_string(CompactEntity)
+        vhdl = std.VhdlCompiler.to_string(CompactEntity, compact=True)
+
+        self.assertLess(len(vhdl), len(default))
+        self.assertLess(len(declarations(vhdl)), len(declarations(default)))
+
+        # only ports read in the architecture are buffered
+        buffers = [decl for decl in declarations(vhdl) if "buffer_" in decl]
+        self.assertEqual(
+            buffers,
+            [
+                "signal buffer_result_read : std_logic;",
+                "signal buffer_result_seq : unsigned(7 downto 0);",
+            ],
+        )
+
+        # temporaries are inlined into the reading expression
+        self.assertIn("result_and <= ((a) and (b)) or (c);", vhdl)
+        # slices of vectors are not converted to their own type
+        self.assertIn("result_slice <= vec(3 downto 0);", vhdl)
+        # the unsigned slice is not converted to std_logic_vector and back
+        self.assertIn(
+            "buffer_result_seq <= (buffer_result_seq) - (num(3 downto 0));", vhdl
+        )
+
+    def test_variable_operands(self):
+        vhdl = std.VhdlCompiler.to_string(VariableEntity, compact=True)
+
+        # the variable changes between definition and use of
+        # the temporary, so it must not be inlined
+        self.assertIn("temp := (v) xor (b);", vhdl)
+        self.assertNotIn("buffer_result", vhdl)
+
+    def test_case_selector(self):
+        vhdl = std.VhdlCompiler.to_string(CaseEntity, compact=True)
+
+        # VHDL-93 requires a locally static subtype for case expressions,
+        # so slices keep their qualification in compact mode
+        self.assertIn("case std_logic_vector'(vec(3 downto 0)) is", vhdl)
+        self.assertIn("case unsigned'(num(7 downto 6)) is", vhdl)
@@ -0,0 +1,129 @@
+import unittest
+import tempfile
+import os
+
+import cohdl
+from cohdl import Bit, Unsigned, Port, Signal
+from cohdl import std
+
+
+def make_adder(name, width):
+    class Adder(cohdl.Entity, name=name):
+        clk = Port.input(Bit)
+        a = Port.input(Unsigned[width])
+        b = Port.input(Unsigned[width])
+        result = Port.output(Unsigned[width])
+
+        def architecture(self):
+            acc = Signal[Unsigned[width]](0)
+
+            @std.sequential(std.Clock(self.clk))
+            def proc():
+                acc.next = self.a + self.b
+                self.result <<= acc
+
+    return Adder
+
+
+AdderA = make_adder("AdderA", 8)
+AdderB = make_adder("AdderB", 8)
+AdderWide = make_adder("AdderWide", 16)
+
+
+class Wrapper(cohdl.Entity):
+    clk = Port.input(Bit)
+    a = Port.input(Unsigned[8])
+    b = Port.input(Unsigned[8])
+    result_a = Port.output(Unsigned[8])
+    result_b = Port.output(Unsigned[8])
+
+    def architecture(self):
+        AdderA(clk=self.clk, a=self.a, b=self.b, result=self.result_a)
+        AdderB(clk=self.clk, a=self.b, b=self.a, result=self.result_b)
+
+
+class WrapperA(cohdl.Entity):
+    clk = Port.input(Bit)
+    a = Port.input(Unsigned[8])
+    result = Port.output(Unsigned[8])
+
+    def architecture(self):
+        AdderA(clk=self.clk, a=self.a, b=self.a, result=self.result)
+
+
+class WrapperB(cohdl.Entity):
+    clk = Port.input(Bit)
+    a = Port.input(Unsigned[8])
+    result = Port.output(Unsigned[8])
+
+    def architecture(self):
+        AdderB(clk=self.clk, a=self.a, b=self.a, result=self.result)
+
+
+class Top(cohdl.Entity):
+    clk = Port.input(Bit)
+    a = Port.input(Unsigned[8])
+    b = Port.input(Unsigned[8])
+    wide = Port.input(Unsigned[16])
+    result_a = Port.output(Unsigned[8])
+    result_b = Port.output(Unsigned[8])
+    result_c = Port.output(Unsigned[8])
+    result_d = Port.output(Unsigned[8])
+    result_wide = Port.output(Unsigned[16])
+
+    def architecture(self):
+        Wrapper(
+            clk=self.clk,
+            a=self.a,
+            b=self.b,
+            result_a=self.result_a,
+            result_b=self.result_b,
+        )
+        WrapperA(clk=self.clk, a=self.a, result=self.result_c)
+        WrapperB(clk=self.clk, a=self.b, result=self.result_d)
+        AdderWide(
+            clk=self.clk,
+            a=self.wide,
+            b=self.wide,
+            result=self.result_wide,
+        )
+
+
+class DeduplicateTester(unittest.TestCase):
+    def write_dir(self, **kwargs):
+        with tempfile.TemporaryDirectory() as tmp:
+            files = std.VhdlCompiler.to_dir(Top, tmp, **kwargs)
+            return [os.path.basename(file) for file in files]
+
+    def test_default(self):
+        self.assertEqual(
+            self.write_dir(),
+            [
+                "AdderA.vhd",
+                "AdderB.vhd",
+                "Wrapper.vhd",
+                "WrapperA.vhd",
+                "WrapperB.vhd",
+                "AdderWide.vhd",
+                "Top.vhd",
+            ],
+        )
+
+    def test_deduplicate(self):
+        # AdderA/AdderB and consequently WrapperA/WrapperB are identical
+        self.assertEqual(
+            self.write_dir(deduplicate=True),
+            [
+                "AdderA.vhd",
+                "Wrapper.vhd",
+                "WrapperA.vhd",
+                "AdderWide.vhd",
+                "Top.vhd",
+            ],
+        )
+
+        vhdl = std.VhdlCompiler.to_string(Top, deduplicate=True)
+        self.assertNotIn("AdderB", vhdl)
+        self.assertNotIn("WrapperB", vhdl)
+        self.assertEqual(vhdl.count("entity work.AdderA"), 3)
+        self.assertEqual(vhdl.count("entity work.WrapperA"), 2)
@@ -0,0 +1,64 @@
+import unittest
+
+import cohdl
+from cohdl import Bit, BitVector, Unsigned, Port, Signal, Null
+from cohdl import std
+
+
+class CacheEntity(cohdl.Entity):
+    clk = Port.input(Bit)
+    reset = Port.input(Bit)
+
+    inp = Port.input(BitVector[8])
+    result = Port.output(BitVector[8], default=Null)
+
+    def architecture(self):
+        mem = Signal[std.Array[BitVector[8], 4]](Null)
+        cnt = Signal[Unsigned[2]](0)
+
+        @std.sequential(std.Clock(self.clk), std.Reset(self.reset))
+        def proc():
+            cnt.next = cnt + 1
+            mem[cnt] <<= self.inp
+
+            if self.inp[0]:
+                self.result <<= Null
+            elif self.inp[1]:
+                self.result <<= mem[0]
+            elif self.inp[2]:
+                self.result <<= mem[1]
+            else:
+                self.result <<= mem[cnt]
+
+
+class FormatCacheTester(unittest.TestCase):
+    def test_stats(self):
+        lib = std.VhdlCompiler.to_vhdl_library(CacheEntity)
+
+        stats = lib.format_cache_stats()
+        self.assertEqual(sum(stats.hits.values()), 0)
+        self.assertEqual(sum(stats.misses.values()), 0)
+
+        first = lib.write()
+        stats = lib.format_cache_stats()
+
+        # the type std_logic_vector(7 downto 0) is used multiple times
+        self.assertGreater(stats.hits["type"], 0)
+        self.assertGreater(stats.misses["ref"], 0)
+        self.assertGreater(stats.hit_rate(), 0)
+
+        # the second write is served entirely from the cache
+        misses = dict(stats.misses)
+        self.assertEqual(first, lib.write())
+        self.assertEqual(misses, lib.format_cache_stats().misses)
+
+    def test_stats_sum(self):
+        a = std.VhdlCompiler.to_vhdl_library(CacheEntity)
+        a.write()
+
+        stats = a.format_cache_stats()
+        doubled = stats + stats
+
+        for table in ("type", "literal", "ref"):
+            self.assertEqual(doubled.hits[table], 2 * stats.hits[table])
+            self.assertEqual(doubled.misses[table], 2 * stats.misses[table])
@@ -0,0 +1,124 @@
+import unittest
+
+import cohdl
+from cohdl import Bit, Unsigned, Port, Generic
+from cohdl import std
+
+
+class AddOffset(cohdl.Entity):
+    a = Port.input(Unsigned[8])
+    result = Port.output(Unsigned[8])
+
+    offset = Generic[Unsigned[8]](3)
+    enable = Generic[Bit](True)
+
+    def architecture(self):
+        @std.sequential
+        def proc():
+            if self.enable:
+                self.result <<= self.a + self.offset
+            else:
+                self.result <<= self.a
+
+
+class ForwardOffset(cohdl.Entity):
+    a = Port.input(Unsigned[8])
+    result = Port.output(Unsigned[8])
+
+    offset = Generic[Unsigned[8]](1)
+
+    def architecture(self):
+        AddOffset(a=self.a, result=self.result, offset=self.offset)
+
+
+class Top(cohdl.Entity):
+    a = Port.input(Unsigned[8])
+    r1 = Port.output(Unsigned[8])
+    r2 = Port.output(Unsigned[8])
+    r3 = Port.output(Unsigned[8])
+    r4 = Port.output(Unsigned[8])
+
+    def architecture(self):
+        AddOffset(a=self.a, result=self.r1)
+        AddOffset(a=self.a, result=self.r2, offset=5)
+        AddOffset(a=self.a, result=self.r3, offset=Unsigned[8](7), enable=False)
+        ForwardOffset(a=self.a, result=self.r4, offset=9)
+
+
+class WriteGeneric(cohdl.Entity):
+    result = Port.output(Unsigned[8])
+
+    value = Generic[Unsigned[8]](3)
+
+    def architecture(self):
+        @std.concurrent
+        def logic():
+            self.value <<= 1
+            self.result <<= self.value
+
+
+def lines(vhdl: str):
+    return [line.strip() for line in vhdl.splitlines()]
+
+
+class GenericTester(unittest.TestCase):
+    def test_generic(self):
+        vhdl = std.VhdlCompiler.to_string(Top)
+        text = lines(vhdl)
+
+        # the entity is only traced once
+        self.assertEqual(vhdl.count("entity AddOffset is"), 1)
+        self.assertIn('offset : unsigned(7 downto 0) := unsigned\'("00000011");', text)
+        self.assertIn("enable : std_logic := '1'", text)
+
+        # generics are referenced by name and not part of the sensitivity list
+        self.assertIn("proc: process(a)", text)
+        self.assertIn("temp := enable = '1';", text)
+        self.assertIn("temp1 := (a) + (offset);", text)
+        self.assertEqual(
+            [
+                line
+                for line in text
+                if line.startswith(("signal offset", "signal enable"))
+            ],
+            [],
+        )
+
+        # instantiations only map generics that are set explicitly
+        self.assertEqual(vhdl.count("generic map("), 4)
+        self.assertIn('offset => unsigned\'("00000101")', text)
+        self.assertIn('offset => unsigned\'("00000111"),', text)
+        self.assertIn("enable => '0'", text)
+        self.assertIn("offset => offset", text)
+        self.assertIn('offset : unsigned(7 downto 0) := unsigned\'("00000001")', text)
+
+    def test_write_generic(self):
+        with self.assertRaises(AssertionError):
+            std.VhdlCompiler.to_string(WriteGeneric)
+
+    def test_invalid_definition(self):
+        class Parent(cohdl.Entity):
+            a = Port.input(Unsigned[8])
+            result = Port.output(Unsigned[8])
+
+            def architecture(self):
+                # only constants and generics can be passed to generics
+                AddOffset(a=self.a, result=self.result, offset=self.a)
+
+        with self.assertRaises(AssertionError):
+            std.VhdlCompiler.to_string(Parent)
+
+    def test_width_mismatch(self):
+        class Parent(cohdl.Entity):
+            a = Port.input(Unsigned[8])
+            result = Port.output(Unsigned[8])
+
+            offset = Generic[Unsigned[4]](1)
+
+            def architecture(self):
+                # the type of a generic is fixed by its declaration,
+                # width generics are not supported
+                AddOffset(a=self.a, result=self.result, offset=self.offset)
+
+        with self.assertRaises(AssertionError):
+            std.VhdlCompiler.to_string(Parent)
@@ -0,0 +1,123 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import cohdl
+from cohdl import Bit, BitVector, Unsigned, Port
+from cohdl import std
+from cohdl._compiler.backend.vhdl import _vhdl_repr
+
+
+class OrEntity(cohdl.Entity):
+    a = Port.input(Bit)
+    b = Port.input(Bit)
+
+    result = Port.output(Bit)
+
+    def architecture(self):
+        @std.concurrent
+        def logic():
+            self.result <<= self.a | self.b
+
+
+class CounterEntity(cohdl.Entity):
+    clk = Port.input(Bit)
+    reset = Port.input(Bit)
+
+    result = Port.output(Unsigned[8], default=0)
+
+    def architecture(self):
+        @std.sequential(std.Clock(self.clk), std.Reset(self.reset))
+        def proc():
+            self.result <<= self.result + 1
+
+
+class NestedEntity(cohdl.Entity):
+    a = Port.input(Bit)
+    b = Port.input(Bit)
+
+    result = Port.output(Bit)
+
+    def architecture(self):
+        OrEntity(a=self.a, b=self.b, result=self.result)
+
+
+class TopEntity(cohdl.Entity):
+    clk = Port.input(Bit)
+    reset = Port.input(Bit)
+
+    a = Port.input(BitVector[4])
+    result_a = Port.output(Bit)
+    result_b = Port.output(Bit)
+    cnt = Port.output(Unsigned[8])
+
+    def architecture(self):
+        OrEntity(a=self.a[0], b=self.a[1], result=self.result_a)
+        NestedEntity(a=self.a[2], b=self.a[3], result=self.result_b)
+        CounterEntity(clk=self.clk, reset=self.reset, result=self.cnt)
+
+
+class ParallelWriteTester(unittest.TestCase):
+    def test_string(self):
+        lib = std.VhdlCompiler.to_vhdl_library(TopEntity)
+
+        serial = lib.write()
+
+        self.assertEqual(serial, lib.write(jobs=1))
+        self.assertEqual(serial, lib.write(jobs=2))
+        self.assertEqual(serial, lib.write(jobs=16))
+
+    def test_dir(self):
+        with tempfile.TemporaryDirectory() as serial_dir:
+            with tempfile.TemporaryDirectory() as parallel_dir:
+                serial_files = std.VhdlCompiler.to_dir(TopEntity, serial_dir)
+                parallel_files = std.VhdlCompiler.to_dir(
+                    TopEntity, parallel_dir, jobs=4
+                )
+
+                # file order is deterministic and independent of jobs
+                self.assertEqual(
+                    [os.path.basename(f) for f in serial_files],
+                    [os.path.basename(f) for f in parallel_files],
+                )
+                self.assertEqual(
+                    [os.path.basename(f) for f in serial_files],
+                    [
+                        "OrEntity.vhd",
+                        "NestedEntity.vhd",
+                        "CounterEntity.vhd",
+                        "TopEntity.vhd",
+                    ],
+                )
+
+                for serial_file, parallel_file in zip(serial_files, parallel_files):
+                    with open(serial_file) as a, open(parallel_file) as b:
+                        self.assertEqual(a.read(), b.read())
+
+    def test_stats(self):
+        # statistics of the worker processes are not lost
+        serial_lib = std.VhdlCompiler.to_vhdl_library(TopEntity)
+        parallel_lib = std.VhdlCompiler.to_vhdl_library(TopEntity)
+
+        self.assertEqual(serial_lib.write(), parallel_lib.write(jobs=4))
+
+        serial = serial_lib.format_cache_stats()
+        parallel = parallel_lib.format_cache_stats()
+        self.assertGreater(sum(parallel.misses.values()), 0)
+        self.assertEqual(serial.hits, parallel.hits)
+        self.assertEqual(serial.misses, parallel.misses)
+
+    def test_without_fork(self):
+        # platforms without fork write the entities sequentially
+        lib = std.VhdlCompiler.to_vhdl_library(TopEntity)
+        serial = lib.write()
+
+        with mock.patch.object(
+            _vhdl_repr.multiprocessing, "get_all_start_methods", return_value=["spawn"]
+        ), mock.patch.object(
+            _vhdl_repr.concurrent.futures, "ProcessPoolExecutor"
+        ) as executor:
+            self.assertEqual(serial, lib.write(jobs=4))
+
+        executor.assert_not_called()
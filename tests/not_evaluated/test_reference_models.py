@@ -0,0 +1,209 @@
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import cohdl
+from cohdl import Bit, Unsigned, Port
+from cohdl import std
+
+if np is not None:
+    from cohdl.sim import LaneSimulator
+    from tests.cohdl_testutil.reference_models import (
+        check,
+        simulate,
+        FifoModel,
+        StackModel,
+        DelayLineModel,
+        SyncFlagModel,
+        MailboxModel,
+    )
+
+COUNT = 4
+
+
+class FifoWrapper(cohdl.Entity):
+    clk = Port.input(Bit)
+    push = Port.input(Bit)
+    pop = Port.input(Bit)
+    data_in = Port.input(Unsigned[8])
+    data_out = Port.output(Unsigned[8], default=0)
+    empty = Port.output(Bit)
+    full = Port.output(Bit)
+
+    def architecture(self):
+        fifo = std.Fifo[Unsigned[8], COUNT]()
+
+        @std.concurrent
+        def proc_flags():
+            self.empty <<= fifo.empty()
+            self.full <<= fifo.full()
+
+        @std.sequential(std.Clock(self.clk))
+        def proc():
+            if self.pop and not fifo.empty():
+                self.data_out <<= fifo.pop()
+            if self.push and not fifo.full():
+                fifo.push(self.data_in)
+
+
+class StackWrapper(cohdl.Entity):
+    clk = Port.input(Bit)
+    push = Port.input(Bit)
+    pop = Port.input(Bit)
+    data_in = Port.input(Unsigned[8])
+    data_out = Port.output(Unsigned[8], default=0)
+    empty = Port.output(Bit)
+    full = Port.output(Bit)
+
+    drop_old = False
+
+    def architecture(self):
+        mode = std.StackMode.DROP_OLD if self.drop_old else std.StackMode.NO_OVERFLOW
+        stack = std.Stack[Unsigned[8], COUNT](mode=mode)
+
+        @std.concurrent
+        def proc_flags():
+            self.empty <<= stack.empty()
+            self.full <<= stack.full()
+
+        @std.sequential(std.Clock(self.clk))
+        def proc():
+            if self.pop and not stack.empty():
+                self.data_out <<= stack.pop()
+            elif self.push and (self.drop_old or not stack.full()):
+                stack.push(self.data_in)
+
+
+class DropOldStackWrapper(StackWrapper):
+    drop_old = True
+
+
+class DelayLineWrapper(cohdl.Entity):
+    clk = Port.input(Bit)
+    inp = Port.input(Unsigned[8])
+    data_out = Port.output(Unsigned[8])
+
+    def architecture(self):
+        ctx = std.SequentialContext(std.Clock(self.clk))
+        line = std.DelayLine(self.inp, 3, initial=Unsigned[8](0), ctx=ctx)
+
+        @std.concurrent
+        def proc():
+            self.data_out <<= line.last()
+
+
+class SyncFlagWrapper(cohdl.Entity):
+    clk = Port.input(Bit)
+    set_in = Port.input(Bit)
+    clear_in = Port.input(Bit)
+    is_set = Port.output(Bit)
+
+    def architecture(self):
+        flag = std.SyncFlag()
+
+        @std.concurrent
+        def proc_state():
+            self.is_set <<= flag.is_set()
+
+        @std.sequential(std.Clock(self.clk))
+        def proc_set():
+            if self.set_in:
+                flag.set()
+
+        @std.sequential(std.Clock(self.clk))
+        def proc_clear():
+            if self.clear_in:
+                flag.clear()
+
+
+class MailboxWrapper(cohdl.Entity):
+    clk = Port.input(Bit)
+    send = Port.input(Bit)
+    receive = Port.input(Bit)
+    data_in = Port.input(Unsigned[8])
+    data_out = Port.output(Unsigned[8], default=0)
+    is_set = Port.output(Bit)
+
+    def architecture(self):
+        mailbox = std.Mailbox[Unsigned[8]]()
+
+        @std.concurrent
+        def proc_state():
+            self.is_set <<= mailbox.is_set()
+
+        @std.sequential(std.Clock(self.clk))
+        def proc_send():
+            if self.send:
+                mailbox.send(self.data_in)
+
+        @std.sequential(std.Clock(self.clk))
+        def proc_receive():
+            if self.receive and mailbox.is_set():
+                self.data_out <<= mailbox.data()
+                mailbox.clear()
+
+
+@unittest.skipIf(np is None, "reference models require numpy")
+class ReferenceModelTester(unittest.TestCase):
+    lanes = 32
+    cycles = 64
+
+    def stimulus(self, seed, **high):
+        rng = np.random.default_rng(seed)
+        return {
+            name: rng.integers(0, limit, (self.cycles, self.lanes))
+            for name, limit in high.items()
+        }
+
+    def run_entity(self, entity, model, stimulus):
+        sim = LaneSimulator(entity, self.lanes)
+        expected = model.run(**stimulus)
+        actual = simulate(sim, stimulus, list(expected))
+        check(expected, actual)
+
+    def test_fifo(self):
+        stimulus = self.stimulus(1, push=2, pop=2, data_in=256)
+        self.run_entity(FifoWrapper, FifoModel(COUNT), stimulus)
+
+    def test_stack(self):
+        stimulus = self.stimulus(2, push=2, pop=2, data_in=256)
+        self.run_entity(StackWrapper, StackModel(COUNT), stimulus)
+
+    def test_stack_drop_old(self):
+        # pushes are more likely, so the stack overflows
+        stimulus = self.stimulus(3, push=2, pop=2, data_in=256)
+        stimulus["pop"] &= stimulus["data_in"] & 1
+        self.run_entity(DropOldStackWrapper, StackModel(COUNT, drop_old=True), stimulus)
+
+    def test_delay_line(self):
+        stimulus = self.stimulus(4, inp=256)
+        self.run_entity(DelayLineWrapper, DelayLineModel(3), stimulus)
+
+    def test_sync_flag(self):
+        stimulus = self.stimulus(5, set_in=2, clear_in=2)
+        self.run_entity(SyncFlagWrapper, SyncFlagModel(), stimulus)
+
+    def test_mailbox(self):
+        stimulus = self.stimulus(6, send=2, receive=2, data_in=256)
+        self.run_entity(MailboxWrapper, MailboxModel(), stimulus)
+
+    def test_check(self):
+        # single lane stimulus returns one dimensional results
+        result = DelayLineModel(2, initial=7).run(inp=np.arange(4))
+        self.assertEqual(list(result["data_out"]), [7, 0, 1, 2])
+
+        with self.assertRaisesRegex(AssertionError, "cycle 2"):
+            check(result, {"data_out": np.array([7, 0, 2, 2])})
+
+        with self.assertRaisesRegex(AssertionError, "cycle 1 lane 3"):
+            expected = {"x": np.zeros((4, 8), dtype=int)}
+            actual = {"x": np.zeros((4, 8), dtype=int)}
+            actual["x"][1, 3] = 1
+            check(expected, actual)
+
+
+if __name__ == "__main__":
+    unittest.main()
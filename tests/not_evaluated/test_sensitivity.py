@@ -0,0 +1,55 @@
+import unittest
+
+import cohdl
+from cohdl import Bit, Port, Signal
+from cohdl import std
+
+
+class SensitivityEntity(cohdl.Entity):
+    clk = Port.input(Bit)
+
+    c = Port.input(Bit)
+    a = Port.input(Bit)
+    b = Port.input(Bit)
+
+    comb_result = Port.output(Bit)
+    seq_result = Port.output(Bit)
+
+    def architecture(self):
+        x = Signal[Bit](False)
+
+        @std.sequential
+        def comb():
+            if self.c:
+                self.comb_result <<= self.a
+            else:
+                self.comb_result <<= self.b & x
+
+        @std.sequential(std.Clock(self.clk))
+        def seq():
+            x.next = self.a
+            self.seq_result <<= x
+
+
+def process_header(vhdl: str, name: str):
+    for line in vhdl.splitlines():
+        line = line.strip()
+        if line.startswith(f"{name}: process"):
+            return line
+    raise AssertionError(f"process {name} not found")
+
+
+class SensitivityTester(unittest.TestCase):
+    def test_sensitivity_list(self):
+        vhdl = std.VhdlCompiler.to_string(SensitivityEntity)
+
+        # signals are listed in order of their first read
+        self.assertEqual(process_header(vhdl, "comb"), "comb: process(c, a, b, x)")
+        self.assertEqual(process_header(vhdl, "seq"), "seq: process(clk)")
+
+    def test_process_all(self):
+        vhdl = std.VhdlCompiler.to_string(SensitivityEntity, process_all=True)
+
+        self.assertEqual(process_header(vhdl, "comb"), "comb: process(all)")
+        # explicit sensitivity lists are not affected
+        self.assertEqual(process_header(vhdl, "seq"), "seq: process(clk)")
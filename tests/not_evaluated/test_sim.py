@@ -0,0 +1,896 @@
+from __future__ import annotations
+
+import io
+import gzip
+import os
+import tempfile
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import cohdl
+from cohdl import (
+    Bit,
+    BitVector,
+    Unsigned,
+    Signed,
+    Port,
+    Signal,
+    Variable,
+    Generic,
+    Array,
+    Null,
+)
+from cohdl import std
+from cohdl.sim import Simulator, FunctionalModel, VcdWriter
+from cohdl._compiler.frontend import generate_internal_representation
+
+
+class Combinational(cohdl.Entity):
+    a = Port.input(Unsigned[8])
+    b = Port.input(Unsigned[8])
+    sa = Port.input(Signed[8])
+    sb = Port.input(Signed[8])
+
+    sum = Port.output(Unsigned[8])
+    diff = Port.output(Signed[8])
+    shifted = Port.output(Signed[8])
+    lower = Port.output(BitVector[4])
+    less = Port.output(Bit)
+    signed_less = Port.output(Bit)
+
+    def architecture(self):
+        @std.concurrent
+        def logic():
+            self.sum <<= self.a + self.b
+            self.diff <<= self.sa - self.sb
+            self.shifted <<= self.sa >> 2
+            self.lower <<= self.a.lsb(4)
+            self.less <<= self.a < self.b
+            self.signed_less <<= self.sa < self.sb
+
+
+class Counter(cohdl.Entity):
+    clk = Port.input(Bit)
+    reset = Port.input(Bit)
+    enable = Port.input(Bit)
+    count = Port.output(Unsigned[4], default=0)
+
+    def architecture(self):
+        @std.sequential(std.Clock(self.clk), std.Reset(self.reset))
+        def proc():
+            if self.enable:
+                self.count <<= self.count + 1
+
+
+class Handshake(cohdl.Entity):
+    clk = Port.input(Bit)
+    start = Port.input(Bit)
+    data = Port.input(Unsigned[8])
+    result = Port.output(Unsigned[8], default=0)
+    done = Port.output(Bit, default=False)
+
+    # optional std.Coverage collector for the statemachine
+    coverage = None
+
+    def architecture(self):
+        @std.sequential(std.Clock(self.clk), coverage=self.coverage)
+        async def proc():
+            self.done ^= False
+            await self.start
+            first = Signal[Unsigned[8]](name="first")
+            first <<= self.data
+            await std.wait_for(2)
+            self.result <<= first + self.data
+            self.done ^= True
+
+
+class Capture(cohdl.Entity):
+    clk = Port.input(Bit)
+    load = Port.input(Bit)
+    go = Port.input(Bit)
+    data = Port.input(Unsigned[8])
+    result = Port.output(Unsigned[8], default=0)
+
+    def architecture(self):
+        @std.sequential(std.Clock(self.clk))
+        async def proc():
+            loaded = Variable[Bit](False)
+
+            while True:
+                # captured is assigned in a previous clock cycle
+                # and has to keep its value until it is used
+                if ~loaded:
+                    captured = Signal(self.data, maybe_uninitialized=True)
+
+                loaded @= loaded | self.load
+
+                if self.go:
+                    break
+
+            self.result <<= captured
+
+
+class Memory(cohdl.Entity):
+    clk = Port.input(Bit)
+    wr = Port.input(Bit)
+    addr = Port.input(Unsigned[2])
+    wdata = Port.input(Unsigned[8])
+    rdata = Port.output(Unsigned[8])
+
+    def architecture(self):
+        mem = Signal[Array[Unsigned[8], 4]](name="mem")
+
+        @std.sequential(std.Clock(self.clk))
+        def proc_write():
+            if self.wr:
+                mem[self.addr] <<= self.wdata
+
+        @std.concurrent
+        def logic():
+            self.rdata <<= mem[self.addr]
+
+
+class AddOffset(cohdl.Entity):
+    a = Port.input(Unsigned[4])
+    result = Port.output(Unsigned[4])
+
+    offset = Generic[Unsigned[4]](1)
+
+    def architecture(self):
+        @std.concurrent
+        def logic():
+            self.result <<= self.a + self.offset
+
+
+class Hierarchy(cohdl.Entity):
+    a = Port.input(Unsigned[8])
+    low = Port.output(Unsigned[4])
+    high = Port.output(Unsigned[4])
+
+    def architecture(self):
+        AddOffset(a=self.a[3:0], result=self.low)
+        AddOffset(a=self.a[7:4], result=self.high, offset=Unsigned[4](2))
+
+
+class Wide(cohdl.Entity):
+    a = Port.input(Unsigned[100])
+    b = Port.input(Unsigned[100])
+    sum = Port.output(Unsigned[100])
+    upper = Port.output(Unsigned[32])
+
+    def architecture(self):
+        @std.concurrent
+        def logic():
+            self.sum <<= self.a + self.b
+            self.upper <<= self.a.msb(32)
+
+
+class Oscillator(cohdl.Entity):
+    a = Port.input(Bit)
+    b = Port.output(Bit)
+
+    def architecture(self):
+        inner = Signal[Bit](False, name="inner")
+
+        @std.concurrent
+        def logic():
+            inner.next = ~inner if self.a else inner
+            self.b <<= inner
+
+
+class SpiTransfer(cohdl.Entity):
+    clk = Port.input(Bit)
+    reset = Port.input(Bit)
+    start = Port.input(Bit)
+    data = Port.input(BitVector[8])
+    miso = Port.input(Bit)
+    sclk = Port.output(Bit)
+    mosi = Port.output(Bit)
+    cs = Port.output(Bit)
+    result = Port.output(BitVector[8], default=cohdl.Null)
+    done = Port.output(Bit, default=False)
+
+    def architecture(self):
+        ctx = std.SequentialContext(std.Clock(self.clk), std.Reset(self.reset))
+        spi = std.spi.SpiMaster(
+            ctx, std.spi.Spi(self.sclk, self.mosi, self.miso, self.cs), clk_period=4
+        )
+
+        @ctx
+        async def proc():
+            self.done ^= False
+            await self.start
+            self.result <<= await spi.transaction(
+                self.data, receive_len=8, receive_offset=-8
+            )
+            self.done ^= True
+
+
+class Pair(std.Record):
+    low: Unsigned[4]
+    high: Unsigned[4]
+
+
+class StdComponents(cohdl.Entity):
+    clk = Port.input(Bit)
+    reset = Port.input(Bit)
+    data = Port.input(Unsigned[8])
+    push = Port.input(Bit)
+    pop = Port.input(Bit)
+
+    delayed = Port.output(Unsigned[8], default=0)
+    set_bits = Port.output(Unsigned[4], default=0)
+    selected = Port.output(Unsigned[8], default=0)
+    swapped = Port.output(BitVector[8], default=Null)
+    front = Port.output(BitVector[8])
+    empty = Port.output(Bit)
+    full = Port.output(Bit)
+    popped = Port.output(BitVector[8], default=Null)
+
+    def architecture(self):
+        ctx = std.SequentialContext(std.Clock(self.clk), std.Reset(self.reset))
+        fifo = std.Fifo[BitVector[8], 4]()
+
+        @std.concurrent
+        def logic():
+            self.set_bits <<= std.count_set_bits(self.data)
+            self.selected <<= std.select[Unsigned[8]](
+                self.data.lsb(2).unsigned,
+                {0: self.data, 1: self.data + 1, 2: self.data - 1},
+                default=Unsigned[8](0),
+            )
+            self.front <<= fifo.front()
+            self.empty <<= fifo.empty()
+            self.full <<= fifo.full()
+
+        @std.concurrent
+        def dynamic():
+            # the port is added at elaboration time
+            parity = std.as_pyeval(Port.output, Bit, name="parity")
+            std.add_entity_port(self, parity)
+            parity <<= std.count_set_bits(self.data).lsb()
+
+        @ctx
+        def proc():
+            self.delayed <<= std.delayed(self.data, 2)
+
+            pair = std.from_bits[Pair](self.data.bitvector)
+            self.swapped <<= std.to_bits(Pair(low=pair.high, high=pair.low))
+
+        @ctx
+        def data_receiver():
+            if self.push:
+                fifo.push(self.data.bitvector)
+
+        @ctx
+        def data_transmitter():
+            if self.pop:
+                self.popped <<= fifo.pop()
+
+
+class SimTester(unittest.TestCase):
+    compiled = False
+
+    def simulator(self, entity, **kwargs):
+        return Simulator(entity, compiled=self.compiled, **kwargs)
+
+    def test_combinational(self):
+        sim = self.simulator(Combinational)
+        dut = sim.dut
+
+        for a, b in [(1, 2), (200, 100), (255, 255)]:
+            dut.a.value = Unsigned[8](a)
+            dut.b.value = Unsigned[8](b)
+            self.assertEqual(dut.sum.value, (a + b) % 256)
+            self.assertEqual(dut.lower.value.unsigned, a & 0xF)
+            self.assertEqual(dut.less.value, Bit(a < b))
+
+        for a, b in [(1, 2), (-100, 100), (-128, 127), (-3, -4)]:
+            dut.sa.value = Signed[8](a)
+            dut.sb.value = Signed[8](b)
+            self.assertEqual(dut.diff.value, Signed[8]((a - b + 128) % 256 - 128))
+            self.assertEqual(dut.shifted.value, a >> 2)
+            self.assertEqual(dut.signed_less.value, Bit(a < b))
+
+    def test_counter(self):
+        sim = self.simulator(Counter)
+        dut = sim.dut
+
+        dut.enable.value = Bit(1)
+        sim.tick(dut.clk, 3)
+        self.assertEqual(dut.count.value, 3)
+
+        dut.enable.value = Bit(0)
+        sim.tick("clk", 5)
+        self.assertEqual(dut.count.value, 3)
+
+        dut.enable.value = Bit(1)
+        sim.tick("clk", 14)
+        self.assertEqual(dut.count.value, 1)
+
+        dut.reset.value = Bit(1)
+        sim.tick("clk")
+        self.assertEqual(dut.count.value, 0)
+
+    def test_statemachine(self):
+        sim = self.simulator(Handshake)
+        dut = sim.dut
+
+        sim.tick("clk", 3)
+        self.assertEqual(dut.done.value, Bit(0))
+
+        dut.start.value = Bit(1)
+        dut.data.value = Unsigned[8](10)
+        sim.tick("clk")
+        dut.start.value = Bit(0)
+        dut.data.value = Unsigned[8](5)
+        self.assertEqual(sim.signal("Handshake.first").value, 10)
+
+        sim.tick("clk")
+        self.assertEqual(dut.done.value, Bit(0))
+        sim.tick("clk")
+        self.assertEqual(dut.done.value, Bit(1))
+        self.assertEqual(dut.result.value, 15)
+
+        sim.tick("clk")
+        self.assertEqual(dut.done.value, Bit(0))
+
+    def test_temporary(self):
+        sim = self.simulator(Capture)
+        dut = sim.dut
+
+        sim.tick("clk")
+        dut.data.value = Unsigned[8](5)
+        dut.load.value = Bit(1)
+        sim.tick("clk")
+        dut.data.value = Unsigned[8](9)
+        dut.load.value = Bit(0)
+        sim.tick("clk")
+        dut.go.value = Bit(1)
+        sim.tick("clk")
+        self.assertEqual(dut.result.value, 5)
+
+    def test_array(self):
+        sim = self.simulator(Memory)
+        dut = sim.dut
+
+        dut.wr.value = Bit(1)
+
+        for addr in range(4):
+            dut.addr.value = Unsigned[2](addr)
+            dut.wdata.value = Unsigned[8](addr * 10 + 1)
+            sim.tick("clk")
+
+        dut.wr.value = Bit(0)
+
+        for addr in range(4):
+            dut.addr.value = Unsigned[2](addr)
+            self.assertEqual(dut.rdata.value, addr * 10 + 1)
+
+    def test_hierarchy(self):
+        sim = self.simulator(Hierarchy)
+        dut = sim.dut
+
+        dut.a.value = Unsigned[8](0x35)
+        self.assertEqual(dut.low.value, 0x6)
+        self.assertEqual(dut.high.value, 0x5)
+
+        dut.a.value = Unsigned[8](0xFF)
+        self.assertEqual(dut.low.value, 0x0)
+        self.assertEqual(dut.high.value, 0x1)
+
+        names = [signal.name for signal in sim.signals()]
+        self.assertEqual(names, ["Hierarchy.a", "Hierarchy.low", "Hierarchy.high"])
+
+    def test_settle_limit(self):
+        sim = self.simulator(Oscillator, max_deltas=100)
+        sim.dut.a.value = Bit(1)
+        self.assertRaises(AssertionError, sim.settle)
+
+    def test_snapshot(self):
+        template = generate_internal_representation(Handshake)
+        sim = self.simulator(template)
+        dut = sim.dut
+
+        sim.tick("clk")
+        dut.start.value = Bit(1)
+        dut.data.value = Unsigned[8](10)
+        sim.tick("clk")
+        dut.start.value = Bit(0)
+
+        # the statemachine waits for the second operand
+        # and the pending data input is part of the snapshot
+        dut.data.value = Unsigned[8](5)
+        snapshot = sim.snapshot()
+
+        sim.tick("clk", 2)
+        self.assertEqual(dut.done.value, Bit(1))
+        self.assertEqual(dut.result.value, 15)
+
+        sim.restore(snapshot)
+        self.assertEqual(dut.done.value, Bit(0))
+        dut.data.value = Unsigned[8](7)
+        sim.tick("clk", 2)
+        self.assertEqual(dut.done.value, Bit(1))
+        self.assertEqual(dut.result.value, 17)
+
+        # snapshots can be restored in other simulators of the same IR
+        other = self.simulator(template)
+        other.restore(snapshot)
+        other.tick("clk", 2)
+        self.assertEqual(other.dut.result.value, 15)
+
+        self.assertRaises(AssertionError, self.simulator(Handshake).restore, snapshot)
+
+    def test_snapshot_array(self):
+        sim = self.simulator(Memory)
+        dut = sim.dut
+
+        dut.wr.value = Bit(1)
+        dut.wdata.value = Unsigned[8](3)
+        sim.tick("clk")
+        snapshot = sim.snapshot()
+
+        dut.wdata.value = Unsigned[8](9)
+        sim.tick("clk")
+        self.assertEqual(dut.rdata.value, 9)
+
+        sim.restore(snapshot)
+        self.assertEqual(dut.rdata.value, 3)
+
+    def test_statemachine_coverage(self):
+        collector = std.Coverage()
+
+        class CoveredHandshake(Handshake):
+            coverage = collector
+
+        template = generate_internal_representation(CoveredHandshake)
+
+        (coverage,) = collector.statemachines
+
+        self.assertEqual(
+            [point.name for point in coverage.transitions],
+            [
+                "state_0 -> state_1",
+                "state_1 -> state_2",
+                "state_2 -> state_2",
+                "state_2 -> state_0",
+            ],
+        )
+        self.assertEqual(std.Coverage.location(coverage.states[1]).file, __file__)
+
+        sim = self.simulator(template)
+        dut = sim.dut
+
+        sim.tick("clk", 3)
+        self.assertEqual(sim.signal("CoveredHandshake.s_proc_cov_0").value, 1)
+        self.assertEqual(sim.signal("CoveredHandshake.s_proc_cov_1").value, 2)
+        self.assertEqual(sim.signal("CoveredHandshake.s_proc_cov_0_to_1").value, 1)
+
+        dut.start.value = Bit(1)
+        sim.tick("clk", 2)
+
+        report = collector.report(
+            lambda counter: sim.signal(
+                f"CoveredHandshake.{counter.name()}"
+            ).value.to_int(),
+        )
+        lines = report.splitlines()
+        self.assertEqual(lines[0], "s_proc:")
+        self.assertTrue(lines[-1].startswith("6/7 "))
+        self.assertIn("! state_2 -> state_0", report)
+
+        # the simulator reads the counters directly
+        self.assertEqual(sim.coverage_report(collector), report)
+
+        # designs compiled without a collector are not instrumented
+        self.assertEqual(
+            std.Coverage().report(lambda counter: None),
+            "0/0 states and transitions covered",
+        )
+        self.assertFalse(
+            any(
+                "_cov_" in slot.name()
+                for slot in self.simulator(Handshake)._slots
+            )
+        )
+
+    def test_statemachine_coverage_vhdl(self):
+        collector = std.Coverage()
+
+        class CoveredHandshake(Handshake):
+            coverage = collector
+
+        vhdl = std.VhdlCompiler.to_string(CoveredHandshake)
+
+        # the counters are hidden from synthesis tools
+        self.assertIn("-- pragma translate_off", vhdl)
+        self.assertIn("-- pragma translate_on", vhdl)
+        self.assertNotIn("translate_off", std.VhdlCompiler.to_string(Handshake))
+
+
+class CompiledSimTester(SimTester):
+    compiled = True
+
+
+class VcdWriterTester(unittest.TestCase):
+    def trace(self, entity, cycles, **kwargs):
+        sim = Simulator(entity)
+        out = io.StringIO()
+        writer = VcdWriter(out, **kwargs)
+        writer.probe_simulator(sim)
+
+        sim.dut.enable.value = Bit(1)
+
+        for time in range(cycles):
+            sim.tick("clk")
+            writer.sample(time)
+
+        writer.close()
+        return out.getvalue()
+
+    def test_header(self):
+        text = self.trace(Counter, 4)
+        header, body = text.split("$enddefinitions $end\n")
+
+        self.assertIn("$scope module Counter $end", header)
+        self.assertIn("$var wire 4 ", header)
+        self.assertIn(" count $end", header)
+        self.assertTrue(body.startswith("#0\n$dumpvars\n"))
+
+    def test_changes(self):
+        text = self.trace(Counter, 20, include="*.count")
+        lines = text.split("$enddefinitions $end\n")[1].splitlines()
+        values = [line.split()[0] for line in lines if line.startswith("b")]
+
+        # only the counter is traced and each value is written once
+        self.assertEqual(values, [f"b{nr % 16:04b}" for nr in range(1, 21)])
+
+    def test_window(self):
+        text = self.trace(Counter, 20, include="*.count", start=5, stop=8)
+        body = text.split("$enddefinitions $end\n")[1]
+
+        self.assertEqual(
+            body,
+            "#5\n$dumpvars\nb0110 !\n$end\n#6\nb0111 !\n#7\nb1000 !\n#8\nb1001 !\n",
+        )
+
+    def test_exclude(self):
+        text = self.trace(Counter, 2, exclude=["*.clk", "*.reset"])
+
+        self.assertNotIn(" clk $end", text)
+        self.assertNotIn(" reset $end", text)
+        self.assertIn(" enable $end", text)
+
+    def test_array(self):
+        sim = Simulator(Memory)
+        out = io.StringIO()
+        writer = VcdWriter(out, include="*.mem*")
+        writer.probe_simulator(sim)
+        writer.sample(0)
+
+        sim.dut.wr.value = Bit(1)
+        sim.dut.addr.value = Unsigned[2](2)
+        sim.dut.wdata.value = Unsigned[8](7)
+        sim.tick("clk")
+        writer.sample(1)
+        writer.close()
+
+        text = out.getvalue()
+
+        for nr in range(4):
+            self.assertIn(f" mem[{nr}] $end", text)
+        self.assertTrue(text.endswith("#1\nb00000111 #\n"))
+
+    def test_compressed(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "trace.vcd.gz")
+
+            with VcdWriter(path) as writer:
+                writer.probe("top.value", Unsigned[4], lambda: 3)
+                writer.sample(0)
+
+            with gzip.open(path, "rt") as file:
+                text = file.read()
+
+        self.assertIn("$scope module top $end", text)
+        self.assertIn("b0011 !", text)
+
+
+class FunctionalModelTester(unittest.TestCase):
+    def test_combinational(self):
+        model = FunctionalModel(Combinational)
+        dut = model.dut
+
+        for a, b in [(1, 2), (200, 100), (255, 255)]:
+            dut.a.value = Unsigned[8](a)
+            dut.b.value = Unsigned[8](b)
+            self.assertEqual(dut.sum.value, (a + b) % 256)
+            self.assertEqual(dut.lower.value.unsigned, a & 0xF)
+            self.assertEqual(dut.less.value, Bit(a < b))
+
+        for a, b in [(1, 2), (-100, 100), (-128, 127), (-3, -4)]:
+            dut.sa.value = Signed[8](a)
+            dut.sb.value = Signed[8](b)
+            self.assertEqual(dut.diff.value, Signed[8]((a - b + 128) % 256 - 128))
+            self.assertEqual(dut.shifted.value, a >> 2)
+
+    def test_counter(self):
+        model = FunctionalModel(Counter)
+        dut = model.dut
+
+        dut.enable.value = Bit(1)
+        model.tick(dut.clk, 3)
+        self.assertEqual(dut.count.value, 3)
+
+        dut.enable.value = Bit(0)
+        model.tick("clk", 5)
+        self.assertEqual(dut.count.value, 3)
+
+        dut.reset.value = Bit(1)
+        model.tick("clk")
+        self.assertEqual(dut.count.value, 0)
+
+    def test_statemachine(self):
+        model = FunctionalModel(Handshake)
+        dut = model.dut
+
+        model.tick("clk", 3)
+        self.assertEqual(dut.done.value, Bit(0))
+
+        dut.start.value = Bit(1)
+        dut.data.value = Unsigned[8](10)
+        model.tick("clk")
+        dut.start.value = Bit(0)
+        dut.data.value = Unsigned[8](5)
+
+        model.tick("clk", 2)
+        self.assertEqual(dut.done.value, Bit(1))
+        self.assertEqual(dut.result.value, 15)
+
+        model.tick("clk")
+        self.assertEqual(dut.done.value, Bit(0))
+
+    def test_temporary(self):
+        model = FunctionalModel(Capture)
+        dut = model.dut
+
+        model.tick("clk")
+        dut.data.value = Unsigned[8](5)
+        dut.load.value = Bit(1)
+        model.tick("clk")
+        dut.data.value = Unsigned[8](9)
+        dut.load.value = Bit(0)
+        model.tick("clk")
+        dut.go.value = Bit(1)
+        model.tick("clk")
+        self.assertEqual(dut.result.value, 5)
+
+    def test_array(self):
+        model = FunctionalModel(Memory)
+        dut = model.dut
+
+        dut.wr.value = Bit(1)
+
+        for addr in range(4):
+            dut.addr.value = Unsigned[2](addr)
+            dut.wdata.value = Unsigned[8](addr * 10 + 1)
+            model.tick("clk")
+
+        dut.wr.value = Bit(0)
+
+        for addr in range(4):
+            dut.addr.value = Unsigned[2](addr)
+            self.assertEqual(dut.rdata.value, addr * 10 + 1)
+
+    def test_concurrent_models(self):
+        # each model works on its own copy of the entity ports
+        m1 = FunctionalModel(Counter)
+        m2 = FunctionalModel(Counter)
+        count = str(Counter.count._value)
+
+        m1.dut.enable.value = Bit(1)
+        m1.tick("clk", 3)
+        self.assertEqual(m1.dut.count.value, 3)
+        self.assertEqual(m2.dut.count.value, 0)
+        self.assertEqual(str(Counter.count._value), count)
+
+        m2.dut.enable.value = Bit(1)
+        m2.tick("clk")
+        self.assertEqual(m1.dut.count.value, 3)
+        self.assertEqual(m2.dut.count.value, 1)
+
+    def test_std_components(self):
+        # std components produce the same port values as in the simulator
+        sim = Simulator(StdComponents)
+        model = FunctionalModel(StdComponents)
+        inputs = {"reset": 0, "data": 0, "push": 0, "pop": 0}
+
+        for cycle in range(100):
+            inputs["reset"] = int(cycle == 60)
+            inputs["data"] = (cycle * 73) % 256
+            inputs["push"] = int(cycle % 3 != 0 and not sim.dut.full.value)
+            inputs["pop"] = int(cycle % 4 == 1 and not sim.dut.empty.value)
+
+            for name, value in inputs.items():
+                sim.dut[name].value = value
+                model.dut[name].value = value
+
+            sim.tick("clk")
+            model.tick("clk")
+
+            for name in (
+                "delayed",
+                "set_bits",
+                "selected",
+                "swapped",
+                "front",
+                "empty",
+                "full",
+                "popped",
+                "parity",
+            ):
+                self.assertEqual(
+                    str(model.dut[name].value), str(sim.dut[name].value), name
+                )
+
+    def test_instances(self):
+        # only one instance per entity type is supported
+        self.assertRaises(AssertionError, FunctionalModel, Hierarchy)
+
+    def test_protocol(self):
+        # the model runs the SPI coroutines of the standard library
+        # and produces the same port values as the simulator
+        sim = Simulator(SpiTransfer)
+        model = FunctionalModel(SpiTransfer)
+        inputs = {"reset": 0, "start": 0, "data": 0, "miso": 0}
+
+        for cycle in range(200):
+            inputs["reset"] = int(cycle % 97 == 50)
+            inputs["start"] = int(cycle % 23 == 0)
+            inputs["data"] = (cycle * 37) % 256
+            inputs["miso"] = (cycle // 3) % 2
+
+            for name, value in inputs.items():
+                sim.dut[name].value = value
+                model.dut[name].value = value
+
+            sim.tick("clk")
+            model.tick("clk")
+
+            for name in ("sclk", "mosi", "cs", "result", "done"):
+                self.assertEqual(str(model.dut[name].value), str(sim.dut[name].value))
+
+
+@unittest.skipIf(np is None, "lane simulation requires numpy")
+class LaneSimTester(unittest.TestCase):
+    lanes = 16
+
+    def simulator(self, entity):
+        from cohdl.sim import LaneSimulator
+
+        return LaneSimulator(entity, self.lanes)
+
+    def test_combinational(self):
+        sim = self.simulator(Combinational)
+        dut = sim.dut
+        rng = np.random.default_rng(1)
+
+        a = rng.integers(0, 256, self.lanes)
+        b = rng.integers(0, 256, self.lanes)
+        sa = rng.integers(-128, 128, self.lanes)
+        sb = rng.integers(-128, 128, self.lanes)
+
+        dut.a.value = a
+        dut.b.value = b
+        dut.sa.value = sa
+        dut.sb.value = sb
+
+        self.assertEqual(len(dut.sum.mismatches((a + b) % 256)), 0)
+        self.assertEqual(len(dut.lower.mismatches(a & 0xF)), 0)
+        self.assertEqual(len(dut.less.mismatches(a < b)), 0)
+        self.assertEqual(len(dut.diff.mismatches((sa - sb + 128) % 256 - 128)), 0)
+        self.assertEqual(len(dut.shifted.mismatches(sa >> 2)), 0)
+        self.assertEqual(len(dut.signed_less.mismatches(sa < sb)), 0)
+
+        # scalars are assigned to all lanes
+        dut.a.value = Unsigned[8](3)
+        self.assertEqual(len(dut.sum.mismatches((3 + b) % 256)), 0)
+
+    def test_counter(self):
+        sim = self.simulator(Counter)
+        dut = sim.dut
+        rng = np.random.default_rng(2)
+        expected = np.zeros(self.lanes, dtype=int)
+
+        for _ in range(40):
+            enable = rng.integers(0, 2, self.lanes)
+            reset = rng.integers(0, 8, self.lanes) == 0
+            dut.enable.value = enable
+            dut.reset.value = reset
+            sim.tick("clk")
+            expected = np.where(reset, 0, (expected + enable) % 16)
+
+            self.assertEqual(len(dut.count.mismatches(expected)), 0)
+
+    def test_statemachine(self):
+        sim = self.simulator(Handshake)
+        dut = sim.dut
+
+        sim.tick("clk")
+
+        # lane n starts the handshake in cycle n
+        for cycle in range(self.lanes + 4):
+            dut.start.value = np.arange(self.lanes) == cycle
+            dut.data.value = np.full(self.lanes, cycle)
+            sim.tick("clk")
+
+            done = np.arange(self.lanes) == cycle - 2
+            self.assertEqual(len(dut.done.mismatches(done)), 0)
+
+            if 2 <= cycle < self.lanes + 2:
+                result = dut.result.value[cycle - 2]
+                self.assertEqual(result, 2 * cycle - 2)
+
+    def test_array(self):
+        sim = self.simulator(Memory)
+        dut = sim.dut
+        rng = np.random.default_rng(3)
+        expected = np.zeros((self.lanes, 4), dtype=int)
+        lanes = np.arange(self.lanes)
+
+        for _ in range(20):
+            wr = rng.integers(0, 2, self.lanes)
+            addr = rng.integers(0, 4, self.lanes)
+            wdata = rng.integers(0, 256, self.lanes)
+
+            dut.wr.value = wr
+            dut.addr.value = addr
+            dut.wdata.value = wdata
+            self.assertEqual(len(dut.rdata.mismatches(expected[lanes, addr])), 0)
+
+            sim.tick("clk")
+            expected[lanes, addr] = np.where(wr, wdata, expected[lanes, addr])
+
+    def test_hierarchy(self):
+        sim = self.simulator(Hierarchy)
+        dut = sim.dut
+
+        dut.a.value = [0x35, 0xFF] * (self.lanes // 2)
+        self.assertEqual(list(dut.low.value[:2]), [0x6, 0x0])
+        self.assertEqual(list(dut.high.value[:2]), [0x5, 0x1])
+
+    def test_wide(self):
+        sim = self.simulator(Wide)
+        dut = sim.dut
+        rng = np.random.default_rng(4)
+
+        a = [
+            int(x) << 40 | int(y) for x, y in rng.integers(0, 1 << 60, (self.lanes, 2))
+        ]
+        b = [int(x) for x in rng.integers(0, 1 << 60, self.lanes)]
+
+        dut.a.value = a
+        dut.b.value = b
+
+        for lane in range(self.lanes):
+            self.assertEqual(dut.sum.value[lane], (a[lane] + b[lane]) % (1 << 100))
+            self.assertEqual(dut.upper.value[lane], a[lane] >> 68)
+
+    def test_snapshot(self):
+        sim = self.simulator(Counter)
+        dut = sim.dut
+
+        dut.enable.value = np.arange(self.lanes) % 2
+        sim.tick("clk", 3)
+        snapshot = sim.snapshot()
+
+        sim.tick("clk", 2)
+        self.assertEqual(len(dut.count.mismatches((np.arange(self.lanes) % 2) * 5)), 0)
+
+        sim.restore(snapshot)
+        self.assertEqual(len(dut.count.mismatches((np.arange(self.lanes) % 2) * 3)), 0)
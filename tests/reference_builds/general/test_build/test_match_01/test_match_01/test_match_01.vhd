@@ -0,0 +1,74 @@
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+
+
+entity test_match_01 is
+  port (
+    clk : in std_logic;
+    sw : in std_logic_vector(3 downto 0);
+    out_a : out std_logic;
+    out_b : out std_logic_vector(0 downto 0);
+    out_c : out std_logic_vector(1 downto 0);
+    out_d : out std_logic_vector(3 downto 0)
+    );
+end test_match_01;
+
+
+architecture arch_test_match_01 of test_match_01 is
+  function cohdl_bool_to_std_logic(inp: boolean) return std_logic is
+  begin
+    if inp then
+      return('1');
+    else
+      return('0');
+    end if;
+  end function cohdl_bool_to_std_logic;
+  signal buffer_out_a : std_logic;
+  signal buffer_out_b : std_logic_vector(0 downto 0);
+  signal buffer_out_c : std_logic_vector(1 downto 0);
+  signal buffer_out_d : std_logic_vector(3 downto 0);
+begin
+  
+  -- CONCURRENT BLOCK (buffer assignment)
+  out_a <= buffer_out_a;
+  out_b <= buffer_out_b;
+  out_c <= buffer_out_c;
+  out_d <= buffer_out_d;
+  
+
+  proc_simple: process(clk)
+    variable temp : std_logic_vector(3 downto 0);
+    variable temp1 : boolean;
+    variable temp2 : std_logic_vector(3 downto 0);
+  begin
+    if rising_edge(clk) then
+      case sw is
+        when "0000" =>
+          buffer_out_a <= '0';
+          buffer_out_b <= "0";
+          buffer_out_c <= "00";
+          buffer_out_d <= "0000";
+        when "0001" =>
+          buffer_out_a <= '1';
+          buffer_out_d <= "1011";
+        when "1010" =>
+          buffer_out_c <= "11";
+        when "1110" =>
+          temp := not (sw);
+          temp1 := buffer_out_a = '1';
+          case temp1 is
+            when true =>
+              temp2 := sw;
+            when others =>
+              temp2 := temp;
+          end case;
+          buffer_out_d <= temp2;
+        when "1111" =>
+          buffer_out_a <= '1';
+        when others =>
+          buffer_out_a <= '0';
+      end case;
+    end if;
+  end process;
+end architecture arch_test_match_01;
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import unittest
+
+import cohdl
+from cohdl import Bit, BitVector, Unsigned, Port, select_with
+from cohdl import std
+
+from cohdl_testutil import cocotb_util
+
+#
+# runs the output of the compact VHDL emission mode through GHDL,
+# case and select expressions on slices must remain valid VHDL-93
+#
+
+
+class test_compact_01(cohdl.Entity):
+    clk = Port.input(Bit)
+
+    vec = Port.input(BitVector[8])
+    num = Port.input(Unsigned[8])
+
+    out_case = Port.output(BitVector[2])
+    out_select = Port.output(BitVector[2])
+    out_slice = Port.output(BitVector[4])
+    out_sum = Port.output(Unsigned[8])
+
+    def architecture(self):
+        @std.concurrent
+        def logic():
+            self.out_slice <<= self.vec[7:4]
+            self.out_sum <<= self.num + self.vec[3:0].unsigned
+
+        @std.sequential(std.Clock(self.clk))
+        def proc():
+            match self.vec[3:0]:
+                case "0000":
+                    self.out_case <<= "01"
+                case "1010":
+                    self.out_case <<= "11"
+                case _:
+                    self.out_case <<= "10"
+
+            self.out_select <<= select_with(
+                self.num[7:6],
+                {
+                    "00": BitVector[2]("11"),
+                    "01": BitVector[2]("01"),
+                },
+                default=BitVector[2]("00"),
+            )
+
+
+#
+# test code
+#
+
+
+@cocotb_util.test()
+async def testbench_compact(dut: test_compact_01):
+    seq = cocotb_util.SequentialTest(dut.clk)
+
+    for vec in cocotb_util.ConstrainedGenerator(8).random(64, required=[0, 10]):
+        num = cocotb_util.ConstrainedGenerator(8).random()
+
+        low = vec.as_int() & 0xF
+
+        if low == 0:
+            out_case = 1
+        elif low == 10:
+            out_case = 3
+        else:
+            out_case = 2
+
+        out_select = {0: 3, 1: 1}.get(num.as_int() >> 6, 0)
+
+        await seq.check_next_tick(
+            [(dut.vec, vec), (dut.num, num)],
+            [
+                (dut.out_case, out_case),
+                (dut.out_select, out_select),
+                (dut.out_slice, vec.as_int() >> 4),
+                (dut.out_sum, (num.as_int() + low) % 256),
+            ],
+            check_msg=f"{vec=}, {num=}",
+        )
+
+
+class Unittest(unittest.TestCase):
+    def test_compact(self):
+        cocotb_util.run_cocotb_tests(
+            test_compact_01, __file__, self.__module__, compact=True
+        )
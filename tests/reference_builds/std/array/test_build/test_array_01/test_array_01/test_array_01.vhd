@@ -0,0 +1,58 @@
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+
+
+entity test_array_01 is
+  port (
+    clk : in std_logic;
+    enable_in : in std_logic;
+    index_in : in unsigned(4 downto 0);
+    data_in : in std_logic_vector(31 downto 0);
+    index_out : in unsigned(4 downto 0);
+    data_out : out std_logic_vector(31 downto 0)
+    );
+end test_array_01;
+
+
+architecture arch_test_array_01 of test_array_01 is
+  function cohdl_bool_to_std_logic(inp: boolean) return std_logic is
+  begin
+    if inp then
+      return('1');
+    else
+      return('0');
+    end if;
+  end function cohdl_bool_to_std_logic;
+  signal buffer_data_out : std_logic_vector(31 downto 0);
+  type array_type is array(0 to 31) of std_logic_vector(31 downto 0);
+  signal bits : array_type := ( 0 => "00000000000000000000000000000000", 1 => "00000000000000000000000000000000", 2 => "00000000000000000000000000000000", 3 => "00000000000000000000000000000000", 4 => "00000000000000000000000000000000", 5 => "00000000000000000000000000000000", 6 => "00000000000000000000000000000000", 7 => "00000000000000000000000000000000", 8 => "00000000000000000000000000000000", 9 => "00000000000000000000000000000000", 10 => "00000000000000000000000000000000", 11 => "00000000000000000000000000000000", 12 => "00000000000000000000000000000000", 13 => "00000000000000000000000000000000", 14 => "00000000000000000000000000000000", 15 => "00000000000000000000000000000000", 16 => "00000000000000000000000000000000", 17 => "00000000000000000000000000000000", 18 => "00000000000000000000000000000000", 19 => "00000000000000000000000000000000", 20 => "00000000000000000000000000000000", 21 => "00000000000000000000000000000000", 22 => "00000000000000000000000000000000", 23 => "00000000000000000000000000000000", 24 => "00000000000000000000000000000000", 25 => "00000000000000000000000000000000", 26 => "00000000000000000000000000000000", 27 => "00000000000000000000000000000000", 28 => "00000000000000000000000000000000", 29 => "00000000000000000000000000000000", 30 => "00000000000000000000000000000000", 31 => "00000000000000000000000000000000" );
+begin
+  
+  -- CONCURRENT BLOCK (buffer assignment)
+  data_out <= buffer_data_out;
+  
+
+  proc_in: process(clk)
+    variable temp : boolean;
+    variable temp1 : unsigned(4 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := enable_in = '1';
+      if temp then
+        temp1 := index_in;
+        bits(to_integer(temp1)) <= data_in;
+      end if;
+    end if;
+  end process;
+  
+
+  proc_out: process(clk)
+    variable temp : unsigned(4 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := index_out;
+      buffer_data_out <= bits(to_integer(temp));
+    end if;
+  end process;
+end architecture arch_test_array_01;
@@ -0,0 +1,58 @@
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+
+
+entity test_array_02 is
+  port (
+    clk : in std_logic;
+    enable_in : in std_logic;
+    index_in : in unsigned(4 downto 0);
+    data_in : in std_logic_vector(31 downto 0);
+    index_out : in unsigned(4 downto 0);
+    data_out : out std_logic_vector(31 downto 0)
+    );
+end test_array_02;
+
+
+architecture arch_test_array_02 of test_array_02 is
+  function cohdl_bool_to_std_logic(inp: boolean) return std_logic is
+  begin
+    if inp then
+      return('1');
+    else
+      return('0');
+    end if;
+  end function cohdl_bool_to_std_logic;
+  signal buffer_data_out : std_logic_vector(31 downto 0);
+  type array_type is array(0 to 31) of std_logic_vector(31 downto 0);
+  signal bits : array_type;
+begin
+  
+  -- CONCURRENT BLOCK (buffer assignment)
+  data_out <= buffer_data_out;
+  
+
+  proc_in: process(clk)
+    variable temp : boolean;
+    variable temp1 : unsigned(4 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := enable_in = '1';
+      if temp then
+        temp1 := index_in;
+        bits(to_integer(temp1)) <= data_in;
+      end if;
+    end if;
+  end process;
+  
+
+  proc_out: process(clk)
+    variable temp : unsigned(4 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := index_out;
+      buffer_data_out <= bits(to_integer(temp));
+    end if;
+  end process;
+end architecture arch_test_array_02;
@@ -0,0 +1,121 @@
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+
+
+entity test_array_03 is
+  port (
+    clk : in std_logic;
+    enable_in : in std_logic;
+    index_in : in unsigned(4 downto 0);
+    data_in : in std_logic_vector(31 downto 0);
+    index_out : in unsigned(4 downto 0);
+    data_out : out std_logic_vector(31 downto 0);
+    a_out : out std_logic;
+    b_out : out std_logic_vector(6 downto 0);
+    c_out : out unsigned(7 downto 0);
+    d_out : out signed(7 downto 0);
+    x_out : out std_logic_vector(3 downto 0);
+    y_out : out std_logic_vector(3 downto 0)
+    );
+end test_array_03;
+
+
+architecture arch_test_array_03 of test_array_03 is
+  function cohdl_bool_to_std_logic(inp: boolean) return std_logic is
+  begin
+    if inp then
+      return('1');
+    else
+      return('0');
+    end if;
+  end function cohdl_bool_to_std_logic;
+  signal buffer_data_out : std_logic_vector(31 downto 0);
+  signal buffer_a_out : std_logic;
+  signal buffer_b_out : std_logic_vector(6 downto 0);
+  signal buffer_c_out : unsigned(7 downto 0);
+  signal buffer_d_out : signed(7 downto 0);
+  signal buffer_x_out : std_logic_vector(3 downto 0);
+  signal buffer_y_out : std_logic_vector(3 downto 0);
+  type array_type is array(0 to 31) of std_logic_vector(31 downto 0);
+  signal bits : array_type;
+begin
+  
+  -- CONCURRENT BLOCK (buffer assignment)
+  data_out <= buffer_data_out;
+  a_out <= buffer_a_out;
+  b_out <= buffer_b_out;
+  c_out <= buffer_c_out;
+  d_out <= buffer_d_out;
+  x_out <= buffer_x_out;
+  y_out <= buffer_y_out;
+  
+
+  proc_in: process(clk)
+    variable temp : boolean;
+    variable temp1 : std_logic;
+    variable temp2 : std_logic_vector(6 downto 0);
+    variable temp3 : unsigned(7 downto 0);
+    variable temp4 : signed(7 downto 0);
+    variable temp5 : std_logic_vector(3 downto 0);
+    variable temp6 : std_logic_vector(3 downto 0);
+    variable temp7 : unsigned(4 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := enable_in = '1';
+      if temp then
+        temp1 := data_in(0);
+        temp2 := std_logic_vector(data_in(7 downto 1));
+        temp3 := unsigned(std_logic_vector(data_in(15 downto 8)));
+        temp4 := signed(std_logic_vector(data_in(23 downto 16)));
+        temp5 := std_logic_vector(data_in(27 downto 24));
+        temp6 := std_logic_vector(data_in(31 downto 28));
+        temp7 := index_in;
+        bits(to_integer(temp7))(0) <= temp1;
+        bits(to_integer(temp7))(7 downto 1) <= temp2;
+        bits(to_integer(temp7))(15 downto 8) <= std_logic_vector(temp3);
+        bits(to_integer(temp7))(23 downto 16) <= std_logic_vector(temp4);
+        bits(to_integer(temp7))(27 downto 24) <= temp5;
+        bits(to_integer(temp7))(31 downto 28) <= temp6;
+      end if;
+    end if;
+  end process;
+  
+
+  proc_out: process(clk)
+    variable temp : unsigned(4 downto 0);
+    variable first : std_logic_vector(3 downto 0);
+    variable b : std_logic_vector(3 downto 0);
+    variable first1 : std_logic_vector(7 downto 0);
+    variable b1 : std_logic_vector(7 downto 0);
+    variable a : std_logic_vector(7 downto 0);
+    variable b2 : std_logic_vector(6 downto 0);
+    variable b3 : std_logic_vector(1 downto 0);
+    variable a1 : std_logic_vector(15 downto 0);
+    variable b4 : std_logic_vector(14 downto 0);
+    variable a2 : std_logic_vector(30 downto 0);
+    variable temp1 : std_logic_vector(31 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := index_out;
+      first := std_logic_vector(bits(to_integer(temp))(31 downto 28));
+      b := std_logic_vector(bits(to_integer(temp))(27 downto 24));
+      first1 := (first) & (b);
+      b1 := std_logic_vector(bits(to_integer(temp))(23 downto 16));
+      a := std_logic_vector(bits(to_integer(temp))(15 downto 8));
+      b2 := std_logic_vector(bits(to_integer(temp))(7 downto 1));
+      b3 := (bits(to_integer(temp))(0)) & (bits(to_integer(temp))(0));
+      a1 := (first1) & (b1);
+      b4 := (a) & (b2);
+      a2 := (a1) & (b4);
+      temp1 := (a2) & (std_logic_vector(b3(0 downto 0)));
+      buffer_data_out <= temp1;
+      buffer_a_out <= bits(to_integer(temp))(0);
+      buffer_b_out <= std_logic_vector(bits(to_integer(temp))(7 downto 1));
+      buffer_c_out <= unsigned(std_logic_vector(bits(to_integer(temp))(15 downto 8)));
+      buffer_d_out <= signed(std_logic_vector(bits(to_integer(temp))(23 downto 16)));
+      buffer_x_out <= std_logic_vector(bits(to_integer(temp))(27 downto 24));
+      buffer_y_out <= std_logic_vector(bits(to_integer(temp))(31 downto 28));
+    end if;
+  end process;
+end architecture arch_test_array_03;
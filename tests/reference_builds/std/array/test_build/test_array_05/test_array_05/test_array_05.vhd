@@ -0,0 +1,225 @@
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+
+
+entity test_array_05 is
+  port (
+    clk : in std_logic;
+    mode : in integer;
+    addr_0 : in unsigned(2 downto 0);
+    addr_1 : in unsigned(2 downto 0);
+    addr_2 : in unsigned(2 downto 0);
+    addr_3 : in unsigned(2 downto 0);
+    data_0 : in std_logic_vector(7 downto 0);
+    data_1 : in std_logic_vector(7 downto 0);
+    data_2 : in std_logic_vector(7 downto 0);
+    data_3 : in std_logic_vector(7 downto 0);
+    out_0 : out std_logic_vector(7 downto 0);
+    out_1 : out std_logic_vector(7 downto 0);
+    out_2 : out std_logic_vector(7 downto 0);
+    out_3 : out std_logic_vector(7 downto 0);
+    out_4 : out std_logic_vector(7 downto 0);
+    out_5 : out std_logic_vector(7 downto 0);
+    out_6 : out std_logic_vector(7 downto 0);
+    out_7 : out std_logic_vector(7 downto 0)
+    );
+end test_array_05;
+
+
+architecture arch_test_array_05 of test_array_05 is
+  function cohdl_bool_to_std_logic(inp: boolean) return std_logic is
+  begin
+    if inp then
+      return('1');
+    else
+      return('0');
+    end if;
+  end function cohdl_bool_to_std_logic;
+  signal buffer_out_0 : std_logic_vector(7 downto 0) := "00000000";
+  signal buffer_out_1 : std_logic_vector(7 downto 0) := "00000000";
+  signal buffer_out_2 : std_logic_vector(7 downto 0) := "00000000";
+  signal buffer_out_3 : std_logic_vector(7 downto 0) := "00000000";
+  signal buffer_out_4 : std_logic_vector(7 downto 0) := "00000000";
+  signal buffer_out_5 : std_logic_vector(7 downto 0) := "00000000";
+  signal buffer_out_6 : std_logic_vector(7 downto 0) := "00000000";
+  signal buffer_out_7 : std_logic_vector(7 downto 0) := "00000000";
+  type array_type is array(0 to 7) of std_logic_vector(7 downto 0);
+  signal bits : array_type := ( 0 => "00000000", 1 => "00000000", 2 => "00000000", 3 => "00000000", 4 => "00000000", 5 => "00000000", 6 => "00000000", 7 => "00000000" );
+begin
+  
+  -- CONCURRENT BLOCK (buffer assignment)
+  out_0 <= buffer_out_0;
+  out_1 <= buffer_out_1;
+  out_2 <= buffer_out_2;
+  out_3 <= buffer_out_3;
+  out_4 <= buffer_out_4;
+  out_5 <= buffer_out_5;
+  out_6 <= buffer_out_6;
+  out_7 <= buffer_out_7;
+  
+  -- CONCURRENT BLOCK (logic)
+  buffer_out_0 <= bits(0);
+  buffer_out_1 <= bits(1);
+  buffer_out_2 <= bits(2);
+  buffer_out_3 <= bits(3);
+  buffer_out_4 <= bits(4);
+  buffer_out_5 <= bits(5);
+  buffer_out_6 <= bits(6);
+  buffer_out_7 <= bits(7);
+  
+
+  proc_in: process(clk)
+    variable inp : std_logic_vector(7 downto 0);
+    variable temp : std_logic_vector(7 downto 0);
+    variable inp1 : std_logic_vector(7 downto 0);
+    variable temp1 : std_logic_vector(7 downto 0);
+    variable inp2 : std_logic_vector(7 downto 0);
+    variable temp2 : std_logic_vector(7 downto 0);
+    variable inp3 : std_logic_vector(7 downto 0);
+    variable temp3 : std_logic_vector(7 downto 0);
+    variable inp4 : std_logic_vector(7 downto 0);
+    variable temp4 : std_logic_vector(7 downto 0);
+    variable inp5 : std_logic_vector(7 downto 0);
+    variable temp5 : std_logic_vector(7 downto 0);
+    variable inp6 : std_logic_vector(7 downto 0);
+    variable temp6 : std_logic_vector(7 downto 0);
+    variable inp7 : std_logic_vector(7 downto 0);
+    variable temp7 : std_logic_vector(7 downto 0);
+    variable inp8 : std_logic_vector(7 downto 0);
+    variable temp8 : std_logic_vector(7 downto 0);
+    variable temp9 : unsigned(2 downto 0);
+    variable inp9 : std_logic_vector(7 downto 0);
+    variable temp10 : std_logic_vector(7 downto 0);
+    variable temp11 : unsigned(2 downto 0);
+    variable index : unsigned(2 downto 0);
+    variable value : std_logic_vector(7 downto 0);
+    variable index1 : unsigned(2 downto 0);
+    variable value1 : std_logic_vector(7 downto 0);
+    variable temp12 : std_logic_vector(7 downto 0);
+    variable temp13 : unsigned(2 downto 0);
+    variable temp14 : std_logic_vector(7 downto 0);
+    variable temp15 : unsigned(2 downto 0);
+    variable inp10 : std_logic_vector(7 downto 0);
+    variable temp16 : std_logic_vector(7 downto 0);
+    variable inp11 : std_logic_vector(7 downto 0);
+    variable temp17 : std_logic_vector(7 downto 0);
+    variable inp12 : std_logic_vector(7 downto 0);
+    variable temp18 : std_logic_vector(7 downto 0);
+    variable inp13 : std_logic_vector(7 downto 0);
+    variable temp19 : std_logic_vector(7 downto 0);
+    variable inp14 : std_logic_vector(7 downto 0);
+    variable temp20 : std_logic_vector(7 downto 0);
+    variable temp21 : unsigned(2 downto 0);
+    variable inp15 : std_logic_vector(7 downto 0);
+    variable temp22 : std_logic_vector(7 downto 0);
+    variable temp23 : unsigned(2 downto 0);
+    variable inp16 : std_logic_vector(7 downto 0);
+    variable temp24 : std_logic_vector(7 downto 0);
+    variable temp25 : unsigned(2 downto 0);
+    variable inp17 : std_logic_vector(7 downto 0);
+    variable temp26 : std_logic_vector(7 downto 0);
+    variable temp27 : unsigned(2 downto 0);
+  begin
+    if rising_edge(clk) then
+      case mode is
+        when 0 =>
+          bits(0) <= "00000000";
+          bits(1) <= "00000000";
+          bits(2) <= "00000000";
+          bits(3) <= "00000000";
+          bits(4) <= "00000000";
+          bits(5) <= "00000000";
+          bits(6) <= "00000000";
+          bits(7) <= "00000000";
+        when 1 =>
+          bits(0) <= "11111111";
+          bits(1) <= "11111111";
+          bits(2) <= "11111111";
+          bits(3) <= "11111111";
+          bits(4) <= "11111111";
+          bits(5) <= "11111111";
+          bits(6) <= "11111111";
+          bits(7) <= "11111111";
+        when 2 =>
+          inp := data_0;
+          temp := inp;
+          bits(0) <= temp;
+          inp1 := data_1;
+          temp1 := inp1;
+          bits(1) <= temp1;
+          inp2 := data_2;
+          temp2 := inp2;
+          bits(2) <= temp2;
+          inp3 := data_3;
+          temp3 := inp3;
+          bits(3) <= temp3;
+          inp4 := data_0;
+          temp4 := inp4;
+          bits(4) <= temp4;
+          inp5 := data_1;
+          temp5 := inp5;
+          bits(5) <= temp5;
+          inp6 := data_2;
+          temp6 := inp6;
+          bits(6) <= temp6;
+          inp7 := data_3;
+          temp7 := inp7;
+          bits(7) <= temp7;
+        when 3 =>
+          inp8 := data_0;
+          temp8 := inp8;
+          temp9 := addr_0;
+          bits(to_integer(temp9)) <= temp8;
+          inp9 := data_1;
+          temp10 := inp9;
+          temp11 := addr_1;
+          bits(to_integer(temp11)) <= temp10;
+        when 4 =>
+          index := (addr_0) xor (addr_2);
+          value := (data_0) and (data_2);
+          index1 := (addr_1) xor (addr_3);
+          value1 := (data_1) or (data_3);
+          temp12 := value;
+          temp13 := index;
+          bits(to_integer(temp13)) <= temp12;
+          temp14 := value1;
+          temp15 := index1;
+          bits(to_integer(temp15)) <= temp14;
+        when 5 =>
+          bits(0) <= "00000000";
+          bits(1) <= "11111111";
+          inp10 := data_0;
+          temp16 := inp10;
+          bits(2) <= temp16;
+          inp11 := data_1;
+          temp17 := inp11;
+          bits(3) <= temp17;
+          inp12 := data_2;
+          temp18 := inp12;
+          bits(4) <= temp18;
+          inp13 := data_3;
+          temp19 := inp13;
+          bits(5) <= temp19;
+          inp14 := data_0;
+          temp20 := inp14;
+          temp21 := addr_0;
+          bits(to_integer(temp21)) <= temp20;
+          inp15 := data_1;
+          temp22 := inp15;
+          temp23 := addr_1;
+          bits(to_integer(temp23)) <= temp22;
+          inp16 := data_2;
+          temp24 := inp16;
+          temp25 := addr_2;
+          bits(to_integer(temp25)) <= temp24;
+          inp17 := data_3;
+          temp26 := inp17;
+          temp27 := addr_3;
+          bits(to_integer(temp27)) <= temp26;
+        when others =>
+          null;
+      end case;
+    end if;
+  end process;
+end architecture arch_test_array_05;
@@ -0,0 +1,315 @@
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+
+
+entity test_array_06 is
+  port (
+    clk : in std_logic;
+    mode : in integer;
+    addr_0 : in unsigned(2 downto 0);
+    addr_1 : in unsigned(2 downto 0);
+    addr_2 : in unsigned(2 downto 0);
+    addr_3 : in unsigned(2 downto 0);
+    data_0 : in std_logic_vector(3 downto 0);
+    data_1 : in std_logic_vector(3 downto 0);
+    data_2 : in std_logic_vector(3 downto 0);
+    data_3 : in std_logic_vector(3 downto 0);
+    data_4 : in std_logic_vector(3 downto 0);
+    data_5 : in std_logic_vector(3 downto 0);
+    data_6 : in std_logic_vector(3 downto 0);
+    data_7 : in std_logic_vector(3 downto 0);
+    out_0 : out std_logic_vector(3 downto 0);
+    out_1 : out std_logic_vector(3 downto 0);
+    out_2 : out std_logic_vector(3 downto 0);
+    out_3 : out std_logic_vector(3 downto 0);
+    out_4 : out std_logic_vector(3 downto 0);
+    out_5 : out std_logic_vector(3 downto 0);
+    out_6 : out std_logic_vector(3 downto 0);
+    out_7 : out std_logic_vector(3 downto 0)
+    );
+end test_array_06;
+
+
+architecture arch_test_array_06 of test_array_06 is
+  function cohdl_bool_to_std_logic(inp: boolean) return std_logic is
+  begin
+    if inp then
+      return('1');
+    else
+      return('0');
+    end if;
+  end function cohdl_bool_to_std_logic;
+  signal buffer_out_0 : std_logic_vector(3 downto 0) := "0000";
+  signal buffer_out_1 : std_logic_vector(3 downto 0) := "0000";
+  signal buffer_out_2 : std_logic_vector(3 downto 0) := "0000";
+  signal buffer_out_3 : std_logic_vector(3 downto 0) := "0000";
+  signal buffer_out_4 : std_logic_vector(3 downto 0) := "0000";
+  signal buffer_out_5 : std_logic_vector(3 downto 0) := "0000";
+  signal buffer_out_6 : std_logic_vector(3 downto 0) := "0000";
+  signal buffer_out_7 : std_logic_vector(3 downto 0) := "0000";
+  signal inp : std_logic_vector(3 downto 0);
+  signal temp : std_logic_vector(3 downto 0);
+  type array_type is array(0 to 7) of std_logic_vector(3 downto 0);
+  signal arr_inp : array_type := ( 0 => "0000", 1 => "0000", 2 => "0000", 3 => "0000", 4 => "0000", 5 => "0000", 6 => "0000", 7 => "0000" );
+  signal inp1 : std_logic_vector(3 downto 0);
+  signal temp1 : std_logic_vector(3 downto 0);
+  signal inp2 : std_logic_vector(3 downto 0);
+  signal temp2 : std_logic_vector(3 downto 0);
+  signal inp3 : std_logic_vector(3 downto 0);
+  signal temp3 : std_logic_vector(3 downto 0);
+  signal inp4 : std_logic_vector(3 downto 0);
+  signal temp4 : std_logic_vector(3 downto 0);
+  signal inp5 : std_logic_vector(3 downto 0);
+  signal temp5 : std_logic_vector(3 downto 0);
+  signal inp6 : std_logic_vector(3 downto 0);
+  signal temp6 : std_logic_vector(3 downto 0);
+  signal inp7 : std_logic_vector(3 downto 0);
+  signal temp7 : std_logic_vector(3 downto 0);
+  signal arr_out : array_type := ( 0 => "0000", 1 => "0000", 2 => "0000", 3 => "0000", 4 => "0000", 5 => "0000", 6 => "0000", 7 => "0000" );
+begin
+  
+  -- CONCURRENT BLOCK (buffer assignment)
+  out_0 <= buffer_out_0;
+  out_1 <= buffer_out_1;
+  out_2 <= buffer_out_2;
+  out_3 <= buffer_out_3;
+  out_4 <= buffer_out_4;
+  out_5 <= buffer_out_5;
+  out_6 <= buffer_out_6;
+  out_7 <= buffer_out_7;
+  
+  -- CONCURRENT BLOCK (logic)
+  inp <= data_0;
+  temp <= inp;
+  arr_inp(0) <= temp;
+  inp1 <= data_1;
+  temp1 <= inp1;
+  arr_inp(1) <= temp1;
+  inp2 <= data_2;
+  temp2 <= inp2;
+  arr_inp(2) <= temp2;
+  inp3 <= data_3;
+  temp3 <= inp3;
+  arr_inp(3) <= temp3;
+  inp4 <= data_4;
+  temp4 <= inp4;
+  arr_inp(4) <= temp4;
+  inp5 <= data_5;
+  temp5 <= inp5;
+  arr_inp(5) <= temp5;
+  inp6 <= data_6;
+  temp6 <= inp6;
+  arr_inp(6) <= temp6;
+  inp7 <= data_7;
+  temp7 <= inp7;
+  arr_inp(7) <= temp7;
+  buffer_out_0 <= arr_out(0);
+  buffer_out_1 <= arr_out(1);
+  buffer_out_2 <= arr_out(2);
+  buffer_out_3 <= arr_out(3);
+  buffer_out_4 <= arr_out(4);
+  buffer_out_5 <= arr_out(5);
+  buffer_out_6 <= arr_out(6);
+  buffer_out_7 <= arr_out(7);
+  
+
+  proc_in: process(clk)
+    variable inp8 : std_logic_vector(3 downto 0);
+    variable temp8 : std_logic_vector(3 downto 0);
+    variable inp9 : std_logic_vector(3 downto 0);
+    variable temp9 : std_logic_vector(3 downto 0);
+    variable inp10 : std_logic_vector(3 downto 0);
+    variable temp10 : std_logic_vector(3 downto 0);
+    variable inp11 : std_logic_vector(3 downto 0);
+    variable temp11 : std_logic_vector(3 downto 0);
+    variable inp12 : std_logic_vector(3 downto 0);
+    variable temp12 : std_logic_vector(3 downto 0);
+    variable inp13 : std_logic_vector(3 downto 0);
+    variable temp13 : std_logic_vector(3 downto 0);
+    variable inp14 : std_logic_vector(3 downto 0);
+    variable temp14 : std_logic_vector(3 downto 0);
+    variable inp15 : std_logic_vector(3 downto 0);
+    variable temp15 : std_logic_vector(3 downto 0);
+    variable inp16 : std_logic_vector(3 downto 0);
+    variable temp16 : std_logic_vector(3 downto 0);
+    variable inp17 : std_logic_vector(3 downto 0);
+    variable temp17 : std_logic_vector(3 downto 0);
+    variable inp18 : std_logic_vector(3 downto 0);
+    variable temp18 : std_logic_vector(3 downto 0);
+    variable inp19 : std_logic_vector(3 downto 0);
+    variable temp19 : std_logic_vector(3 downto 0);
+    variable inp20 : std_logic_vector(3 downto 0);
+    variable temp20 : std_logic_vector(3 downto 0);
+    variable inp21 : std_logic_vector(3 downto 0);
+    variable temp21 : std_logic_vector(3 downto 0);
+    variable inp22 : std_logic_vector(3 downto 0);
+    variable temp22 : std_logic_vector(3 downto 0);
+    variable inp23 : std_logic_vector(3 downto 0);
+    variable temp23 : std_logic_vector(3 downto 0);
+    variable inp24 : std_logic_vector(3 downto 0);
+    variable temp24 : std_logic_vector(3 downto 0);
+    variable inp25 : std_logic_vector(3 downto 0);
+    variable temp25 : std_logic_vector(3 downto 0);
+    variable inp26 : std_logic_vector(3 downto 0);
+    variable temp26 : std_logic_vector(3 downto 0);
+    variable inp27 : std_logic_vector(3 downto 0);
+    variable temp27 : std_logic_vector(3 downto 0);
+    variable inp28 : std_logic_vector(3 downto 0);
+    variable temp28 : std_logic_vector(3 downto 0);
+    variable inp29 : std_logic_vector(3 downto 0);
+    variable temp29 : std_logic_vector(3 downto 0);
+    variable inp30 : std_logic_vector(3 downto 0);
+    variable temp30 : std_logic_vector(3 downto 0);
+    variable inp31 : std_logic_vector(3 downto 0);
+    variable temp31 : std_logic_vector(3 downto 0);
+    variable temp32 : unsigned(2 downto 0);
+    variable inp32 : std_logic_vector(3 downto 0);
+    variable temp33 : std_logic_vector(3 downto 0);
+    variable temp34 : unsigned(2 downto 0);
+    variable inp33 : std_logic_vector(3 downto 0);
+    variable temp35 : std_logic_vector(3 downto 0);
+    variable temp36 : unsigned(2 downto 0);
+    variable temp37 : unsigned(2 downto 0);
+    variable temp38 : unsigned(2 downto 0);
+    variable inp34 : std_logic_vector(3 downto 0);
+    variable temp39 : std_logic_vector(3 downto 0);
+    variable temp40 : unsigned(2 downto 0);
+    variable temp41 : unsigned(2 downto 0);
+    variable inp35 : std_logic_vector(3 downto 0);
+    variable temp42 : std_logic_vector(3 downto 0);
+    variable value : std_logic_vector(3 downto 0);
+    variable temp43 : std_logic_vector(3 downto 0);
+    variable temp44 : unsigned(2 downto 0);
+    variable temp45 : std_logic_vector(3 downto 0);
+  begin
+    if rising_edge(clk) then
+      case mode is
+        when 0 =>
+          arr_out(0) <= "0000";
+          arr_out(1) <= "0000";
+          arr_out(2) <= "1111";
+          arr_out(3) <= "1111";
+          arr_out(4) <= "1111";
+          arr_out(7) <= "0000";
+          arr_out(6) <= "0000";
+          arr_out(5) <= "0000";
+        when 1 =>
+          arr_out(0) <= "1111";
+          arr_out(2) <= "1111";
+          arr_out(4) <= "1111";
+          arr_out(6) <= "1111";
+          arr_out(1) <= "0000";
+          arr_out(3) <= "0000";
+          arr_out(5) <= "0000";
+          arr_out(7) <= "0000";
+        when 2 =>
+          inp8 := arr_inp(0);
+          temp8 := inp8;
+          arr_out(0) <= temp8;
+          inp9 := arr_inp(1);
+          temp9 := inp9;
+          arr_out(1) <= temp9;
+          inp10 := arr_inp(2);
+          temp10 := inp10;
+          arr_out(2) <= temp10;
+          inp11 := arr_inp(2);
+          temp11 := inp11;
+          arr_out(3) <= temp11;
+          inp12 := arr_inp(4);
+          temp12 := inp12;
+          arr_out(4) <= temp12;
+          inp13 := arr_inp(0);
+          temp13 := inp13;
+          arr_out(5) <= temp13;
+          inp14 := arr_inp(6);
+          temp14 := inp14;
+          arr_out(6) <= temp14;
+          inp15 := arr_inp(7);
+          temp15 := inp15;
+          arr_out(7) <= temp15;
+        when 3 =>
+          inp16 := arr_inp(0);
+          temp16 := inp16;
+          arr_out(7) <= temp16;
+          inp17 := arr_inp(1);
+          temp17 := inp17;
+          arr_out(6) <= temp17;
+          inp18 := arr_inp(2);
+          temp18 := inp18;
+          arr_out(5) <= temp18;
+          inp19 := arr_inp(3);
+          temp19 := inp19;
+          arr_out(4) <= temp19;
+          inp20 := arr_inp(4);
+          temp20 := inp20;
+          arr_out(3) <= temp20;
+          inp21 := arr_inp(5);
+          temp21 := inp21;
+          arr_out(2) <= temp21;
+          inp22 := arr_inp(6);
+          temp22 := inp22;
+          arr_out(1) <= temp22;
+          inp23 := arr_inp(7);
+          temp23 := inp23;
+          arr_out(0) <= temp23;
+        when 4 =>
+          inp24 := arr_inp(3);
+          temp24 := inp24;
+          arr_out(0) <= temp24;
+          inp25 := arr_inp(0);
+          temp25 := inp25;
+          arr_out(2) <= temp25;
+          inp26 := arr_inp(1);
+          temp26 := inp26;
+          arr_out(6) <= temp26;
+          inp27 := arr_inp(1);
+          temp27 := inp27;
+          arr_out(4) <= temp27;
+          inp28 := arr_inp(3);
+          temp28 := inp28;
+          arr_out(1) <= temp28;
+          inp29 := arr_inp(2);
+          temp29 := inp29;
+          arr_out(3) <= temp29;
+          inp30 := arr_inp(4);
+          temp30 := inp30;
+          arr_out(5) <= temp30;
+          inp31 := arr_inp(5);
+          temp31 := inp31;
+          arr_out(7) <= temp31;
+        when 5 =>
+          temp32 := addr_3;
+          inp32 := arr_inp(to_integer(temp32));
+          temp33 := inp32;
+          temp34 := addr_0;
+          arr_out(to_integer(temp34)) <= temp33;
+          inp33 := arr_inp(5);
+          temp35 := inp33;
+          temp36 := addr_1;
+          arr_out(to_integer(temp36)) <= temp35;
+        when 6 =>
+          temp37 := addr_2;
+          temp38 := addr_3;
+          arr_out(to_integer(temp38)) <= arr_inp(to_integer(temp37));
+        when 7 =>
+          inp34 := arr_inp(3);
+          temp39 := inp34;
+          temp40 := addr_3;
+          arr_out(to_integer(temp40)) <= temp39;
+          temp41 := addr_2;
+          inp35 := arr_inp(to_integer(temp41));
+          temp42 := inp35;
+          arr_out(0) <= temp42;
+          value := arr_inp(1);
+          temp43 := value;
+          temp44 := addr_1;
+          arr_out(to_integer(temp44)) <= temp43;
+          temp45 := arr_inp(2);
+          arr_out(5) <= temp45;
+        when others =>
+          null;
+      end case;
+    end if;
+  end process;
+end architecture arch_test_array_06;
@@ -0,0 +1,230 @@
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+
+
+entity test_axilite_02 is
+  port (
+    clk : in std_logic;
+    reset : in std_logic;
+    axi_awaddr : in unsigned(31 downto 0);
+    axi_awprot : in unsigned(2 downto 0);
+    axi_awvalid : in std_logic;
+    axi_awready : out std_logic;
+    axi_wdata : in std_logic_vector(31 downto 0);
+    axi_wstrb : in std_logic_vector(3 downto 0);
+    axi_wvalid : in std_logic;
+    axi_wready : out std_logic;
+    axi_bresp : out std_logic_vector(1 downto 0);
+    axi_bvalid : out std_logic;
+    axi_bready : in std_logic;
+    axi_araddr : in unsigned(31 downto 0);
+    axi_arprot : in unsigned(2 downto 0);
+    axi_arvalid : in std_logic;
+    axi_arready : out std_logic;
+    axi_rdata : out std_logic_vector(31 downto 0);
+    axi_rresp : out std_logic_vector(1 downto 0);
+    axi_rvalid : out std_logic;
+    axi_rready : in std_logic
+    );
+end test_axilite_02;
+
+
+architecture arch_test_axilite_02 of test_axilite_02 is
+  function cohdl_bool_to_std_logic(inp: boolean) return std_logic is
+  begin
+    if inp then
+      return('1');
+    else
+      return('0');
+    end if;
+  end function cohdl_bool_to_std_logic;
+  signal buffer_axi_awready : std_logic := '0';
+  signal buffer_axi_wready : std_logic := '0';
+  signal buffer_axi_bresp : std_logic_vector(1 downto 0) := "00";
+  signal buffer_axi_bvalid : std_logic := '0';
+  signal buffer_axi_arready : std_logic := '0';
+  signal buffer_axi_rdata : std_logic_vector(31 downto 0) := "00000000000000000000000000000000";
+  signal buffer_axi_rresp : std_logic_vector(1 downto 0) := "00";
+  signal buffer_axi_rvalid : std_logic := '0';
+  type state_proc_read is (state_0, state_1, state_2);
+  signal s_proc_read : state_proc_read := state_0;
+  signal data_buffer : std_logic_vector(31 downto 0) := "00000000000000000000000000000000";
+  type state_proc_write is (state_0, state_1, state_2);
+  signal s_proc_write : state_proc_write := state_0;
+  signal addr : unsigned(31 downto 0);
+  signal prot : unsigned(2 downto 0);
+  signal data : std_logic_vector(31 downto 0);
+  signal strb : std_logic_vector(3 downto 0);
+begin
+  
+  -- CONCURRENT BLOCK (buffer assignment)
+  axi_awready <= buffer_axi_awready;
+  axi_wready <= buffer_axi_wready;
+  axi_bresp <= buffer_axi_bresp;
+  axi_bvalid <= buffer_axi_bvalid;
+  axi_arready <= buffer_axi_arready;
+  axi_rdata <= buffer_axi_rdata;
+  axi_rresp <= buffer_axi_rresp;
+  axi_rvalid <= buffer_axi_rvalid;
+  
+
+  proc_read: process(clk)
+    variable temp : boolean;
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+        s_proc_read <= state_0;
+        buffer_axi_arready <= '0';
+        buffer_axi_rdata <= "00000000000000000000000000000000";
+        buffer_axi_rresp <= "00";
+        buffer_axi_rvalid <= '0';
+      else
+        case s_proc_read is
+          when state_0 =>
+            s_proc_read <= state_1;
+            buffer_axi_arready <= '1';
+          when state_1 =>
+            if axi_arvalid = '1' then
+              s_proc_read <= state_2;
+              buffer_axi_arready <= '0';
+              buffer_axi_rdata <= data_buffer;
+              buffer_axi_rresp <= "00";
+              buffer_axi_rvalid <= '1';
+            end if;
+          when state_2 =>
+            if axi_rready = '1' then
+              buffer_axi_rvalid <= '0';
+              s_proc_read <= state_1;
+              buffer_axi_arready <= '1';
+            end if;
+          when others =>
+            null;
+        end case;
+      end if;
+    end if;
+  end process;
+  
+
+  proc_write: process(clk)
+    variable temp : boolean;
+    variable var : std_logic;
+    variable var1 : std_logic;
+    variable temp1 : std_logic;
+    variable temp2 : boolean;
+    variable temp3 : std_logic;
+    variable temp4 : boolean;
+    variable alias1 : std_logic_vector(31 downto 0);
+    variable alias2 : std_logic_vector(3 downto 0);
+    variable temp5 : std_logic;
+    variable temp6 : std_logic;
+    variable temp7 : std_logic;
+    variable temp8 : std_logic;
+    variable temp9 : std_logic;
+    variable temp10 : boolean;
+    variable temp11 : std_logic_vector(1 downto 0);
+    variable temp12 : std_logic_vector(3 downto 0);
+    variable first : std_logic_vector(7 downto 0);
+    variable temp13 : std_logic_vector(1 downto 0);
+    variable temp14 : std_logic_vector(3 downto 0);
+    variable first1 : std_logic_vector(7 downto 0);
+    variable temp15 : std_logic_vector(1 downto 0);
+    variable temp16 : std_logic_vector(3 downto 0);
+    variable first2 : std_logic_vector(7 downto 0);
+    variable temp17 : std_logic_vector(1 downto 0);
+    variable temp18 : std_logic_vector(3 downto 0);
+    variable first3 : std_logic_vector(7 downto 0);
+    variable a : std_logic_vector(15 downto 0);
+    variable b : std_logic_vector(15 downto 0);
+    variable mask : std_logic_vector(31 downto 0);
+    variable temp19 : std_logic_vector(31 downto 0);
+    variable temp20 : std_logic_vector(31 downto 0);
+    variable temp21 : std_logic_vector(31 downto 0);
+    variable temp22 : std_logic_vector(31 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+        s_proc_write <= state_0;
+        buffer_axi_awready <= '0';
+        buffer_axi_wready <= '0';
+        data_buffer <= "00000000000000000000000000000000";
+        buffer_axi_bresp <= "00";
+        buffer_axi_bvalid <= '0';
+      else
+        case s_proc_write is
+          when state_0 =>
+            s_proc_write <= state_1;
+            var := '0';
+            var1 := '0';
+            buffer_axi_awready <= '1';
+            buffer_axi_wready <= '1';
+          when state_1 =>
+            temp1 := not (var);
+            temp2 := temp1 = '1';
+            if temp2 then
+              addr <= axi_awaddr;
+              prot <= axi_awprot;
+            end if;
+            temp3 := not (var1);
+            temp4 := temp3 = '1';
+            if temp4 then
+              alias1 := axi_wdata;
+              data <= axi_wdata;
+              alias2 := axi_wstrb;
+              strb <= axi_wstrb;
+            end if;
+            temp5 := (var) or (axi_awvalid);
+            var := temp5;
+            temp6 := (var1) or (axi_wvalid);
+            var1 := temp6;
+            temp7 := not (var);
+            buffer_axi_awready <= temp7;
+            temp8 := not (var1);
+            buffer_axi_wready <= temp8;
+            temp9 := (var) and (var1);
+            temp10 := temp9 = '1';
+            if temp10 then
+              s_proc_write <= state_2;
+              temp11 := (alias2(0)) & (alias2(0));
+              temp12 := (temp11) & (temp11);
+              first := (temp12) & (temp12);
+              temp13 := (alias2(1)) & (alias2(1));
+              temp14 := (temp13) & (temp13);
+              first1 := (temp14) & (temp14);
+              temp15 := (alias2(2)) & (alias2(2));
+              temp16 := (temp15) & (temp15);
+              first2 := (temp16) & (temp16);
+              temp17 := (alias2(3)) & (alias2(3));
+              temp18 := (temp17) & (temp17);
+              first3 := (temp18) & (temp18);
+              a := (first3) & (first2);
+              b := (first1) & (first);
+              mask := (a) & (b);
+              temp19 := not (mask);
+              temp20 := (data_buffer) and (temp19);
+              temp21 := (alias1) and (mask);
+              temp22 := (temp20) or (temp21);
+              data_buffer <= temp22;
+              buffer_axi_bresp <= "00";
+              buffer_axi_bvalid <= '1';
+            else
+              s_proc_write <= state_1;
+            end if;
+          when state_2 =>
+            if axi_bready = '1' then
+              buffer_axi_bvalid <= '0';
+              s_proc_write <= state_1;
+              var := '0';
+              var1 := '0';
+              buffer_axi_awready <= '1';
+              buffer_axi_wready <= '1';
+            end if;
+          when others =>
+            null;
+        end case;
+      end if;
+    end if;
+  end process;
+end architecture arch_test_axilite_02;
@@ -0,0 +1,420 @@
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+
+
+entity test_axilite_addr_map_entity_01 is
+  port (
+    axi_clk : in std_logic;
+    axi_reset : in std_logic;
+    axi_awaddr : in unsigned(31 downto 0);
+    axi_awprot : in unsigned(2 downto 0);
+    axi_awvalid : in std_logic;
+    axi_awready : out std_logic;
+    axi_wdata : in std_logic_vector(31 downto 0);
+    axi_wstrb : in std_logic_vector(3 downto 0);
+    axi_wvalid : in std_logic;
+    axi_wready : out std_logic;
+    axi_bresp : out std_logic_vector(1 downto 0);
+    axi_bvalid : out std_logic;
+    axi_bready : in std_logic;
+    axi_araddr : in unsigned(31 downto 0);
+    axi_arprot : in unsigned(2 downto 0);
+    axi_arvalid : in std_logic;
+    axi_arready : out std_logic;
+    axi_rdata : out std_logic_vector(31 downto 0);
+    axi_rresp : out std_logic_vector(1 downto 0);
+    axi_rvalid : out std_logic;
+    axi_rready : in std_logic
+    );
+end test_axilite_addr_map_entity_01;
+
+
+architecture arch_test_axilite_addr_map_entity_01 of test_axilite_addr_map_entity_01 is
+  function cohdl_bool_to_std_logic(inp: boolean) return std_logic is
+  begin
+    if inp then
+      return('1');
+    else
+      return('0');
+    end if;
+  end function cohdl_bool_to_std_logic;
+  signal buffer_axi_awready : std_logic := '0';
+  signal buffer_axi_wready : std_logic := '0';
+  signal buffer_axi_bresp : std_logic_vector(1 downto 0) := "00";
+  signal buffer_axi_bvalid : std_logic := '0';
+  signal buffer_axi_arready : std_logic := '0';
+  signal buffer_axi_rdata : std_logic_vector(31 downto 0) := "00000000000000000000000000000000";
+  signal buffer_axi_rresp : std_logic_vector(1 downto 0) := "00";
+  signal buffer_axi_rvalid : std_logic := '0';
+  signal inp : unsigned(31 downto 0);
+  signal other : unsigned(31 downto 0) := unsigned'("00000000000000000000000000000000");
+  type state_proc_read is (state_0, state_1, state_2);
+  signal s_proc_read : state_proc_read := state_0;
+  signal old : std_logic_vector(31 downto 0) := "00000000000000000000000000000000";
+  signal old1 : std_logic_vector(31 downto 0) := "00000000000000000000000000000000";
+  signal old2 : std_logic_vector(31 downto 0) := "00000000000000000000000000000000";
+  signal old3 : std_logic_vector(31 downto 0) := "00000000000000000000000000000000";
+  signal inp1 : std_logic_vector(31 downto 0);
+  signal inp2 : unsigned(31 downto 0) := unsigned'("00000000000000000000000000000000");
+  type state_proc_write is (state_0, state_1, state_2);
+  signal s_proc_write : state_proc_write := state_0;
+  signal addr : unsigned(31 downto 0);
+  signal prot : unsigned(2 downto 0);
+  signal data : std_logic_vector(31 downto 0);
+  signal strb : std_logic_vector(3 downto 0);
+begin
+  
+  -- CONCURRENT BLOCK (buffer assignment)
+  axi_awready <= buffer_axi_awready;
+  axi_wready <= buffer_axi_wready;
+  axi_bresp <= buffer_axi_bresp;
+  axi_bvalid <= buffer_axi_bvalid;
+  axi_arready <= buffer_axi_arready;
+  axi_rdata <= buffer_axi_rdata;
+  axi_rresp <= buffer_axi_rresp;
+  axi_rvalid <= buffer_axi_rvalid;
+  
+  -- CONCURRENT BLOCK (_impl_concurrent_)
+  inp <= other;
+  
+
+  proc_read: process(axi_clk)
+    variable temp : boolean;
+    variable temp1 : boolean;
+    variable data1 : std_logic_vector(31 downto 0);
+    variable temp2 : boolean;
+    variable temp3 : boolean;
+    variable temp4 : boolean;
+    variable temp5 : boolean;
+    variable temp6 : boolean;
+    variable a : std_logic_vector(1 downto 0);
+    variable b : std_logic_vector(1 downto 0);
+    variable a1 : std_logic_vector(1 downto 0);
+    variable b1 : std_logic_vector(1 downto 0);
+    variable a2 : std_logic_vector(1 downto 0);
+    variable b2 : std_logic_vector(1 downto 0);
+    variable a3 : std_logic_vector(1 downto 0);
+    variable b3 : std_logic_vector(1 downto 0);
+    variable a4 : std_logic_vector(1 downto 0);
+    variable b4 : std_logic_vector(1 downto 0);
+    variable a5 : std_logic_vector(1 downto 0);
+    variable b5 : std_logic_vector(1 downto 0);
+    variable a6 : std_logic_vector(1 downto 0);
+    variable b6 : std_logic_vector(1 downto 0);
+    variable a7 : std_logic_vector(1 downto 0);
+    variable b7 : std_logic_vector(1 downto 0);
+    variable a8 : std_logic_vector(3 downto 0);
+    variable b8 : std_logic_vector(3 downto 0);
+    variable a9 : std_logic_vector(3 downto 0);
+    variable b9 : std_logic_vector(3 downto 0);
+    variable a10 : std_logic_vector(3 downto 0);
+    variable b10 : std_logic_vector(3 downto 0);
+    variable a11 : std_logic_vector(3 downto 0);
+    variable b11 : std_logic_vector(3 downto 0);
+    variable a12 : std_logic_vector(7 downto 0);
+    variable b12 : std_logic_vector(7 downto 0);
+    variable a13 : std_logic_vector(7 downto 0);
+    variable b13 : std_logic_vector(7 downto 0);
+    variable a14 : std_logic_vector(15 downto 0);
+    variable b14 : std_logic_vector(15 downto 0);
+    variable value : std_logic_vector(31 downto 0);
+    variable first : std_logic_vector(31 downto 0);
+    variable temp7 : boolean;
+    variable first1 : std_logic_vector(31 downto 0);
+    variable temp8 : boolean;
+    variable temp9 : unsigned(31 downto 0);
+    variable first2 : std_logic_vector(31 downto 0);
+  begin
+    if rising_edge(axi_clk) then
+      temp := axi_reset = '1';
+      temp1 := not (temp);
+      if temp1 then
+        s_proc_read <= state_0;
+        buffer_axi_arready <= '0';
+        other <= unsigned'("00000000000000000000000000000000");
+        buffer_axi_rdata <= "00000000000000000000000000000000";
+        buffer_axi_rresp <= "00";
+        buffer_axi_rvalid <= '0';
+      else
+        case s_proc_read is
+          when state_0 =>
+            s_proc_read <= state_1;
+            buffer_axi_arready <= '1';
+          when state_1 =>
+            if axi_arvalid = '1' then
+              s_proc_read <= state_2;
+              buffer_axi_arready <= '0';
+              data1 := "00000000000000000000000000000000";
+              temp2 := (unsigned(axi_araddr(31 downto 2)) = 0);
+              if temp2 then
+                data1 := old;
+              end if;
+              temp3 := (unsigned(axi_araddr(31 downto 2)) = 1);
+              if temp3 then
+                data1 := old1;
+              end if;
+              temp4 := (unsigned(axi_araddr(31 downto 2)) = 2);
+              if temp4 then
+                data1 := old2;
+              end if;
+              temp5 := (unsigned(axi_araddr(31 downto 2)) = 3);
+              if temp5 then
+                data1 := old3;
+              end if;
+              temp6 := (unsigned(axi_araddr(31 downto 2)) = 4);
+              if temp6 then
+                a := (inp1(0)) & (inp1(1));
+                b := (inp1(2)) & (inp1(3));
+                a1 := (inp1(4)) & (inp1(5));
+                b1 := (inp1(6)) & (inp1(7));
+                a2 := (inp1(8)) & (inp1(9));
+                b2 := (inp1(10)) & (inp1(11));
+                a3 := (inp1(12)) & (inp1(13));
+                b3 := (inp1(14)) & (inp1(15));
+                a4 := (inp1(16)) & (inp1(17));
+                b4 := (inp1(18)) & (inp1(19));
+                a5 := (inp1(20)) & (inp1(21));
+                b5 := (inp1(22)) & (inp1(23));
+                a6 := (inp1(24)) & (inp1(25));
+                b6 := (inp1(26)) & (inp1(27));
+                a7 := (inp1(28)) & (inp1(29));
+                b7 := (inp1(30)) & (inp1(31));
+                a8 := (a) & (b);
+                b8 := (a1) & (b1);
+                a9 := (a2) & (b2);
+                b9 := (a3) & (b3);
+                a10 := (a4) & (b4);
+                b10 := (a5) & (b5);
+                a11 := (a6) & (b6);
+                b11 := (a7) & (b7);
+                a12 := (a8) & (b8);
+                b12 := (a9) & (b9);
+                a13 := (a10) & (b10);
+                b13 := (a11) & (b11);
+                a14 := (a12) & (b12);
+                b14 := (a13) & (b13);
+                value := (a14) & (b14);
+                first := value;
+                data1 := first;
+              end if;
+              temp7 := (unsigned(axi_araddr(31 downto 2)) = 8);
+              if temp7 then
+                first1 := std_logic_vector(inp2);
+                data1 := first1;
+              end if;
+              temp8 := (unsigned(axi_araddr(31 downto 2)) = 9);
+              if temp8 then
+                temp9 := (other) + (1);
+                other <= temp9;
+                first2 := std_logic_vector(inp);
+                data1 := first2;
+              end if;
+              buffer_axi_rdata <= data1;
+              buffer_axi_rresp <= "00";
+              buffer_axi_rvalid <= '1';
+            end if;
+          when state_2 =>
+            if axi_rready = '1' then
+              buffer_axi_rvalid <= '0';
+              s_proc_read <= state_1;
+              buffer_axi_arready <= '1';
+            end if;
+          when others =>
+            null;
+        end case;
+      end if;
+    end if;
+  end process;
+  
+
+  proc_write: process(axi_clk)
+    variable temp : boolean;
+    variable temp1 : boolean;
+    variable var : std_logic;
+    variable var1 : std_logic;
+    variable temp2 : std_logic;
+    variable temp3 : boolean;
+    variable alias1 : unsigned(31 downto 0);
+    variable temp4 : std_logic;
+    variable temp5 : boolean;
+    variable alias2 : std_logic_vector(31 downto 0);
+    variable alias3 : std_logic_vector(3 downto 0);
+    variable temp6 : std_logic;
+    variable temp7 : std_logic;
+    variable temp8 : std_logic;
+    variable temp9 : std_logic;
+    variable temp10 : std_logic;
+    variable temp11 : boolean;
+    variable temp12 : std_logic_vector(1 downto 0);
+    variable temp13 : std_logic_vector(3 downto 0);
+    variable first : std_logic_vector(7 downto 0);
+    variable temp14 : std_logic_vector(1 downto 0);
+    variable temp15 : std_logic_vector(3 downto 0);
+    variable first1 : std_logic_vector(7 downto 0);
+    variable temp16 : std_logic_vector(1 downto 0);
+    variable temp17 : std_logic_vector(3 downto 0);
+    variable first2 : std_logic_vector(7 downto 0);
+    variable temp18 : std_logic_vector(1 downto 0);
+    variable temp19 : std_logic_vector(3 downto 0);
+    variable first3 : std_logic_vector(7 downto 0);
+    variable a : std_logic_vector(15 downto 0);
+    variable b : std_logic_vector(15 downto 0);
+    variable val : std_logic_vector(31 downto 0);
+    variable val1 : std_logic_vector(31 downto 0);
+    variable temp20 : boolean;
+    variable temp21 : std_logic_vector(31 downto 0);
+    variable temp22 : std_logic_vector(31 downto 0);
+    variable temp23 : std_logic_vector(31 downto 0);
+    variable temp24 : std_logic_vector(31 downto 0);
+    variable temp25 : boolean;
+    variable temp26 : std_logic_vector(31 downto 0);
+    variable temp27 : std_logic_vector(31 downto 0);
+    variable temp28 : std_logic_vector(31 downto 0);
+    variable temp29 : std_logic_vector(31 downto 0);
+    variable temp30 : boolean;
+    variable temp31 : std_logic_vector(31 downto 0);
+    variable temp32 : std_logic_vector(31 downto 0);
+    variable temp33 : std_logic_vector(31 downto 0);
+    variable temp34 : std_logic_vector(31 downto 0);
+    variable temp35 : boolean;
+    variable temp36 : std_logic_vector(31 downto 0);
+    variable temp37 : std_logic_vector(31 downto 0);
+    variable temp38 : std_logic_vector(31 downto 0);
+    variable temp39 : std_logic_vector(31 downto 0);
+    variable temp40 : boolean;
+    variable temp41 : boolean;
+    variable value : unsigned(31 downto 0);
+    variable temp42 : boolean;
+  begin
+    if rising_edge(axi_clk) then
+      temp := axi_reset = '1';
+      temp1 := not (temp);
+      if temp1 then
+        s_proc_write <= state_0;
+        buffer_axi_awready <= '0';
+        buffer_axi_wready <= '0';
+        old <= "00000000000000000000000000000000";
+        old1 <= "00000000000000000000000000000000";
+        old2 <= "00000000000000000000000000000000";
+        old3 <= "00000000000000000000000000000000";
+        inp2 <= unsigned'("00000000000000000000000000000000");
+        buffer_axi_bresp <= "00";
+        buffer_axi_bvalid <= '0';
+      else
+        case s_proc_write is
+          when state_0 =>
+            s_proc_write <= state_1;
+            var := '0';
+            var1 := '0';
+            buffer_axi_awready <= '1';
+            buffer_axi_wready <= '1';
+          when state_1 =>
+            temp2 := not (var);
+            temp3 := temp2 = '1';
+            if temp3 then
+              alias1 := axi_awaddr;
+              addr <= axi_awaddr;
+              prot <= axi_awprot;
+            end if;
+            temp4 := not (var1);
+            temp5 := temp4 = '1';
+            if temp5 then
+              alias2 := axi_wdata;
+              data <= axi_wdata;
+              alias3 := axi_wstrb;
+              strb <= axi_wstrb;
+            end if;
+            temp6 := (var) or (axi_awvalid);
+            var := temp6;
+            temp7 := (var1) or (axi_wvalid);
+            var1 := temp7;
+            temp8 := not (var);
+            buffer_axi_awready <= temp8;
+            temp9 := not (var1);
+            buffer_axi_wready <= temp9;
+            temp10 := (var) and (var1);
+            temp11 := temp10 = '1';
+            if temp11 then
+              s_proc_write <= state_2;
+              temp12 := (alias3(0)) & (alias3(0));
+              temp13 := (temp12) & (temp12);
+              first := (temp13) & (temp13);
+              temp14 := (alias3(1)) & (alias3(1));
+              temp15 := (temp14) & (temp14);
+              first1 := (temp15) & (temp15);
+              temp16 := (alias3(2)) & (alias3(2));
+              temp17 := (temp16) & (temp16);
+              first2 := (temp17) & (temp17);
+              temp18 := (alias3(3)) & (alias3(3));
+              temp19 := (temp18) & (temp18);
+              first3 := (temp19) & (temp19);
+              a := (first3) & (first2);
+              b := (first1) & (first);
+              val := (a) & (b);
+              val1 := val;
+              temp20 := (unsigned(alias1(31 downto 2)) = 0);
+              if temp20 then
+                temp21 := not (val1);
+                temp22 := (old) and (temp21);
+                temp23 := (alias2) and (val1);
+                temp24 := (temp22) or (temp23);
+                old <= temp24;
+              end if;
+              temp25 := (unsigned(alias1(31 downto 2)) = 1);
+              if temp25 then
+                temp26 := not (val1);
+                temp27 := (old1) and (temp26);
+                temp28 := (alias2) and (val1);
+                temp29 := (temp27) or (temp28);
+                old1 <= temp29;
+              end if;
+              temp30 := (unsigned(alias1(31 downto 2)) = 2);
+              if temp30 then
+                temp31 := not (val1);
+                temp32 := (old2) and (temp31);
+                temp33 := (alias2) and (val1);
+                temp34 := (temp32) or (temp33);
+                old2 <= temp34;
+              end if;
+              temp35 := (unsigned(alias1(31 downto 2)) = 3);
+              if temp35 then
+                temp36 := not (val1);
+                temp37 := (old3) and (temp36);
+                temp38 := (alias2) and (val1);
+                temp39 := (temp37) or (temp38);
+                old3 <= temp39;
+              end if;
+              temp40 := (unsigned(alias1(31 downto 2)) = 4);
+              if temp40 then
+                inp1 <= std_logic_vector(alias2(31 downto 0));
+              end if;
+              temp41 := (unsigned(alias1(31 downto 2)) = 8);
+              if temp41 then
+                value := (inp2) + (1);
+                inp2 <= value;
+              end if;
+              temp42 := (unsigned(alias1(31 downto 2)) = 9);
+              if temp42 then
+              end if;
+              buffer_axi_bresp <= "00";
+              buffer_axi_bvalid <= '1';
+            else
+              s_proc_write <= state_1;
+            end if;
+          when state_2 =>
+            if axi_bready = '1' then
+              buffer_axi_bvalid <= '0';
+              s_proc_write <= state_1;
+              var := '0';
+              var1 := '0';
+              buffer_axi_awready <= '1';
+              buffer_axi_wready <= '1';
+            end if;
+          when others =>
+            null;
+        end case;
+      end if;
+    end if;
+  end process;
+end architecture arch_test_axilite_addr_map_entity_01;
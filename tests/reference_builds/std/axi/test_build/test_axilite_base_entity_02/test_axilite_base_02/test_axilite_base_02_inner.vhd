@@ -0,0 +1,251 @@
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+
+
+entity test_axilite_base_02_inner is
+  port (
+    axi_clk : in std_logic;
+    axi_reset : in std_logic;
+    axi_awaddr : in unsigned(10 downto 0);
+    axi_awprot : in unsigned(2 downto 0);
+    axi_awvalid : in std_logic;
+    axi_awready : out std_logic;
+    axi_wdata : in std_logic_vector(4 downto 0);
+    axi_wstrb : in std_logic_vector(3 downto 0);
+    axi_wvalid : in std_logic;
+    axi_wready : out std_logic;
+    axi_bresp : out std_logic_vector(1 downto 0);
+    axi_bvalid : out std_logic;
+    axi_bready : in std_logic;
+    axi_araddr : in unsigned(10 downto 0);
+    axi_arprot : in unsigned(2 downto 0);
+    axi_arvalid : in std_logic;
+    axi_arready : out std_logic;
+    axi_rdata : out std_logic_vector(4 downto 0);
+    axi_rresp : out std_logic_vector(1 downto 0);
+    axi_rvalid : out std_logic;
+    axi_rready : in std_logic
+    );
+end test_axilite_base_02_inner;
+
+
+architecture arch_test_axilite_base_02_inner of test_axilite_base_02_inner is
+  function cohdl_bool_to_std_logic(inp: boolean) return std_logic is
+  begin
+    if inp then
+      return('1');
+    else
+      return('0');
+    end if;
+  end function cohdl_bool_to_std_logic;
+  signal buffer_axi_awready : std_logic := '0';
+  signal buffer_axi_wready : std_logic := '0';
+  signal buffer_axi_bresp : std_logic_vector(1 downto 0) := "00";
+  signal buffer_axi_bvalid : std_logic := '0';
+  signal buffer_axi_arready : std_logic := '0';
+  signal buffer_axi_rdata : std_logic_vector(4 downto 0) := "00000";
+  signal buffer_axi_rresp : std_logic_vector(1 downto 0) := "00";
+  signal buffer_axi_rvalid : std_logic := '0';
+  signal fifo_wr_index : unsigned(3 downto 0) := unsigned'("0000");
+  signal fifo_rd_index : unsigned(3 downto 0) := unsigned'("0000");
+  signal temp : boolean;
+  signal fifo_empty : std_logic;
+  signal temp1 : unsigned(3 downto 0);
+  signal temp2 : boolean;
+  signal fifo_full : std_logic;
+  type state_proc_write is (state_0, state_1, state_2);
+  signal s_proc_write : state_proc_write := state_0;
+  signal addr : unsigned(10 downto 0);
+  signal prot : unsigned(2 downto 0);
+  signal data : std_logic_vector(4 downto 0);
+  signal strb : std_logic_vector(3 downto 0);
+  type array_type is array(0 to 15) of std_logic_vector(4 downto 0);
+  signal fifo_fifo_mem : array_type;
+  type state_proc_read is (state_0, state_1, state_2);
+  signal s_proc_read : state_proc_read := state_0;
+begin
+  
+  -- CONCURRENT BLOCK (buffer assignment)
+  axi_awready <= buffer_axi_awready;
+  axi_wready <= buffer_axi_wready;
+  axi_bresp <= buffer_axi_bresp;
+  axi_bvalid <= buffer_axi_bvalid;
+  axi_arready <= buffer_axi_arready;
+  axi_rdata <= buffer_axi_rdata;
+  axi_rresp <= buffer_axi_rresp;
+  axi_rvalid <= buffer_axi_rvalid;
+  
+  -- CONCURRENT BLOCK (logic)
+  temp <= (fifo_wr_index = fifo_rd_index);
+  fifo_empty <= cohdl_bool_to_std_logic(temp);
+  temp1 <= (fifo_wr_index) + (1);
+  temp2 <= (temp1 = fifo_rd_index);
+  fifo_full <= cohdl_bool_to_std_logic(temp2);
+  
+
+  proc_write: process(axi_clk)
+    variable temp3 : boolean;
+    variable temp4 : boolean;
+    variable var : std_logic;
+    variable var1 : std_logic;
+    variable temp5 : std_logic;
+    variable temp6 : boolean;
+    variable alias1 : unsigned(10 downto 0);
+    variable temp7 : std_logic;
+    variable temp8 : boolean;
+    variable alias2 : std_logic_vector(4 downto 0);
+    variable temp9 : std_logic;
+    variable temp10 : std_logic;
+    variable temp11 : std_logic;
+    variable temp12 : std_logic;
+    variable temp13 : std_logic;
+    variable temp14 : boolean;
+    variable temp15 : boolean;
+    variable temp16 : boolean;
+    variable data1 : std_logic_vector(4 downto 0);
+    variable temp17 : boolean;
+    variable temp18 : boolean;
+    variable temp19 : std_logic_vector(4 downto 0);
+    variable temp20 : unsigned(3 downto 0);
+    variable temp21 : unsigned(3 downto 0);
+  begin
+    if rising_edge(axi_clk) then
+      temp3 := axi_reset = '1';
+      temp4 := not (temp3);
+      if temp4 then
+        s_proc_write <= state_0;
+        buffer_axi_awready <= '0';
+        buffer_axi_wready <= '0';
+        fifo_wr_index <= unsigned'("0000");
+        buffer_axi_bresp <= "00";
+        buffer_axi_bvalid <= '0';
+      else
+        case s_proc_write is
+          when state_0 =>
+            s_proc_write <= state_1;
+            var := '0';
+            var1 := '0';
+            buffer_axi_awready <= '1';
+            buffer_axi_wready <= '1';
+          when state_1 =>
+            temp5 := not (var);
+            temp6 := temp5 = '1';
+            if temp6 then
+              alias1 := axi_awaddr;
+              addr <= axi_awaddr;
+              prot <= axi_awprot;
+            end if;
+            temp7 := not (var1);
+            temp8 := temp7 = '1';
+            if temp8 then
+              alias2 := axi_wdata;
+              data <= axi_wdata;
+              strb <= axi_wstrb;
+            end if;
+            temp9 := (var) or (axi_awvalid);
+            var := temp9;
+            temp10 := (var1) or (axi_wvalid);
+            var1 := temp10;
+            temp11 := not (var);
+            buffer_axi_awready <= temp11;
+            temp12 := not (var1);
+            buffer_axi_wready <= temp12;
+            temp13 := (var) and (var1);
+            temp14 := temp13 = '1';
+            if temp14 then
+              s_proc_write <= state_2;
+              temp15 := fifo_full = '1';
+              temp16 := not (temp15);
+              if temp16 then
+                data1 := (alias2) xor (std_logic_vector(unsigned(alias1(4 downto 0))));
+                temp17 := fifo_full = '1';
+                temp18 := not (temp17);
+                assert temp18 report "writing to full fifo";
+                temp19 := data1;
+                temp20 := fifo_wr_index;
+                fifo_fifo_mem(to_integer(temp20)) <= temp19;
+                temp21 := (fifo_wr_index) + (1);
+                fifo_wr_index <= temp21;
+              end if;
+              buffer_axi_bresp <= "00";
+              buffer_axi_bvalid <= '1';
+            else
+              s_proc_write <= state_1;
+            end if;
+          when state_2 =>
+            if axi_bready = '1' then
+              s_proc_write <= state_0;
+              buffer_axi_bvalid <= '0';
+            end if;
+          when others =>
+            null;
+        end case;
+      end if;
+    end if;
+  end process;
+  
+
+  proc_read: process(axi_clk)
+    variable temp3 : boolean;
+    variable temp4 : boolean;
+    variable temp5 : boolean;
+    variable temp6 : std_logic_vector(4 downto 0);
+    variable temp7 : boolean;
+    variable temp8 : boolean;
+    variable temp9 : unsigned(3 downto 0);
+    variable temp10 : unsigned(3 downto 0);
+    variable temp11 : std_logic_vector(4 downto 0);
+  begin
+    if rising_edge(axi_clk) then
+      temp3 := axi_reset = '1';
+      temp4 := not (temp3);
+      if temp4 then
+        s_proc_read <= state_0;
+        buffer_axi_arready <= '0';
+        buffer_axi_rdata <= "00000";
+        buffer_axi_rresp <= "00";
+        buffer_axi_rvalid <= '0';
+        fifo_rd_index <= unsigned'("0000");
+      else
+        case s_proc_read is
+          when state_0 =>
+            s_proc_read <= state_1;
+            buffer_axi_arready <= '1';
+          when state_1 =>
+            if axi_arvalid = '1' then
+              buffer_axi_arready <= '0';
+              temp5 := fifo_empty = '1';
+              if temp5 then
+                s_proc_read <= state_2;
+                temp6 := "00000";
+                buffer_axi_rdata <= temp6;
+                buffer_axi_rresp <= "00";
+                buffer_axi_rvalid <= '1';
+              else
+                s_proc_read <= state_2;
+                temp7 := fifo_empty = '1';
+                temp8 := not (temp7);
+                assert temp8 report "reading from empty fifo";
+                temp9 := (fifo_rd_index) + (1);
+                fifo_rd_index <= temp9;
+                temp10 := fifo_rd_index;
+                temp11 := fifo_fifo_mem(to_integer(temp10));
+                temp6 := temp11;
+                buffer_axi_rdata <= temp6;
+                buffer_axi_rresp <= "00";
+                buffer_axi_rvalid <= '1';
+              end if;
+            end if;
+          when state_2 =>
+            if axi_rready = '1' then
+              s_proc_read <= state_0;
+              buffer_axi_rvalid <= '0';
+            end if;
+          when others =>
+            null;
+        end case;
+      end if;
+    end if;
+  end process;
+end architecture arch_test_axilite_base_02_inner;
@@ -0,0 +1,529 @@
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+
+
+entity test_axilite_reg_03 is
+  port (
+    clk : in std_logic;
+    reset : in std_logic;
+    axi_awaddr : in unsigned(31 downto 0);
+    axi_awprot : in unsigned(2 downto 0);
+    axi_awvalid : in std_logic;
+    axi_awready : out std_logic;
+    axi_wdata : in std_logic_vector(31 downto 0);
+    axi_wstrb : in std_logic_vector(3 downto 0);
+    axi_wvalid : in std_logic;
+    axi_wready : out std_logic;
+    axi_bresp : out std_logic_vector(1 downto 0);
+    axi_bvalid : out std_logic;
+    axi_bready : in std_logic;
+    axi_araddr : in unsigned(31 downto 0);
+    axi_arprot : in unsigned(2 downto 0);
+    axi_arvalid : in std_logic;
+    axi_arready : out std_logic;
+    axi_rdata : out std_logic_vector(31 downto 0);
+    axi_rresp : out std_logic_vector(1 downto 0);
+    axi_rvalid : out std_logic;
+    axi_rready : in std_logic
+    );
+end test_axilite_reg_03;
+
+
+architecture arch_test_axilite_reg_03 of test_axilite_reg_03 is
+  function cohdl_bool_to_std_logic(inp: boolean) return std_logic is
+  begin
+    if inp then
+      return('1');
+    else
+      return('0');
+    end if;
+  end function cohdl_bool_to_std_logic;
+  signal buffer_axi_awready : std_logic := '0';
+  signal buffer_axi_wready : std_logic := '0';
+  signal buffer_axi_bresp : std_logic_vector(1 downto 0) := "00";
+  signal buffer_axi_bvalid : std_logic := '0';
+  signal buffer_axi_arready : std_logic := '0';
+  signal buffer_axi_rdata : std_logic_vector(31 downto 0) := "00000000000000000000000000000000";
+  signal buffer_axi_rresp : std_logic_vector(1 downto 0) := "00";
+  signal buffer_axi_rvalid : std_logic := '0';
+  type state_impl_sequential is (state_0, state_1, state_2);
+  signal s_impl_sequential : state_impl_sequential := state_0;
+  signal inp : unsigned(15 downto 0) := unsigned'("0000000000000000");
+  signal sync_flag_4_rx : std_logic := '0';
+  signal sig : unsigned(7 downto 0);
+  signal sync_flag_4_tx : std_logic := '0';
+  type state_impl_sequential1 is (state_0, state_1, state_2);
+  signal s_impl_sequential1 : state_impl_sequential1 := state_0;
+  signal inp1 : unsigned(15 downto 0) := unsigned'("0000000000000000");
+  signal sync_flag_5_rx : std_logic := '0';
+  signal sig1 : unsigned(7 downto 0);
+  signal sync_flag_5_tx : std_logic := '0';
+  type state_impl_sequential2 is (state_0, state_1, state_2);
+  signal s_impl_sequential2 : state_impl_sequential2 := state_0;
+  signal inp2 : unsigned(15 downto 0) := unsigned'("0000000000000000");
+  signal sync_flag_6_rx : std_logic := '0';
+  signal sig2 : unsigned(7 downto 0);
+  signal sync_flag_6_tx : std_logic := '0';
+  type state_impl_sequential3 is (state_0, state_1, state_2);
+  signal s_impl_sequential3 : state_impl_sequential3 := state_0;
+  signal inp3 : unsigned(15 downto 0) := unsigned'("0000000000000000");
+  signal sync_flag_7_rx : std_logic := '0';
+  signal sig3 : unsigned(7 downto 0);
+  signal sync_flag_7_tx : std_logic := '0';
+  type state_proc_read is (state_0, state_1, state_2);
+  signal s_proc_read : state_proc_read := state_0;
+  type state_proc_write is (state_0, state_1, state_2);
+  signal s_proc_write : state_proc_write := state_0;
+  signal addr : unsigned(31 downto 0);
+  signal prot : unsigned(2 downto 0);
+  signal data : std_logic_vector(31 downto 0);
+  signal strb : std_logic_vector(3 downto 0);
+begin
+  
+  -- CONCURRENT BLOCK (buffer assignment)
+  axi_awready <= buffer_axi_awready;
+  axi_wready <= buffer_axi_wready;
+  axi_bresp <= buffer_axi_bresp;
+  axi_bvalid <= buffer_axi_bvalid;
+  axi_arready <= buffer_axi_arready;
+  axi_rdata <= buffer_axi_rdata;
+  axi_rresp <= buffer_axi_rresp;
+  axi_rvalid <= buffer_axi_rvalid;
+  
+
+  impl_sequential: process(clk)
+    variable temp : boolean;
+    variable temp1 : boolean;
+    variable temp2 : boolean;
+    variable temp3 : unsigned(7 downto 0);
+    variable other : unsigned(15 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+        s_impl_sequential <= state_0;
+        inp <= unsigned'("0000000000000000");
+        sync_flag_4_rx <= '0';
+      else
+        case s_impl_sequential is
+          when state_0 =>
+            s_impl_sequential <= state_1;
+            sig <= unsigned'("00000000");
+          when state_1 =>
+            temp1 := (sync_flag_4_tx /= sync_flag_4_rx);
+            if temp1 then
+              s_impl_sequential <= state_2;
+            end if;
+          when state_2 =>
+            temp2 := (sig < 16);
+            if temp2 then
+              s_impl_sequential <= state_2;
+              temp3 := (sig) + (1);
+              sig <= temp3;
+            else
+              s_impl_sequential <= state_0;
+              other := (inp) + (1);
+              inp <= other;
+              sync_flag_4_rx <= sync_flag_4_tx;
+            end if;
+          when others =>
+            null;
+        end case;
+      end if;
+    end if;
+  end process;
+  
+
+  impl_sequential1: process(clk)
+    variable temp : boolean;
+    variable temp1 : boolean;
+    variable temp2 : boolean;
+    variable temp3 : unsigned(7 downto 0);
+    variable other : unsigned(15 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+        s_impl_sequential1 <= state_0;
+        inp1 <= unsigned'("0000000000000000");
+        sync_flag_5_rx <= '0';
+      else
+        case s_impl_sequential1 is
+          when state_0 =>
+            s_impl_sequential1 <= state_1;
+            sig1 <= unsigned'("00000000");
+          when state_1 =>
+            temp1 := (sync_flag_5_tx /= sync_flag_5_rx);
+            if temp1 then
+              s_impl_sequential1 <= state_2;
+            end if;
+          when state_2 =>
+            temp2 := (sig1 < 16);
+            if temp2 then
+              s_impl_sequential1 <= state_2;
+              temp3 := (sig1) + (1);
+              sig1 <= temp3;
+            else
+              s_impl_sequential1 <= state_0;
+              other := (inp1) + (1);
+              inp1 <= other;
+              sync_flag_5_rx <= sync_flag_5_tx;
+            end if;
+          when others =>
+            null;
+        end case;
+      end if;
+    end if;
+  end process;
+  
+
+  impl_sequential2: process(clk)
+    variable temp : boolean;
+    variable temp1 : boolean;
+    variable temp2 : boolean;
+    variable temp3 : unsigned(7 downto 0);
+    variable other : unsigned(15 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+        s_impl_sequential2 <= state_0;
+        inp2 <= unsigned'("0000000000000000");
+        sync_flag_6_rx <= '0';
+      else
+        case s_impl_sequential2 is
+          when state_0 =>
+            s_impl_sequential2 <= state_1;
+            sig2 <= unsigned'("00000000");
+          when state_1 =>
+            temp1 := (sync_flag_6_tx /= sync_flag_6_rx);
+            if temp1 then
+              s_impl_sequential2 <= state_2;
+            end if;
+          when state_2 =>
+            temp2 := (sig2 < 16);
+            if temp2 then
+              s_impl_sequential2 <= state_2;
+              temp3 := (sig2) + (1);
+              sig2 <= temp3;
+            else
+              s_impl_sequential2 <= state_0;
+              other := (inp2) + (1);
+              inp2 <= other;
+              sync_flag_6_rx <= sync_flag_6_tx;
+            end if;
+          when others =>
+            null;
+        end case;
+      end if;
+    end if;
+  end process;
+  
+
+  impl_sequential3: process(clk)
+    variable temp : boolean;
+    variable temp1 : boolean;
+    variable temp2 : boolean;
+    variable temp3 : unsigned(7 downto 0);
+    variable other : unsigned(15 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+        s_impl_sequential3 <= state_0;
+        inp3 <= unsigned'("0000000000000000");
+        sync_flag_7_rx <= '0';
+      else
+        case s_impl_sequential3 is
+          when state_0 =>
+            s_impl_sequential3 <= state_1;
+            sig3 <= unsigned'("00000000");
+          when state_1 =>
+            temp1 := (sync_flag_7_tx /= sync_flag_7_rx);
+            if temp1 then
+              s_impl_sequential3 <= state_2;
+            end if;
+          when state_2 =>
+            temp2 := (sig3 < 16);
+            if temp2 then
+              s_impl_sequential3 <= state_2;
+              temp3 := (sig3) + (1);
+              sig3 <= temp3;
+            else
+              s_impl_sequential3 <= state_0;
+              other := (inp3) + (1);
+              inp3 <= other;
+              sync_flag_7_rx <= sync_flag_7_tx;
+            end if;
+          when others =>
+            null;
+        end case;
+      end if;
+    end if;
+  end process;
+  
+
+  proc_read: process(clk)
+    variable temp : boolean;
+    variable data1 : std_logic_vector(31 downto 0);
+    variable temp1 : boolean;
+    variable b : std_logic_vector(15 downto 0);
+    variable temp2 : boolean;
+    variable first : std_logic;
+    variable a : std_logic_vector(15 downto 0);
+    variable temp3 : std_logic_vector(31 downto 0);
+    variable temp4 : boolean;
+    variable b1 : std_logic_vector(15 downto 0);
+    variable temp5 : boolean;
+    variable first1 : std_logic;
+    variable a1 : std_logic_vector(15 downto 0);
+    variable temp6 : std_logic_vector(31 downto 0);
+    variable temp7 : boolean;
+    variable b2 : std_logic_vector(15 downto 0);
+    variable temp8 : boolean;
+    variable first2 : std_logic;
+    variable a2 : std_logic_vector(15 downto 0);
+    variable temp9 : std_logic_vector(31 downto 0);
+    variable temp10 : boolean;
+    variable b3 : std_logic_vector(15 downto 0);
+    variable temp11 : boolean;
+    variable first3 : std_logic;
+    variable a3 : std_logic_vector(15 downto 0);
+    variable temp12 : std_logic_vector(31 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+        s_proc_read <= state_0;
+        buffer_axi_arready <= '0';
+        buffer_axi_rdata <= "00000000000000000000000000000000";
+        buffer_axi_rresp <= "00";
+        buffer_axi_rvalid <= '0';
+      else
+        case s_proc_read is
+          when state_0 =>
+            s_proc_read <= state_1;
+            buffer_axi_arready <= '1';
+          when state_1 =>
+            if axi_arvalid = '1' then
+              s_proc_read <= state_2;
+              buffer_axi_arready <= '0';
+              data1 := "00000000000000000000000000000000";
+              temp1 := (unsigned(axi_araddr(31 downto 2)) = 0);
+              if temp1 then
+                b := std_logic_vector(inp);
+                temp2 := (sync_flag_4_tx /= sync_flag_4_rx);
+                first := cohdl_bool_to_std_logic(temp2);
+                a := (first) & ("000000000000000");
+                temp3 := (a) & (b);
+                data1 := temp3;
+              end if;
+              temp4 := (unsigned(axi_araddr(31 downto 2)) = 1);
+              if temp4 then
+                b1 := std_logic_vector(inp1);
+                temp5 := (sync_flag_5_tx /= sync_flag_5_rx);
+                first1 := cohdl_bool_to_std_logic(temp5);
+                a1 := (first1) & ("000000000000000");
+                temp6 := (a1) & (b1);
+                data1 := temp6;
+              end if;
+              temp7 := (unsigned(axi_araddr(31 downto 2)) = 2);
+              if temp7 then
+                b2 := std_logic_vector(inp2);
+                temp8 := (sync_flag_6_tx /= sync_flag_6_rx);
+                first2 := cohdl_bool_to_std_logic(temp8);
+                a2 := (first2) & ("000000000000000");
+                temp9 := (a2) & (b2);
+                data1 := temp9;
+              end if;
+              temp10 := (unsigned(axi_araddr(31 downto 2)) = 3);
+              if temp10 then
+                b3 := std_logic_vector(inp3);
+                temp11 := (sync_flag_7_tx /= sync_flag_7_rx);
+                first3 := cohdl_bool_to_std_logic(temp11);
+                a3 := (first3) & ("000000000000000");
+                temp12 := (a3) & (b3);
+                data1 := temp12;
+              end if;
+              buffer_axi_rdata <= data1;
+              buffer_axi_rresp <= "00";
+              buffer_axi_rvalid <= '1';
+            end if;
+          when state_2 =>
+            if axi_rready = '1' then
+              buffer_axi_rvalid <= '0';
+              s_proc_read <= state_1;
+              buffer_axi_arready <= '1';
+            end if;
+          when others =>
+            null;
+        end case;
+      end if;
+    end if;
+  end process;
+  
+
+  proc_write: process(clk)
+    variable temp : boolean;
+    variable var : std_logic;
+    variable var1 : std_logic;
+    variable temp1 : std_logic;
+    variable temp2 : boolean;
+    variable alias1 : unsigned(31 downto 0);
+    variable temp3 : std_logic;
+    variable temp4 : boolean;
+    variable alias2 : std_logic_vector(31 downto 0);
+    variable alias3 : std_logic_vector(3 downto 0);
+    variable temp5 : std_logic;
+    variable temp6 : std_logic;
+    variable temp7 : std_logic;
+    variable temp8 : std_logic;
+    variable temp9 : std_logic;
+    variable temp10 : boolean;
+    variable temp11 : std_logic_vector(1 downto 0);
+    variable temp12 : std_logic_vector(3 downto 0);
+    variable first : std_logic_vector(7 downto 0);
+    variable temp13 : std_logic_vector(1 downto 0);
+    variable temp14 : std_logic_vector(3 downto 0);
+    variable first1 : std_logic_vector(7 downto 0);
+    variable temp15 : std_logic_vector(1 downto 0);
+    variable temp16 : std_logic_vector(3 downto 0);
+    variable first2 : std_logic_vector(7 downto 0);
+    variable temp17 : std_logic_vector(1 downto 0);
+    variable temp18 : std_logic_vector(3 downto 0);
+    variable first3 : std_logic_vector(7 downto 0);
+    variable a : std_logic_vector(15 downto 0);
+    variable b : std_logic_vector(15 downto 0);
+    variable val : std_logic_vector(31 downto 0);
+    variable val1 : std_logic_vector(31 downto 0);
+    variable temp19 : boolean;
+    variable temp20 : boolean;
+    variable temp21 : std_logic;
+    variable temp22 : boolean;
+    variable temp23 : boolean;
+    variable temp24 : std_logic;
+    variable temp25 : boolean;
+    variable temp26 : boolean;
+    variable temp27 : std_logic;
+    variable temp28 : boolean;
+    variable temp29 : boolean;
+    variable temp30 : std_logic;
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+        s_proc_write <= state_0;
+        buffer_axi_awready <= '0';
+        buffer_axi_wready <= '0';
+        sync_flag_4_tx <= '0';
+        sync_flag_5_tx <= '0';
+        sync_flag_6_tx <= '0';
+        sync_flag_7_tx <= '0';
+        buffer_axi_bresp <= "00";
+        buffer_axi_bvalid <= '0';
+      else
+        case s_proc_write is
+          when state_0 =>
+            s_proc_write <= state_1;
+            var := '0';
+            var1 := '0';
+            buffer_axi_awready <= '1';
+            buffer_axi_wready <= '1';
+          when state_1 =>
+            temp1 := not (var);
+            temp2 := temp1 = '1';
+            if temp2 then
+              alias1 := axi_awaddr;
+              addr <= axi_awaddr;
+              prot <= axi_awprot;
+            end if;
+            temp3 := not (var1);
+            temp4 := temp3 = '1';
+            if temp4 then
+              alias2 := axi_wdata;
+              data <= axi_wdata;
+              alias3 := axi_wstrb;
+              strb <= axi_wstrb;
+            end if;
+            temp5 := (var) or (axi_awvalid);
+            var := temp5;
+            temp6 := (var1) or (axi_wvalid);
+            var1 := temp6;
+            temp7 := not (var);
+            buffer_axi_awready <= temp7;
+            temp8 := not (var1);
+            buffer_axi_wready <= temp8;
+            temp9 := (var) and (var1);
+            temp10 := temp9 = '1';
+            if temp10 then
+              s_proc_write <= state_2;
+              temp11 := (alias3(0)) & (alias3(0));
+              temp12 := (temp11) & (temp11);
+              first := (temp12) & (temp12);
+              temp13 := (alias3(1)) & (alias3(1));
+              temp14 := (temp13) & (temp13);
+              first1 := (temp14) & (temp14);
+              temp15 := (alias3(2)) & (alias3(2));
+              temp16 := (temp15) & (temp15);
+              first2 := (temp16) & (temp16);
+              temp17 := (alias3(3)) & (alias3(3));
+              temp18 := (temp17) & (temp17);
+              first3 := (temp18) & (temp18);
+              a := (first3) & (first2);
+              b := (first1) & (first);
+              val := (a) & (b);
+              val1 := val;
+              temp19 := (unsigned(alias1(31 downto 2)) = 0);
+              if temp19 then
+                temp20 := alias2(31) = '1';
+                if temp20 then
+                  temp21 := not (sync_flag_4_rx);
+                  sync_flag_4_tx <= temp21;
+                end if;
+              end if;
+              temp22 := (unsigned(alias1(31 downto 2)) = 1);
+              if temp22 then
+                temp23 := alias2(31) = '1';
+                if temp23 then
+                  temp24 := not (sync_flag_5_rx);
+                  sync_flag_5_tx <= temp24;
+                end if;
+              end if;
+              temp25 := (unsigned(alias1(31 downto 2)) = 2);
+              if temp25 then
+                temp26 := alias2(31) = '1';
+                if temp26 then
+                  temp27 := not (sync_flag_6_rx);
+                  sync_flag_6_tx <= temp27;
+                end if;
+              end if;
+              temp28 := (unsigned(alias1(31 downto 2)) = 3);
+              if temp28 then
+                temp29 := alias2(31) = '1';
+                if temp29 then
+                  temp30 := not (sync_flag_7_rx);
+                  sync_flag_7_tx <= temp30;
+                end if;
+              end if;
+              buffer_axi_bresp <= "00";
+              buffer_axi_bvalid <= '1';
+            else
+              s_proc_write <= state_1;
+            end if;
+          when state_2 =>
+            if axi_bready = '1' then
+              buffer_axi_bvalid <= '0';
+              s_proc_write <= state_1;
+              var := '0';
+              var1 := '0';
+              buffer_axi_awready <= '1';
+              buffer_axi_wready <= '1';
+            end if;
+          when others =>
+            null;
+        end case;
+      end if;
+    end if;
+  end process;
+end architecture arch_test_axilite_reg_03;
@@ -0,0 +1,361 @@
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+
+
+entity test_axilite_reg_05 is
+  port (
+    clk : in std_logic;
+    reset : in std_logic;
+    axi_awaddr : in unsigned(31 downto 0);
+    axi_awprot : in unsigned(2 downto 0);
+    axi_awvalid : in std_logic;
+    axi_awready : out std_logic;
+    axi_wdata : in std_logic_vector(31 downto 0);
+    axi_wstrb : in std_logic_vector(3 downto 0);
+    axi_wvalid : in std_logic;
+    axi_wready : out std_logic;
+    axi_bresp : out std_logic_vector(1 downto 0);
+    axi_bvalid : out std_logic;
+    axi_bready : in std_logic;
+    axi_araddr : in unsigned(31 downto 0);
+    axi_arprot : in unsigned(2 downto 0);
+    axi_arvalid : in std_logic;
+    axi_arready : out std_logic;
+    axi_rdata : out std_logic_vector(31 downto 0);
+    axi_rresp : out std_logic_vector(1 downto 0);
+    axi_rvalid : out std_logic;
+    axi_rready : in std_logic
+    );
+end test_axilite_reg_05;
+
+
+architecture arch_test_axilite_reg_05 of test_axilite_reg_05 is
+  function cohdl_bool_to_std_logic(inp: boolean) return std_logic is
+  begin
+    if inp then
+      return('1');
+    else
+      return('0');
+    end if;
+  end function cohdl_bool_to_std_logic;
+  signal buffer_axi_awready : std_logic := '0';
+  signal buffer_axi_wready : std_logic := '0';
+  signal buffer_axi_bresp : std_logic_vector(1 downto 0) := "00";
+  signal buffer_axi_bvalid : std_logic := '0';
+  signal buffer_axi_arready : std_logic := '0';
+  signal buffer_axi_rdata : std_logic_vector(31 downto 0) := "00000000000000000000000000000000";
+  signal buffer_axi_rresp : std_logic_vector(1 downto 0) := "00";
+  signal buffer_axi_rvalid : std_logic := '0';
+  signal inp : std_logic_vector(2 downto 0) := "000";
+  signal inp1 : signed(4 downto 0) := signed'("11111");
+  signal inp2 : std_logic_vector(2 downto 0) := "000";
+  signal inp3 : signed(4 downto 0) := signed'("11111");
+  signal inp4 : std_logic_vector(2 downto 0) := "000";
+  signal inp5 : signed(4 downto 0) := signed'("11111");
+  signal inp6 : std_logic_vector(2 downto 0) := "000";
+  signal inp7 : signed(4 downto 0) := signed'("11111");
+  type state_proc_read is (state_0, state_1, state_2);
+  signal s_proc_read : state_proc_read := state_0;
+  signal inp8 : unsigned(3 downto 0) := unsigned'("0001");
+  signal inp9 : unsigned(3 downto 0) := unsigned'("0001");
+  signal inp10 : unsigned(3 downto 0) := unsigned'("0001");
+  signal inp11 : unsigned(3 downto 0) := unsigned'("0001");
+  type state_proc_write is (state_0, state_1, state_2);
+  signal s_proc_write : state_proc_write := state_0;
+  signal addr : unsigned(31 downto 0);
+  signal prot : unsigned(2 downto 0);
+  signal data : std_logic_vector(31 downto 0);
+  signal strb : std_logic_vector(3 downto 0);
+begin
+  
+  -- CONCURRENT BLOCK (buffer assignment)
+  axi_awready <= buffer_axi_awready;
+  axi_wready <= buffer_axi_wready;
+  axi_bresp <= buffer_axi_bresp;
+  axi_bvalid <= buffer_axi_bvalid;
+  axi_arready <= buffer_axi_arready;
+  axi_rdata <= buffer_axi_rdata;
+  axi_rresp <= buffer_axi_rresp;
+  axi_rvalid <= buffer_axi_rvalid;
+  
+  -- CONCURRENT BLOCK (_impl_concurrent_)
+  inp <= "010";
+  inp1 <= signed'("00011");
+  
+  -- CONCURRENT BLOCK (_impl_concurrent_)
+  inp2 <= "010";
+  inp3 <= signed'("00011");
+  
+  -- CONCURRENT BLOCK (_impl_concurrent_)
+  inp4 <= "010";
+  inp5 <= signed'("00011");
+  
+  -- CONCURRENT BLOCK (_impl_concurrent_)
+  inp6 <= "010";
+  inp7 <= signed'("00011");
+  
+
+  proc_read: process(clk)
+    variable temp : boolean;
+    variable data1 : std_logic_vector(31 downto 0);
+    variable temp1 : boolean;
+    variable b : std_logic_vector(2 downto 0);
+    variable b1 : std_logic_vector(3 downto 0);
+    variable b2 : std_logic_vector(4 downto 0);
+    variable a : std_logic_vector(15 downto 0);
+    variable b3 : std_logic_vector(7 downto 0);
+    variable b4 : std_logic_vector(7 downto 0);
+    variable a1 : std_logic_vector(23 downto 0);
+    variable temp2 : std_logic_vector(31 downto 0);
+    variable temp3 : boolean;
+    variable b5 : std_logic_vector(2 downto 0);
+    variable b6 : std_logic_vector(3 downto 0);
+    variable b7 : std_logic_vector(4 downto 0);
+    variable a2 : std_logic_vector(15 downto 0);
+    variable b8 : std_logic_vector(7 downto 0);
+    variable b9 : std_logic_vector(7 downto 0);
+    variable a3 : std_logic_vector(23 downto 0);
+    variable temp4 : std_logic_vector(31 downto 0);
+    variable temp5 : boolean;
+    variable b10 : std_logic_vector(2 downto 0);
+    variable b11 : std_logic_vector(3 downto 0);
+    variable b12 : std_logic_vector(4 downto 0);
+    variable a4 : std_logic_vector(15 downto 0);
+    variable b13 : std_logic_vector(7 downto 0);
+    variable b14 : std_logic_vector(7 downto 0);
+    variable a5 : std_logic_vector(23 downto 0);
+    variable temp6 : std_logic_vector(31 downto 0);
+    variable temp7 : boolean;
+    variable b15 : std_logic_vector(2 downto 0);
+    variable b16 : std_logic_vector(3 downto 0);
+    variable b17 : std_logic_vector(4 downto 0);
+    variable a6 : std_logic_vector(15 downto 0);
+    variable b18 : std_logic_vector(7 downto 0);
+    variable b19 : std_logic_vector(7 downto 0);
+    variable a7 : std_logic_vector(23 downto 0);
+    variable temp8 : std_logic_vector(31 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+        s_proc_read <= state_0;
+        buffer_axi_arready <= '0';
+        buffer_axi_rdata <= "00000000000000000000000000000000";
+        buffer_axi_rresp <= "00";
+        buffer_axi_rvalid <= '0';
+      else
+        case s_proc_read is
+          when state_0 =>
+            s_proc_read <= state_1;
+            buffer_axi_arready <= '1';
+          when state_1 =>
+            if axi_arvalid = '1' then
+              s_proc_read <= state_2;
+              buffer_axi_arready <= '0';
+              data1 := "00000000000000000000000000000000";
+              temp1 := (unsigned(axi_araddr(31 downto 2)) = 0);
+              if temp1 then
+                b := inp;
+                b1 := std_logic_vector(inp8);
+                b2 := std_logic_vector(inp1);
+                a := ("00000000000") & (b2);
+                b3 := ("0000") & (b1);
+                b4 := ("00000") & (b);
+                a1 := (a) & (b3);
+                temp2 := (a1) & (b4);
+                data1 := temp2;
+              end if;
+              temp3 := (unsigned(axi_araddr(31 downto 2)) = 1);
+              if temp3 then
+                b5 := inp2;
+                b6 := std_logic_vector(inp9);
+                b7 := std_logic_vector(inp3);
+                a2 := ("00000000000") & (b7);
+                b8 := ("0000") & (b6);
+                b9 := ("00000") & (b5);
+                a3 := (a2) & (b8);
+                temp4 := (a3) & (b9);
+                data1 := temp4;
+              end if;
+              temp5 := (unsigned(axi_araddr(31 downto 2)) = 2);
+              if temp5 then
+                b10 := inp4;
+                b11 := std_logic_vector(inp10);
+                b12 := std_logic_vector(inp5);
+                a4 := ("00000000000") & (b12);
+                b13 := ("0000") & (b11);
+                b14 := ("00000") & (b10);
+                a5 := (a4) & (b13);
+                temp6 := (a5) & (b14);
+                data1 := temp6;
+              end if;
+              temp7 := (unsigned(axi_araddr(31 downto 2)) = 3);
+              if temp7 then
+                b15 := inp6;
+                b16 := std_logic_vector(inp11);
+                b17 := std_logic_vector(inp7);
+                a6 := ("00000000000") & (b17);
+                b18 := ("0000") & (b16);
+                b19 := ("00000") & (b15);
+                a7 := (a6) & (b18);
+                temp8 := (a7) & (b19);
+                data1 := temp8;
+              end if;
+              buffer_axi_rdata <= data1;
+              buffer_axi_rresp <= "00";
+              buffer_axi_rvalid <= '1';
+            end if;
+          when state_2 =>
+            if axi_rready = '1' then
+              buffer_axi_rvalid <= '0';
+              s_proc_read <= state_1;
+              buffer_axi_arready <= '1';
+            end if;
+          when others =>
+            null;
+        end case;
+      end if;
+    end if;
+  end process;
+  
+
+  proc_write: process(clk)
+    variable temp : boolean;
+    variable var : std_logic;
+    variable var1 : std_logic;
+    variable temp1 : std_logic;
+    variable temp2 : boolean;
+    variable alias1 : unsigned(31 downto 0);
+    variable temp3 : std_logic;
+    variable temp4 : boolean;
+    variable alias2 : std_logic_vector(31 downto 0);
+    variable alias3 : std_logic_vector(3 downto 0);
+    variable temp5 : std_logic;
+    variable temp6 : std_logic;
+    variable temp7 : std_logic;
+    variable temp8 : std_logic;
+    variable temp9 : std_logic;
+    variable temp10 : boolean;
+    variable temp11 : std_logic_vector(1 downto 0);
+    variable temp12 : std_logic_vector(3 downto 0);
+    variable first : std_logic_vector(7 downto 0);
+    variable temp13 : std_logic_vector(1 downto 0);
+    variable temp14 : std_logic_vector(3 downto 0);
+    variable first1 : std_logic_vector(7 downto 0);
+    variable temp15 : std_logic_vector(1 downto 0);
+    variable temp16 : std_logic_vector(3 downto 0);
+    variable first2 : std_logic_vector(7 downto 0);
+    variable temp17 : std_logic_vector(1 downto 0);
+    variable temp18 : std_logic_vector(3 downto 0);
+    variable first3 : std_logic_vector(7 downto 0);
+    variable a : std_logic_vector(15 downto 0);
+    variable b : std_logic_vector(15 downto 0);
+    variable val : std_logic_vector(31 downto 0);
+    variable val1 : std_logic_vector(31 downto 0);
+    variable temp19 : boolean;
+    variable temp20 : boolean;
+    variable temp21 : boolean;
+    variable temp22 : boolean;
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+        s_proc_write <= state_0;
+        buffer_axi_awready <= '0';
+        buffer_axi_wready <= '0';
+        inp8 <= unsigned'("0001");
+        inp9 <= unsigned'("0001");
+        inp10 <= unsigned'("0001");
+        inp11 <= unsigned'("0001");
+        buffer_axi_bresp <= "00";
+        buffer_axi_bvalid <= '0';
+      else
+        case s_proc_write is
+          when state_0 =>
+            s_proc_write <= state_1;
+            var := '0';
+            var1 := '0';
+            buffer_axi_awready <= '1';
+            buffer_axi_wready <= '1';
+          when state_1 =>
+            temp1 := not (var);
+            temp2 := temp1 = '1';
+            if temp2 then
+              alias1 := axi_awaddr;
+              addr <= axi_awaddr;
+              prot <= axi_awprot;
+            end if;
+            temp3 := not (var1);
+            temp4 := temp3 = '1';
+            if temp4 then
+              alias2 := axi_wdata;
+              data <= axi_wdata;
+              alias3 := axi_wstrb;
+              strb <= axi_wstrb;
+            end if;
+            temp5 := (var) or (axi_awvalid);
+            var := temp5;
+            temp6 := (var1) or (axi_wvalid);
+            var1 := temp6;
+            temp7 := not (var);
+            buffer_axi_awready <= temp7;
+            temp8 := not (var1);
+            buffer_axi_wready <= temp8;
+            temp9 := (var) and (var1);
+            temp10 := temp9 = '1';
+            if temp10 then
+              s_proc_write <= state_2;
+              temp11 := (alias3(0)) & (alias3(0));
+              temp12 := (temp11) & (temp11);
+              first := (temp12) & (temp12);
+              temp13 := (alias3(1)) & (alias3(1));
+              temp14 := (temp13) & (temp13);
+              first1 := (temp14) & (temp14);
+              temp15 := (alias3(2)) & (alias3(2));
+              temp16 := (temp15) & (temp15);
+              first2 := (temp16) & (temp16);
+              temp17 := (alias3(3)) & (alias3(3));
+              temp18 := (temp17) & (temp17);
+              first3 := (temp18) & (temp18);
+              a := (first3) & (first2);
+              b := (first1) & (first);
+              val := (a) & (b);
+              val1 := val;
+              temp19 := (unsigned(alias1(31 downto 2)) = 0);
+              if temp19 then
+                inp8 <= unsigned(std_logic_vector(alias2(11 downto 8)));
+              end if;
+              temp20 := (unsigned(alias1(31 downto 2)) = 1);
+              if temp20 then
+                inp9 <= unsigned(std_logic_vector(alias2(11 downto 8)));
+              end if;
+              temp21 := (unsigned(alias1(31 downto 2)) = 2);
+              if temp21 then
+                inp10 <= unsigned(std_logic_vector(alias2(11 downto 8)));
+              end if;
+              temp22 := (unsigned(alias1(31 downto 2)) = 3);
+              if temp22 then
+                inp11 <= unsigned(std_logic_vector(alias2(11 downto 8)));
+              end if;
+              buffer_axi_bresp <= "00";
+              buffer_axi_bvalid <= '1';
+            else
+              s_proc_write <= state_1;
+            end if;
+          when state_2 =>
+            if axi_bready = '1' then
+              buffer_axi_bvalid <= '0';
+              s_proc_write <= state_1;
+              var := '0';
+              var1 := '0';
+              buffer_axi_awready <= '1';
+              buffer_axi_wready <= '1';
+            end if;
+          when others =>
+            null;
+        end case;
+      end if;
+    end if;
+  end process;
+end architecture arch_test_axilite_reg_05;
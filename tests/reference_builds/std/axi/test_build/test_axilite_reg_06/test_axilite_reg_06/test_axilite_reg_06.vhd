@@ -0,0 +1,320 @@
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+
+
+entity test_axilite_reg_06 is
+  port (
+    clk : in std_logic;
+    reset : in std_logic;
+    axi_awaddr : in unsigned(31 downto 0);
+    axi_awprot : in unsigned(2 downto 0);
+    axi_awvalid : in std_logic;
+    axi_awready : out std_logic;
+    axi_wdata : in std_logic_vector(31 downto 0);
+    axi_wstrb : in std_logic_vector(3 downto 0);
+    axi_wvalid : in std_logic;
+    axi_wready : out std_logic;
+    axi_bresp : out std_logic_vector(1 downto 0);
+    axi_bvalid : out std_logic;
+    axi_bready : in std_logic;
+    axi_araddr : in unsigned(31 downto 0);
+    axi_arprot : in unsigned(2 downto 0);
+    axi_arvalid : in std_logic;
+    axi_arready : out std_logic;
+    axi_rdata : out std_logic_vector(31 downto 0);
+    axi_rresp : out std_logic_vector(1 downto 0);
+    axi_rvalid : out std_logic;
+    axi_rready : in std_logic
+    );
+end test_axilite_reg_06;
+
+
+architecture arch_test_axilite_reg_06 of test_axilite_reg_06 is
+  function cohdl_bool_to_std_logic(inp: boolean) return std_logic is
+  begin
+    if inp then
+      return('1');
+    else
+      return('0');
+    end if;
+  end function cohdl_bool_to_std_logic;
+  signal buffer_axi_awready : std_logic := '0';
+  signal buffer_axi_wready : std_logic := '0';
+  signal buffer_axi_bresp : std_logic_vector(1 downto 0) := "00";
+  signal buffer_axi_bvalid : std_logic := '0';
+  signal buffer_axi_arready : std_logic := '0';
+  signal buffer_axi_rdata : std_logic_vector(31 downto 0) := "00000000000000000000000000000000";
+  signal buffer_axi_rresp : std_logic_vector(1 downto 0) := "00";
+  signal buffer_axi_rvalid : std_logic := '0';
+  signal sig : std_logic_vector(31 downto 0) := "00000000000000000000000000000000";
+  signal old : std_logic_vector(31 downto 0) := "00000000000000000000000000000000";
+  signal sig1 : unsigned(31 downto 0) := unsigned'("00000000000000000000000000000000");
+  signal src : unsigned(31 downto 0) := unsigned'("00000000000000000000010011010010");
+  signal sig2 : signed(31 downto 0) := signed'("00000000000000000000000000000000");
+  signal old1 : signed(31 downto 0) := signed'("00000000000000000001010110110011");
+  type state_proc_read is (state_0, state_1, state_2);
+  signal s_proc_read : state_proc_read := state_0;
+  type state_proc_write is (state_0, state_1, state_2);
+  signal s_proc_write : state_proc_write := state_0;
+  signal addr : unsigned(31 downto 0);
+  signal prot : unsigned(2 downto 0);
+  signal data : std_logic_vector(31 downto 0);
+  signal strb : std_logic_vector(3 downto 0);
+begin
+  
+  -- CONCURRENT BLOCK (buffer assignment)
+  axi_awready <= buffer_axi_awready;
+  axi_wready <= buffer_axi_wready;
+  axi_bresp <= buffer_axi_bresp;
+  axi_bvalid <= buffer_axi_bvalid;
+  axi_arready <= buffer_axi_arready;
+  axi_rdata <= buffer_axi_rdata;
+  axi_rresp <= buffer_axi_rresp;
+  axi_rvalid <= buffer_axi_rvalid;
+  
+  -- CONCURRENT BLOCK (_impl_concurrent_)
+  sig <= old;
+  sig1 <= src;
+  sig2 <= old1;
+  
+
+  proc_read: process(clk)
+    variable temp : boolean;
+    variable data1 : std_logic_vector(31 downto 0);
+    variable temp1 : boolean;
+    variable temp2 : boolean;
+    variable temp3 : boolean;
+    variable temp4 : boolean;
+    variable temp5 : boolean;
+    variable temp6 : boolean;
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+        s_proc_read <= state_0;
+        buffer_axi_arready <= '0';
+        buffer_axi_rdata <= "00000000000000000000000000000000";
+        buffer_axi_rresp <= "00";
+        buffer_axi_rvalid <= '0';
+      else
+        case s_proc_read is
+          when state_0 =>
+            s_proc_read <= state_1;
+            buffer_axi_arready <= '1';
+          when state_1 =>
+            if axi_arvalid = '1' then
+              s_proc_read <= state_2;
+              buffer_axi_arready <= '0';
+              data1 := "00000000000000000000000000000000";
+              temp1 := (unsigned(axi_araddr(31 downto 2)) = 0);
+              if temp1 then
+                data1 := sig;
+              end if;
+              temp2 := (unsigned(axi_araddr(31 downto 2)) = 1);
+              if temp2 then
+                data1 := std_logic_vector(sig1);
+              end if;
+              temp3 := (unsigned(axi_araddr(31 downto 2)) = 2);
+              if temp3 then
+                data1 := std_logic_vector(sig2);
+              end if;
+              temp4 := (unsigned(axi_araddr(31 downto 2)) = 4);
+              if temp4 then
+                data1 := old;
+              end if;
+              temp5 := (unsigned(axi_araddr(31 downto 2)) = 5);
+              if temp5 then
+                data1 := std_logic_vector(src);
+              end if;
+              temp6 := (unsigned(axi_araddr(31 downto 2)) = 6);
+              if temp6 then
+                data1 := std_logic_vector(old1);
+              end if;
+              buffer_axi_rdata <= data1;
+              buffer_axi_rresp <= "00";
+              buffer_axi_rvalid <= '1';
+            end if;
+          when state_2 =>
+            if axi_rready = '1' then
+              buffer_axi_rvalid <= '0';
+              s_proc_read <= state_1;
+              buffer_axi_arready <= '1';
+            end if;
+          when others =>
+            null;
+        end case;
+      end if;
+    end if;
+  end process;
+  
+
+  proc_write: process(clk)
+    variable temp : boolean;
+    variable var : std_logic;
+    variable var1 : std_logic;
+    variable temp1 : std_logic;
+    variable temp2 : boolean;
+    variable alias1 : unsigned(31 downto 0);
+    variable temp3 : std_logic;
+    variable temp4 : boolean;
+    variable alias2 : std_logic_vector(31 downto 0);
+    variable alias3 : std_logic_vector(3 downto 0);
+    variable temp5 : std_logic;
+    variable temp6 : std_logic;
+    variable temp7 : std_logic;
+    variable temp8 : std_logic;
+    variable temp9 : std_logic;
+    variable temp10 : boolean;
+    variable temp11 : std_logic_vector(1 downto 0);
+    variable temp12 : std_logic_vector(3 downto 0);
+    variable first : std_logic_vector(7 downto 0);
+    variable temp13 : std_logic_vector(1 downto 0);
+    variable temp14 : std_logic_vector(3 downto 0);
+    variable first1 : std_logic_vector(7 downto 0);
+    variable temp15 : std_logic_vector(1 downto 0);
+    variable temp16 : std_logic_vector(3 downto 0);
+    variable first2 : std_logic_vector(7 downto 0);
+    variable temp17 : std_logic_vector(1 downto 0);
+    variable temp18 : std_logic_vector(3 downto 0);
+    variable first3 : std_logic_vector(7 downto 0);
+    variable a : std_logic_vector(15 downto 0);
+    variable b : std_logic_vector(15 downto 0);
+    variable val : std_logic_vector(31 downto 0);
+    variable val1 : std_logic_vector(31 downto 0);
+    variable temp19 : boolean;
+    variable temp20 : boolean;
+    variable temp21 : boolean;
+    variable temp22 : boolean;
+    variable temp23 : std_logic_vector(31 downto 0);
+    variable temp24 : std_logic_vector(31 downto 0);
+    variable temp25 : std_logic_vector(31 downto 0);
+    variable temp26 : std_logic_vector(31 downto 0);
+    variable temp27 : boolean;
+    variable temp28 : std_logic_vector(31 downto 0);
+    variable temp29 : std_logic_vector(31 downto 0);
+    variable temp30 : std_logic_vector(31 downto 0);
+    variable temp31 : std_logic_vector(31 downto 0);
+    variable temp32 : boolean;
+    variable temp33 : std_logic_vector(31 downto 0);
+    variable temp34 : std_logic_vector(31 downto 0);
+    variable temp35 : std_logic_vector(31 downto 0);
+    variable temp36 : std_logic_vector(31 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+        s_proc_write <= state_0;
+        buffer_axi_awready <= '0';
+        buffer_axi_wready <= '0';
+        old <= "00000000000000000000000000000000";
+        src <= unsigned'("00000000000000000000010011010010");
+        old1 <= signed'("00000000000000000001010110110011");
+        buffer_axi_bresp <= "00";
+        buffer_axi_bvalid <= '0';
+      else
+        case s_proc_write is
+          when state_0 =>
+            s_proc_write <= state_1;
+            var := '0';
+            var1 := '0';
+            buffer_axi_awready <= '1';
+            buffer_axi_wready <= '1';
+          when state_1 =>
+            temp1 := not (var);
+            temp2 := temp1 = '1';
+            if temp2 then
+              alias1 := axi_awaddr;
+              addr <= axi_awaddr;
+              prot <= axi_awprot;
+            end if;
+            temp3 := not (var1);
+            temp4 := temp3 = '1';
+            if temp4 then
+              alias2 := axi_wdata;
+              data <= axi_wdata;
+              alias3 := axi_wstrb;
+              strb <= axi_wstrb;
+            end if;
+            temp5 := (var) or (axi_awvalid);
+            var := temp5;
+            temp6 := (var1) or (axi_wvalid);
+            var1 := temp6;
+            temp7 := not (var);
+            buffer_axi_awready <= temp7;
+            temp8 := not (var1);
+            buffer_axi_wready <= temp8;
+            temp9 := (var) and (var1);
+            temp10 := temp9 = '1';
+            if temp10 then
+              s_proc_write <= state_2;
+              temp11 := (alias3(0)) & (alias3(0));
+              temp12 := (temp11) & (temp11);
+              first := (temp12) & (temp12);
+              temp13 := (alias3(1)) & (alias3(1));
+              temp14 := (temp13) & (temp13);
+              first1 := (temp14) & (temp14);
+              temp15 := (alias3(2)) & (alias3(2));
+              temp16 := (temp15) & (temp15);
+              first2 := (temp16) & (temp16);
+              temp17 := (alias3(3)) & (alias3(3));
+              temp18 := (temp17) & (temp17);
+              first3 := (temp18) & (temp18);
+              a := (first3) & (first2);
+              b := (first1) & (first);
+              val := (a) & (b);
+              val1 := val;
+              temp19 := (unsigned(alias1(31 downto 2)) = 0);
+              if temp19 then
+              end if;
+              temp20 := (unsigned(alias1(31 downto 2)) = 1);
+              if temp20 then
+              end if;
+              temp21 := (unsigned(alias1(31 downto 2)) = 2);
+              if temp21 then
+              end if;
+              temp22 := (unsigned(alias1(31 downto 2)) = 4);
+              if temp22 then
+                temp23 := not (val1);
+                temp24 := (old) and (temp23);
+                temp25 := (alias2) and (val1);
+                temp26 := (temp24) or (temp25);
+                old <= temp26;
+              end if;
+              temp27 := (unsigned(alias1(31 downto 2)) = 5);
+              if temp27 then
+                temp28 := not (val1);
+                temp29 := (std_logic_vector(src)) and (temp28);
+                temp30 := (alias2) and (val1);
+                temp31 := (temp29) or (temp30);
+                src <= unsigned(temp31);
+              end if;
+              temp32 := (unsigned(alias1(31 downto 2)) = 6);
+              if temp32 then
+                temp33 := not (val1);
+                temp34 := (std_logic_vector(old1)) and (temp33);
+                temp35 := (alias2) and (val1);
+                temp36 := (temp34) or (temp35);
+                old1 <= signed(temp36);
+              end if;
+              buffer_axi_bresp <= "00";
+              buffer_axi_bvalid <= '1';
+            else
+              s_proc_write <= state_1;
+            end if;
+          when state_2 =>
+            if axi_bready = '1' then
+              buffer_axi_bvalid <= '0';
+              s_proc_write <= state_1;
+              var := '0';
+              var1 := '0';
+              buffer_axi_awready <= '1';
+              buffer_axi_wready <= '1';
+            end if;
+          when others =>
+            null;
+        end case;
+      end if;
+    end if;
+  end process;
+end architecture arch_test_axilite_reg_06;
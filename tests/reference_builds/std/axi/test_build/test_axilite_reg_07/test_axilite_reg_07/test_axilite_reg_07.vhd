@@ -0,0 +1,626 @@
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+
+
+entity test_axilite_reg_07 is
+  port (
+    clk : in std_logic;
+    reset : in std_logic;
+    axi_awaddr : in unsigned(31 downto 0);
+    axi_awprot : in unsigned(2 downto 0);
+    axi_awvalid : in std_logic;
+    axi_awready : out std_logic;
+    axi_wdata : in std_logic_vector(31 downto 0);
+    axi_wstrb : in std_logic_vector(3 downto 0);
+    axi_wvalid : in std_logic;
+    axi_wready : out std_logic;
+    axi_bresp : out std_logic_vector(1 downto 0);
+    axi_bvalid : out std_logic;
+    axi_bready : in std_logic;
+    axi_araddr : in unsigned(31 downto 0);
+    axi_arprot : in unsigned(2 downto 0);
+    axi_arvalid : in std_logic;
+    axi_arready : out std_logic;
+    axi_rdata : out std_logic_vector(31 downto 0);
+    axi_rresp : out std_logic_vector(1 downto 0);
+    axi_rvalid : out std_logic;
+    axi_rready : in std_logic
+    );
+end test_axilite_reg_07;
+
+
+architecture arch_test_axilite_reg_07 of test_axilite_reg_07 is
+  function cohdl_bool_to_std_logic(inp: boolean) return std_logic is
+  begin
+    if inp then
+      return('1');
+    else
+      return('0');
+    end if;
+  end function cohdl_bool_to_std_logic;
+  signal buffer_axi_awready : std_logic := '0';
+  signal buffer_axi_wready : std_logic := '0';
+  signal buffer_axi_bresp : std_logic_vector(1 downto 0) := "00";
+  signal buffer_axi_bvalid : std_logic := '0';
+  signal buffer_axi_arready : std_logic := '0';
+  signal buffer_axi_rdata : std_logic_vector(31 downto 0) := "00000000000000000000000000000000";
+  signal buffer_axi_rresp : std_logic_vector(1 downto 0) := "00";
+  signal buffer_axi_rvalid : std_logic := '0';
+  signal inp : unsigned(7 downto 0);
+  signal read_1 : unsigned(7 downto 0) := unsigned'("00000000");
+  signal inp1 : unsigned(7 downto 0);
+  signal read_2 : unsigned(7 downto 0) := unsigned'("00000000");
+  signal inp2 : unsigned(7 downto 0);
+  signal write_1 : unsigned(7 downto 0) := unsigned'("00000000");
+  signal sig : std_logic := '0';
+  signal sync_flag_rx : std_logic := '0';
+  signal sync_flag_tx : std_logic := '0';
+  signal sig1 : std_logic := '0';
+  signal inp3 : unsigned(7 downto 0) := unsigned'("00000000");
+  signal sync_flag_1_rx : std_logic := '0';
+  signal sync_flag_1_tx : std_logic := '0';
+  signal inp4 : unsigned(7 downto 0);
+  signal read_11 : unsigned(7 downto 0) := unsigned'("00000000");
+  signal inp5 : unsigned(7 downto 0);
+  signal read_21 : unsigned(7 downto 0) := unsigned'("00000000");
+  signal inp6 : unsigned(7 downto 0);
+  signal write_11 : unsigned(7 downto 0) := unsigned'("00000000");
+  signal sig2 : std_logic := '0';
+  signal sync_flag_2_rx : std_logic := '0';
+  signal sync_flag_2_tx : std_logic := '0';
+  signal sig3 : std_logic := '0';
+  signal inp7 : unsigned(7 downto 0) := unsigned'("00000000");
+  signal sync_flag_3_rx : std_logic := '0';
+  signal sync_flag_3_tx : std_logic := '0';
+  signal inp8 : unsigned(7 downto 0) := unsigned'("00000000");
+  signal inp9 : unsigned(7 downto 0) := unsigned'("00000000");
+  signal sig4 : std_logic := '0';
+  signal sig5 : std_logic := '0';
+  signal inp10 : unsigned(7 downto 0) := unsigned'("00000000");
+  signal sync_flag_4_rx : std_logic := '0';
+  signal sync_flag_4_tx : std_logic := '0';
+  type state_proc_read is (state_0, state_1, state_2);
+  signal s_proc_read : state_proc_read := state_0;
+  signal inp11 : std_logic_vector(15 downto 0) := "0000000000000000";
+  signal inp12 : std_logic_vector(7 downto 0) := "00000000";
+  signal inp13 : unsigned(3 downto 0) := unsigned'("0000");
+  signal inp14 : signed(3 downto 0) := signed'("0000");
+  type state_proc_write is (state_0, state_1, state_2);
+  signal s_proc_write : state_proc_write := state_0;
+  signal addr : unsigned(31 downto 0);
+  signal prot : unsigned(2 downto 0);
+  signal data : std_logic_vector(31 downto 0);
+  signal strb : std_logic_vector(3 downto 0);
+begin
+  
+  -- CONCURRENT BLOCK (buffer assignment)
+  axi_awready <= buffer_axi_awready;
+  axi_wready <= buffer_axi_wready;
+  axi_bresp <= buffer_axi_bresp;
+  axi_bvalid <= buffer_axi_bvalid;
+  axi_arready <= buffer_axi_arready;
+  axi_rdata <= buffer_axi_rdata;
+  axi_rresp <= buffer_axi_rresp;
+  axi_rvalid <= buffer_axi_rvalid;
+  
+  -- CONCURRENT BLOCK (logic)
+  inp <= read_1;
+  inp1 <= read_2;
+  inp2 <= write_1;
+  
+
+  proc_read_cnt_1: process(clk)
+    variable temp : boolean;
+    variable temp1 : boolean;
+    variable temp2 : unsigned(7 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+        read_1 <= unsigned'("00000000");
+      else
+        temp1 := sig = '1';
+        if temp1 then
+          temp2 := (read_1) + (1);
+          read_1 <= temp2;
+        end if;
+      end if;
+    end if;
+  end process;
+  
+
+  proc_read_cnt_2: process(clk)
+    variable temp : boolean;
+    variable temp1 : boolean;
+    variable temp2 : unsigned(7 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+        read_2 <= unsigned'("00000000");
+        sync_flag_rx <= '0';
+      else
+        temp1 := (sync_flag_tx /= sync_flag_rx);
+        if temp1 then
+          temp2 := (read_2) + (1);
+          read_2 <= temp2;
+          sync_flag_rx <= sync_flag_tx;
+        end if;
+      end if;
+    end if;
+  end process;
+  
+
+  proc_write_cnt_1: process(clk)
+    variable temp : boolean;
+    variable temp1 : boolean;
+    variable temp2 : unsigned(7 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+        write_1 <= unsigned'("00000000");
+      else
+        temp1 := sig1 = '1';
+        if temp1 then
+          temp2 := (write_1) + (1);
+          write_1 <= temp2;
+        end if;
+      end if;
+    end if;
+  end process;
+  
+
+  proc_write_cnt_2: process(clk)
+    variable temp : boolean;
+    variable temp1 : boolean;
+    variable other : unsigned(7 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+        inp3 <= unsigned'("00000000");
+        sync_flag_1_rx <= '0';
+      else
+        temp1 := (sync_flag_1_tx /= sync_flag_1_rx);
+        if temp1 then
+          other := (inp3) + (1);
+          inp3 <= other;
+          sync_flag_1_rx <= sync_flag_1_tx;
+        end if;
+      end if;
+    end if;
+  end process;
+  
+  -- CONCURRENT BLOCK (logic)
+  inp4 <= read_11;
+  inp5 <= read_21;
+  inp6 <= write_11;
+  
+
+  proc_read_cnt_11: process(clk)
+    variable temp : boolean;
+    variable temp1 : boolean;
+    variable temp2 : unsigned(7 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+        read_11 <= unsigned'("00000000");
+      else
+        temp1 := sig2 = '1';
+        if temp1 then
+          temp2 := (read_11) + (1);
+          read_11 <= temp2;
+        end if;
+      end if;
+    end if;
+  end process;
+  
+
+  proc_read_cnt_21: process(clk)
+    variable temp : boolean;
+    variable temp1 : boolean;
+    variable temp2 : unsigned(7 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+        read_21 <= unsigned'("00000000");
+        sync_flag_2_rx <= '0';
+      else
+        temp1 := (sync_flag_2_tx /= sync_flag_2_rx);
+        if temp1 then
+          temp2 := (read_21) + (1);
+          read_21 <= temp2;
+          sync_flag_2_rx <= sync_flag_2_tx;
+        end if;
+      end if;
+    end if;
+  end process;
+  
+
+  proc_write_cnt_11: process(clk)
+    variable temp : boolean;
+    variable temp1 : boolean;
+    variable temp2 : unsigned(7 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+        write_11 <= unsigned'("00000000");
+      else
+        temp1 := sig3 = '1';
+        if temp1 then
+          temp2 := (write_11) + (1);
+          write_11 <= temp2;
+        end if;
+      end if;
+    end if;
+  end process;
+  
+
+  proc_write_cnt_21: process(clk)
+    variable temp : boolean;
+    variable temp1 : boolean;
+    variable other : unsigned(7 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+        inp7 <= unsigned'("00000000");
+        sync_flag_3_rx <= '0';
+      else
+        temp1 := (sync_flag_3_tx /= sync_flag_3_rx);
+        if temp1 then
+          other := (inp7) + (1);
+          inp7 <= other;
+          sync_flag_3_rx <= sync_flag_3_tx;
+        end if;
+      end if;
+    end if;
+  end process;
+  
+
+  impl_sequential: process(clk)
+    variable temp : boolean;
+    variable temp1 : boolean;
+    variable other : unsigned(7 downto 0);
+    variable temp2 : boolean;
+    variable other1 : unsigned(7 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+        inp8 <= unsigned'("00000000");
+        inp9 <= unsigned'("00000000");
+      else
+        temp1 := sig4 = '1';
+        if temp1 then
+          other := (inp8) + (1);
+          inp8 <= other;
+        end if;
+        temp2 := sig5 = '1';
+        if temp2 then
+          other1 := (inp9) + (1);
+          inp9 <= other1;
+        end if;
+      end if;
+    end if;
+  end process;
+  
+
+  impl_sequential1: process(clk)
+    variable temp : boolean;
+    variable temp1 : boolean;
+    variable other : unsigned(7 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+        inp10 <= unsigned'("00000000");
+        sync_flag_4_rx <= '0';
+      else
+        temp1 := (sync_flag_4_tx /= sync_flag_4_rx);
+        if temp1 then
+          other := (inp10) + (1);
+          inp10 <= other;
+          sync_flag_4_rx <= sync_flag_4_tx;
+        end if;
+      end if;
+    end if;
+  end process;
+  
+
+  proc_read: process(clk)
+    variable temp : boolean;
+    variable data1 : std_logic_vector(31 downto 0);
+    variable temp1 : boolean;
+    variable temp2 : std_logic;
+    variable b : std_logic_vector(7 downto 0);
+    variable a : std_logic_vector(7 downto 0);
+    variable b1 : std_logic_vector(7 downto 0);
+    variable first : std_logic_vector(7 downto 0);
+    variable a1 : std_logic_vector(15 downto 0);
+    variable b2 : std_logic_vector(15 downto 0);
+    variable temp3 : std_logic_vector(31 downto 0);
+    variable temp4 : boolean;
+    variable temp5 : std_logic;
+    variable b3 : std_logic_vector(7 downto 0);
+    variable a2 : std_logic_vector(7 downto 0);
+    variable b4 : std_logic_vector(7 downto 0);
+    variable first1 : std_logic_vector(7 downto 0);
+    variable a3 : std_logic_vector(15 downto 0);
+    variable b5 : std_logic_vector(15 downto 0);
+    variable temp6 : std_logic_vector(31 downto 0);
+    variable temp7 : boolean;
+    variable b6 : std_logic_vector(15 downto 0);
+    variable b7 : std_logic_vector(7 downto 0);
+    variable first2 : std_logic_vector(7 downto 0);
+    variable a4 : std_logic_vector(15 downto 0);
+    variable temp8 : std_logic_vector(31 downto 0);
+    variable temp9 : boolean;
+    variable temp10 : std_logic;
+    variable b8 : std_logic_vector(7 downto 0);
+    variable b9 : std_logic_vector(3 downto 0);
+    variable a5 : std_logic_vector(3 downto 0);
+    variable b10 : std_logic_vector(7 downto 0);
+    variable a6 : std_logic_vector(15 downto 0);
+    variable b11 : std_logic_vector(7 downto 0);
+    variable a7 : std_logic_vector(23 downto 0);
+    variable temp11 : std_logic_vector(31 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+        s_proc_read <= state_0;
+        buffer_axi_arready <= '0';
+        sig <= '0';
+        sync_flag_tx <= '0';
+        sig2 <= '0';
+        sync_flag_2_tx <= '0';
+        sig4 <= '0';
+        sync_flag_4_tx <= '0';
+        buffer_axi_rdata <= "00000000000000000000000000000000";
+        buffer_axi_rresp <= "00";
+        buffer_axi_rvalid <= '0';
+      else
+        sig <= '0';
+        sig2 <= '0';
+        sig4 <= '0';
+        case s_proc_read is
+          when state_0 =>
+            s_proc_read <= state_1;
+            buffer_axi_arready <= '1';
+          when state_1 =>
+            if axi_arvalid = '1' then
+              s_proc_read <= state_2;
+              buffer_axi_arready <= '0';
+              data1 := "00000000000000000000000000000000";
+              temp1 := (unsigned(axi_araddr(31 downto 2)) = 0);
+              if temp1 then
+                sig <= '1';
+                temp2 := not (sync_flag_rx);
+                sync_flag_tx <= temp2;
+                b := std_logic_vector(inp);
+                a := std_logic_vector(inp1);
+                b1 := std_logic_vector(inp2);
+                first := std_logic_vector(inp3);
+                a1 := (first) & (b1);
+                b2 := (a) & (b);
+                temp3 := (a1) & (b2);
+                data1 := temp3;
+              end if;
+              temp4 := (unsigned(axi_araddr(31 downto 2)) = 1);
+              if temp4 then
+                sig2 <= '1';
+                temp5 := not (sync_flag_2_rx);
+                sync_flag_2_tx <= temp5;
+                b3 := std_logic_vector(inp4);
+                a2 := std_logic_vector(inp5);
+                b4 := std_logic_vector(inp6);
+                first1 := std_logic_vector(inp7);
+                a3 := (first1) & (b4);
+                b5 := (a2) & (b3);
+                temp6 := (a3) & (b5);
+                data1 := temp6;
+              end if;
+              temp7 := (unsigned(axi_araddr(31 downto 2)) = 2);
+              if temp7 then
+                sig4 <= '1';
+                b6 := inp11;
+                b7 := std_logic_vector(inp8);
+                first2 := std_logic_vector(inp9);
+                a4 := (first2) & (b7);
+                temp8 := (a4) & (b6);
+                data1 := temp8;
+              end if;
+              temp9 := (unsigned(axi_araddr(31 downto 2)) = 3);
+              if temp9 then
+                temp10 := not (sync_flag_4_rx);
+                sync_flag_4_tx <= temp10;
+                b8 := inp12;
+                b9 := std_logic_vector(inp13);
+                a5 := std_logic_vector(inp14);
+                b10 := std_logic_vector(inp10);
+                a6 := ("00000000") & (b10);
+                b11 := (a5) & (b9);
+                a7 := (a6) & (b11);
+                temp11 := (a7) & (b8);
+                data1 := temp11;
+              end if;
+              buffer_axi_rdata <= data1;
+              buffer_axi_rresp <= "00";
+              buffer_axi_rvalid <= '1';
+            end if;
+          when state_2 =>
+            if axi_rready = '1' then
+              buffer_axi_rvalid <= '0';
+              s_proc_read <= state_1;
+              buffer_axi_arready <= '1';
+            end if;
+          when others =>
+            null;
+        end case;
+      end if;
+    end if;
+  end process;
+  
+
+  proc_write: process(clk)
+    variable temp : boolean;
+    variable var : std_logic;
+    variable var1 : std_logic;
+    variable temp1 : std_logic;
+    variable temp2 : boolean;
+    variable alias1 : unsigned(31 downto 0);
+    variable temp3 : std_logic;
+    variable temp4 : boolean;
+    variable alias2 : std_logic_vector(31 downto 0);
+    variable alias3 : std_logic_vector(3 downto 0);
+    variable temp5 : std_logic;
+    variable temp6 : std_logic;
+    variable temp7 : std_logic;
+    variable temp8 : std_logic;
+    variable temp9 : std_logic;
+    variable temp10 : boolean;
+    variable temp11 : std_logic_vector(1 downto 0);
+    variable temp12 : std_logic_vector(3 downto 0);
+    variable first : std_logic_vector(7 downto 0);
+    variable temp13 : std_logic_vector(1 downto 0);
+    variable temp14 : std_logic_vector(3 downto 0);
+    variable first1 : std_logic_vector(7 downto 0);
+    variable temp15 : std_logic_vector(1 downto 0);
+    variable temp16 : std_logic_vector(3 downto 0);
+    variable first2 : std_logic_vector(7 downto 0);
+    variable temp17 : std_logic_vector(1 downto 0);
+    variable temp18 : std_logic_vector(3 downto 0);
+    variable first3 : std_logic_vector(7 downto 0);
+    variable a : std_logic_vector(15 downto 0);
+    variable b : std_logic_vector(15 downto 0);
+    variable val : std_logic_vector(31 downto 0);
+    variable val1 : std_logic_vector(31 downto 0);
+    variable temp19 : boolean;
+    variable temp20 : std_logic;
+    variable temp21 : boolean;
+    variable temp22 : std_logic;
+    variable temp23 : boolean;
+    variable temp24 : boolean;
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+        s_proc_write <= state_0;
+        buffer_axi_awready <= '0';
+        buffer_axi_wready <= '0';
+        sig1 <= '0';
+        sync_flag_1_tx <= '0';
+        sig3 <= '0';
+        sync_flag_3_tx <= '0';
+        sig5 <= '0';
+        inp11 <= "0000000000000000";
+        inp12 <= "00000000";
+        inp13 <= unsigned'("0000");
+        inp14 <= signed'("0000");
+        buffer_axi_bresp <= "00";
+        buffer_axi_bvalid <= '0';
+      else
+        sig1 <= '0';
+        sig3 <= '0';
+        sig5 <= '0';
+        case s_proc_write is
+          when state_0 =>
+            s_proc_write <= state_1;
+            var := '0';
+            var1 := '0';
+            buffer_axi_awready <= '1';
+            buffer_axi_wready <= '1';
+          when state_1 =>
+            temp1 := not (var);
+            temp2 := temp1 = '1';
+            if temp2 then
+              alias1 := axi_awaddr;
+              addr <= axi_awaddr;
+              prot <= axi_awprot;
+            end if;
+            temp3 := not (var1);
+            temp4 := temp3 = '1';
+            if temp4 then
+              alias2 := axi_wdata;
+              data <= axi_wdata;
+              alias3 := axi_wstrb;
+              strb <= axi_wstrb;
+            end if;
+            temp5 := (var) or (axi_awvalid);
+            var := temp5;
+            temp6 := (var1) or (axi_wvalid);
+            var1 := temp6;
+            temp7 := not (var);
+            buffer_axi_awready <= temp7;
+            temp8 := not (var1);
+            buffer_axi_wready <= temp8;
+            temp9 := (var) and (var1);
+            temp10 := temp9 = '1';
+            if temp10 then
+              s_proc_write <= state_2;
+              temp11 := (alias3(0)) & (alias3(0));
+              temp12 := (temp11) & (temp11);
+              first := (temp12) & (temp12);
+              temp13 := (alias3(1)) & (alias3(1));
+              temp14 := (temp13) & (temp13);
+              first1 := (temp14) & (temp14);
+              temp15 := (alias3(2)) & (alias3(2));
+              temp16 := (temp15) & (temp15);
+              first2 := (temp16) & (temp16);
+              temp17 := (alias3(3)) & (alias3(3));
+              temp18 := (temp17) & (temp17);
+              first3 := (temp18) & (temp18);
+              a := (first3) & (first2);
+              b := (first1) & (first);
+              val := (a) & (b);
+              val1 := val;
+              temp19 := (unsigned(alias1(31 downto 2)) = 0);
+              if temp19 then
+                sig1 <= '1';
+                temp20 := not (sync_flag_1_rx);
+                sync_flag_1_tx <= temp20;
+              end if;
+              temp21 := (unsigned(alias1(31 downto 2)) = 1);
+              if temp21 then
+                sig3 <= '1';
+                temp22 := not (sync_flag_3_rx);
+                sync_flag_3_tx <= temp22;
+              end if;
+              temp23 := (unsigned(alias1(31 downto 2)) = 2);
+              if temp23 then
+                sig5 <= '1';
+                inp11 <= std_logic_vector(alias2(15 downto 0));
+              end if;
+              temp24 := (unsigned(alias1(31 downto 2)) = 3);
+              if temp24 then
+                inp12 <= std_logic_vector(alias2(7 downto 0));
+                inp13 <= unsigned(std_logic_vector(alias2(11 downto 8)));
+                inp14 <= signed(std_logic_vector(alias2(15 downto 12)));
+              end if;
+              buffer_axi_bresp <= "00";
+              buffer_axi_bvalid <= '1';
+            else
+              s_proc_write <= state_1;
+            end if;
+          when state_2 =>
+            if axi_bready = '1' then
+              buffer_axi_bvalid <= '0';
+              s_proc_write <= state_1;
+              var := '0';
+              var1 := '0';
+              buffer_axi_awready <= '1';
+              buffer_axi_wready <= '1';
+            end if;
+          when others =>
+            null;
+        end case;
+      end if;
+    end if;
+  end process;
+end architecture arch_test_axilite_reg_07;
@@ -0,0 +1,835 @@
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+
+
+entity test_axilite_reg_08 is
+  port (
+    clk : in std_logic;
+    reset : in std_logic;
+    axi_awaddr : in unsigned(31 downto 0);
+    axi_awprot : in unsigned(2 downto 0);
+    axi_awvalid : in std_logic;
+    axi_awready : out std_logic;
+    axi_wdata : in std_logic_vector(31 downto 0);
+    axi_wstrb : in std_logic_vector(3 downto 0);
+    axi_wvalid : in std_logic;
+    axi_wready : out std_logic;
+    axi_bresp : out std_logic_vector(1 downto 0);
+    axi_bvalid : out std_logic;
+    axi_bready : in std_logic;
+    axi_araddr : in unsigned(31 downto 0);
+    axi_arprot : in unsigned(2 downto 0);
+    axi_arvalid : in std_logic;
+    axi_arready : out std_logic;
+    axi_rdata : out std_logic_vector(31 downto 0);
+    axi_rresp : out std_logic_vector(1 downto 0);
+    axi_rvalid : out std_logic;
+    axi_rready : in std_logic
+    );
+end test_axilite_reg_08;
+
+
+architecture arch_test_axilite_reg_08 of test_axilite_reg_08 is
+  function cohdl_bool_to_std_logic(inp: boolean) return std_logic is
+  begin
+    if inp then
+      return('1');
+    else
+      return('0');
+    end if;
+  end function cohdl_bool_to_std_logic;
+  signal buffer_axi_awready : std_logic := '0';
+  signal buffer_axi_wready : std_logic := '0';
+  signal buffer_axi_bresp : std_logic_vector(1 downto 0) := "00";
+  signal buffer_axi_bvalid : std_logic := '0';
+  signal buffer_axi_arready : std_logic := '0';
+  signal buffer_axi_rdata : std_logic_vector(31 downto 0) := "00000000000000000000000000000000";
+  signal buffer_axi_rresp : std_logic_vector(1 downto 0) := "00";
+  signal buffer_axi_rvalid : std_logic := '0';
+  signal sig : std_logic := '0';
+  signal addr : unsigned(7 downto 0);
+  signal sig1 : unsigned(31 downto 0);
+  type array_type is array(0 to 31) of std_logic_vector(31 downto 0);
+  signal bits : array_type;
+  signal sig2 : std_logic := '0';
+  signal addr1 : unsigned(7 downto 0);
+  signal val : std_logic_vector(31 downto 0);
+  signal data : unsigned(31 downto 0);
+  signal sig3 : std_logic := '0';
+  signal addr2 : unsigned(7 downto 0);
+  signal sig4 : unsigned(31 downto 0);
+  signal bits1 : array_type := ( 0 => "11111111111111111111111111111111", 1 => "11111111111111111111111111111111", 2 => "11111111111111111111111111111111", 3 => "11111111111111111111111111111111", 4 => "11111111111111111111111111111111", 5 => "11111111111111111111111111111111", 6 => "11111111111111111111111111111111", 7 => "11111111111111111111111111111111", 8 => "11111111111111111111111111111111", 9 => "11111111111111111111111111111111", 10 => "11111111111111111111111111111111", 11 => "11111111111111111111111111111111", 12 => "11111111111111111111111111111111", 13 => "11111111111111111111111111111111", 14 => "11111111111111111111111111111111", 15 => "11111111111111111111111111111111", 16 => "11111111111111111111111111111111", 17 => "11111111111111111111111111111111", 18 => "11111111111111111111111111111111", 19 => "11111111111111111111111111111111", 20 => "11111111111111111111111111111111", 21 => "11111111111111111111111111111111", 22 => "11111111111111111111111111111111", 23 => "11111111111111111111111111111111", 24 => "11111111111111111111111111111111", 25 => "11111111111111111111111111111111", 26 => "11111111111111111111111111111111", 27 => "11111111111111111111111111111111", 28 => "11111111111111111111111111111111", 29 => "11111111111111111111111111111111", 30 => "11111111111111111111111111111111", 31 => "11111111111111111111111111111111" );
+  signal sig5 : std_logic := '0';
+  signal addr3 : unsigned(7 downto 0);
+  signal val1 : std_logic_vector(31 downto 0);
+  signal data1 : unsigned(31 downto 0);
+  signal sig6 : std_logic := '0';
+  signal addr4 : unsigned(6 downto 0);
+  signal sig7 : unsigned(31 downto 0);
+  type array_type1 is array(0 to 15) of std_logic_vector(31 downto 0);
+  signal bits2 : array_type1 := ( 0 => "00000000000000000000000000000000", 1 => "00000000000000000000010000000000", 2 => "00000000000000000000100000000000", 3 => "00000000000000000000110000000000", 4 => "00000000000000000001000000000000", 5 => "00000000000000000001010000000000", 6 => "00000000000000000001100000000000", 7 => "00000000000000000001110000000000", 8 => "00000000000000000010000000000000", 9 => "00000000000000000010010000000000", 10 => "00000000000000000010100000000000", 11 => "00000000000000000010110000000000", 12 => "00000000000000000011000000000000", 13 => "00000000000000000011010000000000", 14 => "00000000000000000011100000000000", 15 => "00000000000000000011110000000000" );
+  signal sig8 : std_logic := '0';
+  signal addr5 : unsigned(6 downto 0);
+  signal val2 : std_logic_vector(31 downto 0);
+  signal data2 : unsigned(31 downto 0);
+  signal sig9 : std_logic := '0';
+  signal addr6 : unsigned(6 downto 0);
+  type array_type2 is array(0 to 15) of std_logic_vector(7 downto 0);
+  signal bits3 : array_type2 := ( 0 => "00000000", 1 => "00000000", 2 => "00000000", 3 => "00000000", 4 => "00000000", 5 => "00000000", 6 => "00000000", 7 => "00000000", 8 => "00000000", 9 => "00000000", 10 => "00000000", 11 => "00000000", 12 => "00000000", 13 => "00000000", 14 => "00000000", 15 => "00000000" );
+  signal bits4 : array_type2 := ( 0 => "00000000", 1 => "00000000", 2 => "00000000", 3 => "00000000", 4 => "00000000", 5 => "00000000", 6 => "00000000", 7 => "00000000", 8 => "00000000", 9 => "00000000", 10 => "00000000", 11 => "00000000", 12 => "00000000", 13 => "00000000", 14 => "00000000", 15 => "00000000" );
+  signal bits5 : array_type2 := ( 0 => "00000000", 1 => "00000001", 2 => "00000011", 3 => "00000101", 4 => "00000111", 5 => "00001001", 6 => "00001011", 7 => "00001101", 8 => "00001111", 9 => "00010001", 10 => "00010011", 11 => "00010101", 12 => "00010111", 13 => "00011001", 14 => "00011011", 15 => "00011101" );
+  signal bits6 : array_type2 := ( 0 => "00000000", 1 => "11110100", 2 => "11101000", 3 => "11011100", 4 => "11010000", 5 => "11000100", 6 => "10111000", 7 => "10101100", 8 => "10100000", 9 => "10010100", 10 => "10001000", 11 => "01111100", 12 => "01110000", 13 => "01100100", 14 => "01011000", 15 => "01001100" );
+  signal sig10 : unsigned(31 downto 0);
+  signal sig11 : std_logic := '0';
+  signal addr7 : unsigned(6 downto 0);
+  signal val3 : std_logic_vector(31 downto 0);
+  signal data3 : unsigned(31 downto 0);
+  type state_proc_read is (state_0, state_1, state_2, state_3, state_4, state_5, state_6, state_7, state_8, state_9, state_10, state_11, state_12, state_13, state_14, state_15, state_16, state_17, state_18, state_19, state_20, state_21, state_22, state_23, state_24, state_25, state_26, state_27, state_28, state_29, state_30, state_31, state_32);
+  signal s_proc_read : state_proc_read := state_0;
+  type state_proc_write is (state_0, state_1, state_2);
+  signal s_proc_write : state_proc_write := state_0;
+  signal addr8 : unsigned(31 downto 0);
+  signal prot : unsigned(2 downto 0);
+  signal data4 : std_logic_vector(31 downto 0);
+  signal strb : std_logic_vector(3 downto 0);
+begin
+  
+  -- CONCURRENT BLOCK (buffer assignment)
+  axi_awready <= buffer_axi_awready;
+  axi_wready <= buffer_axi_wready;
+  axi_bresp <= buffer_axi_bresp;
+  axi_bvalid <= buffer_axi_bvalid;
+  axi_arready <= buffer_axi_arready;
+  axi_rdata <= buffer_axi_rdata;
+  axi_rresp <= buffer_axi_rresp;
+  axi_rvalid <= buffer_axi_rvalid;
+  
+
+  impl_read_memory: process(clk)
+    variable temp : boolean;
+    variable temp1 : boolean;
+    variable index : std_logic_vector(5 downto 0);
+    variable temp2 : unsigned(5 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+      else
+        temp1 := sig = '1';
+        if temp1 then
+          index := std_logic_vector(unsigned(addr(7 downto 2)));
+          temp2 := unsigned(index);
+          sig1 <= unsigned(bits(to_integer(temp2)));
+        end if;
+      end if;
+    end if;
+  end process;
+  
+
+  impl_write_memory: process(clk)
+    variable temp : boolean;
+    variable temp1 : boolean;
+    variable val4 : std_logic_vector(5 downto 0);
+    variable index : unsigned(5 downto 0);
+    variable temp2 : unsigned(5 downto 0);
+    variable temp3 : std_logic_vector(31 downto 0);
+    variable temp4 : std_logic_vector(31 downto 0);
+    variable temp5 : std_logic_vector(31 downto 0);
+    variable temp6 : std_logic_vector(31 downto 0);
+    variable temp7 : unsigned(5 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+      else
+        temp1 := sig2 = '1';
+        if temp1 then
+          val4 := std_logic_vector(unsigned(addr1(7 downto 2)));
+          index := unsigned(val4);
+          temp2 := index;
+          temp3 := not (val);
+          temp4 := (bits(to_integer(temp2))) and (temp3);
+          temp5 := (std_logic_vector(data)) and (val);
+          temp6 := (temp4) or (temp5);
+          temp7 := index;
+          bits(to_integer(temp7)) <= temp6;
+        end if;
+      end if;
+    end if;
+  end process;
+  
+
+  impl_read_memory1: process(clk)
+    variable temp : boolean;
+    variable temp1 : boolean;
+    variable index : std_logic_vector(5 downto 0);
+    variable temp2 : unsigned(5 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+      else
+        temp1 := sig3 = '1';
+        if temp1 then
+          index := std_logic_vector(unsigned(addr2(7 downto 2)));
+          temp2 := unsigned(index);
+          sig4 <= unsigned(bits1(to_integer(temp2)));
+        end if;
+      end if;
+    end if;
+  end process;
+  
+
+  impl_write_memory1: process(clk)
+    variable temp : boolean;
+    variable temp1 : boolean;
+    variable val4 : std_logic_vector(5 downto 0);
+    variable index : unsigned(5 downto 0);
+    variable temp2 : unsigned(5 downto 0);
+    variable temp3 : std_logic_vector(31 downto 0);
+    variable temp4 : std_logic_vector(31 downto 0);
+    variable temp5 : std_logic_vector(31 downto 0);
+    variable temp6 : std_logic_vector(31 downto 0);
+    variable temp7 : unsigned(5 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+        bits1 <= ( 0 => "11111111111111111111111111111111", 1 => "11111111111111111111111111111111", 2 => "11111111111111111111111111111111", 3 => "11111111111111111111111111111111", 4 => "11111111111111111111111111111111", 5 => "11111111111111111111111111111111", 6 => "11111111111111111111111111111111", 7 => "11111111111111111111111111111111", 8 => "11111111111111111111111111111111", 9 => "11111111111111111111111111111111", 10 => "11111111111111111111111111111111", 11 => "11111111111111111111111111111111", 12 => "11111111111111111111111111111111", 13 => "11111111111111111111111111111111", 14 => "11111111111111111111111111111111", 15 => "11111111111111111111111111111111", 16 => "11111111111111111111111111111111", 17 => "11111111111111111111111111111111", 18 => "11111111111111111111111111111111", 19 => "11111111111111111111111111111111", 20 => "11111111111111111111111111111111", 21 => "11111111111111111111111111111111", 22 => "11111111111111111111111111111111", 23 => "11111111111111111111111111111111", 24 => "11111111111111111111111111111111", 25 => "11111111111111111111111111111111", 26 => "11111111111111111111111111111111", 27 => "11111111111111111111111111111111", 28 => "11111111111111111111111111111111", 29 => "11111111111111111111111111111111", 30 => "11111111111111111111111111111111", 31 => "11111111111111111111111111111111" );
+      else
+        temp1 := sig5 = '1';
+        if temp1 then
+          val4 := std_logic_vector(unsigned(addr3(7 downto 2)));
+          index := unsigned(val4);
+          temp2 := index;
+          temp3 := not (val1);
+          temp4 := (bits1(to_integer(temp2))) and (temp3);
+          temp5 := (std_logic_vector(data1)) and (val1);
+          temp6 := (temp4) or (temp5);
+          temp7 := index;
+          bits1(to_integer(temp7)) <= temp6;
+        end if;
+      end if;
+    end if;
+  end process;
+  
+
+  impl_read_memory2: process(clk)
+    variable temp : boolean;
+    variable temp1 : boolean;
+    variable index : std_logic_vector(4 downto 0);
+    variable temp2 : unsigned(4 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+      else
+        temp1 := sig6 = '1';
+        if temp1 then
+          index := std_logic_vector(unsigned(addr4(6 downto 2)));
+          temp2 := unsigned(index);
+          sig7 <= unsigned(bits2(to_integer(temp2)));
+        end if;
+      end if;
+    end if;
+  end process;
+  
+
+  impl_write_memory2: process(clk)
+    variable temp : boolean;
+    variable temp1 : boolean;
+    variable val4 : std_logic_vector(4 downto 0);
+    variable index : unsigned(4 downto 0);
+    variable temp2 : unsigned(4 downto 0);
+    variable temp3 : std_logic_vector(31 downto 0);
+    variable temp4 : std_logic_vector(31 downto 0);
+    variable temp5 : std_logic_vector(31 downto 0);
+    variable temp6 : std_logic_vector(31 downto 0);
+    variable temp7 : unsigned(4 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+        bits2 <= ( 0 => "00000000000000000000000000000000", 1 => "00000000000000000000010000000000", 2 => "00000000000000000000100000000000", 3 => "00000000000000000000110000000000", 4 => "00000000000000000001000000000000", 5 => "00000000000000000001010000000000", 6 => "00000000000000000001100000000000", 7 => "00000000000000000001110000000000", 8 => "00000000000000000010000000000000", 9 => "00000000000000000010010000000000", 10 => "00000000000000000010100000000000", 11 => "00000000000000000010110000000000", 12 => "00000000000000000011000000000000", 13 => "00000000000000000011010000000000", 14 => "00000000000000000011100000000000", 15 => "00000000000000000011110000000000" );
+      else
+        temp1 := sig8 = '1';
+        if temp1 then
+          val4 := std_logic_vector(unsigned(addr5(6 downto 2)));
+          index := unsigned(val4);
+          temp2 := index;
+          temp3 := not (val2);
+          temp4 := (bits2(to_integer(temp2))) and (temp3);
+          temp5 := (std_logic_vector(data2)) and (val2);
+          temp6 := (temp4) or (temp5);
+          temp7 := index;
+          bits2(to_integer(temp7)) <= temp6;
+        end if;
+      end if;
+    end if;
+  end process;
+  
+
+  impl_read_memory3: process(clk)
+    variable temp : boolean;
+    variable temp1 : boolean;
+    variable index : std_logic_vector(4 downto 0);
+    variable temp2 : boolean;
+    variable temp3 : unsigned(4 downto 0);
+    variable temp4 : unsigned(4 downto 0);
+    variable temp5 : unsigned(4 downto 0);
+    variable temp6 : unsigned(4 downto 0);
+    variable a : std_logic_vector(15 downto 0);
+    variable b : std_logic_vector(15 downto 0);
+    variable temp7 : std_logic_vector(31 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+      else
+        temp1 := sig9 = '1';
+        if temp1 then
+          index := std_logic_vector(unsigned(addr6(6 downto 2)));
+          temp2 := (unsigned(addr6(1 downto 0)) = 0);
+          assert temp2 report "stride error";
+          temp3 := unsigned(index);
+          temp4 := unsigned(index);
+          temp5 := unsigned(index);
+          temp6 := unsigned(index);
+          a := (bits3(to_integer(temp6))) & (bits4(to_integer(temp5)));
+          b := (bits5(to_integer(temp4))) & (bits6(to_integer(temp3)));
+          temp7 := (a) & (b);
+          sig10 <= unsigned(temp7);
+        end if;
+      end if;
+    end if;
+  end process;
+  
+
+  impl_write_memory3: process(clk)
+    variable temp : boolean;
+    variable temp1 : boolean;
+    variable val4 : std_logic_vector(4 downto 0);
+    variable index : unsigned(4 downto 0);
+    variable temp2 : std_logic_vector(31 downto 0);
+    variable temp3 : std_logic_vector(31 downto 0);
+    variable temp4 : std_logic_vector(31 downto 0);
+    variable temp5 : std_logic_vector(31 downto 0);
+    variable temp6 : boolean;
+    variable temp7 : unsigned(4 downto 0);
+    variable temp8 : boolean;
+    variable temp9 : unsigned(4 downto 0);
+    variable temp10 : boolean;
+    variable temp11 : unsigned(4 downto 0);
+    variable temp12 : boolean;
+    variable temp13 : unsigned(4 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+      else
+        temp1 := sig11 = '1';
+        if temp1 then
+          val4 := std_logic_vector(unsigned(addr7(6 downto 2)));
+          index := unsigned(val4);
+          temp2 := not (val3);
+          temp3 := ("00000000000000000000000000000000") and (temp2);
+          temp4 := ("11111111111111111111111111111111") and (val3);
+          temp5 := (temp3) or (temp4);
+          temp6 := temp5(0) = '1';
+          if temp6 then
+            temp7 := index;
+            bits6(to_integer(temp7)) <= std_logic_vector(unsigned(data3(7 downto 0)));
+          end if;
+          temp8 := temp5(8) = '1';
+          if temp8 then
+            temp9 := index;
+            bits5(to_integer(temp9)) <= std_logic_vector(unsigned(data3(15 downto 8)));
+          end if;
+          temp10 := temp5(16) = '1';
+          if temp10 then
+            temp11 := index;
+            bits4(to_integer(temp11)) <= std_logic_vector(unsigned(data3(23 downto 16)));
+          end if;
+          temp12 := temp5(24) = '1';
+          if temp12 then
+            temp13 := index;
+            bits3(to_integer(temp13)) <= std_logic_vector(unsigned(data3(31 downto 24)));
+          end if;
+        end if;
+      end if;
+    end if;
+  end process;
+  
+
+  proc_read: process(clk)
+    variable temp : boolean;
+    variable data5 : std_logic_vector(31 downto 0);
+    variable temp1 : boolean;
+    variable addr9 : unsigned(31 downto 0);
+    variable temp2 : boolean;
+    variable addr10 : unsigned(31 downto 0);
+    variable temp3 : boolean;
+    variable addr11 : unsigned(31 downto 0);
+    variable temp4 : boolean;
+    variable addr12 : unsigned(31 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+        s_proc_read <= state_0;
+        buffer_axi_arready <= '0';
+        sig <= '0';
+        sig3 <= '0';
+        sig6 <= '0';
+        sig9 <= '0';
+        buffer_axi_rdata <= "00000000000000000000000000000000";
+        buffer_axi_rresp <= "00";
+        buffer_axi_rvalid <= '0';
+      else
+        sig <= '0';
+        sig3 <= '0';
+        sig6 <= '0';
+        sig9 <= '0';
+        case s_proc_read is
+          when state_0 =>
+            s_proc_read <= state_1;
+            buffer_axi_arready <= '1';
+          when state_1 =>
+            if axi_arvalid = '1' then
+              buffer_axi_arready <= '0';
+              data5 := "00000000000000000000000000000000";
+              temp1 := (unsigned(axi_araddr(31 downto 7)) = 0);
+              if temp1 then
+                s_proc_read <= state_2;
+                addr9 := (axi_araddr) - (0);
+                addr <= unsigned(std_logic_vector(unsigned(addr9(7 downto 0))));
+                sig <= '1';
+              else
+                temp2 := (unsigned(axi_araddr(31 downto 7)) = 1);
+                if temp2 then
+                  s_proc_read <= state_4;
+                  addr10 := (axi_araddr) - (128);
+                  addr2 <= unsigned(std_logic_vector(unsigned(addr10(7 downto 0))));
+                  sig3 <= '1';
+                else
+                  temp3 := (unsigned(axi_araddr(31 downto 6)) = 4);
+                  if temp3 then
+                    s_proc_read <= state_8;
+                    addr11 := (axi_araddr) - (256);
+                    addr4 <= unsigned(std_logic_vector(unsigned(addr11(6 downto 0))));
+                    sig6 <= '1';
+                  else
+                    temp4 := (unsigned(axi_araddr(31 downto 6)) = 5);
+                    if temp4 then
+                      s_proc_read <= state_16;
+                      addr12 := (axi_araddr) - (320);
+                      addr6 <= unsigned(std_logic_vector(unsigned(addr12(6 downto 0))));
+                      sig9 <= '1';
+                    else
+                      s_proc_read <= state_32;
+                      buffer_axi_rdata <= data5;
+                      buffer_axi_rresp <= "00";
+                      buffer_axi_rvalid <= '1';
+                    end if;
+                  end if;
+                end if;
+              end if;
+            end if;
+          when state_2 =>
+            s_proc_read <= state_3;
+          when state_3 =>
+            data5 := std_logic_vector(sig1);
+            temp2 := (unsigned(axi_araddr(31 downto 7)) = 1);
+            if temp2 then
+              s_proc_read <= state_6;
+              addr10 := (axi_araddr) - (128);
+              addr2 <= unsigned(std_logic_vector(unsigned(addr10(7 downto 0))));
+              sig3 <= '1';
+            else
+              temp3 := (unsigned(axi_araddr(31 downto 6)) = 4);
+              if temp3 then
+                s_proc_read <= state_12;
+                addr11 := (axi_araddr) - (256);
+                addr4 <= unsigned(std_logic_vector(unsigned(addr11(6 downto 0))));
+                sig6 <= '1';
+              else
+                temp4 := (unsigned(axi_araddr(31 downto 6)) = 5);
+                if temp4 then
+                  s_proc_read <= state_24;
+                  addr12 := (axi_araddr) - (320);
+                  addr6 <= unsigned(std_logic_vector(unsigned(addr12(6 downto 0))));
+                  sig9 <= '1';
+                else
+                  s_proc_read <= state_32;
+                  buffer_axi_rdata <= data5;
+                  buffer_axi_rresp <= "00";
+                  buffer_axi_rvalid <= '1';
+                end if;
+              end if;
+            end if;
+          when state_4 =>
+            s_proc_read <= state_5;
+          when state_5 =>
+            data5 := std_logic_vector(sig4);
+            temp3 := (unsigned(axi_araddr(31 downto 6)) = 4);
+            if temp3 then
+              s_proc_read <= state_10;
+              addr11 := (axi_araddr) - (256);
+              addr4 <= unsigned(std_logic_vector(unsigned(addr11(6 downto 0))));
+              sig6 <= '1';
+            else
+              temp4 := (unsigned(axi_araddr(31 downto 6)) = 5);
+              if temp4 then
+                s_proc_read <= state_20;
+                addr12 := (axi_araddr) - (320);
+                addr6 <= unsigned(std_logic_vector(unsigned(addr12(6 downto 0))));
+                sig9 <= '1';
+              else
+                s_proc_read <= state_32;
+                buffer_axi_rdata <= data5;
+                buffer_axi_rresp <= "00";
+                buffer_axi_rvalid <= '1';
+              end if;
+            end if;
+          when state_6 =>
+            s_proc_read <= state_7;
+          when state_7 =>
+            data5 := std_logic_vector(sig4);
+            temp3 := (unsigned(axi_araddr(31 downto 6)) = 4);
+            if temp3 then
+              s_proc_read <= state_14;
+              addr11 := (axi_araddr) - (256);
+              addr4 <= unsigned(std_logic_vector(unsigned(addr11(6 downto 0))));
+              sig6 <= '1';
+            else
+              temp4 := (unsigned(axi_araddr(31 downto 6)) = 5);
+              if temp4 then
+                s_proc_read <= state_28;
+                addr12 := (axi_araddr) - (320);
+                addr6 <= unsigned(std_logic_vector(unsigned(addr12(6 downto 0))));
+                sig9 <= '1';
+              else
+                s_proc_read <= state_32;
+                buffer_axi_rdata <= data5;
+                buffer_axi_rresp <= "00";
+                buffer_axi_rvalid <= '1';
+              end if;
+            end if;
+          when state_8 =>
+            s_proc_read <= state_9;
+          when state_9 =>
+            data5 := std_logic_vector(sig7);
+            temp4 := (unsigned(axi_araddr(31 downto 6)) = 5);
+            if temp4 then
+              s_proc_read <= state_18;
+              addr12 := (axi_araddr) - (320);
+              addr6 <= unsigned(std_logic_vector(unsigned(addr12(6 downto 0))));
+              sig9 <= '1';
+            else
+              s_proc_read <= state_32;
+              buffer_axi_rdata <= data5;
+              buffer_axi_rresp <= "00";
+              buffer_axi_rvalid <= '1';
+            end if;
+          when state_10 =>
+            s_proc_read <= state_11;
+          when state_11 =>
+            data5 := std_logic_vector(sig7);
+            temp4 := (unsigned(axi_araddr(31 downto 6)) = 5);
+            if temp4 then
+              s_proc_read <= state_22;
+              addr12 := (axi_araddr) - (320);
+              addr6 <= unsigned(std_logic_vector(unsigned(addr12(6 downto 0))));
+              sig9 <= '1';
+            else
+              s_proc_read <= state_32;
+              buffer_axi_rdata <= data5;
+              buffer_axi_rresp <= "00";
+              buffer_axi_rvalid <= '1';
+            end if;
+          when state_12 =>
+            s_proc_read <= state_13;
+          when state_13 =>
+            data5 := std_logic_vector(sig7);
+            temp4 := (unsigned(axi_araddr(31 downto 6)) = 5);
+            if temp4 then
+              s_proc_read <= state_26;
+              addr12 := (axi_araddr) - (320);
+              addr6 <= unsigned(std_logic_vector(unsigned(addr12(6 downto 0))));
+              sig9 <= '1';
+            else
+              s_proc_read <= state_32;
+              buffer_axi_rdata <= data5;
+              buffer_axi_rresp <= "00";
+              buffer_axi_rvalid <= '1';
+            end if;
+          when state_14 =>
+            s_proc_read <= state_15;
+          when state_15 =>
+            data5 := std_logic_vector(sig7);
+            temp4 := (unsigned(axi_araddr(31 downto 6)) = 5);
+            if temp4 then
+              s_proc_read <= state_30;
+              addr12 := (axi_araddr) - (320);
+              addr6 <= unsigned(std_logic_vector(unsigned(addr12(6 downto 0))));
+              sig9 <= '1';
+            else
+              s_proc_read <= state_32;
+              buffer_axi_rdata <= data5;
+              buffer_axi_rresp <= "00";
+              buffer_axi_rvalid <= '1';
+            end if;
+          when state_16 =>
+            s_proc_read <= state_17;
+          when state_17 =>
+            s_proc_read <= state_32;
+            data5 := std_logic_vector(sig10);
+            buffer_axi_rdata <= data5;
+            buffer_axi_rresp <= "00";
+            buffer_axi_rvalid <= '1';
+          when state_18 =>
+            s_proc_read <= state_19;
+          when state_19 =>
+            s_proc_read <= state_32;
+            data5 := std_logic_vector(sig10);
+            buffer_axi_rdata <= data5;
+            buffer_axi_rresp <= "00";
+            buffer_axi_rvalid <= '1';
+          when state_20 =>
+            s_proc_read <= state_21;
+          when state_21 =>
+            s_proc_read <= state_32;
+            data5 := std_logic_vector(sig10);
+            buffer_axi_rdata <= data5;
+            buffer_axi_rresp <= "00";
+            buffer_axi_rvalid <= '1';
+          when state_22 =>
+            s_proc_read <= state_23;
+          when state_23 =>
+            s_proc_read <= state_32;
+            data5 := std_logic_vector(sig10);
+            buffer_axi_rdata <= data5;
+            buffer_axi_rresp <= "00";
+            buffer_axi_rvalid <= '1';
+          when state_24 =>
+            s_proc_read <= state_25;
+          when state_25 =>
+            s_proc_read <= state_32;
+            data5 := std_logic_vector(sig10);
+            buffer_axi_rdata <= data5;
+            buffer_axi_rresp <= "00";
+            buffer_axi_rvalid <= '1';
+          when state_26 =>
+            s_proc_read <= state_27;
+          when state_27 =>
+            s_proc_read <= state_32;
+            data5 := std_logic_vector(sig10);
+            buffer_axi_rdata <= data5;
+            buffer_axi_rresp <= "00";
+            buffer_axi_rvalid <= '1';
+          when state_28 =>
+            s_proc_read <= state_29;
+          when state_29 =>
+            s_proc_read <= state_32;
+            data5 := std_logic_vector(sig10);
+            buffer_axi_rdata <= data5;
+            buffer_axi_rresp <= "00";
+            buffer_axi_rvalid <= '1';
+          when state_30 =>
+            s_proc_read <= state_31;
+          when state_31 =>
+            s_proc_read <= state_32;
+            data5 := std_logic_vector(sig10);
+            buffer_axi_rdata <= data5;
+            buffer_axi_rresp <= "00";
+            buffer_axi_rvalid <= '1';
+          when state_32 =>
+            if axi_rready = '1' then
+              buffer_axi_rvalid <= '0';
+              s_proc_read <= state_1;
+              buffer_axi_arready <= '1';
+            end if;
+          when others =>
+            null;
+        end case;
+      end if;
+    end if;
+  end process;
+  
+
+  proc_write: process(clk)
+    variable temp : boolean;
+    variable var : std_logic;
+    variable var1 : std_logic;
+    variable temp1 : std_logic;
+    variable temp2 : boolean;
+    variable alias1 : unsigned(31 downto 0);
+    variable temp3 : std_logic;
+    variable temp4 : boolean;
+    variable alias2 : std_logic_vector(31 downto 0);
+    variable alias3 : std_logic_vector(3 downto 0);
+    variable temp5 : std_logic;
+    variable temp6 : std_logic;
+    variable temp7 : std_logic;
+    variable temp8 : std_logic;
+    variable temp9 : std_logic;
+    variable temp10 : boolean;
+    variable temp11 : std_logic_vector(1 downto 0);
+    variable temp12 : std_logic_vector(3 downto 0);
+    variable first : std_logic_vector(7 downto 0);
+    variable temp13 : std_logic_vector(1 downto 0);
+    variable temp14 : std_logic_vector(3 downto 0);
+    variable first1 : std_logic_vector(7 downto 0);
+    variable temp15 : std_logic_vector(1 downto 0);
+    variable temp16 : std_logic_vector(3 downto 0);
+    variable first2 : std_logic_vector(7 downto 0);
+    variable temp17 : std_logic_vector(1 downto 0);
+    variable temp18 : std_logic_vector(3 downto 0);
+    variable first3 : std_logic_vector(7 downto 0);
+    variable a : std_logic_vector(15 downto 0);
+    variable b : std_logic_vector(15 downto 0);
+    variable val4 : std_logic_vector(31 downto 0);
+    variable val5 : std_logic_vector(31 downto 0);
+    variable temp19 : boolean;
+    variable addr9 : unsigned(31 downto 0);
+    variable temp20 : std_logic_vector(31 downto 0);
+    variable temp21 : std_logic_vector(31 downto 0);
+    variable temp22 : std_logic_vector(31 downto 0);
+    variable temp23 : std_logic_vector(31 downto 0);
+    variable temp24 : boolean;
+    variable addr10 : unsigned(31 downto 0);
+    variable temp25 : std_logic_vector(31 downto 0);
+    variable temp26 : std_logic_vector(31 downto 0);
+    variable temp27 : std_logic_vector(31 downto 0);
+    variable temp28 : std_logic_vector(31 downto 0);
+    variable temp29 : boolean;
+    variable addr11 : unsigned(31 downto 0);
+    variable temp30 : std_logic_vector(31 downto 0);
+    variable temp31 : std_logic_vector(31 downto 0);
+    variable temp32 : std_logic_vector(31 downto 0);
+    variable temp33 : std_logic_vector(31 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+        s_proc_write <= state_0;
+        buffer_axi_awready <= '0';
+        buffer_axi_wready <= '0';
+        sig2 <= '0';
+        sig5 <= '0';
+        sig8 <= '0';
+        buffer_axi_bresp <= "00";
+        buffer_axi_bvalid <= '0';
+      else
+        sig2 <= '0';
+        sig5 <= '0';
+        sig8 <= '0';
+        case s_proc_write is
+          when state_0 =>
+            s_proc_write <= state_1;
+            var := '0';
+            var1 := '0';
+            buffer_axi_awready <= '1';
+            buffer_axi_wready <= '1';
+          when state_1 =>
+            temp1 := not (var);
+            temp2 := temp1 = '1';
+            if temp2 then
+              alias1 := axi_awaddr;
+              addr8 <= axi_awaddr;
+              prot <= axi_awprot;
+            end if;
+            temp3 := not (var1);
+            temp4 := temp3 = '1';
+            if temp4 then
+              alias2 := axi_wdata;
+              data4 <= axi_wdata;
+              alias3 := axi_wstrb;
+              strb <= axi_wstrb;
+            end if;
+            temp5 := (var) or (axi_awvalid);
+            var := temp5;
+            temp6 := (var1) or (axi_wvalid);
+            var1 := temp6;
+            temp7 := not (var);
+            buffer_axi_awready <= temp7;
+            temp8 := not (var1);
+            buffer_axi_wready <= temp8;
+            temp9 := (var) and (var1);
+            temp10 := temp9 = '1';
+            if temp10 then
+              s_proc_write <= state_2;
+              temp11 := (alias3(0)) & (alias3(0));
+              temp12 := (temp11) & (temp11);
+              first := (temp12) & (temp12);
+              temp13 := (alias3(1)) & (alias3(1));
+              temp14 := (temp13) & (temp13);
+              first1 := (temp14) & (temp14);
+              temp15 := (alias3(2)) & (alias3(2));
+              temp16 := (temp15) & (temp15);
+              first2 := (temp16) & (temp16);
+              temp17 := (alias3(3)) & (alias3(3));
+              temp18 := (temp17) & (temp17);
+              first3 := (temp18) & (temp18);
+              a := (first3) & (first2);
+              b := (first1) & (first);
+              val4 := (a) & (b);
+              val5 := val4;
+              temp19 := (unsigned(alias1(31 downto 7)) = 0);
+              if temp19 then
+                addr9 := (alias1) - (0);
+                temp20 := not (val5);
+                temp21 := ("00000000000000000000000000000000") and (temp20);
+                temp22 := ("11111111111111111111111111111111") and (val5);
+                temp23 := (temp21) or (temp22);
+                val <= temp23;
+                addr1 <= unsigned(std_logic_vector(unsigned(addr9(7 downto 0))));
+                data <= unsigned(alias2);
+                sig2 <= '1';
+              end if;
+              temp24 := (unsigned(alias1(31 downto 7)) = 1);
+              if temp24 then
+                addr10 := (alias1) - (128);
+                temp25 := not (val5);
+                temp26 := ("00000000000000000000000000000000") and (temp25);
+                temp27 := ("11111111111111111111111111111111") and (val5);
+                temp28 := (temp26) or (temp27);
+                val1 <= temp28;
+                addr3 <= unsigned(std_logic_vector(unsigned(addr10(7 downto 0))));
+                data1 <= unsigned(alias2);
+                sig5 <= '1';
+              end if;
+              temp29 := (unsigned(alias1(31 downto 6)) = 4);
+              if temp29 then
+                addr11 := (alias1) - (256);
+                temp30 := not (val5);
+                temp31 := ("00000000000000000000000000000000") and (temp30);
+                temp32 := ("11111111111111111111111111111111") and (val5);
+                temp33 := (temp31) or (temp32);
+                val2 <= temp33;
+                addr5 <= unsigned(std_logic_vector(unsigned(addr11(6 downto 0))));
+                data2 <= unsigned(alias2);
+                sig8 <= '1';
+              end if;
+              buffer_axi_bresp <= "00";
+              buffer_axi_bvalid <= '1';
+            else
+              s_proc_write <= state_1;
+            end if;
+          when state_2 =>
+            if axi_bready = '1' then
+              buffer_axi_bvalid <= '0';
+              s_proc_write <= state_1;
+              var := '0';
+              var1 := '0';
+              buffer_axi_awready <= '1';
+              buffer_axi_wready <= '1';
+            end if;
+          when others =>
+            null;
+        end case;
+      end if;
+    end if;
+  end process;
+end architecture arch_test_axilite_reg_08;
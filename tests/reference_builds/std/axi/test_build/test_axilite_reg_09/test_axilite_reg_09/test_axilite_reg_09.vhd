@@ -0,0 +1,1205 @@
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+
+
+entity test_axilite_reg_09 is
+  port (
+    clk : in std_logic;
+    reset : in std_logic;
+    axi_awaddr : in unsigned(31 downto 0);
+    axi_awprot : in unsigned(2 downto 0);
+    axi_awvalid : in std_logic;
+    axi_awready : out std_logic;
+    axi_wdata : in std_logic_vector(31 downto 0);
+    axi_wstrb : in std_logic_vector(3 downto 0);
+    axi_wvalid : in std_logic;
+    axi_wready : out std_logic;
+    axi_bresp : out std_logic_vector(1 downto 0);
+    axi_bvalid : out std_logic;
+    axi_bready : in std_logic;
+    axi_araddr : in unsigned(31 downto 0);
+    axi_arprot : in unsigned(2 downto 0);
+    axi_arvalid : in std_logic;
+    axi_arready : out std_logic;
+    axi_rdata : out std_logic_vector(31 downto 0);
+    axi_rresp : out std_logic_vector(1 downto 0);
+    axi_rvalid : out std_logic;
+    axi_rready : in std_logic
+    );
+end test_axilite_reg_09;
+
+
+architecture arch_test_axilite_reg_09 of test_axilite_reg_09 is
+  function cohdl_bool_to_std_logic(inp: boolean) return std_logic is
+  begin
+    if inp then
+      return('1');
+    else
+      return('0');
+    end if;
+  end function cohdl_bool_to_std_logic;
+  signal buffer_axi_awready : std_logic := '0';
+  signal buffer_axi_wready : std_logic := '0';
+  signal buffer_axi_bresp : std_logic_vector(1 downto 0) := "00";
+  signal buffer_axi_bvalid : std_logic := '0';
+  signal buffer_axi_arready : std_logic := '0';
+  signal buffer_axi_rdata : std_logic_vector(31 downto 0) := "00000000000000000000000000000000";
+  signal buffer_axi_rresp : std_logic_vector(1 downto 0) := "00";
+  signal buffer_axi_rvalid : std_logic := '0';
+  signal sig : std_logic := '0';
+  signal addr : unsigned(7 downto 0);
+  signal sig1 : unsigned(31 downto 0);
+  type array_type is array(0 to 31) of std_logic_vector(31 downto 0);
+  signal bits : array_type := ( 0 => "01110000110100111101101000011111", 1 => "00000001111010101111011000010100", 2 => "10010101000011001101110111011001", 3 => "00010101011111001111100111000110", 4 => "11000100001110000001100000110110", 5 => "00111100100111111001000011001001", 6 => "11001001111011010000001001001000", 7 => "10011111100011110101111111111011", 8 => "10011101101001100001100011111101", 9 => "00100110000001111010110101011111", 10 => "11110111000000111100100111111111", 11 => "01110111010001010010000011010111", 12 => "10010100001110011000010100100000", 13 => "10001110011100100101110101010111", 14 => "10100101000001101011111111000101", 15 => "01011010111100001111001111100000", 16 => "11101110111110101101111100100011", 17 => "10000010000100101111011111000110", 18 => "00000001011110101101000001010001", 19 => "01100000100110011101011110010101", 20 => "00001101110111100110110100001000", 21 => "10010110011010000100010010101010", 22 => "00101001111111000001110110011101", 23 => "10001110101011010011000111001000", 24 => "00100100111011010100100110110001", 25 => "11101111111100110101101101100001", 26 => "11000101010111101111000110000110", 27 => "01001110001011100011011101100001", 28 => "00001010001000101000101110101000", 29 => "11001110011101111001101010010011", 30 => "00101101011001100101101001111011", 31 => "00100111100100011110111011111000" );
+  signal sig2 : std_logic := '0';
+  signal addr1 : unsigned(7 downto 0);
+  signal val : std_logic_vector(31 downto 0);
+  signal data : unsigned(31 downto 0);
+  signal sig3 : std_logic := '0';
+  signal addr2 : unsigned(7 downto 0);
+  signal sig4 : unsigned(31 downto 0);
+  signal bits1 : array_type := ( 0 => "11010101011110011100010011001001", 1 => "01011001011111101110000110001011", 2 => "11010001000000111011100100011111", 3 => "01111001110101101101111011011011", 4 => "11100001101011100110101000000000", 5 => "11010000100100101110000001111111", 6 => "01001011101100011001110100000010", 7 => "00101111100001001110101000001111", 8 => "10000111101000001110101010111111", 9 => "01111100001101100010010010010001", 10 => "10101000000010010100100000000101", 11 => "10100100000110110110010101111010", 12 => "01011000011010001100100110011011", 13 => "10111000010110100100111010101011", 14 => "00010010000111100011110011000100", 15 => "01100101001011101010011000010011", 16 => "00001001101110100000001110011010", 17 => "01010001001001011111111100001111", 18 => "11110001111011101101110111101110", 19 => "00110011101011111000000111011001", 20 => "01100101100010101010001001011101", 21 => "11100011001010011001011010110100", 22 => "10000000001000011110111100110010", 23 => "11011011110100101101101101100010", 24 => "10110011110100011000000000100010", 25 => "10010101101000101001000011100011", 26 => "01001101010000010100001011111000", 27 => "11010000000101110000011101111000", 28 => "10001000110010101000111000111100", 29 => "10001100100011010100011000110000", 30 => "01010101011100010010101001010101", 31 => "00100001100001001101000011101010" );
+  signal sig5 : std_logic := '0';
+  signal addr3 : unsigned(7 downto 0);
+  signal val1 : std_logic_vector(31 downto 0);
+  signal data1 : unsigned(31 downto 0);
+  signal sig6 : std_logic := '0';
+  signal addr4 : unsigned(6 downto 0);
+  signal sig7 : unsigned(31 downto 0);
+  type array_type1 is array(0 to 15) of std_logic_vector(31 downto 0);
+  signal bits2 : array_type1 := ( 0 => "10011111110111111001111111100010", 1 => "11101100111000110111110101110111", 2 => "01010011010001011110010000100111", 3 => "10101100101110001111010010101111", 4 => "10100011011001100101001101100011", 5 => "00110111100011111000010100101001", 6 => "01101110110010100010101110100000", 7 => "10111100100110100000000000000101", 8 => "11110101110001000010110100111110", 9 => "11101011110010110001001000000000", 10 => "01101100000010101001101110111010", 11 => "11011000110011110000010010101110", 12 => "01000010101001000000110111001000", 13 => "01101001000001101010101101101000", 14 => "01100000000101101101011000001110", 15 => "00110110110000010011100010100100" );
+  signal sig8 : std_logic := '0';
+  signal addr5 : unsigned(6 downto 0);
+  signal data2 : unsigned(31 downto 0);
+  signal sig9 : std_logic := '0';
+  signal addr6 : unsigned(6 downto 0);
+  signal sig10 : unsigned(31 downto 0);
+  signal bits3 : array_type1 := ( 0 => "10010110011001110000011000001100", 1 => "00001101011100001001001001001000", 2 => "01110000110010000011011111101010", 3 => "11000110111000100001000110100000", 4 => "00101010010100100111010100100001", 5 => "01001110110100111010100011010001", 6 => "00010010110001011000001100001001", 7 => "01100101000111100001110010100101", 8 => "01111010110001100100010100001101", 9 => "01111010010110111011011101110110", 10 => "10011001101110011111010101010111", 11 => "00110100110000001101111100011000", 12 => "10101011000101100110010111010111", 13 => "10101000111010110111101111010110", 14 => "10111001101111011010101101101000", 15 => "00011010100011001100101011111000" );
+  type state_impl_write_memory is (state_0, state_1);
+  signal s_impl_write_memory : state_impl_write_memory := state_0;
+  signal sig11 : std_logic := '0';
+  signal addr7 : unsigned(6 downto 0);
+  signal old : std_logic_vector(31 downto 0);
+  signal val2 : std_logic_vector(31 downto 0);
+  signal data3 : unsigned(31 downto 0);
+  signal sig12 : std_logic := '0';
+  signal addr8 : unsigned(6 downto 0);
+  type array_type2 is array(0 to 15) of std_logic_vector(7 downto 0);
+  signal bits4 : array_type2 := ( 0 => "11001011", 1 => "10010110", 2 => "11111010", 3 => "11111110", 4 => "01000111", 5 => "10011010", 6 => "01010010", 7 => "01000100", 8 => "10001100", 9 => "11010010", 10 => "01000001", 11 => "00000111", 12 => "11111101", 13 => "11111001", 14 => "10101010", 15 => "11111101" );
+  signal bits5 : array_type2 := ( 0 => "01000111", 1 => "10001000", 2 => "11101100", 3 => "11100100", 4 => "01101110", 5 => "00101010", 6 => "00110001", 7 => "01111011", 8 => "01011001", 9 => "11111010", 10 => "11010100", 11 => "01000011", 12 => "10011100", 13 => "01001011", 14 => "10100110", 15 => "10011011" );
+  signal bits6 : array_type2 := ( 0 => "10001010", 1 => "01010000", 2 => "01010111", 3 => "11000000", 4 => "11010000", 5 => "00000101", 6 => "00010000", 7 => "00100001", 8 => "11001001", 9 => "10111101", 10 => "10011111", 11 => "11011001", 12 => "11110101", 13 => "11101011", 14 => "01001000", 15 => "11101011" );
+  signal bits7 : array_type2 := ( 0 => "10101100", 1 => "00011000", 2 => "00011101", 3 => "00011111", 4 => "11010001", 5 => "11011100", 6 => "11000100", 7 => "00000000", 8 => "11010111", 9 => "11100011", 10 => "01010111", 11 => "11010110", 12 => "00001011", 13 => "01111010", 14 => "00100101", 15 => "11110001" );
+  signal sig13 : unsigned(31 downto 0);
+  signal sig14 : std_logic := '0';
+  signal addr9 : unsigned(6 downto 0);
+  signal val3 : std_logic_vector(31 downto 0);
+  signal data4 : unsigned(31 downto 0);
+  type state_proc_read is (state_0, state_1, state_2, state_3, state_4, state_5, state_6, state_7, state_8, state_9, state_10, state_11, state_12, state_13, state_14, state_15, state_16, state_17, state_18, state_19, state_20, state_21, state_22, state_23, state_24, state_25, state_26, state_27, state_28, state_29, state_30, state_31, state_32, state_33, state_34, state_35, state_36, state_37, state_38, state_39, state_40, state_41, state_42, state_43, state_44, state_45, state_46, state_47, state_48, state_49, state_50, state_51, state_52, state_53, state_54, state_55, state_56, state_57, state_58, state_59, state_60, state_61, state_62, state_63, state_64);
+  signal s_proc_read : state_proc_read := state_0;
+  type state_proc_write is (state_0, state_1, state_2);
+  signal s_proc_write : state_proc_write := state_0;
+  signal addr10 : unsigned(31 downto 0);
+  signal prot : unsigned(2 downto 0);
+  signal data5 : std_logic_vector(31 downto 0);
+  signal strb : std_logic_vector(3 downto 0);
+begin
+  
+  -- CONCURRENT BLOCK (buffer assignment)
+  axi_awready <= buffer_axi_awready;
+  axi_wready <= buffer_axi_wready;
+  axi_bresp <= buffer_axi_bresp;
+  axi_bvalid <= buffer_axi_bvalid;
+  axi_arready <= buffer_axi_arready;
+  axi_rdata <= buffer_axi_rdata;
+  axi_rresp <= buffer_axi_rresp;
+  axi_rvalid <= buffer_axi_rvalid;
+  
+
+  impl_read_memory: process(clk)
+    variable temp : boolean;
+    variable temp1 : boolean;
+    variable index : std_logic_vector(5 downto 0);
+    variable temp2 : unsigned(5 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+      else
+        temp1 := sig = '1';
+        if temp1 then
+          index := std_logic_vector(unsigned(addr(7 downto 2)));
+          temp2 := unsigned(index);
+          sig1 <= unsigned(bits(to_integer(temp2)));
+        end if;
+      end if;
+    end if;
+  end process;
+  
+
+  impl_write_memory: process(clk)
+    variable temp : boolean;
+    variable temp1 : boolean;
+    variable val4 : std_logic_vector(5 downto 0);
+    variable index : unsigned(5 downto 0);
+    variable temp2 : unsigned(5 downto 0);
+    variable temp3 : std_logic_vector(31 downto 0);
+    variable temp4 : std_logic_vector(31 downto 0);
+    variable temp5 : std_logic_vector(31 downto 0);
+    variable temp6 : std_logic_vector(31 downto 0);
+    variable temp7 : unsigned(5 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+        bits <= ( 0 => "01110000110100111101101000011111", 1 => "00000001111010101111011000010100", 2 => "10010101000011001101110111011001", 3 => "00010101011111001111100111000110", 4 => "11000100001110000001100000110110", 5 => "00111100100111111001000011001001", 6 => "11001001111011010000001001001000", 7 => "10011111100011110101111111111011", 8 => "10011101101001100001100011111101", 9 => "00100110000001111010110101011111", 10 => "11110111000000111100100111111111", 11 => "01110111010001010010000011010111", 12 => "10010100001110011000010100100000", 13 => "10001110011100100101110101010111", 14 => "10100101000001101011111111000101", 15 => "01011010111100001111001111100000", 16 => "11101110111110101101111100100011", 17 => "10000010000100101111011111000110", 18 => "00000001011110101101000001010001", 19 => "01100000100110011101011110010101", 20 => "00001101110111100110110100001000", 21 => "10010110011010000100010010101010", 22 => "00101001111111000001110110011101", 23 => "10001110101011010011000111001000", 24 => "00100100111011010100100110110001", 25 => "11101111111100110101101101100001", 26 => "11000101010111101111000110000110", 27 => "01001110001011100011011101100001", 28 => "00001010001000101000101110101000", 29 => "11001110011101111001101010010011", 30 => "00101101011001100101101001111011", 31 => "00100111100100011110111011111000" );
+      else
+        temp1 := sig2 = '1';
+        if temp1 then
+          val4 := std_logic_vector(unsigned(addr1(7 downto 2)));
+          index := unsigned(val4);
+          temp2 := index;
+          temp3 := not (val);
+          temp4 := (bits(to_integer(temp2))) and (temp3);
+          temp5 := (std_logic_vector(data)) and (val);
+          temp6 := (temp4) or (temp5);
+          temp7 := index;
+          bits(to_integer(temp7)) <= temp6;
+        end if;
+      end if;
+    end if;
+  end process;
+  
+
+  impl_read_memory1: process(clk)
+    variable temp : boolean;
+    variable temp1 : boolean;
+    variable index : std_logic_vector(5 downto 0);
+    variable temp2 : unsigned(5 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+      else
+        temp1 := sig3 = '1';
+        if temp1 then
+          index := std_logic_vector(unsigned(addr2(7 downto 2)));
+          temp2 := unsigned(index);
+          sig4 <= unsigned(bits1(to_integer(temp2)));
+        end if;
+      end if;
+    end if;
+  end process;
+  
+
+  impl_write_memory1: process(clk)
+    variable temp : boolean;
+    variable temp1 : boolean;
+    variable val4 : std_logic_vector(5 downto 0);
+    variable index : unsigned(5 downto 0);
+    variable temp2 : unsigned(5 downto 0);
+    variable temp3 : std_logic_vector(31 downto 0);
+    variable temp4 : std_logic_vector(31 downto 0);
+    variable temp5 : std_logic_vector(31 downto 0);
+    variable temp6 : std_logic_vector(31 downto 0);
+    variable temp7 : unsigned(5 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+      else
+        temp1 := sig5 = '1';
+        if temp1 then
+          val4 := std_logic_vector(unsigned(addr3(7 downto 2)));
+          index := unsigned(val4);
+          temp2 := index;
+          temp3 := not (val1);
+          temp4 := (bits1(to_integer(temp2))) and (temp3);
+          temp5 := (std_logic_vector(data1)) and (val1);
+          temp6 := (temp4) or (temp5);
+          temp7 := index;
+          bits1(to_integer(temp7)) <= temp6;
+        end if;
+      end if;
+    end if;
+  end process;
+  
+
+  impl_read_memory2: process(clk)
+    variable temp : boolean;
+    variable temp1 : boolean;
+    variable index : std_logic_vector(4 downto 0);
+    variable temp2 : unsigned(4 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+      else
+        temp1 := sig6 = '1';
+        if temp1 then
+          index := std_logic_vector(unsigned(addr4(6 downto 2)));
+          temp2 := unsigned(index);
+          sig7 <= unsigned(bits2(to_integer(temp2)));
+        end if;
+      end if;
+    end if;
+  end process;
+  
+
+  impl_write_memory2: process(clk)
+    variable temp : boolean;
+    variable temp1 : boolean;
+    variable val4 : std_logic_vector(4 downto 0);
+    variable index : unsigned(4 downto 0);
+    variable temp2 : unsigned(4 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+        bits2 <= ( 0 => "10011111110111111001111111100010", 1 => "11101100111000110111110101110111", 2 => "01010011010001011110010000100111", 3 => "10101100101110001111010010101111", 4 => "10100011011001100101001101100011", 5 => "00110111100011111000010100101001", 6 => "01101110110010100010101110100000", 7 => "10111100100110100000000000000101", 8 => "11110101110001000010110100111110", 9 => "11101011110010110001001000000000", 10 => "01101100000010101001101110111010", 11 => "11011000110011110000010010101110", 12 => "01000010101001000000110111001000", 13 => "01101001000001101010101101101000", 14 => "01100000000101101101011000001110", 15 => "00110110110000010011100010100100" );
+      else
+        temp1 := sig8 = '1';
+        if temp1 then
+          val4 := std_logic_vector(unsigned(addr5(6 downto 2)));
+          index := unsigned(val4);
+          temp2 := index;
+          bits2(to_integer(temp2)) <= std_logic_vector(data2);
+        end if;
+      end if;
+    end if;
+  end process;
+  
+
+  impl_read_memory3: process(clk)
+    variable temp : boolean;
+    variable temp1 : boolean;
+    variable index : std_logic_vector(4 downto 0);
+    variable temp2 : unsigned(4 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+      else
+        temp1 := sig9 = '1';
+        if temp1 then
+          index := std_logic_vector(unsigned(addr6(6 downto 2)));
+          temp2 := unsigned(index);
+          sig10 <= unsigned(bits3(to_integer(temp2)));
+        end if;
+      end if;
+    end if;
+  end process;
+  
+
+  impl_write_memory3: process(clk)
+    variable temp : boolean;
+    variable temp1 : boolean;
+    variable val4 : std_logic_vector(4 downto 0);
+    variable index : unsigned(4 downto 0);
+    variable temp2 : unsigned(4 downto 0);
+    variable temp3 : std_logic_vector(31 downto 0);
+    variable temp4 : std_logic_vector(31 downto 0);
+    variable temp5 : std_logic_vector(31 downto 0);
+    variable temp6 : std_logic_vector(31 downto 0);
+    variable temp7 : unsigned(4 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+        s_impl_write_memory <= state_0;
+      else
+        case s_impl_write_memory is
+          when state_0 =>
+            temp1 := sig11 = '1';
+            if temp1 then
+              s_impl_write_memory <= state_1;
+              val4 := std_logic_vector(unsigned(addr7(6 downto 2)));
+              index := unsigned(val4);
+              temp2 := index;
+              old <= bits3(to_integer(temp2));
+            else
+              s_impl_write_memory <= state_0;
+            end if;
+          when state_1 =>
+            temp3 := not (val2);
+            temp4 := (old) and (temp3);
+            temp5 := (std_logic_vector(data3)) and (val2);
+            temp6 := (temp4) or (temp5);
+            temp7 := index;
+            bits3(to_integer(temp7)) <= temp6;
+            temp1 := sig11 = '1';
+            if temp1 then
+              s_impl_write_memory <= state_1;
+              val4 := std_logic_vector(unsigned(addr7(6 downto 2)));
+              index := unsigned(val4);
+              temp2 := index;
+              old <= bits3(to_integer(temp2));
+            else
+              s_impl_write_memory <= state_0;
+            end if;
+          when others =>
+            null;
+        end case;
+      end if;
+    end if;
+  end process;
+  
+
+  impl_read_memory4: process(clk)
+    variable temp : boolean;
+    variable temp1 : boolean;
+    variable index : std_logic_vector(4 downto 0);
+    variable temp2 : boolean;
+    variable temp3 : unsigned(4 downto 0);
+    variable temp4 : unsigned(4 downto 0);
+    variable temp5 : unsigned(4 downto 0);
+    variable temp6 : unsigned(4 downto 0);
+    variable a : std_logic_vector(15 downto 0);
+    variable b : std_logic_vector(15 downto 0);
+    variable temp7 : std_logic_vector(31 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+      else
+        temp1 := sig12 = '1';
+        if temp1 then
+          index := std_logic_vector(unsigned(addr8(6 downto 2)));
+          temp2 := (unsigned(addr8(1 downto 0)) = 0);
+          assert temp2 report "stride error";
+          temp3 := unsigned(index);
+          temp4 := unsigned(index);
+          temp5 := unsigned(index);
+          temp6 := unsigned(index);
+          a := (bits4(to_integer(temp6))) & (bits5(to_integer(temp5)));
+          b := (bits6(to_integer(temp4))) & (bits7(to_integer(temp3)));
+          temp7 := (a) & (b);
+          sig13 <= unsigned(temp7);
+        end if;
+      end if;
+    end if;
+  end process;
+  
+
+  impl_write_memory4: process(clk)
+    variable temp : boolean;
+    variable temp1 : boolean;
+    variable val4 : std_logic_vector(4 downto 0);
+    variable index : unsigned(4 downto 0);
+    variable temp2 : std_logic_vector(31 downto 0);
+    variable temp3 : std_logic_vector(31 downto 0);
+    variable temp4 : std_logic_vector(31 downto 0);
+    variable temp5 : std_logic_vector(31 downto 0);
+    variable temp6 : boolean;
+    variable temp7 : unsigned(4 downto 0);
+    variable temp8 : boolean;
+    variable temp9 : unsigned(4 downto 0);
+    variable temp10 : boolean;
+    variable temp11 : unsigned(4 downto 0);
+    variable temp12 : boolean;
+    variable temp13 : unsigned(4 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+        bits7 <= ( 0 => "10101100", 1 => "00011000", 2 => "00011101", 3 => "00011111", 4 => "11010001", 5 => "11011100", 6 => "11000100", 7 => "00000000", 8 => "11010111", 9 => "11100011", 10 => "01010111", 11 => "11010110", 12 => "00001011", 13 => "01111010", 14 => "00100101", 15 => "11110001" );
+        bits6 <= ( 0 => "10001010", 1 => "01010000", 2 => "01010111", 3 => "11000000", 4 => "11010000", 5 => "00000101", 6 => "00010000", 7 => "00100001", 8 => "11001001", 9 => "10111101", 10 => "10011111", 11 => "11011001", 12 => "11110101", 13 => "11101011", 14 => "01001000", 15 => "11101011" );
+        bits5 <= ( 0 => "01000111", 1 => "10001000", 2 => "11101100", 3 => "11100100", 4 => "01101110", 5 => "00101010", 6 => "00110001", 7 => "01111011", 8 => "01011001", 9 => "11111010", 10 => "11010100", 11 => "01000011", 12 => "10011100", 13 => "01001011", 14 => "10100110", 15 => "10011011" );
+        bits4 <= ( 0 => "11001011", 1 => "10010110", 2 => "11111010", 3 => "11111110", 4 => "01000111", 5 => "10011010", 6 => "01010010", 7 => "01000100", 8 => "10001100", 9 => "11010010", 10 => "01000001", 11 => "00000111", 12 => "11111101", 13 => "11111001", 14 => "10101010", 15 => "11111101" );
+      else
+        temp1 := sig14 = '1';
+        if temp1 then
+          val4 := std_logic_vector(unsigned(addr9(6 downto 2)));
+          index := unsigned(val4);
+          temp2 := not (val3);
+          temp3 := ("00000000000000000000000000000000") and (temp2);
+          temp4 := ("11111111111111111111111111111111") and (val3);
+          temp5 := (temp3) or (temp4);
+          temp6 := temp5(0) = '1';
+          if temp6 then
+            temp7 := index;
+            bits7(to_integer(temp7)) <= std_logic_vector(unsigned(data4(7 downto 0)));
+          end if;
+          temp8 := temp5(8) = '1';
+          if temp8 then
+            temp9 := index;
+            bits6(to_integer(temp9)) <= std_logic_vector(unsigned(data4(15 downto 8)));
+          end if;
+          temp10 := temp5(16) = '1';
+          if temp10 then
+            temp11 := index;
+            bits5(to_integer(temp11)) <= std_logic_vector(unsigned(data4(23 downto 16)));
+          end if;
+          temp12 := temp5(24) = '1';
+          if temp12 then
+            temp13 := index;
+            bits4(to_integer(temp13)) <= std_logic_vector(unsigned(data4(31 downto 24)));
+          end if;
+        end if;
+      end if;
+    end if;
+  end process;
+  
+
+  proc_read: process(clk)
+    variable temp : boolean;
+    variable data6 : std_logic_vector(31 downto 0);
+    variable temp1 : boolean;
+    variable addr11 : unsigned(31 downto 0);
+    variable temp2 : boolean;
+    variable addr12 : unsigned(31 downto 0);
+    variable temp3 : boolean;
+    variable addr13 : unsigned(31 downto 0);
+    variable temp4 : boolean;
+    variable addr14 : unsigned(31 downto 0);
+    variable temp5 : boolean;
+    variable addr15 : unsigned(31 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+        s_proc_read <= state_0;
+        buffer_axi_arready <= '0';
+        sig <= '0';
+        sig3 <= '0';
+        sig6 <= '0';
+        sig9 <= '0';
+        sig12 <= '0';
+        buffer_axi_rdata <= "00000000000000000000000000000000";
+        buffer_axi_rresp <= "00";
+        buffer_axi_rvalid <= '0';
+      else
+        sig <= '0';
+        sig3 <= '0';
+        sig6 <= '0';
+        sig9 <= '0';
+        sig12 <= '0';
+        case s_proc_read is
+          when state_0 =>
+            s_proc_read <= state_1;
+            buffer_axi_arready <= '1';
+          when state_1 =>
+            if axi_arvalid = '1' then
+              buffer_axi_arready <= '0';
+              data6 := "00000000000000000000000000000000";
+              temp1 := (unsigned(axi_araddr(31 downto 7)) = 0);
+              if temp1 then
+                s_proc_read <= state_2;
+                addr11 := (axi_araddr) - (0);
+                addr <= unsigned(std_logic_vector(unsigned(addr11(7 downto 0))));
+                sig <= '1';
+              else
+                temp2 := (unsigned(axi_araddr(31 downto 7)) = 1);
+                if temp2 then
+                  s_proc_read <= state_4;
+                  addr12 := (axi_araddr) - (128);
+                  addr2 <= unsigned(std_logic_vector(unsigned(addr12(7 downto 0))));
+                  sig3 <= '1';
+                else
+                  temp3 := (unsigned(axi_araddr(31 downto 6)) = 4);
+                  if temp3 then
+                    s_proc_read <= state_8;
+                    addr13 := (axi_araddr) - (256);
+                    addr4 <= unsigned(std_logic_vector(unsigned(addr13(6 downto 0))));
+                    sig6 <= '1';
+                  else
+                    temp4 := (unsigned(axi_araddr(31 downto 6)) = 5);
+                    if temp4 then
+                      s_proc_read <= state_16;
+                      addr14 := (axi_araddr) - (320);
+                      addr6 <= unsigned(std_logic_vector(unsigned(addr14(6 downto 0))));
+                      sig9 <= '1';
+                    else
+                      temp5 := (unsigned(axi_araddr(31 downto 6)) = 6);
+                      if temp5 then
+                        s_proc_read <= state_32;
+                        addr15 := (axi_araddr) - (384);
+                        addr8 <= unsigned(std_logic_vector(unsigned(addr15(6 downto 0))));
+                        sig12 <= '1';
+                      else
+                        s_proc_read <= state_64;
+                        buffer_axi_rdata <= data6;
+                        buffer_axi_rresp <= "00";
+                        buffer_axi_rvalid <= '1';
+                      end if;
+                    end if;
+                  end if;
+                end if;
+              end if;
+            end if;
+          when state_2 =>
+            s_proc_read <= state_3;
+          when state_3 =>
+            data6 := std_logic_vector(sig1);
+            temp2 := (unsigned(axi_araddr(31 downto 7)) = 1);
+            if temp2 then
+              s_proc_read <= state_6;
+              addr12 := (axi_araddr) - (128);
+              addr2 <= unsigned(std_logic_vector(unsigned(addr12(7 downto 0))));
+              sig3 <= '1';
+            else
+              temp3 := (unsigned(axi_araddr(31 downto 6)) = 4);
+              if temp3 then
+                s_proc_read <= state_12;
+                addr13 := (axi_araddr) - (256);
+                addr4 <= unsigned(std_logic_vector(unsigned(addr13(6 downto 0))));
+                sig6 <= '1';
+              else
+                temp4 := (unsigned(axi_araddr(31 downto 6)) = 5);
+                if temp4 then
+                  s_proc_read <= state_24;
+                  addr14 := (axi_araddr) - (320);
+                  addr6 <= unsigned(std_logic_vector(unsigned(addr14(6 downto 0))));
+                  sig9 <= '1';
+                else
+                  temp5 := (unsigned(axi_araddr(31 downto 6)) = 6);
+                  if temp5 then
+                    s_proc_read <= state_48;
+                    addr15 := (axi_araddr) - (384);
+                    addr8 <= unsigned(std_logic_vector(unsigned(addr15(6 downto 0))));
+                    sig12 <= '1';
+                  else
+                    s_proc_read <= state_64;
+                    buffer_axi_rdata <= data6;
+                    buffer_axi_rresp <= "00";
+                    buffer_axi_rvalid <= '1';
+                  end if;
+                end if;
+              end if;
+            end if;
+          when state_4 =>
+            s_proc_read <= state_5;
+          when state_5 =>
+            data6 := std_logic_vector(sig4);
+            temp3 := (unsigned(axi_araddr(31 downto 6)) = 4);
+            if temp3 then
+              s_proc_read <= state_10;
+              addr13 := (axi_araddr) - (256);
+              addr4 <= unsigned(std_logic_vector(unsigned(addr13(6 downto 0))));
+              sig6 <= '1';
+            else
+              temp4 := (unsigned(axi_araddr(31 downto 6)) = 5);
+              if temp4 then
+                s_proc_read <= state_20;
+                addr14 := (axi_araddr) - (320);
+                addr6 <= unsigned(std_logic_vector(unsigned(addr14(6 downto 0))));
+                sig9 <= '1';
+              else
+                temp5 := (unsigned(axi_araddr(31 downto 6)) = 6);
+                if temp5 then
+                  s_proc_read <= state_40;
+                  addr15 := (axi_araddr) - (384);
+                  addr8 <= unsigned(std_logic_vector(unsigned(addr15(6 downto 0))));
+                  sig12 <= '1';
+                else
+                  s_proc_read <= state_64;
+                  buffer_axi_rdata <= data6;
+                  buffer_axi_rresp <= "00";
+                  buffer_axi_rvalid <= '1';
+                end if;
+              end if;
+            end if;
+          when state_6 =>
+            s_proc_read <= state_7;
+          when state_7 =>
+            data6 := std_logic_vector(sig4);
+            temp3 := (unsigned(axi_araddr(31 downto 6)) = 4);
+            if temp3 then
+              s_proc_read <= state_14;
+              addr13 := (axi_araddr) - (256);
+              addr4 <= unsigned(std_logic_vector(unsigned(addr13(6 downto 0))));
+              sig6 <= '1';
+            else
+              temp4 := (unsigned(axi_araddr(31 downto 6)) = 5);
+              if temp4 then
+                s_proc_read <= state_28;
+                addr14 := (axi_araddr) - (320);
+                addr6 <= unsigned(std_logic_vector(unsigned(addr14(6 downto 0))));
+                sig9 <= '1';
+              else
+                temp5 := (unsigned(axi_araddr(31 downto 6)) = 6);
+                if temp5 then
+                  s_proc_read <= state_56;
+                  addr15 := (axi_araddr) - (384);
+                  addr8 <= unsigned(std_logic_vector(unsigned(addr15(6 downto 0))));
+                  sig12 <= '1';
+                else
+                  s_proc_read <= state_64;
+                  buffer_axi_rdata <= data6;
+                  buffer_axi_rresp <= "00";
+                  buffer_axi_rvalid <= '1';
+                end if;
+              end if;
+            end if;
+          when state_8 =>
+            s_proc_read <= state_9;
+          when state_9 =>
+            data6 := std_logic_vector(sig7);
+            temp4 := (unsigned(axi_araddr(31 downto 6)) = 5);
+            if temp4 then
+              s_proc_read <= state_18;
+              addr14 := (axi_araddr) - (320);
+              addr6 <= unsigned(std_logic_vector(unsigned(addr14(6 downto 0))));
+              sig9 <= '1';
+            else
+              temp5 := (unsigned(axi_araddr(31 downto 6)) = 6);
+              if temp5 then
+                s_proc_read <= state_36;
+                addr15 := (axi_araddr) - (384);
+                addr8 <= unsigned(std_logic_vector(unsigned(addr15(6 downto 0))));
+                sig12 <= '1';
+              else
+                s_proc_read <= state_64;
+                buffer_axi_rdata <= data6;
+                buffer_axi_rresp <= "00";
+                buffer_axi_rvalid <= '1';
+              end if;
+            end if;
+          when state_10 =>
+            s_proc_read <= state_11;
+          when state_11 =>
+            data6 := std_logic_vector(sig7);
+            temp4 := (unsigned(axi_araddr(31 downto 6)) = 5);
+            if temp4 then
+              s_proc_read <= state_22;
+              addr14 := (axi_araddr) - (320);
+              addr6 <= unsigned(std_logic_vector(unsigned(addr14(6 downto 0))));
+              sig9 <= '1';
+            else
+              temp5 := (unsigned(axi_araddr(31 downto 6)) = 6);
+              if temp5 then
+                s_proc_read <= state_44;
+                addr15 := (axi_araddr) - (384);
+                addr8 <= unsigned(std_logic_vector(unsigned(addr15(6 downto 0))));
+                sig12 <= '1';
+              else
+                s_proc_read <= state_64;
+                buffer_axi_rdata <= data6;
+                buffer_axi_rresp <= "00";
+                buffer_axi_rvalid <= '1';
+              end if;
+            end if;
+          when state_12 =>
+            s_proc_read <= state_13;
+          when state_13 =>
+            data6 := std_logic_vector(sig7);
+            temp4 := (unsigned(axi_araddr(31 downto 6)) = 5);
+            if temp4 then
+              s_proc_read <= state_26;
+              addr14 := (axi_araddr) - (320);
+              addr6 <= unsigned(std_logic_vector(unsigned(addr14(6 downto 0))));
+              sig9 <= '1';
+            else
+              temp5 := (unsigned(axi_araddr(31 downto 6)) = 6);
+              if temp5 then
+                s_proc_read <= state_52;
+                addr15 := (axi_araddr) - (384);
+                addr8 <= unsigned(std_logic_vector(unsigned(addr15(6 downto 0))));
+                sig12 <= '1';
+              else
+                s_proc_read <= state_64;
+                buffer_axi_rdata <= data6;
+                buffer_axi_rresp <= "00";
+                buffer_axi_rvalid <= '1';
+              end if;
+            end if;
+          when state_14 =>
+            s_proc_read <= state_15;
+          when state_15 =>
+            data6 := std_logic_vector(sig7);
+            temp4 := (unsigned(axi_araddr(31 downto 6)) = 5);
+            if temp4 then
+              s_proc_read <= state_30;
+              addr14 := (axi_araddr) - (320);
+              addr6 <= unsigned(std_logic_vector(unsigned(addr14(6 downto 0))));
+              sig9 <= '1';
+            else
+              temp5 := (unsigned(axi_araddr(31 downto 6)) = 6);
+              if temp5 then
+                s_proc_read <= state_60;
+                addr15 := (axi_araddr) - (384);
+                addr8 <= unsigned(std_logic_vector(unsigned(addr15(6 downto 0))));
+                sig12 <= '1';
+              else
+                s_proc_read <= state_64;
+                buffer_axi_rdata <= data6;
+                buffer_axi_rresp <= "00";
+                buffer_axi_rvalid <= '1';
+              end if;
+            end if;
+          when state_16 =>
+            s_proc_read <= state_17;
+          when state_17 =>
+            data6 := std_logic_vector(sig10);
+            temp5 := (unsigned(axi_araddr(31 downto 6)) = 6);
+            if temp5 then
+              s_proc_read <= state_34;
+              addr15 := (axi_araddr) - (384);
+              addr8 <= unsigned(std_logic_vector(unsigned(addr15(6 downto 0))));
+              sig12 <= '1';
+            else
+              s_proc_read <= state_64;
+              buffer_axi_rdata <= data6;
+              buffer_axi_rresp <= "00";
+              buffer_axi_rvalid <= '1';
+            end if;
+          when state_18 =>
+            s_proc_read <= state_19;
+          when state_19 =>
+            data6 := std_logic_vector(sig10);
+            temp5 := (unsigned(axi_araddr(31 downto 6)) = 6);
+            if temp5 then
+              s_proc_read <= state_38;
+              addr15 := (axi_araddr) - (384);
+              addr8 <= unsigned(std_logic_vector(unsigned(addr15(6 downto 0))));
+              sig12 <= '1';
+            else
+              s_proc_read <= state_64;
+              buffer_axi_rdata <= data6;
+              buffer_axi_rresp <= "00";
+              buffer_axi_rvalid <= '1';
+            end if;
+          when state_20 =>
+            s_proc_read <= state_21;
+          when state_21 =>
+            data6 := std_logic_vector(sig10);
+            temp5 := (unsigned(axi_araddr(31 downto 6)) = 6);
+            if temp5 then
+              s_proc_read <= state_42;
+              addr15 := (axi_araddr) - (384);
+              addr8 <= unsigned(std_logic_vector(unsigned(addr15(6 downto 0))));
+              sig12 <= '1';
+            else
+              s_proc_read <= state_64;
+              buffer_axi_rdata <= data6;
+              buffer_axi_rresp <= "00";
+              buffer_axi_rvalid <= '1';
+            end if;
+          when state_22 =>
+            s_proc_read <= state_23;
+          when state_23 =>
+            data6 := std_logic_vector(sig10);
+            temp5 := (unsigned(axi_araddr(31 downto 6)) = 6);
+            if temp5 then
+              s_proc_read <= state_46;
+              addr15 := (axi_araddr) - (384);
+              addr8 <= unsigned(std_logic_vector(unsigned(addr15(6 downto 0))));
+              sig12 <= '1';
+            else
+              s_proc_read <= state_64;
+              buffer_axi_rdata <= data6;
+              buffer_axi_rresp <= "00";
+              buffer_axi_rvalid <= '1';
+            end if;
+          when state_24 =>
+            s_proc_read <= state_25;
+          when state_25 =>
+            data6 := std_logic_vector(sig10);
+            temp5 := (unsigned(axi_araddr(31 downto 6)) = 6);
+            if temp5 then
+              s_proc_read <= state_50;
+              addr15 := (axi_araddr) - (384);
+              addr8 <= unsigned(std_logic_vector(unsigned(addr15(6 downto 0))));
+              sig12 <= '1';
+            else
+              s_proc_read <= state_64;
+              buffer_axi_rdata <= data6;
+              buffer_axi_rresp <= "00";
+              buffer_axi_rvalid <= '1';
+            end if;
+          when state_26 =>
+            s_proc_read <= state_27;
+          when state_27 =>
+            data6 := std_logic_vector(sig10);
+            temp5 := (unsigned(axi_araddr(31 downto 6)) = 6);
+            if temp5 then
+              s_proc_read <= state_54;
+              addr15 := (axi_araddr) - (384);
+              addr8 <= unsigned(std_logic_vector(unsigned(addr15(6 downto 0))));
+              sig12 <= '1';
+            else
+              s_proc_read <= state_64;
+              buffer_axi_rdata <= data6;
+              buffer_axi_rresp <= "00";
+              buffer_axi_rvalid <= '1';
+            end if;
+          when state_28 =>
+            s_proc_read <= state_29;
+          when state_29 =>
+            data6 := std_logic_vector(sig10);
+            temp5 := (unsigned(axi_araddr(31 downto 6)) = 6);
+            if temp5 then
+              s_proc_read <= state_58;
+              addr15 := (axi_araddr) - (384);
+              addr8 <= unsigned(std_logic_vector(unsigned(addr15(6 downto 0))));
+              sig12 <= '1';
+            else
+              s_proc_read <= state_64;
+              buffer_axi_rdata <= data6;
+              buffer_axi_rresp <= "00";
+              buffer_axi_rvalid <= '1';
+            end if;
+          when state_30 =>
+            s_proc_read <= state_31;
+          when state_31 =>
+            data6 := std_logic_vector(sig10);
+            temp5 := (unsigned(axi_araddr(31 downto 6)) = 6);
+            if temp5 then
+              s_proc_read <= state_62;
+              addr15 := (axi_araddr) - (384);
+              addr8 <= unsigned(std_logic_vector(unsigned(addr15(6 downto 0))));
+              sig12 <= '1';
+            else
+              s_proc_read <= state_64;
+              buffer_axi_rdata <= data6;
+              buffer_axi_rresp <= "00";
+              buffer_axi_rvalid <= '1';
+            end if;
+          when state_32 =>
+            s_proc_read <= state_33;
+          when state_33 =>
+            s_proc_read <= state_64;
+            data6 := std_logic_vector(sig13);
+            buffer_axi_rdata <= data6;
+            buffer_axi_rresp <= "00";
+            buffer_axi_rvalid <= '1';
+          when state_34 =>
+            s_proc_read <= state_35;
+          when state_35 =>
+            s_proc_read <= state_64;
+            data6 := std_logic_vector(sig13);
+            buffer_axi_rdata <= data6;
+            buffer_axi_rresp <= "00";
+            buffer_axi_rvalid <= '1';
+          when state_36 =>
+            s_proc_read <= state_37;
+          when state_37 =>
+            s_proc_read <= state_64;
+            data6 := std_logic_vector(sig13);
+            buffer_axi_rdata <= data6;
+            buffer_axi_rresp <= "00";
+            buffer_axi_rvalid <= '1';
+          when state_38 =>
+            s_proc_read <= state_39;
+          when state_39 =>
+            s_proc_read <= state_64;
+            data6 := std_logic_vector(sig13);
+            buffer_axi_rdata <= data6;
+            buffer_axi_rresp <= "00";
+            buffer_axi_rvalid <= '1';
+          when state_40 =>
+            s_proc_read <= state_41;
+          when state_41 =>
+            s_proc_read <= state_64;
+            data6 := std_logic_vector(sig13);
+            buffer_axi_rdata <= data6;
+            buffer_axi_rresp <= "00";
+            buffer_axi_rvalid <= '1';
+          when state_42 =>
+            s_proc_read <= state_43;
+          when state_43 =>
+            s_proc_read <= state_64;
+            data6 := std_logic_vector(sig13);
+            buffer_axi_rdata <= data6;
+            buffer_axi_rresp <= "00";
+            buffer_axi_rvalid <= '1';
+          when state_44 =>
+            s_proc_read <= state_45;
+          when state_45 =>
+            s_proc_read <= state_64;
+            data6 := std_logic_vector(sig13);
+            buffer_axi_rdata <= data6;
+            buffer_axi_rresp <= "00";
+            buffer_axi_rvalid <= '1';
+          when state_46 =>
+            s_proc_read <= state_47;
+          when state_47 =>
+            s_proc_read <= state_64;
+            data6 := std_logic_vector(sig13);
+            buffer_axi_rdata <= data6;
+            buffer_axi_rresp <= "00";
+            buffer_axi_rvalid <= '1';
+          when state_48 =>
+            s_proc_read <= state_49;
+          when state_49 =>
+            s_proc_read <= state_64;
+            data6 := std_logic_vector(sig13);
+            buffer_axi_rdata <= data6;
+            buffer_axi_rresp <= "00";
+            buffer_axi_rvalid <= '1';
+          when state_50 =>
+            s_proc_read <= state_51;
+          when state_51 =>
+            s_proc_read <= state_64;
+            data6 := std_logic_vector(sig13);
+            buffer_axi_rdata <= data6;
+            buffer_axi_rresp <= "00";
+            buffer_axi_rvalid <= '1';
+          when state_52 =>
+            s_proc_read <= state_53;
+          when state_53 =>
+            s_proc_read <= state_64;
+            data6 := std_logic_vector(sig13);
+            buffer_axi_rdata <= data6;
+            buffer_axi_rresp <= "00";
+            buffer_axi_rvalid <= '1';
+          when state_54 =>
+            s_proc_read <= state_55;
+          when state_55 =>
+            s_proc_read <= state_64;
+            data6 := std_logic_vector(sig13);
+            buffer_axi_rdata <= data6;
+            buffer_axi_rresp <= "00";
+            buffer_axi_rvalid <= '1';
+          when state_56 =>
+            s_proc_read <= state_57;
+          when state_57 =>
+            s_proc_read <= state_64;
+            data6 := std_logic_vector(sig13);
+            buffer_axi_rdata <= data6;
+            buffer_axi_rresp <= "00";
+            buffer_axi_rvalid <= '1';
+          when state_58 =>
+            s_proc_read <= state_59;
+          when state_59 =>
+            s_proc_read <= state_64;
+            data6 := std_logic_vector(sig13);
+            buffer_axi_rdata <= data6;
+            buffer_axi_rresp <= "00";
+            buffer_axi_rvalid <= '1';
+          when state_60 =>
+            s_proc_read <= state_61;
+          when state_61 =>
+            s_proc_read <= state_64;
+            data6 := std_logic_vector(sig13);
+            buffer_axi_rdata <= data6;
+            buffer_axi_rresp <= "00";
+            buffer_axi_rvalid <= '1';
+          when state_62 =>
+            s_proc_read <= state_63;
+          when state_63 =>
+            s_proc_read <= state_64;
+            data6 := std_logic_vector(sig13);
+            buffer_axi_rdata <= data6;
+            buffer_axi_rresp <= "00";
+            buffer_axi_rvalid <= '1';
+          when state_64 =>
+            if axi_rready = '1' then
+              buffer_axi_rvalid <= '0';
+              s_proc_read <= state_1;
+              buffer_axi_arready <= '1';
+            end if;
+          when others =>
+            null;
+        end case;
+      end if;
+    end if;
+  end process;
+  
+
+  proc_write: process(clk)
+    variable temp : boolean;
+    variable var : std_logic;
+    variable var1 : std_logic;
+    variable temp1 : std_logic;
+    variable temp2 : boolean;
+    variable alias1 : unsigned(31 downto 0);
+    variable temp3 : std_logic;
+    variable temp4 : boolean;
+    variable alias2 : std_logic_vector(31 downto 0);
+    variable alias3 : std_logic_vector(3 downto 0);
+    variable temp5 : std_logic;
+    variable temp6 : std_logic;
+    variable temp7 : std_logic;
+    variable temp8 : std_logic;
+    variable temp9 : std_logic;
+    variable temp10 : boolean;
+    variable temp11 : std_logic_vector(1 downto 0);
+    variable temp12 : std_logic_vector(3 downto 0);
+    variable first : std_logic_vector(7 downto 0);
+    variable temp13 : std_logic_vector(1 downto 0);
+    variable temp14 : std_logic_vector(3 downto 0);
+    variable first1 : std_logic_vector(7 downto 0);
+    variable temp15 : std_logic_vector(1 downto 0);
+    variable temp16 : std_logic_vector(3 downto 0);
+    variable first2 : std_logic_vector(7 downto 0);
+    variable temp17 : std_logic_vector(1 downto 0);
+    variable temp18 : std_logic_vector(3 downto 0);
+    variable first3 : std_logic_vector(7 downto 0);
+    variable a : std_logic_vector(15 downto 0);
+    variable b : std_logic_vector(15 downto 0);
+    variable val4 : std_logic_vector(31 downto 0);
+    variable val5 : std_logic_vector(31 downto 0);
+    variable temp19 : boolean;
+    variable addr11 : unsigned(31 downto 0);
+    variable temp20 : std_logic_vector(31 downto 0);
+    variable temp21 : std_logic_vector(31 downto 0);
+    variable temp22 : std_logic_vector(31 downto 0);
+    variable temp23 : std_logic_vector(31 downto 0);
+    variable temp24 : boolean;
+    variable addr12 : unsigned(31 downto 0);
+    variable temp25 : std_logic_vector(31 downto 0);
+    variable temp26 : std_logic_vector(31 downto 0);
+    variable temp27 : std_logic_vector(31 downto 0);
+    variable temp28 : std_logic_vector(31 downto 0);
+    variable temp29 : boolean;
+    variable addr13 : unsigned(31 downto 0);
+    variable temp30 : boolean;
+    variable addr14 : unsigned(31 downto 0);
+    variable temp31 : std_logic_vector(31 downto 0);
+    variable temp32 : std_logic_vector(31 downto 0);
+    variable temp33 : std_logic_vector(31 downto 0);
+    variable temp34 : std_logic_vector(31 downto 0);
+    variable temp35 : boolean;
+    variable addr15 : unsigned(31 downto 0);
+    variable temp36 : std_logic_vector(31 downto 0);
+    variable temp37 : std_logic_vector(31 downto 0);
+    variable temp38 : std_logic_vector(31 downto 0);
+    variable temp39 : std_logic_vector(31 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp := reset = '1';
+      if temp then
+        s_proc_write <= state_0;
+        buffer_axi_awready <= '0';
+        buffer_axi_wready <= '0';
+        sig2 <= '0';
+        sig5 <= '0';
+        sig8 <= '0';
+        sig11 <= '0';
+        sig14 <= '0';
+        buffer_axi_bresp <= "00";
+        buffer_axi_bvalid <= '0';
+      else
+        sig2 <= '0';
+        sig5 <= '0';
+        sig8 <= '0';
+        sig11 <= '0';
+        sig14 <= '0';
+        case s_proc_write is
+          when state_0 =>
+            s_proc_write <= state_1;
+            var := '0';
+            var1 := '0';
+            buffer_axi_awready <= '1';
+            buffer_axi_wready <= '1';
+          when state_1 =>
+            temp1 := not (var);
+            temp2 := temp1 = '1';
+            if temp2 then
+              alias1 := axi_awaddr;
+              addr10 <= axi_awaddr;
+              prot <= axi_awprot;
+            end if;
+            temp3 := not (var1);
+            temp4 := temp3 = '1';
+            if temp4 then
+              alias2 := axi_wdata;
+              data5 <= axi_wdata;
+              alias3 := axi_wstrb;
+              strb <= axi_wstrb;
+            end if;
+            temp5 := (var) or (axi_awvalid);
+            var := temp5;
+            temp6 := (var1) or (axi_wvalid);
+            var1 := temp6;
+            temp7 := not (var);
+            buffer_axi_awready <= temp7;
+            temp8 := not (var1);
+            buffer_axi_wready <= temp8;
+            temp9 := (var) and (var1);
+            temp10 := temp9 = '1';
+            if temp10 then
+              s_proc_write <= state_2;
+              temp11 := (alias3(0)) & (alias3(0));
+              temp12 := (temp11) & (temp11);
+              first := (temp12) & (temp12);
+              temp13 := (alias3(1)) & (alias3(1));
+              temp14 := (temp13) & (temp13);
+              first1 := (temp14) & (temp14);
+              temp15 := (alias3(2)) & (alias3(2));
+              temp16 := (temp15) & (temp15);
+              first2 := (temp16) & (temp16);
+              temp17 := (alias3(3)) & (alias3(3));
+              temp18 := (temp17) & (temp17);
+              first3 := (temp18) & (temp18);
+              a := (first3) & (first2);
+              b := (first1) & (first);
+              val4 := (a) & (b);
+              val5 := val4;
+              temp19 := (unsigned(alias1(31 downto 7)) = 0);
+              if temp19 then
+                addr11 := (alias1) - (0);
+                temp20 := not (val5);
+                temp21 := ("00000000000000000000000000000000") and (temp20);
+                temp22 := ("11111111111111111111111111111111") and (val5);
+                temp23 := (temp21) or (temp22);
+                val <= temp23;
+                addr1 <= unsigned(std_logic_vector(unsigned(addr11(7 downto 0))));
+                data <= unsigned(alias2);
+                sig2 <= '1';
+              end if;
+              temp24 := (unsigned(alias1(31 downto 7)) = 1);
+              if temp24 then
+                addr12 := (alias1) - (128);
+                temp25 := not (val5);
+                temp26 := ("00000000000000000000000000000000") and (temp25);
+                temp27 := ("11111111111111111111111111111111") and (val5);
+                temp28 := (temp26) or (temp27);
+                val1 <= temp28;
+                addr3 <= unsigned(std_logic_vector(unsigned(addr12(7 downto 0))));
+                data1 <= unsigned(alias2);
+                sig5 <= '1';
+              end if;
+              temp29 := (unsigned(alias1(31 downto 6)) = 4);
+              if temp29 then
+                addr13 := (alias1) - (256);
+                addr5 <= unsigned(std_logic_vector(unsigned(addr13(6 downto 0))));
+                data2 <= unsigned(alias2);
+                sig8 <= '1';
+              end if;
+              temp30 := (unsigned(alias1(31 downto 6)) = 5);
+              if temp30 then
+                addr14 := (alias1) - (320);
+                temp31 := not (val5);
+                temp32 := ("00000000000000000000000000000000") and (temp31);
+                temp33 := ("11111111111111111111111111111111") and (val5);
+                temp34 := (temp32) or (temp33);
+                val2 <= temp34;
+                addr7 <= unsigned(std_logic_vector(unsigned(addr14(6 downto 0))));
+                data3 <= unsigned(alias2);
+                sig11 <= '1';
+              end if;
+              temp35 := (unsigned(alias1(31 downto 6)) = 6);
+              if temp35 then
+                addr15 := (alias1) - (384);
+                temp36 := not (val5);
+                temp37 := ("00000000000000000000000000000000") and (temp36);
+                temp38 := ("11111111111111111111111111111111") and (val5);
+                temp39 := (temp37) or (temp38);
+                val3 <= temp39;
+                addr9 <= unsigned(std_logic_vector(unsigned(addr15(6 downto 0))));
+                data4 <= unsigned(alias2);
+                sig14 <= '1';
+              end if;
+              buffer_axi_bresp <= "00";
+              buffer_axi_bvalid <= '1';
+            else
+              s_proc_write <= state_1;
+            end if;
+          when state_2 =>
+            if axi_bready = '1' then
+              buffer_axi_bvalid <= '0';
+              s_proc_write <= state_1;
+              var := '0';
+              var1 := '0';
+              buffer_axi_awready <= '1';
+              buffer_axi_wready <= '1';
+            end if;
+          when others =>
+            null;
+        end case;
+      end if;
+    end if;
+  end process;
+end architecture arch_test_axilite_reg_09;
@@ -0,0 +1,923 @@
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+
+
+entity test_axilite_reg_10 is
+  port (
+    clk : in std_logic;
+    reset : in std_logic;
+    addr_offset : in unsigned(1 downto 0);
+    axi_awaddr : in unsigned(31 downto 0);
+    axi_awprot : in unsigned(2 downto 0);
+    axi_awvalid : in std_logic;
+    axi_awready : out std_logic;
+    axi_wdata : in std_logic_vector(31 downto 0);
+    axi_wstrb : in std_logic_vector(3 downto 0);
+    axi_wvalid : in std_logic;
+    axi_wready : out std_logic;
+    axi_bresp : out std_logic_vector(1 downto 0);
+    axi_bvalid : out std_logic;
+    axi_bready : in std_logic;
+    axi_araddr : in unsigned(31 downto 0);
+    axi_arprot : in unsigned(2 downto 0);
+    axi_arvalid : in std_logic;
+    axi_arready : out std_logic;
+    axi_rdata : out std_logic_vector(31 downto 0);
+    axi_rresp : out std_logic_vector(1 downto 0);
+    axi_rvalid : out std_logic;
+    axi_rready : in std_logic
+    );
+end test_axilite_reg_10;
+
+
+architecture arch_test_axilite_reg_10 of test_axilite_reg_10 is
+  function cohdl_bool_to_std_logic(inp: boolean) return std_logic is
+  begin
+    if inp then
+      return('1');
+    else
+      return('0');
+    end if;
+  end function cohdl_bool_to_std_logic;
+  signal buffer_axi_awready : std_logic := '0';
+  signal buffer_axi_wready : std_logic := '0';
+  signal buffer_axi_bresp : std_logic_vector(1 downto 0) := "00";
+  signal buffer_axi_bvalid : std_logic := '0';
+  signal buffer_axi_arready : std_logic := '0';
+  signal buffer_axi_rdata : std_logic_vector(31 downto 0) := "00000000000000000000000000000000";
+  signal buffer_axi_rresp : std_logic_vector(1 downto 0) := "00";
+  signal buffer_axi_rvalid : std_logic := '0';
+  signal temp : unsigned(31 downto 0);
+  signal temp1 : unsigned(31 downto 0);
+  signal unaligned_awaddr : unsigned(31 downto 0);
+  signal temp2 : unsigned(31 downto 0);
+  signal temp3 : unsigned(31 downto 0);
+  signal unaligned_araddr : unsigned(31 downto 0);
+  signal sig : std_logic := '0';
+  signal addr : unsigned(8 downto 0);
+  type array_type is array(0 to 63) of std_logic_vector(7 downto 0);
+  signal bits : array_type := ( 0 => "00110011", 1 => "01110111", 2 => "00010011", 3 => "00100011", 4 => "11000100", 5 => "00111100", 6 => "11001001", 7 => "10011111", 8 => "10011101", 9 => "00100110", 10 => "11110111", 11 => "01110111", 12 => "10010100", 13 => "10001110", 14 => "10100101", 15 => "01011010", 16 => "11101110", 17 => "10000010", 18 => "00000001", 19 => "01100000", 20 => "00001101", 21 => "10010110", 22 => "00101001", 23 => "10001110", 24 => "00100100", 25 => "11101111", 26 => "11000101", 27 => "01001110", 28 => "00001010", 29 => "11001110", 30 => "00101101", 31 => "00100111", 32 => "11010101", 33 => "01011001", 34 => "11010001", 35 => "01111001", 36 => "11100001", 37 => "11010000", 38 => "01001011", 39 => "00101111", 40 => "10000111", 41 => "01111100", 42 => "10101000", 43 => "10100100", 44 => "01011000", 45 => "10111000", 46 => "00010010", 47 => "01100101", 48 => "00001001", 49 => "01010001", 50 => "11110001", 51 => "00110011", 52 => "01100101", 53 => "11100011", 54 => "10000000", 55 => "11011011", 56 => "10110011", 57 => "10010101", 58 => "01001101", 59 => "11010000", 60 => "10001000", 61 => "10001100", 62 => "01010101", 63 => "00100001" );
+  signal bits1 : array_type := ( 0 => "00100010", 1 => "01100110", 2 => "00010010", 3 => "00100010", 4 => "00111000", 5 => "10011111", 6 => "11101101", 7 => "10001111", 8 => "10100110", 9 => "00000111", 10 => "00000011", 11 => "01000101", 12 => "00111001", 13 => "01110010", 14 => "00000110", 15 => "11110000", 16 => "11111010", 17 => "00010010", 18 => "01111010", 19 => "10011001", 20 => "11011110", 21 => "01101000", 22 => "11111100", 23 => "10101101", 24 => "11101101", 25 => "11110011", 26 => "01011110", 27 => "00101110", 28 => "00100010", 29 => "01110111", 30 => "01100110", 31 => "10010001", 32 => "01111001", 33 => "01111110", 34 => "00000011", 35 => "11010110", 36 => "10101110", 37 => "10010010", 38 => "10110001", 39 => "10000100", 40 => "10100000", 41 => "00110110", 42 => "00001001", 43 => "00011011", 44 => "01101000", 45 => "01011010", 46 => "00011110", 47 => "00101110", 48 => "10111010", 49 => "00100101", 50 => "11101110", 51 => "10101111", 52 => "10001010", 53 => "00101001", 54 => "00100001", 55 => "11010010", 56 => "11010001", 57 => "10100010", 58 => "01000001", 59 => "00010111", 60 => "11001010", 61 => "10001101", 62 => "01110001", 63 => "10000100" );
+  signal bits2 : array_type := ( 0 => "00010001", 1 => "01010101", 2 => "00010001", 3 => "00100001", 4 => "00011000", 5 => "10010000", 6 => "00000010", 7 => "01011111", 8 => "00011000", 9 => "10101101", 10 => "11001001", 11 => "00100000", 12 => "10000101", 13 => "01011101", 14 => "10111111", 15 => "11110011", 16 => "11011111", 17 => "11110111", 18 => "11010000", 19 => "11010111", 20 => "01101101", 21 => "01000100", 22 => "00011101", 23 => "00110001", 24 => "01001001", 25 => "01011011", 26 => "11110001", 27 => "00110111", 28 => "10001011", 29 => "10011010", 30 => "01011010", 31 => "11101110", 32 => "11000100", 33 => "11100001", 34 => "10111001", 35 => "11011110", 36 => "01101010", 37 => "11100000", 38 => "10011101", 39 => "11101010", 40 => "11101010", 41 => "00100100", 42 => "01001000", 43 => "01100101", 44 => "11001001", 45 => "01001110", 46 => "00111100", 47 => "10100110", 48 => "00000011", 49 => "11111111", 50 => "11011101", 51 => "10000001", 52 => "10100010", 53 => "10010110", 54 => "11101111", 55 => "11011011", 56 => "10000000", 57 => "10010000", 58 => "01000010", 59 => "00000111", 60 => "10001110", 61 => "01000110", 62 => "00101010", 63 => "11010000" );
+  signal bits3 : array_type := ( 0 => "00000000", 1 => "01000100", 2 => "00010000", 3 => "00100000", 4 => "00110110", 5 => "11001001", 6 => "01001000", 7 => "11111011", 8 => "11111101", 9 => "01011111", 10 => "11111111", 11 => "11010111", 12 => "00100000", 13 => "01010111", 14 => "11000101", 15 => "11100000", 16 => "00100011", 17 => "11000110", 18 => "01010001", 19 => "10010101", 20 => "00001000", 21 => "10101010", 22 => "10011101", 23 => "11001000", 24 => "10110001", 25 => "01100001", 26 => "10000110", 27 => "01100001", 28 => "10101000", 29 => "10010011", 30 => "01111011", 31 => "11111000", 32 => "11001001", 33 => "10001011", 34 => "00011111", 35 => "11011011", 36 => "00000000", 37 => "01111111", 38 => "00000010", 39 => "00001111", 40 => "10111111", 41 => "10010001", 42 => "00000101", 43 => "01111010", 44 => "10011011", 45 => "10101011", 46 => "11000100", 47 => "00010011", 48 => "10011010", 49 => "00001111", 50 => "11101110", 51 => "11011001", 52 => "01011101", 53 => "10110100", 54 => "00110010", 55 => "01100010", 56 => "00100010", 57 => "11100011", 58 => "11111000", 59 => "01111000", 60 => "00111100", 61 => "00110000", 62 => "01010101", 63 => "11101010" );
+  signal sig1 : unsigned(31 downto 0);
+  signal sig2 : std_logic := '0';
+  signal addr1 : unsigned(8 downto 0);
+  signal val : std_logic_vector(31 downto 0);
+  signal data : unsigned(31 downto 0);
+  signal sig3 : std_logic := '0';
+  signal addr2 : unsigned(8 downto 0);
+  signal bits4 : array_type := ( 0 => "10011111", 1 => "11101100", 2 => "01010011", 3 => "10101100", 4 => "10100011", 5 => "00110111", 6 => "01101110", 7 => "10111100", 8 => "11110101", 9 => "11101011", 10 => "01101100", 11 => "11011000", 12 => "01000010", 13 => "01101001", 14 => "01100000", 15 => "00110110", 16 => "10010110", 17 => "00001101", 18 => "01110000", 19 => "11000110", 20 => "00101010", 21 => "01001110", 22 => "00010010", 23 => "01100101", 24 => "01111010", 25 => "01111010", 26 => "10011001", 27 => "00110100", 28 => "10101011", 29 => "10101000", 30 => "10111001", 31 => "00011010", 32 => "11001011", 33 => "10010110", 34 => "11111010", 35 => "11111110", 36 => "01000111", 37 => "10011010", 38 => "01010010", 39 => "01000100", 40 => "10001100", 41 => "11010010", 42 => "01000001", 43 => "00000111", 44 => "11111101", 45 => "11111001", 46 => "10101010", 47 => "11111101", 48 => "10000100", 49 => "01001110", 50 => "10110010", 51 => "00111000", 52 => "10000001", 53 => "11001111", 54 => "10010000", 55 => "00101001", 56 => "10011110", 57 => "11000110", 58 => "01010011", 59 => "01110010", 60 => "01011111", 61 => "11101110", 62 => "10101101", 63 => "11100010" );
+  signal bits5 : array_type := ( 0 => "11011111", 1 => "11100011", 2 => "01000101", 3 => "10111000", 4 => "01100110", 5 => "10001111", 6 => "11001010", 7 => "10011010", 8 => "11000100", 9 => "11001011", 10 => "00001010", 11 => "11001111", 12 => "10100100", 13 => "00000110", 14 => "00010110", 15 => "11000001", 16 => "01100111", 17 => "01110000", 18 => "11001000", 19 => "11100010", 20 => "01010010", 21 => "11010011", 22 => "11000101", 23 => "00011110", 24 => "11000110", 25 => "01011011", 26 => "10111001", 27 => "11000000", 28 => "00010110", 29 => "11101011", 30 => "10111101", 31 => "10001100", 32 => "01000111", 33 => "10001000", 34 => "11101100", 35 => "11100100", 36 => "01101110", 37 => "00101010", 38 => "00110001", 39 => "01111011", 40 => "01011001", 41 => "11111010", 42 => "11010100", 43 => "01000011", 44 => "10011100", 45 => "01001011", 46 => "10100110", 47 => "10011011", 48 => "00000001", 49 => "00011111", 50 => "10110101", 51 => "00110111", 52 => "00011110", 53 => "10011010", 54 => "01101110", 55 => "10011011", 56 => "10101111", 57 => "00000000", 58 => "10010101", 59 => "01000011", 60 => "00100111", 61 => "00000010", 62 => "00000101", 63 => "11100101" );
+  signal bits6 : array_type := ( 0 => "10011111", 1 => "01111101", 2 => "11100100", 3 => "11110100", 4 => "01010011", 5 => "10000101", 6 => "00101011", 7 => "00000000", 8 => "00101101", 9 => "00010010", 10 => "10011011", 11 => "00000100", 12 => "00001101", 13 => "10101011", 14 => "11010110", 15 => "00111000", 16 => "00000110", 17 => "10010010", 18 => "00110111", 19 => "00010001", 20 => "01110101", 21 => "10101000", 22 => "10000011", 23 => "00011100", 24 => "01000101", 25 => "10110111", 26 => "11110101", 27 => "11011111", 28 => "01100101", 29 => "01111011", 30 => "10101011", 31 => "11001010", 32 => "10001010", 33 => "01010000", 34 => "01010111", 35 => "11000000", 36 => "11010000", 37 => "00000101", 38 => "00010000", 39 => "00100001", 40 => "11001001", 41 => "10111101", 42 => "10011111", 43 => "11011001", 44 => "11110101", 45 => "11101011", 46 => "01001000", 47 => "11101011", 48 => "11001101", 49 => "00010000", 50 => "01100110", 51 => "10100101", 52 => "11001101", 53 => "11110111", 54 => "00010110", 55 => "11011000", 56 => "01000011", 57 => "10110110", 58 => "10110110", 59 => "00110001", 60 => "11111001", 61 => "01010110", 62 => "11001000", 63 => "01001000" );
+  signal bits7 : array_type := ( 0 => "11100010", 1 => "01110111", 2 => "00100111", 3 => "10101111", 4 => "01100011", 5 => "00101001", 6 => "10100000", 7 => "00000101", 8 => "00111110", 9 => "00000000", 10 => "10111010", 11 => "10101110", 12 => "11001000", 13 => "01101000", 14 => "00001110", 15 => "10100100", 16 => "00001100", 17 => "01001000", 18 => "11101010", 19 => "10100000", 20 => "00100001", 21 => "11010001", 22 => "00001001", 23 => "10100101", 24 => "00001101", 25 => "01110110", 26 => "01010111", 27 => "00011000", 28 => "11010111", 29 => "11010110", 30 => "01101000", 31 => "11111000", 32 => "10101100", 33 => "00011000", 34 => "00011101", 35 => "00011111", 36 => "11010001", 37 => "11011100", 38 => "11000100", 39 => "00000000", 40 => "11010111", 41 => "11100011", 42 => "01010111", 43 => "11010110", 44 => "00001011", 45 => "01111010", 46 => "00100101", 47 => "11110001", 48 => "01110111", 49 => "11000101", 50 => "01110000", 51 => "01100110", 52 => "11010111", 53 => "00000010", 54 => "11110010", 55 => "11111101", 56 => "10001001", 57 => "01111100", 58 => "00110000", 59 => "00000000", 60 => "11001111", 61 => "10111000", 62 => "11101011", 63 => "11011100" );
+  signal sig4 : unsigned(31 downto 0);
+  signal sig5 : std_logic := '0';
+  signal addr3 : unsigned(8 downto 0);
+  signal val1 : std_logic_vector(31 downto 0);
+  signal data1 : unsigned(31 downto 0);
+  type state_proc_read is (state_0, state_1, state_2, state_3, state_4, state_5, state_6, state_7, state_8);
+  signal s_proc_read : state_proc_read := state_0;
+  type state_proc_write is (state_0, state_1, state_2);
+  signal s_proc_write : state_proc_write := state_0;
+  signal addr4 : unsigned(31 downto 0);
+  signal prot : unsigned(2 downto 0);
+  signal data2 : std_logic_vector(31 downto 0);
+  signal strb : std_logic_vector(3 downto 0);
+begin
+  
+  -- CONCURRENT BLOCK (buffer assignment)
+  axi_awready <= buffer_axi_awready;
+  axi_wready <= buffer_axi_wready;
+  axi_bresp <= buffer_axi_bresp;
+  axi_bvalid <= buffer_axi_bvalid;
+  axi_arready <= buffer_axi_arready;
+  axi_rdata <= buffer_axi_rdata;
+  axi_rresp <= buffer_axi_rresp;
+  axi_rvalid <= buffer_axi_rvalid;
+  
+  -- CONCURRENT BLOCK (logic)
+  temp <= (axi_awaddr) and (unsigned'("11111111111111111111111111111100"));
+  temp1 <= (temp) + (addr_offset);
+  unaligned_awaddr <= temp1;
+  temp2 <= (axi_araddr) and (unsigned'("11111111111111111111111111111100"));
+  temp3 <= (temp2) + (addr_offset);
+  unaligned_araddr <= temp3;
+  
+
+  impl_read_memory: process(clk)
+    variable temp4 : boolean;
+    variable temp5 : boolean;
+    variable temp6 : std_logic_vector(6 downto 0);
+    variable temp7 : boolean;
+    variable temp8 : unsigned(0 downto 0);
+    variable index : unsigned(6 downto 0);
+    variable temp9 : unsigned(6 downto 0);
+    variable temp10 : boolean;
+    variable temp11 : unsigned(0 downto 0);
+    variable index1 : unsigned(6 downto 0);
+    variable temp12 : unsigned(6 downto 0);
+    variable temp13 : boolean;
+    variable temp14 : unsigned(0 downto 0);
+    variable index2 : unsigned(6 downto 0);
+    variable temp15 : unsigned(6 downto 0);
+    variable temp16 : boolean;
+    variable temp17 : unsigned(0 downto 0);
+    variable index3 : unsigned(6 downto 0);
+    variable temp18 : unsigned(6 downto 0);
+    variable temp19 : boolean;
+    variable a : std_logic_vector(15 downto 0);
+    variable b : std_logic_vector(15 downto 0);
+    variable temp20 : std_logic_vector(31 downto 0);
+    variable var : std_logic_vector(31 downto 0);
+    variable temp21 : boolean;
+    variable a1 : std_logic_vector(15 downto 0);
+    variable b1 : std_logic_vector(15 downto 0);
+    variable temp22 : std_logic_vector(31 downto 0);
+    variable temp23 : boolean;
+    variable a2 : std_logic_vector(15 downto 0);
+    variable b2 : std_logic_vector(15 downto 0);
+    variable temp24 : std_logic_vector(31 downto 0);
+    variable temp25 : boolean;
+    variable a3 : std_logic_vector(15 downto 0);
+    variable b3 : std_logic_vector(15 downto 0);
+    variable temp26 : std_logic_vector(31 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp4 := reset = '1';
+      if temp4 then
+      else
+        temp5 := sig = '1';
+        if temp5 then
+          temp6 := std_logic_vector(unsigned(addr(8 downto 2)));
+          temp7 := (unsigned(addr(1 downto 0)) <= 0);
+          case temp7 is
+            when true =>
+              temp8 := unsigned'("0");
+            when others =>
+              temp8 := unsigned'("1");
+          end case;
+          index := (unsigned(temp6)) + (temp8);
+          temp9 := index;
+          temp10 := (unsigned(addr(1 downto 0)) <= 1);
+          case temp10 is
+            when true =>
+              temp11 := unsigned'("0");
+            when others =>
+              temp11 := unsigned'("1");
+          end case;
+          index1 := (unsigned(temp6)) + (temp11);
+          temp12 := index1;
+          temp13 := (unsigned(addr(1 downto 0)) <= 2);
+          case temp13 is
+            when true =>
+              temp14 := unsigned'("0");
+            when others =>
+              temp14 := unsigned'("1");
+          end case;
+          index2 := (unsigned(temp6)) + (temp14);
+          temp15 := index2;
+          temp16 := (unsigned(addr(1 downto 0)) <= 3);
+          case temp16 is
+            when true =>
+              temp17 := unsigned'("0");
+            when others =>
+              temp17 := unsigned'("1");
+          end case;
+          index3 := (unsigned(temp6)) + (temp17);
+          temp18 := index3;
+          temp19 := (unsigned(addr(1 downto 0)) = 0);
+          if temp19 then
+            a := (bits(to_integer(temp18))) & (bits1(to_integer(temp15)));
+            b := (bits2(to_integer(temp12))) & (bits3(to_integer(temp9)));
+            temp20 := (a) & (b);
+            var := temp20;
+          end if;
+          temp21 := (unsigned(addr(1 downto 0)) = 1);
+          if temp21 then
+            a1 := (bits3(to_integer(temp9))) & (bits(to_integer(temp18)));
+            b1 := (bits1(to_integer(temp15))) & (bits2(to_integer(temp12)));
+            temp22 := (a1) & (b1);
+            var := temp22;
+          end if;
+          temp23 := (unsigned(addr(1 downto 0)) = 2);
+          if temp23 then
+            a2 := (bits2(to_integer(temp12))) & (bits3(to_integer(temp9)));
+            b2 := (bits(to_integer(temp18))) & (bits1(to_integer(temp15)));
+            temp24 := (a2) & (b2);
+            var := temp24;
+          end if;
+          temp25 := (unsigned(addr(1 downto 0)) = 3);
+          if temp25 then
+            a3 := (bits1(to_integer(temp15))) & (bits2(to_integer(temp12)));
+            b3 := (bits3(to_integer(temp9))) & (bits(to_integer(temp18)));
+            temp26 := (a3) & (b3);
+            var := temp26;
+          end if;
+          sig1 <= unsigned(var);
+        end if;
+      end if;
+    end if;
+  end process;
+  
+
+  impl_write_memory: process(clk)
+    variable temp4 : boolean;
+    variable temp5 : boolean;
+    variable val2 : std_logic_vector(6 downto 0);
+    variable x : unsigned(6 downto 0);
+    variable temp6 : std_logic_vector(31 downto 0);
+    variable temp7 : std_logic_vector(31 downto 0);
+    variable temp8 : std_logic_vector(31 downto 0);
+    variable temp9 : std_logic_vector(31 downto 0);
+    variable temp10 : boolean;
+    variable temp11 : unsigned(0 downto 0);
+    variable temp12 : unsigned(6 downto 0);
+    variable index : unsigned(6 downto 0);
+    variable temp13 : boolean;
+    variable temp14 : unsigned(0 downto 0);
+    variable temp15 : unsigned(6 downto 0);
+    variable index1 : unsigned(6 downto 0);
+    variable temp16 : boolean;
+    variable temp17 : unsigned(0 downto 0);
+    variable temp18 : unsigned(6 downto 0);
+    variable index2 : unsigned(6 downto 0);
+    variable temp19 : boolean;
+    variable temp20 : unsigned(0 downto 0);
+    variable temp21 : unsigned(6 downto 0);
+    variable index3 : unsigned(6 downto 0);
+    variable temp22 : boolean;
+    variable var : std_logic_vector(7 downto 0);
+    variable var1 : std_logic;
+    variable var2 : std_logic_vector(7 downto 0);
+    variable var3 : std_logic;
+    variable var4 : std_logic_vector(7 downto 0);
+    variable var5 : std_logic;
+    variable var6 : std_logic_vector(7 downto 0);
+    variable var7 : std_logic;
+    variable temp23 : boolean;
+    variable temp24 : boolean;
+    variable temp25 : boolean;
+    variable temp26 : boolean;
+    variable temp27 : unsigned(6 downto 0);
+    variable temp28 : boolean;
+    variable temp29 : unsigned(6 downto 0);
+    variable temp30 : boolean;
+    variable temp31 : unsigned(6 downto 0);
+    variable temp32 : boolean;
+    variable temp33 : unsigned(6 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp4 := reset = '1';
+      if temp4 then
+        bits3 <= ( 0 => "00000000", 1 => "01000100", 2 => "00010000", 3 => "00100000", 4 => "00110110", 5 => "11001001", 6 => "01001000", 7 => "11111011", 8 => "11111101", 9 => "01011111", 10 => "11111111", 11 => "11010111", 12 => "00100000", 13 => "01010111", 14 => "11000101", 15 => "11100000", 16 => "00100011", 17 => "11000110", 18 => "01010001", 19 => "10010101", 20 => "00001000", 21 => "10101010", 22 => "10011101", 23 => "11001000", 24 => "10110001", 25 => "01100001", 26 => "10000110", 27 => "01100001", 28 => "10101000", 29 => "10010011", 30 => "01111011", 31 => "11111000", 32 => "11001001", 33 => "10001011", 34 => "00011111", 35 => "11011011", 36 => "00000000", 37 => "01111111", 38 => "00000010", 39 => "00001111", 40 => "10111111", 41 => "10010001", 42 => "00000101", 43 => "01111010", 44 => "10011011", 45 => "10101011", 46 => "11000100", 47 => "00010011", 48 => "10011010", 49 => "00001111", 50 => "11101110", 51 => "11011001", 52 => "01011101", 53 => "10110100", 54 => "00110010", 55 => "01100010", 56 => "00100010", 57 => "11100011", 58 => "11111000", 59 => "01111000", 60 => "00111100", 61 => "00110000", 62 => "01010101", 63 => "11101010" );
+        bits2 <= ( 0 => "00010001", 1 => "01010101", 2 => "00010001", 3 => "00100001", 4 => "00011000", 5 => "10010000", 6 => "00000010", 7 => "01011111", 8 => "00011000", 9 => "10101101", 10 => "11001001", 11 => "00100000", 12 => "10000101", 13 => "01011101", 14 => "10111111", 15 => "11110011", 16 => "11011111", 17 => "11110111", 18 => "11010000", 19 => "11010111", 20 => "01101101", 21 => "01000100", 22 => "00011101", 23 => "00110001", 24 => "01001001", 25 => "01011011", 26 => "11110001", 27 => "00110111", 28 => "10001011", 29 => "10011010", 30 => "01011010", 31 => "11101110", 32 => "11000100", 33 => "11100001", 34 => "10111001", 35 => "11011110", 36 => "01101010", 37 => "11100000", 38 => "10011101", 39 => "11101010", 40 => "11101010", 41 => "00100100", 42 => "01001000", 43 => "01100101", 44 => "11001001", 45 => "01001110", 46 => "00111100", 47 => "10100110", 48 => "00000011", 49 => "11111111", 50 => "11011101", 51 => "10000001", 52 => "10100010", 53 => "10010110", 54 => "11101111", 55 => "11011011", 56 => "10000000", 57 => "10010000", 58 => "01000010", 59 => "00000111", 60 => "10001110", 61 => "01000110", 62 => "00101010", 63 => "11010000" );
+        bits1 <= ( 0 => "00100010", 1 => "01100110", 2 => "00010010", 3 => "00100010", 4 => "00111000", 5 => "10011111", 6 => "11101101", 7 => "10001111", 8 => "10100110", 9 => "00000111", 10 => "00000011", 11 => "01000101", 12 => "00111001", 13 => "01110010", 14 => "00000110", 15 => "11110000", 16 => "11111010", 17 => "00010010", 18 => "01111010", 19 => "10011001", 20 => "11011110", 21 => "01101000", 22 => "11111100", 23 => "10101101", 24 => "11101101", 25 => "11110011", 26 => "01011110", 27 => "00101110", 28 => "00100010", 29 => "01110111", 30 => "01100110", 31 => "10010001", 32 => "01111001", 33 => "01111110", 34 => "00000011", 35 => "11010110", 36 => "10101110", 37 => "10010010", 38 => "10110001", 39 => "10000100", 40 => "10100000", 41 => "00110110", 42 => "00001001", 43 => "00011011", 44 => "01101000", 45 => "01011010", 46 => "00011110", 47 => "00101110", 48 => "10111010", 49 => "00100101", 50 => "11101110", 51 => "10101111", 52 => "10001010", 53 => "00101001", 54 => "00100001", 55 => "11010010", 56 => "11010001", 57 => "10100010", 58 => "01000001", 59 => "00010111", 60 => "11001010", 61 => "10001101", 62 => "01110001", 63 => "10000100" );
+        bits <= ( 0 => "00110011", 1 => "01110111", 2 => "00010011", 3 => "00100011", 4 => "11000100", 5 => "00111100", 6 => "11001001", 7 => "10011111", 8 => "10011101", 9 => "00100110", 10 => "11110111", 11 => "01110111", 12 => "10010100", 13 => "10001110", 14 => "10100101", 15 => "01011010", 16 => "11101110", 17 => "10000010", 18 => "00000001", 19 => "01100000", 20 => "00001101", 21 => "10010110", 22 => "00101001", 23 => "10001110", 24 => "00100100", 25 => "11101111", 26 => "11000101", 27 => "01001110", 28 => "00001010", 29 => "11001110", 30 => "00101101", 31 => "00100111", 32 => "11010101", 33 => "01011001", 34 => "11010001", 35 => "01111001", 36 => "11100001", 37 => "11010000", 38 => "01001011", 39 => "00101111", 40 => "10000111", 41 => "01111100", 42 => "10101000", 43 => "10100100", 44 => "01011000", 45 => "10111000", 46 => "00010010", 47 => "01100101", 48 => "00001001", 49 => "01010001", 50 => "11110001", 51 => "00110011", 52 => "01100101", 53 => "11100011", 54 => "10000000", 55 => "11011011", 56 => "10110011", 57 => "10010101", 58 => "01001101", 59 => "11010000", 60 => "10001000", 61 => "10001100", 62 => "01010101", 63 => "00100001" );
+      else
+        temp5 := sig2 = '1';
+        if temp5 then
+          val2 := std_logic_vector(unsigned(addr1(8 downto 2)));
+          x := unsigned(val2);
+          temp6 := not (val);
+          temp7 := ("00000000000000000000000000000000") and (temp6);
+          temp8 := ("11111111111111111111111111111111") and (val);
+          temp9 := (temp7) or (temp8);
+          temp10 := (unsigned(addr1(1 downto 0)) <= 0);
+          case temp10 is
+            when true =>
+              temp11 := unsigned'("0");
+            when others =>
+              temp11 := unsigned'("1");
+          end case;
+          temp12 := (x) + (temp11);
+          index := temp12;
+          temp13 := (unsigned(addr1(1 downto 0)) <= 1);
+          case temp13 is
+            when true =>
+              temp14 := unsigned'("0");
+            when others =>
+              temp14 := unsigned'("1");
+          end case;
+          temp15 := (x) + (temp14);
+          index1 := temp15;
+          temp16 := (unsigned(addr1(1 downto 0)) <= 2);
+          case temp16 is
+            when true =>
+              temp17 := unsigned'("0");
+            when others =>
+              temp17 := unsigned'("1");
+          end case;
+          temp18 := (x) + (temp17);
+          index2 := temp18;
+          temp19 := (unsigned(addr1(1 downto 0)) <= 3);
+          case temp19 is
+            when true =>
+              temp20 := unsigned'("0");
+            when others =>
+              temp20 := unsigned'("1");
+          end case;
+          temp21 := (x) + (temp20);
+          index3 := temp21;
+          temp22 := (unsigned(addr1(1 downto 0)) = 0);
+          if temp22 then
+            var := std_logic_vector(unsigned(data(7 downto 0)));
+            var1 := temp9(0);
+            var2 := std_logic_vector(unsigned(data(15 downto 8)));
+            var3 := temp9(8);
+            var4 := std_logic_vector(unsigned(data(23 downto 16)));
+            var5 := temp9(16);
+            var6 := std_logic_vector(unsigned(data(31 downto 24)));
+            var7 := temp9(24);
+          end if;
+          temp23 := (unsigned(addr1(1 downto 0)) = 1);
+          if temp23 then
+            var := std_logic_vector(unsigned(data(31 downto 24)));
+            var1 := temp9(24);
+            var2 := std_logic_vector(unsigned(data(7 downto 0)));
+            var3 := temp9(0);
+            var4 := std_logic_vector(unsigned(data(15 downto 8)));
+            var5 := temp9(8);
+            var6 := std_logic_vector(unsigned(data(23 downto 16)));
+            var7 := temp9(16);
+          end if;
+          temp24 := (unsigned(addr1(1 downto 0)) = 2);
+          if temp24 then
+            var := std_logic_vector(unsigned(data(23 downto 16)));
+            var1 := temp9(16);
+            var2 := std_logic_vector(unsigned(data(31 downto 24)));
+            var3 := temp9(24);
+            var4 := std_logic_vector(unsigned(data(7 downto 0)));
+            var5 := temp9(0);
+            var6 := std_logic_vector(unsigned(data(15 downto 8)));
+            var7 := temp9(8);
+          end if;
+          temp25 := (unsigned(addr1(1 downto 0)) = 3);
+          if temp25 then
+            var := std_logic_vector(unsigned(data(15 downto 8)));
+            var1 := temp9(8);
+            var2 := std_logic_vector(unsigned(data(23 downto 16)));
+            var3 := temp9(16);
+            var4 := std_logic_vector(unsigned(data(31 downto 24)));
+            var5 := temp9(24);
+            var6 := std_logic_vector(unsigned(data(7 downto 0)));
+            var7 := temp9(0);
+          end if;
+          temp26 := var1 = '1';
+          if temp26 then
+            temp27 := index;
+            bits3(to_integer(temp27)) <= var;
+          end if;
+          temp28 := var3 = '1';
+          if temp28 then
+            temp29 := index1;
+            bits2(to_integer(temp29)) <= var2;
+          end if;
+          temp30 := var5 = '1';
+          if temp30 then
+            temp31 := index2;
+            bits1(to_integer(temp31)) <= var4;
+          end if;
+          temp32 := var7 = '1';
+          if temp32 then
+            temp33 := index3;
+            bits(to_integer(temp33)) <= var6;
+          end if;
+        end if;
+      end if;
+    end if;
+  end process;
+  
+
+  impl_read_memory1: process(clk)
+    variable temp4 : boolean;
+    variable temp5 : boolean;
+    variable temp6 : std_logic_vector(6 downto 0);
+    variable temp7 : boolean;
+    variable temp8 : unsigned(0 downto 0);
+    variable index : unsigned(6 downto 0);
+    variable temp9 : unsigned(6 downto 0);
+    variable temp10 : boolean;
+    variable temp11 : unsigned(0 downto 0);
+    variable index1 : unsigned(6 downto 0);
+    variable temp12 : unsigned(6 downto 0);
+    variable temp13 : boolean;
+    variable temp14 : unsigned(0 downto 0);
+    variable index2 : unsigned(6 downto 0);
+    variable temp15 : unsigned(6 downto 0);
+    variable temp16 : boolean;
+    variable temp17 : unsigned(0 downto 0);
+    variable index3 : unsigned(6 downto 0);
+    variable temp18 : unsigned(6 downto 0);
+    variable temp19 : boolean;
+    variable a : std_logic_vector(15 downto 0);
+    variable b : std_logic_vector(15 downto 0);
+    variable temp20 : std_logic_vector(31 downto 0);
+    variable var : std_logic_vector(31 downto 0);
+    variable temp21 : boolean;
+    variable a1 : std_logic_vector(15 downto 0);
+    variable b1 : std_logic_vector(15 downto 0);
+    variable temp22 : std_logic_vector(31 downto 0);
+    variable temp23 : boolean;
+    variable a2 : std_logic_vector(15 downto 0);
+    variable b2 : std_logic_vector(15 downto 0);
+    variable temp24 : std_logic_vector(31 downto 0);
+    variable temp25 : boolean;
+    variable a3 : std_logic_vector(15 downto 0);
+    variable b3 : std_logic_vector(15 downto 0);
+    variable temp26 : std_logic_vector(31 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp4 := reset = '1';
+      if temp4 then
+      else
+        temp5 := sig3 = '1';
+        if temp5 then
+          temp6 := std_logic_vector(unsigned(addr2(8 downto 2)));
+          temp7 := (unsigned(addr2(1 downto 0)) <= 0);
+          case temp7 is
+            when true =>
+              temp8 := unsigned'("0");
+            when others =>
+              temp8 := unsigned'("1");
+          end case;
+          index := (unsigned(temp6)) + (temp8);
+          temp9 := index;
+          temp10 := (unsigned(addr2(1 downto 0)) <= 1);
+          case temp10 is
+            when true =>
+              temp11 := unsigned'("0");
+            when others =>
+              temp11 := unsigned'("1");
+          end case;
+          index1 := (unsigned(temp6)) + (temp11);
+          temp12 := index1;
+          temp13 := (unsigned(addr2(1 downto 0)) <= 2);
+          case temp13 is
+            when true =>
+              temp14 := unsigned'("0");
+            when others =>
+              temp14 := unsigned'("1");
+          end case;
+          index2 := (unsigned(temp6)) + (temp14);
+          temp15 := index2;
+          temp16 := (unsigned(addr2(1 downto 0)) <= 3);
+          case temp16 is
+            when true =>
+              temp17 := unsigned'("0");
+            when others =>
+              temp17 := unsigned'("1");
+          end case;
+          index3 := (unsigned(temp6)) + (temp17);
+          temp18 := index3;
+          temp19 := (unsigned(addr2(1 downto 0)) = 0);
+          if temp19 then
+            a := (bits4(to_integer(temp18))) & (bits5(to_integer(temp15)));
+            b := (bits6(to_integer(temp12))) & (bits7(to_integer(temp9)));
+            temp20 := (a) & (b);
+            var := temp20;
+          end if;
+          temp21 := (unsigned(addr2(1 downto 0)) = 1);
+          if temp21 then
+            a1 := (bits7(to_integer(temp9))) & (bits4(to_integer(temp18)));
+            b1 := (bits5(to_integer(temp15))) & (bits6(to_integer(temp12)));
+            temp22 := (a1) & (b1);
+            var := temp22;
+          end if;
+          temp23 := (unsigned(addr2(1 downto 0)) = 2);
+          if temp23 then
+            a2 := (bits6(to_integer(temp12))) & (bits7(to_integer(temp9)));
+            b2 := (bits4(to_integer(temp18))) & (bits5(to_integer(temp15)));
+            temp24 := (a2) & (b2);
+            var := temp24;
+          end if;
+          temp25 := (unsigned(addr2(1 downto 0)) = 3);
+          if temp25 then
+            a3 := (bits5(to_integer(temp15))) & (bits6(to_integer(temp12)));
+            b3 := (bits7(to_integer(temp9))) & (bits4(to_integer(temp18)));
+            temp26 := (a3) & (b3);
+            var := temp26;
+          end if;
+          sig4 <= unsigned(var);
+        end if;
+      end if;
+    end if;
+  end process;
+  
+
+  impl_write_memory1: process(clk)
+    variable temp4 : boolean;
+    variable temp5 : boolean;
+    variable val2 : std_logic_vector(6 downto 0);
+    variable x : unsigned(6 downto 0);
+    variable temp6 : std_logic_vector(31 downto 0);
+    variable temp7 : std_logic_vector(31 downto 0);
+    variable temp8 : std_logic_vector(31 downto 0);
+    variable temp9 : std_logic_vector(31 downto 0);
+    variable temp10 : boolean;
+    variable temp11 : unsigned(0 downto 0);
+    variable temp12 : unsigned(6 downto 0);
+    variable index : unsigned(6 downto 0);
+    variable temp13 : boolean;
+    variable temp14 : unsigned(0 downto 0);
+    variable temp15 : unsigned(6 downto 0);
+    variable index1 : unsigned(6 downto 0);
+    variable temp16 : boolean;
+    variable temp17 : unsigned(0 downto 0);
+    variable temp18 : unsigned(6 downto 0);
+    variable index2 : unsigned(6 downto 0);
+    variable temp19 : boolean;
+    variable temp20 : unsigned(0 downto 0);
+    variable temp21 : unsigned(6 downto 0);
+    variable index3 : unsigned(6 downto 0);
+    variable temp22 : boolean;
+    variable var : std_logic_vector(7 downto 0);
+    variable var1 : std_logic;
+    variable var2 : std_logic_vector(7 downto 0);
+    variable var3 : std_logic;
+    variable var4 : std_logic_vector(7 downto 0);
+    variable var5 : std_logic;
+    variable var6 : std_logic_vector(7 downto 0);
+    variable var7 : std_logic;
+    variable temp23 : boolean;
+    variable temp24 : boolean;
+    variable temp25 : boolean;
+    variable temp26 : boolean;
+    variable temp27 : unsigned(6 downto 0);
+    variable temp28 : boolean;
+    variable temp29 : unsigned(6 downto 0);
+    variable temp30 : boolean;
+    variable temp31 : unsigned(6 downto 0);
+    variable temp32 : boolean;
+    variable temp33 : unsigned(6 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp4 := reset = '1';
+      if temp4 then
+      else
+        temp5 := sig5 = '1';
+        if temp5 then
+          val2 := std_logic_vector(unsigned(addr3(8 downto 2)));
+          x := unsigned(val2);
+          temp6 := not (val1);
+          temp7 := ("00000000000000000000000000000000") and (temp6);
+          temp8 := ("11111111111111111111111111111111") and (val1);
+          temp9 := (temp7) or (temp8);
+          temp10 := (unsigned(addr3(1 downto 0)) <= 0);
+          case temp10 is
+            when true =>
+              temp11 := unsigned'("0");
+            when others =>
+              temp11 := unsigned'("1");
+          end case;
+          temp12 := (x) + (temp11);
+          index := temp12;
+          temp13 := (unsigned(addr3(1 downto 0)) <= 1);
+          case temp13 is
+            when true =>
+              temp14 := unsigned'("0");
+            when others =>
+              temp14 := unsigned'("1");
+          end case;
+          temp15 := (x) + (temp14);
+          index1 := temp15;
+          temp16 := (unsigned(addr3(1 downto 0)) <= 2);
+          case temp16 is
+            when true =>
+              temp17 := unsigned'("0");
+            when others =>
+              temp17 := unsigned'("1");
+          end case;
+          temp18 := (x) + (temp17);
+          index2 := temp18;
+          temp19 := (unsigned(addr3(1 downto 0)) <= 3);
+          case temp19 is
+            when true =>
+              temp20 := unsigned'("0");
+            when others =>
+              temp20 := unsigned'("1");
+          end case;
+          temp21 := (x) + (temp20);
+          index3 := temp21;
+          temp22 := (unsigned(addr3(1 downto 0)) = 0);
+          if temp22 then
+            var := std_logic_vector(unsigned(data1(7 downto 0)));
+            var1 := temp9(0);
+            var2 := std_logic_vector(unsigned(data1(15 downto 8)));
+            var3 := temp9(8);
+            var4 := std_logic_vector(unsigned(data1(23 downto 16)));
+            var5 := temp9(16);
+            var6 := std_logic_vector(unsigned(data1(31 downto 24)));
+            var7 := temp9(24);
+          end if;
+          temp23 := (unsigned(addr3(1 downto 0)) = 1);
+          if temp23 then
+            var := std_logic_vector(unsigned(data1(31 downto 24)));
+            var1 := temp9(24);
+            var2 := std_logic_vector(unsigned(data1(7 downto 0)));
+            var3 := temp9(0);
+            var4 := std_logic_vector(unsigned(data1(15 downto 8)));
+            var5 := temp9(8);
+            var6 := std_logic_vector(unsigned(data1(23 downto 16)));
+            var7 := temp9(16);
+          end if;
+          temp24 := (unsigned(addr3(1 downto 0)) = 2);
+          if temp24 then
+            var := std_logic_vector(unsigned(data1(23 downto 16)));
+            var1 := temp9(16);
+            var2 := std_logic_vector(unsigned(data1(31 downto 24)));
+            var3 := temp9(24);
+            var4 := std_logic_vector(unsigned(data1(7 downto 0)));
+            var5 := temp9(0);
+            var6 := std_logic_vector(unsigned(data1(15 downto 8)));
+            var7 := temp9(8);
+          end if;
+          temp25 := (unsigned(addr3(1 downto 0)) = 3);
+          if temp25 then
+            var := std_logic_vector(unsigned(data1(15 downto 8)));
+            var1 := temp9(8);
+            var2 := std_logic_vector(unsigned(data1(23 downto 16)));
+            var3 := temp9(16);
+            var4 := std_logic_vector(unsigned(data1(31 downto 24)));
+            var5 := temp9(24);
+            var6 := std_logic_vector(unsigned(data1(7 downto 0)));
+            var7 := temp9(0);
+          end if;
+          temp26 := var1 = '1';
+          if temp26 then
+            temp27 := index;
+            bits7(to_integer(temp27)) <= var;
+          end if;
+          temp28 := var3 = '1';
+          if temp28 then
+            temp29 := index1;
+            bits6(to_integer(temp29)) <= var2;
+          end if;
+          temp30 := var5 = '1';
+          if temp30 then
+            temp31 := index2;
+            bits5(to_integer(temp31)) <= var4;
+          end if;
+          temp32 := var7 = '1';
+          if temp32 then
+            temp33 := index3;
+            bits4(to_integer(temp33)) <= var6;
+          end if;
+        end if;
+      end if;
+    end if;
+  end process;
+  
+
+  proc_read: process(clk)
+    variable temp4 : boolean;
+    variable data3 : std_logic_vector(31 downto 0);
+    variable temp5 : boolean;
+    variable addr5 : unsigned(31 downto 0);
+    variable temp6 : boolean;
+    variable addr6 : unsigned(31 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp4 := reset = '1';
+      if temp4 then
+        s_proc_read <= state_0;
+        buffer_axi_arready <= '0';
+        sig <= '0';
+        sig3 <= '0';
+        buffer_axi_rdata <= "00000000000000000000000000000000";
+        buffer_axi_rresp <= "00";
+        buffer_axi_rvalid <= '0';
+      else
+        sig <= '0';
+        sig3 <= '0';
+        case s_proc_read is
+          when state_0 =>
+            s_proc_read <= state_1;
+            buffer_axi_arready <= '1';
+          when state_1 =>
+            if axi_arvalid = '1' then
+              buffer_axi_arready <= '0';
+              data3 := "00000000000000000000000000000000";
+              temp5 := (unsigned(unaligned_araddr(31 downto 8)) = 0);
+              if temp5 then
+                s_proc_read <= state_2;
+                addr5 := (unaligned_araddr) - (0);
+                addr <= unsigned(std_logic_vector(unsigned(addr5(8 downto 0))));
+                sig <= '1';
+              else
+                temp6 := (unsigned(unaligned_araddr(31 downto 8)) = 1);
+                if temp6 then
+                  s_proc_read <= state_4;
+                  addr6 := (unaligned_araddr) - (256);
+                  addr2 <= unsigned(std_logic_vector(unsigned(addr6(8 downto 0))));
+                  sig3 <= '1';
+                else
+                  s_proc_read <= state_8;
+                  buffer_axi_rdata <= data3;
+                  buffer_axi_rresp <= "00";
+                  buffer_axi_rvalid <= '1';
+                end if;
+              end if;
+            end if;
+          when state_2 =>
+            s_proc_read <= state_3;
+          when state_3 =>
+            data3 := std_logic_vector(sig1);
+            temp6 := (unsigned(unaligned_araddr(31 downto 8)) = 1);
+            if temp6 then
+              s_proc_read <= state_6;
+              addr6 := (unaligned_araddr) - (256);
+              addr2 <= unsigned(std_logic_vector(unsigned(addr6(8 downto 0))));
+              sig3 <= '1';
+            else
+              s_proc_read <= state_8;
+              buffer_axi_rdata <= data3;
+              buffer_axi_rresp <= "00";
+              buffer_axi_rvalid <= '1';
+            end if;
+          when state_4 =>
+            s_proc_read <= state_5;
+          when state_5 =>
+            s_proc_read <= state_8;
+            data3 := std_logic_vector(sig4);
+            buffer_axi_rdata <= data3;
+            buffer_axi_rresp <= "00";
+            buffer_axi_rvalid <= '1';
+          when state_6 =>
+            s_proc_read <= state_7;
+          when state_7 =>
+            s_proc_read <= state_8;
+            data3 := std_logic_vector(sig4);
+            buffer_axi_rdata <= data3;
+            buffer_axi_rresp <= "00";
+            buffer_axi_rvalid <= '1';
+          when state_8 =>
+            if axi_rready = '1' then
+              buffer_axi_rvalid <= '0';
+              s_proc_read <= state_1;
+              buffer_axi_arready <= '1';
+            end if;
+          when others =>
+            null;
+        end case;
+      end if;
+    end if;
+  end process;
+  
+
+  proc_write: process(clk)
+    variable temp4 : boolean;
+    variable var : std_logic;
+    variable var1 : std_logic;
+    variable temp5 : std_logic;
+    variable temp6 : boolean;
+    variable alias1 : unsigned(31 downto 0);
+    variable temp7 : std_logic;
+    variable temp8 : boolean;
+    variable alias2 : std_logic_vector(31 downto 0);
+    variable alias3 : std_logic_vector(3 downto 0);
+    variable temp9 : std_logic;
+    variable temp10 : std_logic;
+    variable temp11 : std_logic;
+    variable temp12 : std_logic;
+    variable temp13 : std_logic;
+    variable temp14 : boolean;
+    variable temp15 : std_logic_vector(1 downto 0);
+    variable temp16 : std_logic_vector(3 downto 0);
+    variable first : std_logic_vector(7 downto 0);
+    variable temp17 : std_logic_vector(1 downto 0);
+    variable temp18 : std_logic_vector(3 downto 0);
+    variable first1 : std_logic_vector(7 downto 0);
+    variable temp19 : std_logic_vector(1 downto 0);
+    variable temp20 : std_logic_vector(3 downto 0);
+    variable first2 : std_logic_vector(7 downto 0);
+    variable temp21 : std_logic_vector(1 downto 0);
+    variable temp22 : std_logic_vector(3 downto 0);
+    variable first3 : std_logic_vector(7 downto 0);
+    variable a : std_logic_vector(15 downto 0);
+    variable b : std_logic_vector(15 downto 0);
+    variable val2 : std_logic_vector(31 downto 0);
+    variable val3 : std_logic_vector(31 downto 0);
+    variable temp23 : boolean;
+    variable addr5 : unsigned(31 downto 0);
+    variable temp24 : std_logic_vector(31 downto 0);
+    variable temp25 : std_logic_vector(31 downto 0);
+    variable temp26 : std_logic_vector(31 downto 0);
+    variable temp27 : std_logic_vector(31 downto 0);
+    variable temp28 : boolean;
+    variable addr6 : unsigned(31 downto 0);
+    variable temp29 : std_logic_vector(31 downto 0);
+    variable temp30 : std_logic_vector(31 downto 0);
+    variable temp31 : std_logic_vector(31 downto 0);
+    variable temp32 : std_logic_vector(31 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp4 := reset = '1';
+      if temp4 then
+        s_proc_write <= state_0;
+        buffer_axi_awready <= '0';
+        buffer_axi_wready <= '0';
+        sig2 <= '0';
+        sig5 <= '0';
+        buffer_axi_bresp <= "00";
+        buffer_axi_bvalid <= '0';
+      else
+        sig2 <= '0';
+        sig5 <= '0';
+        case s_proc_write is
+          when state_0 =>
+            s_proc_write <= state_1;
+            var := '0';
+            var1 := '0';
+            buffer_axi_awready <= '1';
+            buffer_axi_wready <= '1';
+          when state_1 =>
+            temp5 := not (var);
+            temp6 := temp5 = '1';
+            if temp6 then
+              alias1 := unaligned_awaddr;
+              addr4 <= unaligned_awaddr;
+              prot <= axi_awprot;
+            end if;
+            temp7 := not (var1);
+            temp8 := temp7 = '1';
+            if temp8 then
+              alias2 := axi_wdata;
+              data2 <= axi_wdata;
+              alias3 := axi_wstrb;
+              strb <= axi_wstrb;
+            end if;
+            temp9 := (var) or (axi_awvalid);
+            var := temp9;
+            temp10 := (var1) or (axi_wvalid);
+            var1 := temp10;
+            temp11 := not (var);
+            buffer_axi_awready <= temp11;
+            temp12 := not (var1);
+            buffer_axi_wready <= temp12;
+            temp13 := (var) and (var1);
+            temp14 := temp13 = '1';
+            if temp14 then
+              s_proc_write <= state_2;
+              temp15 := (alias3(0)) & (alias3(0));
+              temp16 := (temp15) & (temp15);
+              first := (temp16) & (temp16);
+              temp17 := (alias3(1)) & (alias3(1));
+              temp18 := (temp17) & (temp17);
+              first1 := (temp18) & (temp18);
+              temp19 := (alias3(2)) & (alias3(2));
+              temp20 := (temp19) & (temp19);
+              first2 := (temp20) & (temp20);
+              temp21 := (alias3(3)) & (alias3(3));
+              temp22 := (temp21) & (temp21);
+              first3 := (temp22) & (temp22);
+              a := (first3) & (first2);
+              b := (first1) & (first);
+              val2 := (a) & (b);
+              val3 := val2;
+              temp23 := (unsigned(alias1(31 downto 8)) = 0);
+              if temp23 then
+                addr5 := (alias1) - (0);
+                temp24 := not (val3);
+                temp25 := ("00000000000000000000000000000000") and (temp24);
+                temp26 := ("11111111111111111111111111111111") and (val3);
+                temp27 := (temp25) or (temp26);
+                val <= temp27;
+                addr1 <= unsigned(std_logic_vector(unsigned(addr5(8 downto 0))));
+                data <= unsigned(alias2);
+                sig2 <= '1';
+              end if;
+              temp28 := (unsigned(alias1(31 downto 8)) = 1);
+              if temp28 then
+                addr6 := (alias1) - (256);
+                temp29 := not (val3);
+                temp30 := ("00000000000000000000000000000000") and (temp29);
+                temp31 := ("11111111111111111111111111111111") and (val3);
+                temp32 := (temp30) or (temp31);
+                val1 <= temp32;
+                addr3 <= unsigned(std_logic_vector(unsigned(addr6(8 downto 0))));
+                data1 <= unsigned(alias2);
+                sig5 <= '1';
+              end if;
+              buffer_axi_bresp <= "00";
+              buffer_axi_bvalid <= '1';
+            else
+              s_proc_write <= state_1;
+            end if;
+          when state_2 =>
+            if axi_bready = '1' then
+              buffer_axi_bvalid <= '0';
+              s_proc_write <= state_1;
+              var := '0';
+              var1 := '0';
+              buffer_axi_awready <= '1';
+              buffer_axi_wready <= '1';
+            end if;
+          when others =>
+            null;
+        end case;
+      end if;
+    end if;
+  end process;
+end architecture arch_test_axilite_reg_10;
@@ -0,0 +1,162 @@
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+
+
+entity test_bitfield is
+  port (
+    inp_vector : in std_logic_vector(15 downto 0);
+    simple_a : out std_logic;
+    simple_b : out std_logic;
+    simple_c : out std_logic_vector(2 downto 0);
+    simple_d : out std_logic_vector(15 downto 0);
+    simple_e : out std_logic_vector(3 downto 0);
+    outer_inner1_all : out std_logic_vector(7 downto 0);
+    outer_inner1_nested1_all : out std_logic_vector(3 downto 0);
+    outer_inner1_nested1_a : out std_logic;
+    outer_inner1_nested1_b : out signed(3 downto 0);
+    outer_inner1_nested1_c : out unsigned(2 downto 0);
+    outer_inner1_nested2_all : out std_logic_vector(3 downto 0);
+    outer_inner1_nested2_a : out std_logic;
+    outer_inner1_nested2_b : out signed(3 downto 0);
+    outer_inner1_nested2_c : out unsigned(2 downto 0);
+    outer_inner1_nested3_all : out std_logic_vector(3 downto 0);
+    outer_inner1_nested3_a : out std_logic;
+    outer_inner1_nested3_b : out signed(3 downto 0);
+    outer_inner1_nested3_c : out unsigned(2 downto 0);
+    outer_inner2_all : out std_logic_vector(7 downto 0);
+    outer_inner2_nested1_all : out std_logic_vector(3 downto 0);
+    outer_inner2_nested1_a : out std_logic;
+    outer_inner2_nested1_b : out signed(3 downto 0);
+    outer_inner2_nested1_c : out unsigned(2 downto 0);
+    outer_inner2_nested2_all : out std_logic_vector(3 downto 0);
+    outer_inner2_nested2_a : out std_logic;
+    outer_inner2_nested2_b : out signed(3 downto 0);
+    outer_inner2_nested2_c : out unsigned(2 downto 0);
+    outer_inner2_nested3_all : out std_logic_vector(3 downto 0);
+    outer_inner2_nested3_a : out std_logic;
+    outer_inner2_nested3_b : out signed(3 downto 0);
+    outer_inner2_nested3_c : out unsigned(2 downto 0)
+    );
+end test_bitfield;
+
+
+architecture arch_test_bitfield of test_bitfield is
+  function cohdl_bool_to_std_logic(inp: boolean) return std_logic is
+  begin
+    if inp then
+      return('1');
+    else
+      return('0');
+    end if;
+  end function cohdl_bool_to_std_logic;
+  signal buffer_simple_a : std_logic;
+  signal buffer_simple_b : std_logic;
+  signal buffer_simple_c : std_logic_vector(2 downto 0);
+  signal buffer_simple_d : std_logic_vector(15 downto 0);
+  signal buffer_simple_e : std_logic_vector(3 downto 0);
+  signal buffer_outer_inner1_all : std_logic_vector(7 downto 0);
+  signal buffer_outer_inner1_nested1_all : std_logic_vector(3 downto 0);
+  signal buffer_outer_inner1_nested1_a : std_logic;
+  signal buffer_outer_inner1_nested1_b : signed(3 downto 0);
+  signal buffer_outer_inner1_nested1_c : unsigned(2 downto 0);
+  signal buffer_outer_inner1_nested2_all : std_logic_vector(3 downto 0);
+  signal buffer_outer_inner1_nested2_a : std_logic;
+  signal buffer_outer_inner1_nested2_b : signed(3 downto 0);
+  signal buffer_outer_inner1_nested2_c : unsigned(2 downto 0);
+  signal buffer_outer_inner1_nested3_all : std_logic_vector(3 downto 0);
+  signal buffer_outer_inner1_nested3_a : std_logic;
+  signal buffer_outer_inner1_nested3_b : signed(3 downto 0);
+  signal buffer_outer_inner1_nested3_c : unsigned(2 downto 0);
+  signal buffer_outer_inner2_all : std_logic_vector(7 downto 0);
+  signal buffer_outer_inner2_nested1_all : std_logic_vector(3 downto 0);
+  signal buffer_outer_inner2_nested1_a : std_logic;
+  signal buffer_outer_inner2_nested1_b : signed(3 downto 0);
+  signal buffer_outer_inner2_nested1_c : unsigned(2 downto 0);
+  signal buffer_outer_inner2_nested2_all : std_logic_vector(3 downto 0);
+  signal buffer_outer_inner2_nested2_a : std_logic;
+  signal buffer_outer_inner2_nested2_b : signed(3 downto 0);
+  signal buffer_outer_inner2_nested2_c : unsigned(2 downto 0);
+  signal buffer_outer_inner2_nested3_all : std_logic_vector(3 downto 0);
+  signal buffer_outer_inner2_nested3_a : std_logic;
+  signal buffer_outer_inner2_nested3_b : signed(3 downto 0);
+  signal buffer_outer_inner2_nested3_c : unsigned(2 downto 0);
+  signal val : std_logic_vector(15 downto 0);
+begin
+  
+  -- CONCURRENT BLOCK (buffer assignment)
+  simple_a <= buffer_simple_a;
+  simple_b <= buffer_simple_b;
+  simple_c <= buffer_simple_c;
+  simple_d <= buffer_simple_d;
+  simple_e <= buffer_simple_e;
+  outer_inner1_all <= buffer_outer_inner1_all;
+  outer_inner1_nested1_all <= buffer_outer_inner1_nested1_all;
+  outer_inner1_nested1_a <= buffer_outer_inner1_nested1_a;
+  outer_inner1_nested1_b <= buffer_outer_inner1_nested1_b;
+  outer_inner1_nested1_c <= buffer_outer_inner1_nested1_c;
+  outer_inner1_nested2_all <= buffer_outer_inner1_nested2_all;
+  outer_inner1_nested2_a <= buffer_outer_inner1_nested2_a;
+  outer_inner1_nested2_b <= buffer_outer_inner1_nested2_b;
+  outer_inner1_nested2_c <= buffer_outer_inner1_nested2_c;
+  outer_inner1_nested3_all <= buffer_outer_inner1_nested3_all;
+  outer_inner1_nested3_a <= buffer_outer_inner1_nested3_a;
+  outer_inner1_nested3_b <= buffer_outer_inner1_nested3_b;
+  outer_inner1_nested3_c <= buffer_outer_inner1_nested3_c;
+  outer_inner2_all <= buffer_outer_inner2_all;
+  outer_inner2_nested1_all <= buffer_outer_inner2_nested1_all;
+  outer_inner2_nested1_a <= buffer_outer_inner2_nested1_a;
+  outer_inner2_nested1_b <= buffer_outer_inner2_nested1_b;
+  outer_inner2_nested1_c <= buffer_outer_inner2_nested1_c;
+  outer_inner2_nested2_all <= buffer_outer_inner2_nested2_all;
+  outer_inner2_nested2_a <= buffer_outer_inner2_nested2_a;
+  outer_inner2_nested2_b <= buffer_outer_inner2_nested2_b;
+  outer_inner2_nested2_c <= buffer_outer_inner2_nested2_c;
+  outer_inner2_nested3_all <= buffer_outer_inner2_nested3_all;
+  outer_inner2_nested3_a <= buffer_outer_inner2_nested3_a;
+  outer_inner2_nested3_b <= buffer_outer_inner2_nested3_b;
+  outer_inner2_nested3_c <= buffer_outer_inner2_nested3_c;
+  
+  -- CONCURRENT BLOCK (logic_simple)
+  val <= inp_vector;
+  buffer_simple_a <= val(0);
+  buffer_simple_b <= val(1);
+  buffer_simple_c <= std_logic_vector(val(4 downto 2));
+  buffer_simple_d <= std_logic_vector(val(15 downto 0));
+  buffer_simple_e <= std_logic_vector(unsigned(std_logic_vector(val(3 downto 0))));
+  
+
+  logic_outer: process(inp_vector)
+    variable self : std_logic_vector(15 downto 0);
+  begin
+    self := inp_vector;
+    self(7 downto 0) := std_logic_vector(inp_vector(7 downto 0));
+    self(15 downto 8) := std_logic_vector(inp_vector(15 downto 8));
+    buffer_outer_inner1_all <= std_logic_vector(self(7 downto 0));
+    buffer_outer_inner1_nested1_all <= std_logic_vector(self(3 downto 0));
+    buffer_outer_inner1_nested1_a <= self(0);
+    buffer_outer_inner1_nested1_b <= signed(std_logic_vector(self(3 downto 0)));
+    buffer_outer_inner1_nested1_c <= unsigned(std_logic_vector(self(2 downto 0)));
+    buffer_outer_inner1_nested2_all <= std_logic_vector(self(3 downto 0));
+    buffer_outer_inner1_nested2_a <= self(0);
+    buffer_outer_inner1_nested2_b <= signed(std_logic_vector(self(3 downto 0)));
+    buffer_outer_inner1_nested2_c <= unsigned(std_logic_vector(self(2 downto 0)));
+    buffer_outer_inner1_nested3_all <= std_logic_vector(self(5 downto 2));
+    buffer_outer_inner1_nested3_a <= self(2);
+    buffer_outer_inner1_nested3_b <= signed(std_logic_vector(self(5 downto 2)));
+    buffer_outer_inner1_nested3_c <= unsigned(std_logic_vector(self(4 downto 2)));
+    buffer_outer_inner2_all <= std_logic_vector(self(15 downto 8));
+    buffer_outer_inner2_nested1_all <= std_logic_vector(self(11 downto 8));
+    buffer_outer_inner2_nested1_a <= self(8);
+    buffer_outer_inner2_nested1_b <= signed(std_logic_vector(self(11 downto 8)));
+    buffer_outer_inner2_nested1_c <= unsigned(std_logic_vector(self(10 downto 8)));
+    buffer_outer_inner2_nested2_all <= std_logic_vector(self(11 downto 8));
+    buffer_outer_inner2_nested2_a <= self(8);
+    buffer_outer_inner2_nested2_b <= signed(std_logic_vector(self(11 downto 8)));
+    buffer_outer_inner2_nested2_c <= unsigned(std_logic_vector(self(10 downto 8)));
+    buffer_outer_inner2_nested3_all <= std_logic_vector(self(13 downto 10));
+    buffer_outer_inner2_nested3_a <= self(10);
+    buffer_outer_inner2_nested3_b <= signed(std_logic_vector(self(13 downto 10)));
+    buffer_outer_inner2_nested3_c <= unsigned(std_logic_vector(self(12 downto 10)));
+  end process;
+end architecture arch_test_bitfield;
@@ -0,0 +1,125 @@
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+
+
+entity test_enum_01 is
+  port (
+    inp_unsafe : in std_logic_vector(3 downto 0);
+    out_assigned : out std_logic_vector(3 downto 0);
+    out_deserialized : out std_logic_vector(3 downto 0);
+    is_a : out std_logic;
+    is_b : out std_logic;
+    is_c : out std_logic;
+    is_d : out std_logic;
+    is_e : out std_logic;
+    is_f : out std_logic;
+    is_g : out std_logic;
+    is_not_a : out std_logic;
+    is_not_b : out std_logic;
+    is_not_c : out std_logic;
+    is_not_d : out std_logic;
+    is_not_e : out std_logic;
+    is_not_f : out std_logic;
+    is_not_g : out std_logic
+    );
+end test_enum_01;
+
+
+architecture arch_test_enum_01 of test_enum_01 is
+  function cohdl_bool_to_std_logic(inp: boolean) return std_logic is
+  begin
+    if inp then
+      return('1');
+    else
+      return('0');
+    end if;
+  end function cohdl_bool_to_std_logic;
+  signal buffer_out_assigned : std_logic_vector(3 downto 0);
+  signal buffer_out_deserialized : std_logic_vector(3 downto 0);
+  signal buffer_is_a : std_logic;
+  signal buffer_is_b : std_logic;
+  signal buffer_is_c : std_logic;
+  signal buffer_is_d : std_logic;
+  signal buffer_is_e : std_logic;
+  signal buffer_is_f : std_logic;
+  signal buffer_is_g : std_logic;
+  signal buffer_is_not_a : std_logic;
+  signal buffer_is_not_b : std_logic;
+  signal buffer_is_not_c : std_logic;
+  signal buffer_is_not_d : std_logic;
+  signal buffer_is_not_e : std_logic;
+  signal buffer_is_not_f : std_logic;
+  signal buffer_is_not_g : std_logic;
+  signal inp : std_logic_vector(3 downto 0);
+  signal sig : std_logic_vector(3 downto 0) := "0000";
+  signal temp : boolean;
+  signal temp1 : boolean;
+  signal temp2 : boolean;
+  signal temp3 : boolean;
+  signal temp4 : boolean;
+  signal temp5 : boolean;
+  signal temp6 : boolean;
+  signal temp7 : boolean;
+  signal temp8 : boolean;
+  signal temp9 : boolean;
+  signal temp10 : boolean;
+  signal temp11 : boolean;
+  signal temp12 : boolean;
+  signal temp13 : boolean;
+  signal bits : std_logic_vector(3 downto 0);
+begin
+  
+  -- CONCURRENT BLOCK (buffer assignment)
+  out_assigned <= buffer_out_assigned;
+  out_deserialized <= buffer_out_deserialized;
+  is_a <= buffer_is_a;
+  is_b <= buffer_is_b;
+  is_c <= buffer_is_c;
+  is_d <= buffer_is_d;
+  is_e <= buffer_is_e;
+  is_f <= buffer_is_f;
+  is_g <= buffer_is_g;
+  is_not_a <= buffer_is_not_a;
+  is_not_b <= buffer_is_not_b;
+  is_not_c <= buffer_is_not_c;
+  is_not_d <= buffer_is_not_d;
+  is_not_e <= buffer_is_not_e;
+  is_not_f <= buffer_is_not_f;
+  is_not_g <= buffer_is_not_g;
+  
+  -- CONCURRENT BLOCK (logic)
+  inp <= inp_unsafe;
+  sig <= inp;
+  buffer_out_assigned <= sig;
+  temp <= (inp = "0000");
+  buffer_is_a <= cohdl_bool_to_std_logic(temp);
+  temp1 <= (inp = "0001");
+  buffer_is_b <= cohdl_bool_to_std_logic(temp1);
+  temp2 <= (inp = "0010");
+  buffer_is_c <= cohdl_bool_to_std_logic(temp2);
+  temp3 <= (inp = "0011");
+  buffer_is_d <= cohdl_bool_to_std_logic(temp3);
+  temp4 <= (inp = "1111");
+  buffer_is_e <= cohdl_bool_to_std_logic(temp4);
+  temp5 <= (inp = "1001");
+  buffer_is_f <= cohdl_bool_to_std_logic(temp5);
+  temp6 <= (inp = "0110");
+  buffer_is_g <= cohdl_bool_to_std_logic(temp6);
+  temp7 <= (inp /= "0000");
+  buffer_is_not_a <= cohdl_bool_to_std_logic(temp7);
+  temp8 <= (inp /= "0001");
+  buffer_is_not_b <= cohdl_bool_to_std_logic(temp8);
+  temp9 <= (inp /= "0010");
+  buffer_is_not_c <= cohdl_bool_to_std_logic(temp9);
+  temp10 <= (inp /= "0011");
+  buffer_is_not_d <= cohdl_bool_to_std_logic(temp10);
+  temp11 <= (inp /= "1111");
+  buffer_is_not_e <= cohdl_bool_to_std_logic(temp11);
+  temp12 <= (inp /= "1001");
+  buffer_is_not_f <= cohdl_bool_to_std_logic(temp12);
+  temp13 <= (inp /= "0110");
+  buffer_is_not_g <= cohdl_bool_to_std_logic(temp13);
+  bits <= inp;
+  buffer_out_deserialized <= bits;
+end architecture arch_test_enum_01;
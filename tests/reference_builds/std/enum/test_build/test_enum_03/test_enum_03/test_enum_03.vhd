@@ -0,0 +1,49 @@
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+
+
+entity test_enum_03 is
+  port (
+    inp_select : in std_logic;
+    inp_a : in std_logic_vector(3 downto 0);
+    inp_b : in std_logic_vector(3 downto 0);
+    result : out std_logic_vector(3 downto 0)
+    );
+end test_enum_03;
+
+
+architecture arch_test_enum_03 of test_enum_03 is
+  function cohdl_bool_to_std_logic(inp: boolean) return std_logic is
+  begin
+    if inp then
+      return('1');
+    else
+      return('0');
+    end if;
+  end function cohdl_bool_to_std_logic;
+  signal buffer_result : std_logic_vector(3 downto 0);
+  signal temp : std_logic_vector(3 downto 0);
+  signal temp1 : std_logic_vector(3 downto 0);
+  signal select1 : std_logic;
+  signal a : std_logic_vector(3 downto 0) := "0000";
+  signal b : std_logic_vector(3 downto 0) := "0000";
+  signal temp2 : boolean;
+  signal temp3 : std_logic_vector(3 downto 0);
+begin
+  
+  -- CONCURRENT BLOCK (buffer assignment)
+  result <= buffer_result;
+  
+  -- CONCURRENT BLOCK (logic)
+  temp <= inp_a;
+  temp1 <= inp_b;
+  select1 <= inp_select;
+  a <= temp;
+  b <= temp1;
+  temp2 <= select1 = '1';
+  with temp2 select temp3 <=
+    b when true,
+    a when others;
+  buffer_result <= temp3;
+end architecture arch_test_enum_03;
@@ -0,0 +1,98 @@
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+
+
+entity test_enum_04 is
+  port (
+    clk : in std_logic;
+    inp_first : in std_logic;
+    inp_second : in unsigned(2 downto 0);
+    inp_index : in unsigned(2 downto 0);
+    do_write : in std_logic_vector(1 downto 0);
+    out_index : in unsigned(2 downto 0);
+    out_first : out std_logic;
+    out_second : out unsigned(2 downto 0);
+    out_pair_first : out std_logic;
+    out_pair_second : out unsigned(2 downto 0);
+    out_is_a : out std_logic
+    );
+end test_enum_04;
+
+
+architecture arch_test_enum_04 of test_enum_04 is
+  function cohdl_bool_to_std_logic(inp: boolean) return std_logic is
+  begin
+    if inp then
+      return('1');
+    else
+      return('0');
+    end if;
+  end function cohdl_bool_to_std_logic;
+  signal buffer_out_first : std_logic;
+  signal buffer_out_second : unsigned(2 downto 0);
+  signal buffer_out_pair_first : std_logic;
+  signal buffer_out_pair_second : unsigned(2 downto 0);
+  signal buffer_out_is_a : std_logic;
+  type array_type is array(0 to 7) of std_logic_vector(3 downto 0);
+  signal bits : array_type := ( 0 => "0000", 1 => "0000", 2 => "0000", 3 => "0000", 4 => "0000", 5 => "0000", 6 => "0000", 7 => "0000" );
+  signal temp : unsigned(2 downto 0);
+  signal temp1 : boolean;
+  signal temp2 : boolean;
+  signal temp3 : boolean;
+begin
+  
+  -- CONCURRENT BLOCK (buffer assignment)
+  out_first <= buffer_out_first;
+  out_second <= buffer_out_second;
+  out_pair_first <= buffer_out_pair_first;
+  out_pair_second <= buffer_out_pair_second;
+  out_is_a <= buffer_out_is_a;
+  
+
+  proc_write: process(clk)
+    variable temp4 : std_logic;
+    variable temp5 : unsigned(2 downto 0);
+    variable temp6 : boolean;
+    variable temp7 : unsigned(2 downto 0);
+    variable temp8 : boolean;
+    variable temp9 : unsigned(2 downto 0);
+    variable temp10 : boolean;
+    variable temp11 : unsigned(2 downto 0);
+  begin
+    if rising_edge(clk) then
+      temp4 := inp_first;
+      temp5 := inp_second;
+      temp6 := (do_write = "11");
+      if temp6 then
+        temp7 := inp_index;
+        temp7 := inp_index;
+        bits(to_integer(temp7))(0) <= temp4;
+        bits(to_integer(temp7))(3 downto 1) <= std_logic_vector(temp5);
+      else
+        temp8 := do_write(0) = '1';
+        if temp8 then
+          temp9 := inp_index;
+          bits(to_integer(temp9))(0) <= inp_first;
+        else
+          temp10 := do_write(1) = '1';
+          if temp10 then
+            temp11 := inp_index;
+            bits(to_integer(temp11))(3 downto 1) <= std_logic_vector(inp_second);
+          end if;
+        end if;
+      end if;
+    end if;
+  end process;
+  
+  -- CONCURRENT BLOCK (proc_read)
+  temp <= out_index;
+  buffer_out_first <= bits(to_integer(temp))(0);
+  buffer_out_second <= unsigned(std_logic_vector(bits(to_integer(temp))(3 downto 1)));
+  temp1 <= (bits(to_integer(temp))(0) = '0');
+  temp2 <= (unsigned(std_logic_vector(bits(to_integer(temp))(3 downto 1))) = unsigned'("000"));
+  temp3 <= temp1 and temp2;
+  buffer_out_is_a <= cohdl_bool_to_std_logic(temp3);
+  buffer_out_pair_first <= bits(to_integer(temp))(0);
+  buffer_out_pair_second <= unsigned(std_logic_vector(bits(to_integer(temp))(3 downto 1)));
+end architecture arch_test_enum_04;
@@ -0,0 +1,92 @@
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+
+
+entity test_flagenum_01 is
+  port (
+    inp_a : in std_logic_vector(7 downto 0);
+    inp_b : in std_logic_vector(7 downto 0);
+    out_and : out std_logic_vector(7 downto 0);
+    out_or : out std_logic_vector(7 downto 0);
+    out_xor : out std_logic_vector(7 downto 0);
+    has_a : out std_logic;
+    has_b : out std_logic;
+    has_c : out std_logic;
+    is_a : out std_logic;
+    is_b : out std_logic;
+    is_c : out std_logic
+    );
+end test_flagenum_01;
+
+
+architecture arch_test_flagenum_01 of test_flagenum_01 is
+  function cohdl_bool_to_std_logic(inp: boolean) return std_logic is
+  begin
+    if inp then
+      return('1');
+    else
+      return('0');
+    end if;
+  end function cohdl_bool_to_std_logic;
+  signal buffer_out_and : std_logic_vector(7 downto 0);
+  signal buffer_out_or : std_logic_vector(7 downto 0);
+  signal buffer_out_xor : std_logic_vector(7 downto 0);
+  signal buffer_has_a : std_logic;
+  signal buffer_has_b : std_logic;
+  signal buffer_has_c : std_logic;
+  signal buffer_is_a : std_logic;
+  signal buffer_is_b : std_logic;
+  signal buffer_is_c : std_logic;
+  signal value : unsigned(7 downto 0) := unsigned'("00000001");
+  signal temp : unsigned(7 downto 0);
+  signal val : unsigned(7 downto 0);
+  signal val1 : unsigned(7 downto 0);
+  signal val2 : unsigned(7 downto 0);
+  signal val3 : unsigned(7 downto 0);
+  signal temp1 : boolean;
+  signal val4 : unsigned(7 downto 0);
+  signal temp2 : boolean;
+  signal val5 : unsigned(7 downto 0);
+  signal temp3 : boolean;
+  signal temp4 : boolean;
+  signal temp5 : boolean;
+  signal temp6 : boolean;
+begin
+  
+  -- CONCURRENT BLOCK (buffer assignment)
+  out_and <= buffer_out_and;
+  out_or <= buffer_out_or;
+  out_xor <= buffer_out_xor;
+  has_a <= buffer_has_a;
+  has_b <= buffer_has_b;
+  has_c <= buffer_has_c;
+  is_a <= buffer_is_a;
+  is_b <= buffer_is_b;
+  is_c <= buffer_is_c;
+  
+  -- CONCURRENT BLOCK (logic)
+  value <= unsigned(inp_a);
+  temp <= unsigned(inp_b);
+  val <= (value) and (temp);
+  buffer_out_and <= std_logic_vector(val);
+  val1 <= (value) or (temp);
+  buffer_out_or <= std_logic_vector(val1);
+  val2 <= (value) xor (temp);
+  buffer_out_xor <= std_logic_vector(val2);
+  val3 <= (value) and (unsigned'("00000001"));
+  temp1 <= (val3 /= 0);
+  buffer_has_a <= cohdl_bool_to_std_logic(temp1);
+  val4 <= (value) and (unsigned'("00000010"));
+  temp2 <= (val4 /= 0);
+  buffer_has_b <= cohdl_bool_to_std_logic(temp2);
+  val5 <= (value) and (unsigned'("00010000"));
+  temp3 <= (val5 /= 0);
+  buffer_has_c <= cohdl_bool_to_std_logic(temp3);
+  temp4 <= (value = unsigned'("00000001"));
+  buffer_is_a <= cohdl_bool_to_std_logic(temp4);
+  temp5 <= (value = unsigned'("00000010"));
+  buffer_is_b <= cohdl_bool_to_std_logic(temp5);
+  temp6 <= (value = unsigned'("00010000"));
+  buffer_is_c <= cohdl_bool_to_std_logic(temp6);
+end architecture arch_test_flagenum_01;
@@ -0,0 +1,96 @@
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+
+
+entity test_record_01 is
+  port (
+    inp_a : in std_logic;
+    inp_b : in std_logic_vector(7 downto 0);
+    inp_c : in unsigned(3 downto 0);
+    inp_d : in signed(6 downto 0);
+    out_a : out std_logic;
+    out_b : out std_logic_vector(7 downto 0);
+    out_c : out unsigned(3 downto 0);
+    out_d : out signed(6 downto 0);
+    serdes_a : out std_logic;
+    serdes_b : out std_logic_vector(7 downto 0);
+    serdes_c : out unsigned(3 downto 0);
+    serdes_d : out signed(6 downto 0)
+    );
+end test_record_01;
+
+
+architecture arch_test_record_01 of test_record_01 is
+  function cohdl_bool_to_std_logic(inp: boolean) return std_logic is
+  begin
+    if inp then
+      return('1');
+    else
+      return('0');
+    end if;
+  end function cohdl_bool_to_std_logic;
+  signal buffer_out_a : std_logic;
+  signal buffer_out_b : std_logic_vector(7 downto 0);
+  signal buffer_out_c : unsigned(3 downto 0);
+  signal buffer_out_d : signed(6 downto 0);
+  signal buffer_serdes_a : std_logic;
+  signal buffer_serdes_b : std_logic_vector(7 downto 0);
+  signal buffer_serdes_c : unsigned(3 downto 0);
+  signal buffer_serdes_d : signed(6 downto 0);
+  signal temp : std_logic;
+  signal temp1 : std_logic_vector(7 downto 0);
+  signal temp2 : unsigned(3 downto 0);
+  signal temp3 : signed(6 downto 0);
+  signal inp : std_logic;
+  signal inp1 : std_logic_vector(7 downto 0);
+  signal inp2 : unsigned(3 downto 0);
+  signal inp3 : signed(6 downto 0);
+  signal first : std_logic_vector(6 downto 0);
+  signal b : std_logic_vector(3 downto 0);
+  signal a : std_logic_vector(7 downto 0);
+  signal b1 : std_logic_vector(1 downto 0);
+  signal a1 : std_logic_vector(10 downto 0);
+  signal b2 : std_logic_vector(8 downto 0);
+  signal bits : std_logic_vector(19 downto 0);
+  signal temp4 : unsigned(3 downto 0);
+  signal temp5 : signed(6 downto 0);
+begin
+  
+  -- CONCURRENT BLOCK (buffer assignment)
+  out_a <= buffer_out_a;
+  out_b <= buffer_out_b;
+  out_c <= buffer_out_c;
+  out_d <= buffer_out_d;
+  serdes_a <= buffer_serdes_a;
+  serdes_b <= buffer_serdes_b;
+  serdes_c <= buffer_serdes_c;
+  serdes_d <= buffer_serdes_d;
+  
+  -- CONCURRENT BLOCK (logic)
+  temp <= inp_a;
+  temp1 <= inp_b;
+  temp2 <= inp_c;
+  temp3 <= inp_d;
+  inp <= temp;
+  inp1 <= temp1;
+  inp2 <= temp2;
+  inp3 <= temp3;
+  first <= std_logic_vector(inp3);
+  b <= std_logic_vector(inp2);
+  a <= inp1;
+  b1 <= (inp) & (inp);
+  a1 <= (first) & (b);
+  b2 <= (a) & (std_logic_vector(b1(0 downto 0)));
+  bits <= (a1) & (b2);
+  temp4 <= unsigned(std_logic_vector(bits(12 downto 9)));
+  temp5 <= signed(std_logic_vector(bits(19 downto 13)));
+  buffer_out_a <= temp;
+  buffer_out_b <= temp1;
+  buffer_out_c <= temp2;
+  buffer_out_d <= temp3;
+  buffer_serdes_a <= bits(0);
+  buffer_serdes_b <= std_logic_vector(bits(8 downto 1));
+  buffer_serdes_c <= temp4;
+  buffer_serdes_d <= temp5;
+end architecture arch_test_record_01;
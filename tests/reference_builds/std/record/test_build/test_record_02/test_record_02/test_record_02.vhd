@@ -0,0 +1,227 @@
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+
+
+entity test_record_02 is
+  port (
+    input : in std_logic_vector(63 downto 0);
+    out_4_inner1_a : out std_logic;
+    out_4_inner1_b : out std_logic_vector(3 downto 0);
+    out_4_inner1_c : out unsigned(3 downto 0);
+    out_4_inner1_d : out signed(3 downto 0);
+    out_4_inner2_a : out std_logic;
+    out_4_inner2_b : out std_logic_vector(7 downto 0);
+    out_4_inner2_c : out unsigned(7 downto 0);
+    out_4_inner2_d : out signed(7 downto 0);
+    out_4_bit : out std_logic;
+    out_4_vec : out std_logic_vector(3 downto 0);
+    out_2_inner1_a : out std_logic;
+    out_2_inner1_b : out std_logic_vector(1 downto 0);
+    out_2_inner1_c : out unsigned(1 downto 0);
+    out_2_inner1_d : out signed(1 downto 0);
+    out_2_inner2_a : out std_logic;
+    out_2_inner2_b : out std_logic_vector(7 downto 0);
+    out_2_inner2_c : out unsigned(7 downto 0);
+    out_2_inner2_d : out signed(7 downto 0);
+    out_2_bit : out std_logic;
+    out_2_vec : out std_logic_vector(1 downto 0)
+    );
+end test_record_02;
+
+
+architecture arch_test_record_02 of test_record_02 is
+  function cohdl_bool_to_std_logic(inp: boolean) return std_logic is
+  begin
+    if inp then
+      return('1');
+    else
+      return('0');
+    end if;
+  end function cohdl_bool_to_std_logic;
+  signal buffer_out_4_inner1_a : std_logic;
+  signal buffer_out_4_inner1_b : std_logic_vector(3 downto 0);
+  signal buffer_out_4_inner1_c : unsigned(3 downto 0);
+  signal buffer_out_4_inner1_d : signed(3 downto 0);
+  signal buffer_out_4_inner2_a : std_logic;
+  signal buffer_out_4_inner2_b : std_logic_vector(7 downto 0);
+  signal buffer_out_4_inner2_c : unsigned(7 downto 0);
+  signal buffer_out_4_inner2_d : signed(7 downto 0);
+  signal buffer_out_4_bit : std_logic;
+  signal buffer_out_4_vec : std_logic_vector(3 downto 0);
+  signal buffer_out_2_inner1_a : std_logic;
+  signal buffer_out_2_inner1_b : std_logic_vector(1 downto 0);
+  signal buffer_out_2_inner1_c : unsigned(1 downto 0);
+  signal buffer_out_2_inner1_d : signed(1 downto 0);
+  signal buffer_out_2_inner2_a : std_logic;
+  signal buffer_out_2_inner2_b : std_logic_vector(7 downto 0);
+  signal buffer_out_2_inner2_c : unsigned(7 downto 0);
+  signal buffer_out_2_inner2_d : signed(7 downto 0);
+  signal buffer_out_2_bit : std_logic;
+  signal buffer_out_2_vec : std_logic_vector(1 downto 0);
+  signal val : std_logic;
+  signal val1 : std_logic_vector(3 downto 0);
+  signal val2 : unsigned(3 downto 0);
+  signal val3 : signed(3 downto 0);
+  signal val4 : std_logic;
+  signal val5 : std_logic_vector(7 downto 0);
+  signal val6 : unsigned(7 downto 0);
+  signal val7 : signed(7 downto 0);
+  signal val8 : std_logic;
+  signal val9 : std_logic_vector(3 downto 0);
+  signal temp : std_logic;
+  signal temp1 : std_logic_vector(1 downto 0);
+  signal temp2 : unsigned(1 downto 0);
+  signal temp3 : signed(1 downto 0);
+  signal temp4 : std_logic;
+  signal temp5 : std_logic_vector(7 downto 0);
+  signal temp6 : unsigned(7 downto 0);
+  signal temp7 : signed(7 downto 0);
+  signal temp8 : std_logic;
+  signal temp9 : std_logic_vector(1 downto 0);
+  signal inner_1_a : std_logic;
+  signal inner_1_b : std_logic_vector(1 downto 0);
+  signal inner_1_c : unsigned(1 downto 0);
+  signal inner_1_d : signed(1 downto 0);
+  signal inner_2_a : std_logic;
+  signal inner_2_b : std_logic_vector(7 downto 0);
+  signal inner_2_c : unsigned(7 downto 0);
+  signal inner_2_d : signed(7 downto 0);
+  signal bit : std_logic;
+  signal vec : std_logic_vector(1 downto 0);
+  signal first : std_logic_vector(1 downto 0);
+  signal b : std_logic_vector(1 downto 0);
+  signal first1 : std_logic_vector(7 downto 0);
+  signal b1 : std_logic_vector(7 downto 0);
+  signal a : std_logic_vector(7 downto 0);
+  signal b2 : std_logic_vector(1 downto 0);
+  signal a1 : std_logic_vector(15 downto 0);
+  signal b3 : std_logic_vector(8 downto 0);
+  signal a2 : std_logic_vector(24 downto 0);
+  signal first2 : std_logic_vector(1 downto 0);
+  signal b4 : std_logic_vector(1 downto 0);
+  signal a3 : std_logic_vector(1 downto 0);
+  signal b5 : std_logic_vector(1 downto 0);
+  signal a4 : std_logic_vector(3 downto 0);
+  signal b6 : std_logic_vector(2 downto 0);
+  signal b7 : std_logic_vector(6 downto 0);
+  signal a5 : std_logic_vector(2 downto 0);
+  signal b8 : std_logic_vector(31 downto 0);
+  signal bits : std_logic_vector(34 downto 0);
+  signal val10 : std_logic;
+  signal val11 : std_logic_vector(1 downto 0);
+  signal val12 : unsigned(1 downto 0);
+  signal val13 : signed(1 downto 0);
+  signal val14 : std_logic;
+  signal val15 : std_logic_vector(7 downto 0);
+  signal val16 : unsigned(7 downto 0);
+  signal val17 : signed(7 downto 0);
+  signal val18 : std_logic;
+  signal val19 : std_logic_vector(1 downto 0);
+begin
+  
+  -- CONCURRENT BLOCK (buffer assignment)
+  out_4_inner1_a <= buffer_out_4_inner1_a;
+  out_4_inner1_b <= buffer_out_4_inner1_b;
+  out_4_inner1_c <= buffer_out_4_inner1_c;
+  out_4_inner1_d <= buffer_out_4_inner1_d;
+  out_4_inner2_a <= buffer_out_4_inner2_a;
+  out_4_inner2_b <= buffer_out_4_inner2_b;
+  out_4_inner2_c <= buffer_out_4_inner2_c;
+  out_4_inner2_d <= buffer_out_4_inner2_d;
+  out_4_bit <= buffer_out_4_bit;
+  out_4_vec <= buffer_out_4_vec;
+  out_2_inner1_a <= buffer_out_2_inner1_a;
+  out_2_inner1_b <= buffer_out_2_inner1_b;
+  out_2_inner1_c <= buffer_out_2_inner1_c;
+  out_2_inner1_d <= buffer_out_2_inner1_d;
+  out_2_inner2_a <= buffer_out_2_inner2_a;
+  out_2_inner2_b <= buffer_out_2_inner2_b;
+  out_2_inner2_c <= buffer_out_2_inner2_c;
+  out_2_inner2_d <= buffer_out_2_inner2_d;
+  out_2_bit <= buffer_out_2_bit;
+  out_2_vec <= buffer_out_2_vec;
+  
+  -- CONCURRENT BLOCK (logic)
+  val <= input(0);
+  val1 <= std_logic_vector(input(4 downto 1));
+  val2 <= unsigned(std_logic_vector(input(8 downto 5)));
+  val3 <= signed(std_logic_vector(input(12 downto 9)));
+  val4 <= input(13);
+  val5 <= std_logic_vector(input(21 downto 14));
+  val6 <= unsigned(std_logic_vector(input(29 downto 22)));
+  val7 <= signed(std_logic_vector(input(37 downto 30)));
+  val8 <= input(38);
+  val9 <= std_logic_vector(input(42 downto 39));
+  buffer_out_4_inner1_a <= val;
+  buffer_out_4_inner1_b <= val1;
+  buffer_out_4_inner1_c <= val2;
+  buffer_out_4_inner1_d <= val3;
+  buffer_out_4_inner2_a <= val4;
+  buffer_out_4_inner2_b <= val5;
+  buffer_out_4_inner2_c <= val6;
+  buffer_out_4_inner2_d <= val7;
+  buffer_out_4_bit <= val8;
+  buffer_out_4_vec <= val9;
+  
+  -- CONCURRENT BLOCK (logic_2)
+  temp <= input(0);
+  temp1 <= std_logic_vector(input(2 downto 1));
+  temp2 <= unsigned(std_logic_vector(input(4 downto 3)));
+  temp3 <= signed(std_logic_vector(input(6 downto 5)));
+  temp4 <= input(13);
+  temp5 <= std_logic_vector(input(21 downto 14));
+  temp6 <= unsigned(std_logic_vector(input(29 downto 22)));
+  temp7 <= signed(std_logic_vector(input(37 downto 30)));
+  temp8 <= input(38);
+  temp9 <= std_logic_vector(input(40 downto 39));
+  inner_1_a <= temp;
+  inner_1_b <= temp1;
+  inner_1_c <= temp2;
+  inner_1_d <= temp3;
+  inner_2_a <= temp4;
+  inner_2_b <= temp5;
+  inner_2_c <= temp6;
+  inner_2_d <= temp7;
+  bit <= temp8;
+  vec <= temp9;
+  first <= vec;
+  b <= (bit) & (bit);
+  first1 <= std_logic_vector(inner_2_d);
+  b1 <= std_logic_vector(inner_2_c);
+  a <= inner_2_b;
+  b2 <= (inner_2_a) & (inner_2_a);
+  a1 <= (first1) & (b1);
+  b3 <= (a) & (std_logic_vector(b2(0 downto 0)));
+  a2 <= (a1) & (b3);
+  first2 <= std_logic_vector(inner_1_d);
+  b4 <= std_logic_vector(inner_1_c);
+  a3 <= inner_1_b;
+  b5 <= (inner_1_a) & (inner_1_a);
+  a4 <= (first2) & (b4);
+  b6 <= (a3) & (std_logic_vector(b5(0 downto 0)));
+  b7 <= (a4) & (b6);
+  a5 <= (first) & (std_logic_vector(b(0 downto 0)));
+  b8 <= (a2) & (b7);
+  bits <= (a5) & (b8);
+  val10 <= bits(0);
+  val11 <= std_logic_vector(bits(2 downto 1));
+  val12 <= unsigned(std_logic_vector(bits(4 downto 3)));
+  val13 <= signed(std_logic_vector(bits(6 downto 5)));
+  val14 <= bits(7);
+  val15 <= std_logic_vector(bits(15 downto 8));
+  val16 <= unsigned(std_logic_vector(bits(23 downto 16)));
+  val17 <= signed(std_logic_vector(bits(31 downto 24)));
+  val18 <= bits(32);
+  val19 <= std_logic_vector(bits(34 downto 33));
+  buffer_out_2_inner1_a <= val10;
+  buffer_out_2_inner1_b <= val11;
+  buffer_out_2_inner1_c <= val12;
+  buffer_out_2_inner1_d <= val13;
+  buffer_out_2_inner2_a <= val14;
+  buffer_out_2_inner2_b <= val15;
+  buffer_out_2_inner2_c <= val16;
+  buffer_out_2_inner2_d <= val17;
+  buffer_out_2_bit <= val18;
+  buffer_out_2_vec <= val19;
+end architecture arch_test_record_02;